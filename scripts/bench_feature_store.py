@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""FeatureStore EAV vs Columnar 벤치마크.
+
+기본: 60일 × 2,000종목 × 58피처 (약 700만 값).
+측정 항목:
+  - write: 종목별 add_features_batch (스캔 경로)
+  - train_collect: 날짜→종목 루프로 get_features_dict (기존 학습 수집 방식)
+  - cross_section: 날짜별 get_cross_section 1개 피처
+  - get_panel: 60일 전체 한 번에 로드
+
+실행: PYTHONPATH=src python3 scripts/bench_feature_store.py [--days 60 --tickers 2000 --features 58]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kstock.ml.feature_store import (  # noqa: E402
+    ColumnarFeatureStore,
+    FeatureRecord,
+    FeatureStore,
+)
+
+
+def _timed(label: str, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"  {label:<16s} {dt:8.2f}s")
+    return dt
+
+
+def run(store, dates, tickers, names, values) -> dict[str, float]:
+    out = {}
+
+    def write():
+        for di, d in enumerate(dates):
+            for ti, t in enumerate(tickers):
+                store.add_features_batch([
+                    FeatureRecord(t, d, n, float(values[di, ti, k]), "ml_v10", "bench")
+                    for k, n in enumerate(names)
+                ])
+
+    def train_collect():
+        for d in dates:
+            for t in store.get_tickers_for_date(d):
+                store.get_features_dict(t, d)
+
+    def cross_section():
+        for d in dates:
+            store.get_cross_section(d, names[0])
+
+    def panel():
+        store.get_panel(dates)
+
+    out["write"] = _timed("write", write)
+    out["train_collect"] = _timed("train_collect", train_collect)
+    out["cross_section"] = _timed("cross_section", cross_section)
+    out["get_panel"] = _timed("get_panel", panel)
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--days", type=int, default=60)
+    ap.add_argument("--tickers", type=int, default=2000)
+    ap.add_argument("--features", type=int, default=58)
+    args = ap.parse_args()
+
+    start = date(2025, 1, 1)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(args.days)]
+    tickers = [f"{i:06d}" for i in range(args.tickers)]
+    names = [f"feat_{k:02d}" for k in range(args.features)]
+    values = np.random.default_rng(0).normal(size=(args.days, args.tickers, args.features))
+    print(f"{args.days} days × {args.tickers} tickers × {args.features} features")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, cls, fname in (
+            ("EAV", FeatureStore, "eav.db"),
+            ("Columnar", ColumnarFeatureStore, "wide.db"),
+        ):
+            print(label)
+            store = cls(db_path=Path(tmp) / fname)
+            results[label] = run(store, dates, tickers, names, values)
+            store.close()
+            print(f"  {'db size':<16s} {(Path(tmp) / fname).stat().st_size / 1e6:8.1f}MB")
+
+    print("speedup (EAV / Columnar)")
+    for k in results["EAV"]:
+        print(f"  {k:<16s} {results['EAV'][k] / max(results['Columnar'][k], 1e-9):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
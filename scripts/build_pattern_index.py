@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Parquet lake → 유니버스 패턴 인덱스(data/pattern_index.npz) 생성.
+
+실행: PYTHONPATH=src python3 scripts/build_pattern_index.py [--years 10 --step 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from kstock.signal.pattern_matcher import DEFAULT_INDEX_PATH, PatternIndex
+from kstock.store.parquet_store import ParquetStore
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--years", type=int, default=10)
+    ap.add_argument("--lookback", type=int, default=20)
+    ap.add_argument("--step", type=int, default=5)
+    ap.add_argument("--band", type=int, default=2)
+    ap.add_argument("--out", default=str(DEFAULT_INDEX_PATH))
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    index = PatternIndex.build(
+        ParquetStore(), years=args.years,
+        lookback=args.lookback, step=args.step, band=args.band,
+    )
+    path = index.save(args.out)
+    print(f"{len(index):,} windows, {len(index.tickers):,} tickers → {path} "
+          f"({time.perf_counter() - t0:.1f}s)")
+
+    if len(index):
+        query = index.windows[np.random.default_rng(0).integers(len(index))]
+        t1 = time.perf_counter()
+        index.search(query, k=10)
+        print(f"sample search: {time.perf_counter() - t1:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
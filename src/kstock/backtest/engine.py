@@ -12,9 +12,9 @@ from datetime import datetime
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
-from kstock.features.technical import compute_indicators
+from kstock.backtest.panel import build_panel, download_ohlcv, simulate_exits
+from kstock.features.technical import compute_indicator_series
 from kstock.signal.scoring import (
     FlowData,
     ScoreBreakdown,
@@ -106,94 +106,51 @@ def _simulate_macro() -> MacroSnapshot:
     )
 
 
-def run_backtest(
+def _entry_signals(
+    df: pd.DataFrame,
     code: str,
-    name: str = "",
-    market: str = "KOSPI",
-    period: str = "1y",
-    target_pct: float = 3.0,
-    stop_pct: float = -5.0,
-    lookback: int = 60,
-    costs: TradeCosts | None = None,
-) -> BacktestResult | None:
-    """Run backtest for a single ticker.
-
-    Downloads historical data, applies scoring at each point,
-    and simulates trades based on BUY signals.
-
-    Args:
-        code: Stock code (e.g., "005930")
-        name: Stock name
-        market: KOSPI or KOSDAQ
-        period: yfinance period string (e.g., "1y", "2y")
-        target_pct: Take-profit percentage
-        stop_pct: Stop-loss percentage (negative)
-        lookback: Minimum bars needed for indicators
+    name: str,
+    market: str,
+    lookback: int,
+    config: dict,
+    macro: MacroSnapshot,
+    flow: FlowData,
+) -> np.ndarray:
+    """Bool array over df's bars: BUY score plus an RSI/BB/MACD trigger.
+
+    The trigger test is vectorized over the indicator series, so the
+    (comparatively slow) composite score only runs on trigger bars.
     """
-    symbol = _yf_symbol(code, market)
-    name = name or code
-
-    try:
-        hist = yf.Ticker(symbol).history(period=period)
-        if hist.empty or len(hist) < lookback + 20:
-            logger.warning("Insufficient data for backtest: %s (%d bars)", symbol, len(hist))
-            return None
-    except Exception as e:
-        logger.error("Failed to download data for %s: %s", symbol, e)
-        return None
-
-    df = pd.DataFrame({
-        "date": hist.index.strftime("%Y-%m-%d"),
-        "open": hist["Open"].values,
-        "high": hist["High"].values,
-        "low": hist["Low"].values,
-        "close": hist["Close"].values,
-        "volume": hist["Volume"].astype(int).values,
-    }).reset_index(drop=True)
-
-    config = load_scoring_config()
-    macro = _simulate_macro()
-    flow = FlowData(foreign_net_buy_days=0, institution_net_buy_days=0, avg_trade_value_krw=5e9)
-
-    trades: list[BacktestTrade] = []
-    in_trade = False
-    entry_price = 0.0
-    entry_date = ""
-    entry_idx = 0
-
-    closes = df["close"].astype(float).values
-
-    for i in range(lookback, len(df) - 1):
-        window = df.iloc[:i + 1].copy()
-
-        if in_trade:
-            current = closes[i]
-            if costs:
-                pnl = costs.net_pnl_pct(entry_price, current)
-            else:
-                pnl = (current - entry_price) / entry_price * 100
-            days_held = i - entry_idx
-
-            # Exit conditions
-            if pnl >= target_pct or pnl <= stop_pct or days_held >= 20:
-                trades.append(BacktestTrade(
-                    ticker=code,
-                    name=name,
-                    entry_date=entry_date,
-                    entry_price=round(entry_price, 0),
-                    exit_date=df["date"].iloc[i],
-                    exit_price=round(current, 0),
-                    pnl_pct=round(pnl, 2),
-                    holding_days=days_held,
-                    signal_score=0,
-                ))
-                in_trade = False
-            continue
-
-        # Check for entry signal
+    from kstock.ingest.kis_client import StockInfo
+
+    n = len(df)
+    signals = np.zeros(n, dtype=bool)
+    if n < 2:
+        return signals
+    tech_series = compute_indicator_series(df)
+    cols = tech_series.cols
+    # Loose pre-filter (values are rounded in TechnicalIndicators);
+    # the exact trigger is re-checked on the rounded values below.
+    rsi = np.nan_to_num(cols["rsi"], nan=50.0)
+    band = cols["bb_upper"] - cols["bb_lower"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pctb = np.where(band != 0, (cols["close"] - cols["bb_lower"]) / band, 0.5)
+    hist = np.nan_to_num(cols["macd_hist"])
+    hist_prev = np.concatenate([[0.0], hist[:-1]])
+    candidate = (rsi <= 30.01) | (np.nan_to_num(pctb, nan=0.5) <= 0.2001) | ((hist > 0) & (hist_prev <= 0))
+    candidate[: lookback] = False
+    candidate[n - 1:] = False
+
+    closes = cols["close"]
+    for i in np.flatnonzero(candidate):
         try:
-            from kstock.ingest.kis_client import StockInfo
-            tech = compute_indicators(window)
+            tech = tech_series.at(int(i))
+            if not (
+                tech.rsi <= 30
+                or tech.bb_pctb <= 0.2
+                or tech.macd_signal_cross == 1
+            ):
+                continue
             info = StockInfo(
                 ticker=code, name=name, market=market,
                 market_cap=1e13, per=15, roe=12,
@@ -201,40 +158,21 @@ def run_backtest(
                 current_price=closes[i],
             )
             score = compute_composite_score(macro, flow, info, tech, config)
-
-            if score.signal == "BUY":
-                buy_trigger = (
-                    tech.rsi <= 30
-                    or tech.bb_pctb <= 0.2
-                    or tech.macd_signal_cross == 1
-                )
-                if buy_trigger:
-                    entry_price = closes[i + 1]  # buy next day open approximation
-                    entry_date = df["date"].iloc[i + 1]
-                    entry_idx = i + 1
-                    in_trade = True
-                    trades[-1:] and None  # no-op
+            signals[i] = score.signal == "BUY"
         except Exception as e:
             logger.debug("run_backtest scoring at bar %d for %s: %s", i, code, e)
-            continue
+    return signals
 
-    # Close any remaining trade
-    if in_trade:
-        current = closes[-1]
-        if costs:
-            pnl = costs.net_pnl_pct(entry_price, current)
-        else:
-            pnl = (current - entry_price) / entry_price * 100
-        trades.append(BacktestTrade(
-            ticker=code, name=name,
-            entry_date=entry_date, entry_price=round(entry_price, 0),
-            exit_date=df["date"].iloc[-1], exit_price=round(current, 0),
-            pnl_pct=round(pnl, 2),
-            holding_days=len(df) - 1 - entry_idx,
-            signal_score=0,
-        ))
-
-    # Compute metrics
+
+def _summarize_trades(
+    code: str,
+    name: str,
+    period: str,
+    df: pd.DataFrame,
+    trades: list[BacktestTrade],
+    costs: TradeCosts | None,
+) -> BacktestResult:
+    """Aggregate a ticker's trades into a BacktestResult."""
     if not trades:
         return BacktestResult(
             ticker=code, name=name,
@@ -297,6 +235,116 @@ def run_backtest(
     )
 
 
+def run_backtest_panel(
+    tickers: list[dict],
+    period: str = "1y",
+    target_pct: float = 3.0,
+    stop_pct: float = -5.0,
+    lookback: int = 60,
+    costs: TradeCosts | None = None,
+) -> dict[str, BacktestResult]:
+    """Backtest many tickers through one aligned (dates × tickers) panel.
+
+    OHLCV is fetched in a single batch download, entry signals are built
+    per ticker from the vectorized indicator series, and the exit state
+    machine runs for all tickers at once (see backtest.panel).
+
+    Args:
+        tickers: [{"code": "005930", "name": "삼성전자", "market": "KOSPI"}, ...]
+
+    Returns:
+        {code: BacktestResult}; tickers with failed/insufficient data are
+        omitted.
+    """
+    symbols = {t["code"]: _yf_symbol(t["code"], t.get("market", "KOSPI")) for t in tickers}
+    frames = download_ohlcv(list(symbols.values()), period=period)
+
+    usable: dict[str, pd.DataFrame] = {}
+    for code, symbol in symbols.items():
+        df = frames.get(symbol)
+        n = 0 if df is None else len(df)
+        if n < lookback + 20:
+            logger.warning("Insufficient data for backtest: %s (%d bars)", symbol, n)
+            continue
+        usable[code] = df
+    if not usable:
+        return {}
+
+    config = load_scoring_config()
+    macro = _simulate_macro()
+    flow = FlowData(foreign_net_buy_days=0, institution_net_buy_days=0, avg_trade_value_krw=5e9)
+    meta = {t["code"]: t for t in tickers}
+
+    panel = build_panel(usable)
+    entry = np.zeros(panel.close.shape, dtype=bool)
+    for j, code in enumerate(panel.codes):
+        rows = np.flatnonzero(panel.valid[:, j])
+        t = meta[code]
+        entry[rows, j] = _entry_signals(
+            usable[code], code, t.get("name") or code, t.get("market", "KOSPI"),
+            lookback, config, macro, flow,
+        )
+
+    cost_pct = None
+    if costs:
+        cost_pct = (costs.commission_rate * 2 + costs.sell_tax_rate + costs.slippage_rate * 2) * 100
+    sim = simulate_exits(
+        panel, entry, target_pct=target_pct, stop_pct=stop_pct,
+        max_hold=20, lookback=lookback, cost_pct=cost_pct,
+    )
+
+    results: dict[str, BacktestResult] = {}
+    for j, code in enumerate(panel.codes):
+        name = meta[code].get("name") or code
+        trades = [
+            BacktestTrade(
+                ticker=code, name=name,
+                entry_date=panel.dates[pt.entry_row],
+                entry_price=round(pt.entry_price, 0),
+                exit_date=panel.dates[pt.exit_row],
+                exit_price=round(pt.exit_price, 0),
+                pnl_pct=round(pt.pnl_pct, 2),
+                holding_days=pt.holding_days,
+                signal_score=0,
+            )
+            for pt in sim.trades[j]
+        ]
+        results[code] = _summarize_trades(code, name, period, usable[code], trades, costs)
+    return results
+
+
+def run_backtest(
+    code: str,
+    name: str = "",
+    market: str = "KOSPI",
+    period: str = "1y",
+    target_pct: float = 3.0,
+    stop_pct: float = -5.0,
+    lookback: int = 60,
+    costs: TradeCosts | None = None,
+) -> BacktestResult | None:
+    """Run backtest for a single ticker.
+
+    Downloads historical data, applies scoring at each point,
+    and simulates trades based on BUY signals.
+
+    Args:
+        code: Stock code (e.g., "005930")
+        name: Stock name
+        market: KOSPI or KOSDAQ
+        period: yfinance period string (e.g., "1y", "2y")
+        target_pct: Take-profit percentage
+        stop_pct: Stop-loss percentage (negative)
+        lookback: Minimum bars needed for indicators
+    """
+    results = run_backtest_panel(
+        [{"code": code, "name": name or code, "market": market}],
+        period=period, target_pct=target_pct, stop_pct=stop_pct,
+        lookback=lookback, costs=costs,
+    )
+    return results.get(code)
+
+
 def format_backtest_result(result: BacktestResult) -> str:
     """Format backtest result for Telegram display."""
     if result.total_trades == 0:
@@ -381,15 +429,11 @@ def run_portfolio_backtest(
     total_cost = 0.0
     total_holding_days = 0
 
+    results = run_backtest_panel(tickers, period=period, costs=costs)
+
     for t in tickers:
         weight = t.get("weight", 1.0 / len(tickers)) / total_weight
-        result = run_backtest(
-            code=t["code"],
-            name=t.get("name", t["code"]),
-            market=t.get("market", "KOSPI"),
-            period=period,
-            costs=costs,
-        )
+        result = results.get(t["code"])
         if result is None:
             continue
         per_stock.append(result)
@@ -0,0 +1,240 @@
+"""Panel (dates × tickers) backtest kernel.
+
+Loads aligned OHLCV for N tickers into 2-D NumPy arrays and runs the
+entry → target/stop/max-hold exit state machine for every ticker at once,
+stepping through dates with vectorized per-ticker state instead of looping
+ticker by ticker and bar by bar in Python.
+
+Semantics match the single-ticker loop in ``engine.run_backtest``: each
+ticker counts its *own* bars (missing rows for halts/new listings are
+skipped), entries fill at the next bar's close, an exit bar cannot re-enter,
+and open trades are closed on the ticker's last bar.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OHLCVPanel:
+    """Date-aligned OHLCV arrays, shape (n_dates, n_tickers), NaN = no bar."""
+
+    dates: np.ndarray
+    codes: list[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~np.isnan(self.close)
+
+    def frame(self, j: int) -> pd.DataFrame:
+        """Ticker j's own bars as the flat frame compute_indicators expects."""
+        rows = np.flatnonzero(self.valid[:, j])
+        return pd.DataFrame({
+            "date": self.dates[rows],
+            "open": self.open[rows, j],
+            "high": self.high[rows, j],
+            "low": self.low[rows, j],
+            "close": self.close[rows, j],
+            "volume": self.volume[rows, j].astype(int),
+        }).reset_index(drop=True)
+
+
+@dataclass
+class PanelTrade:
+    """Raw trade produced by simulate_exits (row indices into the panel)."""
+
+    col: int
+    entry_row: int
+    exit_row: int
+    entry_price: float
+    exit_price: float
+    pnl_pct: float
+    holding_days: int
+
+
+@dataclass
+class PanelSimulation:
+    """simulate_exits output: trades grouped by ticker column."""
+
+    trades: dict[int, list[PanelTrade]] = field(default_factory=dict)
+
+
+def build_panel(frames: dict[str, pd.DataFrame]) -> OHLCVPanel:
+    """Align per-ticker flat OHLCV frames (engine format) on the union of dates."""
+    codes = list(frames)
+    all_dates = sorted(set().union(*(f["date"] for f in frames.values()))) if frames else []
+    dates = np.array(all_dates, dtype=object)
+    row_of = {d: r for r, d in enumerate(all_dates)}
+    shape = (len(all_dates), len(codes))
+    arrays = {k: np.full(shape, np.nan) for k in ("open", "high", "low", "close", "volume")}
+    for j, code in enumerate(codes):
+        f = frames[code]
+        rows = np.fromiter((row_of[d] for d in f["date"]), dtype=np.int64, count=len(f))
+        for k, arr in arrays.items():
+            arr[rows, j] = f[k].astype(float).to_numpy()
+    return OHLCVPanel(dates=dates, codes=codes, **arrays)
+
+
+def _history_to_frame(hist: pd.DataFrame) -> pd.DataFrame:
+    hist = hist.dropna(subset=["Close"])
+    return pd.DataFrame({
+        "date": hist.index.strftime("%Y-%m-%d"),
+        "open": hist["Open"].values,
+        "high": hist["High"].values,
+        "low": hist["Low"].values,
+        "close": hist["Close"].values,
+        "volume": hist["Volume"].fillna(0).astype(int).values,
+    }).reset_index(drop=True)
+
+
+def _split_download(data: pd.DataFrame, symbols: list[str]) -> dict[str, pd.DataFrame]:
+    """Split a yf.download result into {symbol: history} (None if not keyed)."""
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data} if len(symbols) == 1 else {}
+    out: dict[str, pd.DataFrame] = {}
+    level0 = set(data.columns.get_level_values(0))
+    level1 = set(data.columns.get_level_values(1))
+    for symbol in symbols:
+        if symbol in level0:
+            out[symbol] = data[symbol]
+        elif symbol in level1:
+            out[symbol] = data.xs(symbol, axis=1, level=1)
+    return out
+
+
+def download_ohlcv(symbols: list[str], period: str = "1y") -> dict[str, pd.DataFrame]:
+    """Download OHLCV for many symbols in one yfinance batch call.
+
+    Falls back to one call per symbol when the batch result is not keyed
+    by ticker (old yfinance versions, partial failures).
+
+    Returns:
+        {symbol: flat frame with date/open/high/low/close/volume}; failed
+        or empty symbols are omitted.
+    """
+    histories: dict[str, pd.DataFrame] = {}
+    try:
+        data = yf.download(symbols, period=period, group_by="ticker", progress=False)
+        histories = _split_download(data, symbols)
+    except Exception as e:
+        logger.warning("Batch OHLCV download failed (%d symbols): %s", len(symbols), e)
+
+    for symbol in symbols:
+        if symbol in histories:
+            continue
+        try:
+            histories[symbol] = yf.download(symbol, period=period, progress=False)
+        except Exception as e:
+            logger.error("Failed to download data for %s: %s", symbol, e)
+
+    frames: dict[str, pd.DataFrame] = {}
+    for symbol, hist in histories.items():
+        try:
+            if isinstance(hist.columns, pd.MultiIndex):
+                hist = _split_download(hist, [symbol]).get(symbol, pd.DataFrame())
+            if hist is None or hist.empty:
+                continue
+            frame = _history_to_frame(hist)
+            if not frame.empty:
+                frames[symbol] = frame
+        except Exception:
+            logger.debug("download_ohlcv: parse failed for %s", symbol, exc_info=True)
+    return frames
+
+
+def simulate_exits(
+    panel: OHLCVPanel,
+    entry: np.ndarray,
+    target_pct: float = 3.0,
+    stop_pct: float = -5.0,
+    max_hold: int = 20,
+    lookback: int = 60,
+    cost_pct: float | None = None,
+) -> PanelSimulation:
+    """Run the entry/exit state machine for every ticker column at once.
+
+    Args:
+        panel: Aligned OHLCV panel.
+        entry: Bool array (n_dates, n_tickers); True = entry signal on that
+            bar (fills at the ticker's next bar close).
+        target_pct: Take-profit threshold on running pnl %.
+        stop_pct: Stop-loss threshold (negative).
+        max_hold: Exit after this many bars held.
+        lookback: Ticker bars to skip before the first signal check.
+        cost_pct: Round-trip cost in % subtracted from pnl (TradeCosts);
+            None = gross pnl.
+    """
+    close = panel.close
+    valid = panel.valid
+    n_rows, n_cols = close.shape
+    sim = PanelSimulation(trades={j: [] for j in range(n_cols)})
+    if n_rows == 0 or n_cols == 0:
+        return sim
+
+    bar = np.cumsum(valid, axis=0) - 1          # own-bar index per ticker
+    n_bars = valid.sum(axis=0)
+    # Row of each ticker's next bar: fill backwards from valid rows.
+    row_idx = np.where(valid, np.arange(n_rows)[:, None], n_rows)
+    next_row = np.minimum.accumulate(row_idx[::-1], axis=0)[::-1]
+    next_row = np.vstack([next_row[1:], np.full((1, n_cols), n_rows)])
+    last_row = np.where(n_bars > 0, n_rows - 1 - np.argmax(valid[::-1], axis=0), -1)
+
+    in_trade = np.zeros(n_cols, dtype=bool)
+    entry_price = np.zeros(n_cols)
+    entry_bar = np.zeros(n_cols, dtype=np.int64)
+    entry_row = np.zeros(n_cols, dtype=np.int64)
+    cols = np.arange(n_cols)
+
+    def _pnl(current: np.ndarray, basis: np.ndarray) -> np.ndarray:
+        pnl = (current - basis) / basis * 100
+        return pnl - cost_pct if cost_pct is not None else pnl
+
+    for t in range(n_rows):
+        active = valid[t] & (bar[t] >= lookback) & (bar[t] < n_bars - 1)
+        if not active.any():
+            continue
+        held = active & in_trade
+        if held.any():
+            current = np.where(held, close[t], 1.0)
+            pnl = _pnl(current, np.where(held, entry_price, 1.0))
+            days = bar[t] - entry_bar
+            exits = held & ((pnl >= target_pct) | (pnl <= stop_pct) | (days >= max_hold))
+            for j in np.flatnonzero(exits):
+                sim.trades[j].append(PanelTrade(
+                    col=int(j), entry_row=int(entry_row[j]), exit_row=t,
+                    entry_price=float(entry_price[j]), exit_price=float(close[t, j]),
+                    pnl_pct=float(pnl[j]), holding_days=int(days[j]),
+                ))
+            in_trade &= ~exits
+
+        enter = active & ~held & entry[t]
+        if enter.any():
+            rows = next_row[t, enter]
+            entry_row[enter] = rows
+            entry_price[enter] = close[rows, cols[enter]]
+            entry_bar[enter] = bar[t, enter] + 1
+            in_trade |= enter
+
+    for j in np.flatnonzero(in_trade):
+        r = int(last_row[j])
+        current = float(close[r, j])
+        pnl = float(_pnl(np.array([current]), np.array([entry_price[j]]))[0])
+        sim.trades[j].append(PanelTrade(
+            col=int(j), entry_row=int(entry_row[j]), exit_row=r,
+            entry_price=float(entry_price[j]), exit_price=current,
+            pnl_pct=pnl, holding_days=int(n_bars[j] - 1 - entry_bar[j]),
+        ))
+    return sim
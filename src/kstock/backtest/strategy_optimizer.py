@@ -12,8 +12,11 @@ Dependencies: numpy, scipy (scipy.stats only), pandas — no new packages.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -79,6 +82,7 @@ class MultiObjectiveResult:
     pareto_front: List[Individual] = field(default_factory=list)
     dominated: List[Individual] = field(default_factory=list)
     hypervolume: float = 0.0
+    generation_stats: List[Dict[str, float]] = field(default_factory=list)
 
 
 @dataclass
@@ -104,6 +108,8 @@ class OptimizationResult:
     convergence_history: List[float] = field(default_factory=list)
     elapsed_seconds: float = 0.0
     robustness: Optional[RobustnessResult] = None
+    # Per generation/iteration: generation, size, evaluated, cache_hits, seconds
+    generation_stats: List[Dict[str, float]] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -207,6 +213,197 @@ def _evaluate_strategy(
     return ind
 
 
+# ---------------------------------------------------------------------------
+# Pluggable fitness evaluators
+# ---------------------------------------------------------------------------
+
+
+class FitnessEvaluator:
+    """Evaluates batches of parameter sets, caching by quantized genes.
+
+    The optimizers hand a whole generation to ``evaluate`` at once so that
+    subclasses can fan it out. Parameter sets whose genes round to the same
+    values (``decimals``) are evaluated once — crossover without mutation
+    produces many such duplicates. strategy_fn must be deterministic for
+    the cache to be valid.
+    """
+
+    def __init__(
+        self,
+        ohlcv: pd.DataFrame,
+        strategy_fn: Callable,
+        decimals: int = 6,
+    ) -> None:
+        self.ohlcv = ohlcv
+        self.strategy_fn = strategy_fn
+        self.decimals = decimals
+        self.evaluations = 0
+        self.cache_hits = 0
+        self._cache: Dict[Tuple[Tuple[str, float], ...], Individual] = {}
+
+    def _key(self, params: dict) -> Tuple[Tuple[str, float], ...]:
+        return tuple((k, round(float(params[k]), self.decimals)) for k in sorted(params))
+
+    def _evaluate_many(self, params_list: List[dict]) -> List[Individual]:
+        return [_evaluate_strategy(p, self.ohlcv, self.strategy_fn) for p in params_list]
+
+    def evaluate(self, params_list: List[dict]) -> List[Individual]:
+        """Evaluate parameter sets; returns fresh Individuals in input order."""
+        keys = [self._key(p) for p in params_list]
+        pending: Dict[Tuple[Tuple[str, float], ...], dict] = {}
+        for key, params in zip(keys, params_list):
+            if key not in self._cache and key not in pending:
+                pending[key] = params
+        self.cache_hits += len(params_list) - len(pending)
+        if pending:
+            results = self._evaluate_many(list(pending.values()))
+            self.evaluations += len(results)
+            self._cache.update(zip(pending.keys(), results))
+        return [replace(self._cache[key], genes=list(params.values()))
+                for key, params in zip(keys, params_list)]
+
+    def close(self) -> None:
+        """Release resources (no-op for in-process evaluation)."""
+
+    def __enter__(self) -> "FitnessEvaluator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# Worker-process state for ProcessPoolEvaluator (set once by the initializer).
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_pool_worker(layout: dict, strategy_fn: Callable) -> None:
+    """Attach the shared OHLCV block and rebuild the DataFrame once per worker."""
+    from multiprocessing import shared_memory
+
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not transfer ownership; the parent unlinks in close().
+    shm = shared_memory.SharedMemory(name=layout["shm_name"])
+    block = np.ndarray(layout["shape"], dtype=np.float64, buffer=shm.buf)
+    frame = pd.DataFrame(block, columns=layout["numeric_columns"], index=layout["index"], copy=False)
+    for col, dtype in layout["dtypes"].items():
+        if dtype != np.float64:
+            frame[col] = frame[col].astype(dtype)
+    for col, values in layout["other_columns"].items():
+        frame[col] = values
+    _WORKER_STATE.update(
+        shm=shm,
+        ohlcv=frame[layout["column_order"]],
+        strategy_fn=strategy_fn,
+    )
+
+
+def _pool_evaluate(params: dict) -> Individual:
+    return _evaluate_strategy(params, _WORKER_STATE["ohlcv"], _WORKER_STATE["strategy_fn"])
+
+
+class ProcessPoolEvaluator(FitnessEvaluator):
+    """FitnessEvaluator that fans each batch out over a ProcessPoolExecutor.
+
+    Numeric OHLCV columns are copied once into a shared-memory block that
+    every worker maps at start-up, so tasks only pickle the parameter dict.
+    strategy_fn must be picklable (module-level function) on spawn-based
+    platforms; if the pool cannot be used, evaluation falls back to the
+    calling process.
+
+    Use as a context manager so the pool and shared memory are released::
+
+        with ProcessPoolEvaluator(ohlcv, strategy_fn, max_workers=4) as ev:
+            result = optimize_genetic(ranges, ohlcv, strategy_fn, evaluator=ev)
+    """
+
+    def __init__(
+        self,
+        ohlcv: pd.DataFrame,
+        strategy_fn: Callable,
+        max_workers: Optional[int] = None,
+        decimals: int = 6,
+        start_method: Optional[str] = None,
+    ) -> None:
+        super().__init__(ohlcv, strategy_fn, decimals=decimals)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shm: Any = None
+        self._broken = False
+
+    def _start(self) -> ProcessPoolExecutor:
+        from multiprocessing import shared_memory
+
+        numeric = self.ohlcv.select_dtypes(include=[np.number])
+        block = numeric.to_numpy(dtype=np.float64)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(block.nbytes, 1))
+        np.ndarray(block.shape, dtype=np.float64, buffer=self._shm.buf)[:] = block
+        layout = {
+            "shm_name": self._shm.name,
+            "shape": block.shape,
+            "numeric_columns": list(numeric.columns),
+            "dtypes": {col: numeric[col].dtype for col in numeric.columns},
+            "other_columns": {
+                col: self.ohlcv[col].to_numpy()
+                for col in self.ohlcv.columns if col not in numeric.columns
+            },
+            "column_order": list(self.ohlcv.columns),
+            "index": self.ohlcv.index,
+        }
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_pool_worker,
+            initargs=(layout, self.strategy_fn),
+        )
+
+    def _evaluate_many(self, params_list: List[dict]) -> List[Individual]:
+        if self._broken or len(params_list) < 2:
+            return super()._evaluate_many(params_list)
+        try:
+            if self._pool is None:
+                self._pool = self._start()
+            chunksize = max(1, len(params_list) // (self.max_workers * 4))
+            return list(self._pool.map(_pool_evaluate, params_list, chunksize=chunksize))
+        except Exception as e:
+            logger.warning("Process pool evaluation failed, falling back to in-process: %s", e)
+            self._broken = True
+            self.close()
+            return super()._evaluate_many(params_list)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+
+def _evaluate_batch(
+    evaluator: FitnessEvaluator,
+    params_list: List[dict],
+    generation: int,
+    stats: List[Dict[str, float]],
+) -> List[Individual]:
+    """Evaluate one generation and append its timing/cache stats."""
+    t0 = time.time()
+    evals_before, hits_before = evaluator.evaluations, evaluator.cache_hits
+    individuals = evaluator.evaluate(params_list)
+    stats.append({
+        "generation": generation,
+        "size": len(params_list),
+        "evaluated": evaluator.evaluations - evals_before,
+        "cache_hits": evaluator.cache_hits - hits_before,
+        "seconds": round(time.time() - t0, 6),
+    })
+    return individuals
+
+
 # ---------------------------------------------------------------------------
 # Helpers — parameter encoding
 # ---------------------------------------------------------------------------
@@ -316,6 +513,7 @@ def optimize_genetic(
     strategy_fn: Callable,
     config: Optional[GAConfig] = None,
     seed: int = 42,
+    evaluator: Optional[FitnessEvaluator] = None,
 ) -> OptimizationResult:
     """Optimize strategy parameters using a Genetic Algorithm.
 
@@ -326,22 +524,27 @@ def optimize_genetic(
       - Gaussian mutation (sigma = 0.1 * range)
       - Elitism: top N preserved
       - Early stopping: 20 generations without improvement
+
+    Each generation is evaluated as one batch through ``evaluator``
+    (default: in-process FitnessEvaluator; pass a ProcessPoolEvaluator to
+    use all cores).
     """
     t0 = time.time()
     cfg = config or GAConfig()
     rng = np.random.RandomState(seed)
     names = _param_names(param_ranges)
     n_dims = len(names)
+    evaluator = evaluator or FitnessEvaluator(ohlcv, strategy_fn)
+    gen_stats: List[Dict[str, float]] = []
 
     # ---- Initial population via LHS ----
     lhs_genes = _latin_hypercube_sample(param_ranges, cfg.population_size, rng)
-    population: List[Individual] = []
-    for genes in lhs_genes:
-        params = _genes_to_params(genes, param_ranges)
-        ind = _evaluate_strategy(params, ohlcv, strategy_fn)
+    population = _evaluate_batch(
+        evaluator, [_genes_to_params(g, param_ranges) for g in lhs_genes], 0, gen_stats,
+    )
+    for ind, genes in zip(population, lhs_genes):
         ind.genes = genes
         ind.generation = 0
-        population.append(ind)
 
     convergence: List[float] = []
     best_ever_fitness = max(ind.fitness for ind in population)
@@ -368,7 +571,8 @@ def optimize_genetic(
             next_gen.append(elite_copy)
 
         # Fill rest via selection + crossover + mutation
-        while len(next_gen) < cfg.population_size:
+        children_genes: List[List[float]] = []
+        while len(next_gen) + len(children_genes) < cfg.population_size:
             # Tournament selection
             parent_a = _tournament_select(population, cfg.tournament_size, rng)
             parent_b = _tournament_select(population, cfg.tournament_size, rng)
@@ -385,9 +589,14 @@ def optimize_genetic(
             child_genes = _gaussian_mutate(
                 child_genes, param_ranges, cfg.mutation_rate, rng,
             )
-
-            params = _genes_to_params(child_genes, param_ranges)
-            child = _evaluate_strategy(params, ohlcv, strategy_fn)
+            children_genes.append(child_genes)
+
+        children = _evaluate_batch(
+            evaluator,
+            [_genes_to_params(g, param_ranges) for g in children_genes],
+            gen, gen_stats,
+        )
+        for child, child_genes in zip(children, children_genes):
             child.genes = child_genes
             child.generation = gen
             next_gen.append(child)
@@ -426,6 +635,7 @@ def optimize_genetic(
         },
         convergence_history=convergence,
         elapsed_seconds=max(time.time() - t0, 0.001),
+        generation_stats=gen_stats,
     )
 
 
@@ -496,6 +706,7 @@ def optimize_bayesian(
     strategy_fn: Callable,
     config: Optional[BayesianConfig] = None,
     seed: int = 42,
+    evaluator: Optional[FitnessEvaluator] = None,
 ) -> OptimizationResult:
     """Optimize using Bayesian Optimization with GP surrogate.
 
@@ -504,19 +715,24 @@ def optimize_bayesian(
       - Expected Improvement acquisition function
       - Sobol-like quasi-random initial points
       - Convergence: stop when EI < 1e-6
+
+    The initial design is evaluated as one batch through ``evaluator``;
+    each EI step then evaluates a single point.
     """
     t0 = time.time()
     cfg = config or BayesianConfig()
     rng = np.random.RandomState(seed)
     names = _param_names(param_ranges)
+    evaluator = evaluator or FitnessEvaluator(ohlcv, strategy_fn)
+    gen_stats: List[Dict[str, float]] = []
 
     # ---- Initial points via Sobol-like sequence ----
     initial_points = _sobol_like_sample(param_ranges, cfg.n_initial, rng)
     X_observed: List[np.ndarray] = []
     y_observed: List[float] = []
 
-    for params in initial_points:
-        ind = _evaluate_strategy(params, ohlcv, strategy_fn)
+    initial_inds = _evaluate_batch(evaluator, initial_points, 0, gen_stats)
+    for params, ind in zip(initial_points, initial_inds):
         genes = _params_to_genes(params, param_ranges)
         X_observed.append(np.array(genes))
         y_observed.append(ind.fitness)
@@ -573,7 +789,7 @@ def optimize_bayesian(
 
         # Evaluate best candidate
         params = _genes_to_params(best_candidate, param_ranges)
-        ind = _evaluate_strategy(params, ohlcv, strategy_fn)
+        ind = _evaluate_batch(evaluator, [params], iteration + 1, gen_stats)[0]
         X_observed.append(np.array(best_candidate))
         y_observed.append(ind.fitness)
         convergence.append(max(y_observed))
@@ -581,7 +797,7 @@ def optimize_bayesian(
     # Best result
     best_idx = int(np.argmax(y_observed))
     best_params = _genes_to_params(list(X_observed[best_idx]), param_ranges)
-    best_ind = _evaluate_strategy(best_params, ohlcv, strategy_fn)
+    best_ind = evaluator.evaluate([best_params])[0]
 
     return OptimizationResult(
         method="bayesian",
@@ -596,6 +812,7 @@ def optimize_bayesian(
         },
         convergence_history=convergence,
         elapsed_seconds=max(time.time() - t0, 0.001),
+        generation_stats=gen_stats,
     )
 
 
@@ -649,6 +866,7 @@ def optimize_multi_objective(
     population_size: int = 50,
     n_generations: int = 80,
     seed: int = 42,
+    evaluator: Optional[FitnessEvaluator] = None,
 ) -> MultiObjectiveResult:
     """Multi-objective optimization using NSGA-II.
 
@@ -657,12 +875,16 @@ def optimize_multi_objective(
       - Crowding distance assignment
       - Pareto front extraction
       - Hypervolume indicator computation
+
+    Offspring are evaluated one generation per batch through ``evaluator``.
     """
     if objectives is None:
         objectives = ["sharpe", "sortino", "calmar"]
 
     rng = np.random.RandomState(seed)
     names = _param_names(param_ranges)
+    evaluator = evaluator or FitnessEvaluator(ohlcv, strategy_fn)
+    gen_stats: List[Dict[str, float]] = []
 
     def _get_objectives(ind: Individual) -> List[float]:
         """Extract objective values (all maximized)."""
@@ -673,18 +895,17 @@ def optimize_multi_objective(
 
     # ---- Initial population via LHS ----
     lhs_genes = _latin_hypercube_sample(param_ranges, population_size, rng)
-    population: List[Individual] = []
-    for genes in lhs_genes:
-        params = _genes_to_params(genes, param_ranges)
-        ind = _evaluate_strategy(params, ohlcv, strategy_fn)
+    population = _evaluate_batch(
+        evaluator, [_genes_to_params(g, param_ranges) for g in lhs_genes], 0, gen_stats,
+    )
+    for ind, genes in zip(population, lhs_genes):
         ind.genes = genes
         ind.generation = 0
-        population.append(ind)
 
     for gen in range(1, n_generations + 1):
         # Generate offspring
-        offspring: List[Individual] = []
-        while len(offspring) < population_size:
+        offspring_genes: List[List[float]] = []
+        while len(offspring_genes) < population_size:
             p1 = _tournament_select(population, 3, rng)
             p2 = _tournament_select(population, 3, rng)
             if rng.random() < 0.8:
@@ -694,11 +915,16 @@ def optimize_multi_objective(
             else:
                 child_genes = list(p1.genes)
             child_genes = _gaussian_mutate(child_genes, param_ranges, 0.1, rng)
-            params = _genes_to_params(child_genes, param_ranges)
-            child = _evaluate_strategy(params, ohlcv, strategy_fn)
+            offspring_genes.append(child_genes)
+
+        offspring = _evaluate_batch(
+            evaluator,
+            [_genes_to_params(g, param_ranges) for g in offspring_genes],
+            gen, gen_stats,
+        )
+        for child, child_genes in zip(offspring, offspring_genes):
             child.genes = child_genes
             child.generation = gen
-            offspring.append(child)
 
         # Combine parent + offspring
         combined = population + offspring
@@ -739,6 +965,7 @@ def optimize_multi_objective(
         pareto_front=pareto_front,
         dominated=dominated,
         hypervolume=round(hv, 6),
+        generation_stats=gen_stats,
     )
 
 
@@ -919,6 +1146,7 @@ def test_robustness(
     strategy_fn: Callable,
     n_perturbations: int = 50,
     seed: int = 42,
+    evaluator: Optional[FitnessEvaluator] = None,
 ) -> RobustnessResult:
     """Test parameter robustness via Monte Carlo perturbation.
 
@@ -926,16 +1154,16 @@ def test_robustness(
       - Uniform +-10% perturbation of each parameter
       - Stability score = 1 - (std/mean) of Sharpe ratios
       - Per-parameter sensitivity via finite-difference partial derivatives
+
+    Base, perturbed and finite-difference points are evaluated as a single
+    batch through ``evaluator``.
     """
     rng = np.random.RandomState(seed)
     names = _param_names(param_ranges)
-
-    # Base evaluation
-    base_ind = _evaluate_strategy(params, ohlcv, strategy_fn)
-    base_sharpe = base_ind.sharpe
+    evaluator = evaluator or FitnessEvaluator(ohlcv, strategy_fn)
 
     # Monte Carlo perturbation
-    perturbed_sharpes: List[float] = []
+    perturbed_params: List[dict] = []
     for _ in range(n_perturbations):
         perturbed = {}
         for name in names:
@@ -945,9 +1173,27 @@ def test_robustness(
             new_val = base_val + rng.uniform(-delta, delta)
             new_val = float(np.clip(new_val, lo, hi))
             perturbed[name] = new_val
+        perturbed_params.append(perturbed)
+
+    # Finite-difference points: f(x + h), f(x - h) per parameter
+    fd_names: List[str] = []
+    fd_params: List[dict] = []
+    for name in names:
+        lo, hi = param_ranges[name]
+        h = 0.01 * (hi - lo)
+        if h < 1e-12:
+            continue
+        params_plus = dict(params)
+        params_plus[name] = float(np.clip(params[name] + h, lo, hi))
+        params_minus = dict(params)
+        params_minus[name] = float(np.clip(params[name] - h, lo, hi))
+        fd_names.append(name)
+        fd_params.extend([params_plus, params_minus])
 
-        ind = _evaluate_strategy(perturbed, ohlcv, strategy_fn)
-        perturbed_sharpes.append(ind.sharpe)
+    results = evaluator.evaluate([params] + perturbed_params + fd_params)
+    base_sharpe = results[0].sharpe
+    perturbed_sharpes = [ind.sharpe for ind in results[1:1 + n_perturbations]]
+    fd_results = results[1 + n_perturbations:]
 
     # Stability score
     sharpe_arr = np.array(perturbed_sharpes)
@@ -961,24 +1207,10 @@ def test_robustness(
     worst_case = float(np.min(sharpe_arr)) if len(sharpe_arr) > 0 else 0.0
 
     # Parameter sensitivity: partial derivative via central finite difference
-    sensitivity: Dict[str, float] = {}
-    for name in names:
-        lo, hi = param_ranges[name]
-        h = 0.01 * (hi - lo)
-        if h < 1e-12:
-            sensitivity[name] = 0.0
-            continue
-
-        # f(x + h)
-        params_plus = dict(params)
-        params_plus[name] = float(np.clip(params[name] + h, lo, hi))
-        ind_plus = _evaluate_strategy(params_plus, ohlcv, strategy_fn)
-
-        # f(x - h)
-        params_minus = dict(params)
-        params_minus[name] = float(np.clip(params[name] - h, lo, hi))
-        ind_minus = _evaluate_strategy(params_minus, ohlcv, strategy_fn)
-
+    sensitivity: Dict[str, float] = {name: 0.0 for name in names}
+    for k, name in enumerate(fd_names):
+        params_plus, params_minus = fd_params[2 * k], fd_params[2 * k + 1]
+        ind_plus, ind_minus = fd_results[2 * k], fd_results[2 * k + 1]
         actual_h = params_plus[name] - params_minus[name]
         if abs(actual_h) > 1e-12:
             deriv = (ind_plus.sharpe - ind_minus.sharpe) / actual_h
@@ -22,8 +22,9 @@ from typing import Any
 
 import httpx
 
+from kstock.bot.response_cache import AIResponseCache, get_response_cache, response_cache_key
 from kstock.core.budget_manager import get_global_budget_limits
-from kstock.core.token_tracker import get_db, track_usage_global
+from kstock.core.token_tracker import calculate_cost, get_db, track_usage_global
 
 logger = logging.getLogger(__name__)
 
@@ -244,6 +245,8 @@ class AIRouter:
         # [v3.6.4] Prompt Caching 통계
         self._cache_hits: int = 0
         self._cache_tokens_saved: int = 0
+        # v14: 응답 캐시 (첫 사용 시 프로세스 공용 캐시에 연결)
+        self._response_cache: AIResponseCache | None = None
         self._daily_soft_budget_usd = self._load_budget_limit(
             "AI_DAILY_SOFT_BUDGET_USD", 1.5,
         )
@@ -319,6 +322,8 @@ class AIRouter:
         max_tokens: int = 1000,
         temperature: float = 0.3,
         response_format: str = "text",  # "text" or "json"
+        data_version: str = "",
+        use_cache: bool = True,
     ) -> str:
         """태스크에 맞는 AI로 분석 실행.
 
@@ -329,6 +334,8 @@ class AIRouter:
             max_tokens: 최대 토큰
             temperature: 창의성 (0~1)
             response_format: 응답 형식
+            data_version: 데이터 스냅샷 태그 (바뀌면 캐시 키도 바뀜)
+            use_cache: False면 응답 캐시/합류를 건너뛴다
 
         Returns:
             AI 응답 텍스트
@@ -345,6 +352,46 @@ class AIRouter:
             task, provider_name, model_tier, max_tokens,
         )
 
+        async def _call() -> tuple[str, float]:
+            meter: dict[str, float] = {}
+            result = await self._dispatch(
+                task, provider_name, fallback, model_tier, prompt,
+                system=system, max_tokens=max_tokens,
+                temperature=temperature, response_format=response_format,
+                meter=meter,
+            )
+            return result, meter.get("cost_usd", 0.0)
+
+        if not use_cache:
+            return (await _call())[0]
+        key = response_cache_key(
+            task, f"{provider_name}/{model_tier}", system, prompt,
+            data_version=data_version,
+            params=(max_tokens, round(temperature, 3), response_format),
+        )
+        return await self.response_cache.get_or_call(key, task, _call)
+
+    @property
+    def response_cache(self) -> AIResponseCache:
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
+    async def _dispatch(
+        self,
+        task: str,
+        provider_name: str,
+        fallback: str | None,
+        model_tier: str,
+        prompt: str,
+        *,
+        system: str,
+        max_tokens: int,
+        temperature: float,
+        response_format: str,
+        meter: dict[str, float],
+    ) -> str:
+        """지정 → fallback → 사용 가능한 아무 프로바이더 순으로 호출."""
         # 1차: 지정된 프로바이더
         provider = self.providers.get(provider_name)
         if provider and provider.available:
@@ -353,6 +400,7 @@ class AIRouter:
                     provider_name, model_tier, prompt, task=task,
                     system=system, max_tokens=max_tokens,
                     temperature=temperature, response_format=response_format,
+                    meter=meter,
                 )
                 if result:
                     return result
@@ -370,6 +418,7 @@ class AIRouter:
                         fallback, model_tier, prompt, task=task,
                         system=system, max_tokens=max_tokens,
                         temperature=temperature, response_format=response_format,
+                        meter=meter,
                     )
                     if result:
                         return result
@@ -385,6 +434,7 @@ class AIRouter:
                         name, model_tier, prompt, task=task,
                         system=system, max_tokens=max_tokens,
                         temperature=temperature, response_format=response_format,
+                        meter=meter,
                     )
                 except Exception as e:
                     logger.warning("AI %s last-resort fallback failed for task: %s", name, e)
@@ -405,8 +455,9 @@ class AIRouter:
         max_tokens: int = 1000,
         temperature: float = 0.3,
         response_format: str = "text",
+        meter: dict[str, float] | None = None,
     ) -> str:
-        """프로바이더별 API 호출."""
+        """프로바이더별 API 호출 (meter 가 있으면 비용 USD 누적)."""
         provider = self.providers[provider_name]
         model = provider.models.get(model_tier, list(provider.models.values())[0])
 
@@ -437,6 +488,14 @@ class AIRouter:
             stats.calls += 1
             stats.total_latency_ms += elapsed
             self._track_usage(provider_name, model, task, usage, elapsed)
+            if meter is not None and usage:
+                meter["cost_usd"] = meter.get("cost_usd", 0.0) + calculate_cost(
+                    model,
+                    input_tokens=usage.get("input_tokens", 0),
+                    output_tokens=usage.get("output_tokens", 0),
+                    cache_read_tokens=usage.get("cache_read_tokens", 0),
+                    cache_write_tokens=usage.get("cache_write_tokens", 0),
+                )
             logger.debug(
                 "AI %s/%s responded in %.0fms (%d chars)",
                 provider_name, model, elapsed, len(result),
@@ -814,6 +873,12 @@ class AIRouter:
             lines.append(f"\n🗄 캐시 히트: {self._cache_hits}회 | 절감 토큰: {self._cache_tokens_saved:,}")
             lines.append(f"   예상 절감: ~${saved_cost:.4f}")
 
+        # v14: 응답 캐시 적중률 / 절감 지연·비용
+        if self._response_cache is not None:
+            cache_line = self._response_cache.format_status()
+            if cache_line:
+                lines.append("\n" + cache_line)
+
         return "\n".join(lines)
 
     def get_routing_table(self) -> str:
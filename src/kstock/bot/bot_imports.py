@@ -72,6 +72,7 @@ from kstock.features.sector import (
 from kstock.ingest.kis_client import KISClient, StockInfo
 from kstock.ingest.macro_client import MacroClient, MacroSnapshot
 from kstock.ingest.yfinance_kr_client import YFinanceKRClient
+from kstock.ingest.ohlcv_cache import get_ohlcv_cache, tail_period
 from kstock.signal.scoring import (
     FlowData,
     ScoreBreakdown,
@@ -247,6 +248,8 @@ logger = logging.getLogger(__name__)
 # v3.6 imports
 from kstock.bot.ai_router import AIRouter
 from kstock.ingest.kis_websocket import KISWebSocket
+from kstock.ingest.bar_aggregator import BarAggregator
+from kstock.store.parquet_store import IntradayBarStore
 from kstock.core.security import startup_security_check, security_audit, mask_key
 from kstock.core.tz import KST
 
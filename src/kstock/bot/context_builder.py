@@ -15,9 +15,15 @@ Rules:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from typing import Any, Callable, Hashable
 
 from kstock.core.tz import KST, US_EASTERN
 
@@ -813,199 +819,409 @@ def get_financial_context(db) -> str:
         return "재무 데이터 조회 실패"
 
 
-async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -> dict:
-    """Build context with live macro data from MacroClient (async).
+# ── v14: 섹션별 메모이즈 컨텍스트 캐시 ─────────────────────────────────
+# 채팅 메시지/매니저 브리핑마다 모든 섹션을 DB에서 다시 만들지 않도록
+# 섹션마다 TTL과 무효화 키(보유종목 버전, 매크로 스냅샷 시각 등)를 두고,
+# 만료됐거나 키가 바뀐 섹션만 다시 만든다.  섹션 문자열이 바뀌지 않으면
+# 시스템 프롬프트도 바이트 단위로 같아 Claude 프롬프트 캐시가 맞는다.
+
+SECTION_TTL_SECONDS: dict[str, float] = {
+    "portfolio": 600,
+    "portfolio_solutions": 300,
+    "holdings_signals": 300,
+    "realtime": 60,
+    "financials": 1800,
+    "market": 300,
+    "macro_extras": 300,
+    "korea_risk": 300,
+    "sector_rankings": 300,
+    "crisis": 1800,
+    "post_war_rotation": 3600,
+    "recommendations": 300,
+    "policies": 3600,
+    "reports": 1800,
+    "investor_style": 3600,
+    "trade_lessons": 1800,
+    "global_news": 120,
+    "youtube_intel": 300,
+    "recent_briefing": 120,
+    "manager_stances": 300,
+    "multi_agent": 300,
+    "learning": 900,
+    "sector_intelligence": 900,
+    "portfolio_summary": 600,
+}
+_DEFAULT_SECTION_TTL = 300.0
+
+
+def _estimate_tokens(text: str) -> int:
+    """대략적 토큰 수 (ASCII 4자 ≈ 1토큰, 한글 등 비ASCII 1.5자 ≈ 1토큰)."""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return int(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5 + 0.5)
+
+
+@dataclass
+class _CachedSection:
+    value: Any
+    key: Hashable
+    built_at: float  # time.monotonic()
+
+
+@dataclass
+class SectionStats:
+    """섹션별 빌드 통계."""
+
+    builds: int = 0
+    hits: int = 0
+    failures: int = 0
+    total_ms: float = 0.0
+    last_ms: float = 0.0
+    chars: int = 0
+    tokens: int = 0
+
+
+class ContextSectionCache:
+    """AI 컨텍스트 섹션 캐시 (스레드 안전).
+
+    ``(섹션, db)`` 마다 마지막 결과와 무효화 키를 보관한다.  TTL 안이고
+    키가 같으면 저장된 문자열을 그대로 돌려주고, 아니면 빌더를 다시 부른다.
+    빌더 예외는 캐시하지 않고 호출 측으로 올린다.
+    """
 
-    This is the preferred method - fetches real-time market data
-    from the 3-tier cache (memory -> SQLite -> yfinance).
+    def __init__(self, ttls: dict[str, float] | None = None) -> None:
+        self.ttls = dict(SECTION_TTL_SECONDS if ttls is None else ttls)
+        self._entries: dict[tuple[str, int], _CachedSection] = {}
+        self._stats: dict[str, SectionStats] = {}
+        self._lock = threading.Lock()
+
+    def _ttl(self, name: str) -> float:
+        return self.ttls.get(name, _DEFAULT_SECTION_TTL)
+
+    def lookup(self, name: str, db, key: Hashable = None) -> Any:
+        """신선한 캐시 값 (없으면 None)."""
+        with self._lock:
+            entry = self._entries.get((name, id(db)))
+            if (
+                entry is not None
+                and entry.key == key
+                and time.monotonic() - entry.built_at < self._ttl(name)
+            ):
+                self._stats.setdefault(name, SectionStats()).hits += 1
+                return entry.value
+        return None
+
+    def store(self, name: str, db, key: Hashable, value: Any, elapsed_ms: float) -> None:
+        with self._lock:
+            self._entries[(name, id(db))] = _CachedSection(value, key, time.monotonic())
+            st = self._stats.setdefault(name, SectionStats())
+            st.builds += 1
+            st.total_ms += elapsed_ms
+            st.last_ms = elapsed_ms
+            if isinstance(value, str):
+                st.chars = len(value)
+                st.tokens = _estimate_tokens(value)
+
+    def _record_failure(self, name: str) -> None:
+        with self._lock:
+            self._stats.setdefault(name, SectionStats()).failures += 1
+
+    def get(self, name: str, db, key: Hashable, builder: Callable[..., Any], *args) -> Any:
+        """동기 조회: 캐시 미스면 현재 스레드에서 빌드."""
+        cached = self.lookup(name, db, key)
+        if cached is not None:
+            return cached
+        t0 = time.perf_counter()
+        try:
+            value = builder(*args)
+        except Exception:
+            self._record_failure(name)
+            raise
+        self.store(name, db, key, value, (time.perf_counter() - t0) * 1000)
+        return value
+
+    async def aget(self, name: str, db, key: Hashable, builder: Callable[..., Any], *args) -> Any:
+        """비동기 조회: 동기 빌더는 executor에서, 코루틴 빌더는 그대로 await."""
+        cached = self.lookup(name, db, key)
+        if cached is not None:
+            return cached
+        t0 = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(builder):
+                value = await builder(*args)
+            else:
+                loop = asyncio.get_running_loop()
+                value = await loop.run_in_executor(None, builder, *args)
+        except Exception:
+            self._record_failure(name)
+            raise
+        self.store(name, db, key, value, (time.perf_counter() - t0) * 1000)
+        return value
+
+    def invalidate(self, *names: str) -> None:
+        """섹션 무효화 (이름 없으면 전체)."""
+        with self._lock:
+            if not names:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] in names]:
+                del self._entries[key]
+
+    def reset(self) -> None:
+        """캐시와 통계 모두 비우기."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def report(self) -> list[dict]:
+        """섹션별 빌드 횟수/히트/평균·최근 빌드 시간/크기 (총 빌드 시간 순)."""
+        with self._lock:
+            rows = [
+                {
+                    "section": name,
+                    "builds": st.builds,
+                    "hits": st.hits,
+                    "failures": st.failures,
+                    "hit_rate": st.hits / (st.hits + st.builds) if st.hits + st.builds else 0.0,
+                    "avg_ms": st.total_ms / st.builds if st.builds else 0.0,
+                    "last_ms": st.last_ms,
+                    "total_ms": st.total_ms,
+                    "chars": st.chars,
+                    "tokens": st.tokens,
+                }
+                for name, st in self._stats.items()
+            ]
+        rows.sort(key=lambda r: -r["total_ms"])
+        return rows
+
+    def format_report(self, limit: int = 15) -> str:
+        """report()를 텔레그램/로그용 텍스트로."""
+        rows = self.report()
+        if not rows:
+            return "컨텍스트 섹션 통계 없음"
+        lines = ["[컨텍스트 섹션 통계] 섹션 | 빌드/히트 | 평균·최근 ms | 토큰"]
+        for r in rows[:limit]:
+            lines.append(
+                f"- {r['section']}: {r['builds']}/{r['hits']} "
+                f"({r['hit_rate']:.0%}) | {r['avg_ms']:.0f}·{r['last_ms']:.0f}ms "
+                f"| ~{r['tokens']:,}"
+            )
+        total_tokens = sum(r["tokens"] for r in rows)
+        lines.append(f"합계 ~{total_tokens:,} 토큰")
+        return "\n".join(lines)
 
-    Args:
-        db: SQLiteStore instance for data access.
-        macro_client: MacroClient instance for live market data.
-        yf_client: YFinanceKRClient instance for real-time stock prices.
 
-    Returns:
-        Dict with all context sections populated with live data.
+_section_cache: ContextSectionCache | None = None
+
+
+def get_context_cache() -> ContextSectionCache:
+    """프로세스 공용 컨텍스트 섹션 캐시."""
+    global _section_cache
+    if _section_cache is None:
+        _section_cache = ContextSectionCache()
+    return _section_cache
+
+
+def _holdings_version(db) -> tuple:
+    """보유종목 버전 키 — 종목/수량/매수가/현재가/보유유형이 바뀌면 달라진다."""
+    try:
+        holdings = db.get_active_holdings() or []
+    except Exception:
+        logger.debug("holdings version failed", exc_info=True)
+        return ()
+    return tuple(
+        (
+            h.get("id"), h.get("ticker"), h.get("quantity"), h.get("buy_price"),
+            h.get("current_price"), h.get("holding_type"),
+        )
+        for h in holdings
+    )
+
+
+def _macro_version(snap, macro_dict: dict | None) -> Hashable:
+    """매크로 스냅샷 키 — fetched_at 이 있으면 그 시각, 없으면 값 자체."""
+    if macro_dict is None:
+        return None
+    fetched_at = getattr(snap, "fetched_at", None)
+    if fetched_at is not None:
+        return str(fetched_at)
+    return repr(sorted(macro_dict.items()))
+
+
+def _crisis_config_path() -> str:
+    return os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "config", "crisis_events.yaml"
+    )
+
+
+def _crisis_version(macro_dict: dict | None) -> Hashable:
+    """위기 섹션 키 — 위기 수준 판단에 쓰는 세 값 + crisis_events.yaml 수정 시각."""
+    try:
+        mtime = os.path.getmtime(_crisis_config_path())
+    except OSError:
+        mtime = 0.0
+    if not macro_dict:
+        return (mtime, None)
+    return (
+        mtime,
+        macro_dict.get("vix", 0),
+        macro_dict.get("usdkrw", 0),
+        macro_dict.get("fear_greed", 50),
+    )
+
+
+async def _gather_sections(db, specs: dict[str, tuple]) -> dict[str, str]:
+    """``{결과키: (섹션, 무효화키, 빌더, *args)}`` 를 캐시 경유로 병렬 수집.
+
+    v9.6.3: 개별 섹션 실패 시 빈 문자열.
     """
-    # Fetch macro snapshot from cache (instant if cached)
-    macro_dict = None
-    if macro_client:
-        try:
-            snap = await macro_client.get_snapshot()
-            macro_dict = {
-                "sp500": getattr(snap, "spx_change_pct", 0),
-                "nasdaq": getattr(snap, "nasdaq_change_pct", 0),
-                "vix": getattr(snap, "vix", 0),
-                "usdkrw": getattr(snap, "usdkrw", 0),
-                "btc_price": getattr(snap, "btc_price", 0),
-                "gold_price": getattr(snap, "gold_price", 0),
-                "us10y": getattr(snap, "us10y", 0),
-                "us2y": getattr(snap, "us2y", 0),  # [v3.6.6] 유동성 감지
-                "dxy": getattr(snap, "dxy", 0),
-                "fear_greed": getattr(snap, "fear_greed_score", 50),
-                # v6.1.3: 한국 시장 지수
-                "kospi": getattr(snap, "kospi", 0),
-                "kospi_change_pct": getattr(snap, "kospi_change_pct", 0),
-                "kosdaq": getattr(snap, "kosdaq", 0),
-                "kosdaq_change_pct": getattr(snap, "kosdaq_change_pct", 0),
-                # v6.6: 미국 레버리지 ETF
-                "koru_price": getattr(snap, "koru_price", 0),
-                "koru_change_pct": getattr(snap, "koru_change_pct", 0),
-                "soxl_price": getattr(snap, "soxl_price", 0),
-                "soxl_change_pct": getattr(snap, "soxl_change_pct", 0),
-                "tqqq_price": getattr(snap, "tqqq_price", 0),
-                "tqqq_change_pct": getattr(snap, "tqqq_change_pct", 0),
-                # v9.0: 선물지수
-                "es_futures": getattr(snap, "es_futures", 0),
-                "es_futures_change_pct": getattr(snap, "es_futures_change_pct", 0),
-                "nq_futures": getattr(snap, "nq_futures", 0),
-                "nq_futures_change_pct": getattr(snap, "nq_futures_change_pct", 0),
-                # v9.0: 변동성 레짐
-                "korean_vol": getattr(snap, "korean_vol", 0),
-                "vol_regime": getattr(snap, "vol_regime", ""),
-                # v10.2: 유가/원자재
-                "wti_price": getattr(snap, "wti_price", 0),
-                "wti_change_pct": getattr(snap, "wti_change_pct", 0),
-                "brent_price": getattr(snap, "brent_price", 0),
-                "brent_change_pct": getattr(snap, "brent_change_pct", 0),
-                "natural_gas_price": getattr(snap, "natural_gas_price", 0),
-                "natural_gas_change_pct": getattr(snap, "natural_gas_change_pct", 0),
+    cache = get_context_cache()
+    names = list(specs)
+    results = await asyncio.gather(
+        *(cache.aget(spec[0], db, spec[1], *spec[2:]) for spec in specs.values()),
+        return_exceptions=True,
+    )
+    out: dict[str, str] = {}
+    for name, val in zip(names, results):
+        if isinstance(val, BaseException):
+            logger.warning("Context %s failed: %s", name, val)
+            val = ""
+        out[name] = val
+    return out
+
+
+def _snapshot_to_macro_dict(snap) -> dict:
+    """MacroSnapshot → 컨텍스트용 매크로 dict."""
+    return {
+        "sp500": getattr(snap, "spx_change_pct", 0),
+        "nasdaq": getattr(snap, "nasdaq_change_pct", 0),
+        "vix": getattr(snap, "vix", 0),
+        "usdkrw": getattr(snap, "usdkrw", 0),
+        "btc_price": getattr(snap, "btc_price", 0),
+        "gold_price": getattr(snap, "gold_price", 0),
+        "us10y": getattr(snap, "us10y", 0),
+        "us2y": getattr(snap, "us2y", 0),  # [v3.6.6] 유동성 감지
+        "dxy": getattr(snap, "dxy", 0),
+        "fear_greed": getattr(snap, "fear_greed_score", 50),
+        # v6.1.3: 한국 시장 지수
+        "kospi": getattr(snap, "kospi", 0),
+        "kospi_change_pct": getattr(snap, "kospi_change_pct", 0),
+        "kosdaq": getattr(snap, "kosdaq", 0),
+        "kosdaq_change_pct": getattr(snap, "kosdaq_change_pct", 0),
+        # v6.6: 미국 레버리지 ETF
+        "koru_price": getattr(snap, "koru_price", 0),
+        "koru_change_pct": getattr(snap, "koru_change_pct", 0),
+        "soxl_price": getattr(snap, "soxl_price", 0),
+        "soxl_change_pct": getattr(snap, "soxl_change_pct", 0),
+        "tqqq_price": getattr(snap, "tqqq_price", 0),
+        "tqqq_change_pct": getattr(snap, "tqqq_change_pct", 0),
+        # v9.0: 선물지수
+        "es_futures": getattr(snap, "es_futures", 0),
+        "es_futures_change_pct": getattr(snap, "es_futures_change_pct", 0),
+        "nq_futures": getattr(snap, "nq_futures", 0),
+        "nq_futures_change_pct": getattr(snap, "nq_futures_change_pct", 0),
+        # v9.0: 변동성 레짐
+        "korean_vol": getattr(snap, "korean_vol", 0),
+        "vol_regime": getattr(snap, "vol_regime", ""),
+        # v10.2: 유가/원자재
+        "wti_price": getattr(snap, "wti_price", 0),
+        "wti_change_pct": getattr(snap, "wti_change_pct", 0),
+        "brent_price": getattr(snap, "brent_price", 0),
+        "brent_change_pct": getattr(snap, "brent_change_pct", 0),
+        "natural_gas_price": getattr(snap, "natural_gas_price", 0),
+        "natural_gas_change_pct": getattr(snap, "natural_gas_change_pct", 0),
+    }
+
+
+def _get_macro_extras(db) -> dict:
+    """매크로 dict에 덧붙이는 DB 지표 (프로그램매매/신용/ETF/유가/레짐)."""
+    extras: dict = {}
+    # v9.0: 프로그램 매매 데이터 추가
+    try:
+        prog_data = db.get_program_trading(days=1, market="KOSPI")
+        if prog_data:
+            extras["program_trading"] = prog_data[0]
+    except Exception:
+        logger.debug("program_trading context failed", exc_info=True)
+    # v9.0: 신용잔고 데이터 추가
+    try:
+        cred_data = db.get_credit_balance(days=1)
+        if cred_data:
+            extras["credit_balance"] = cred_data[0]
+    except Exception:
+        logger.debug("credit_balance context failed", exc_info=True)
+    # v9.0: ETF 자금흐름 데이터 추가
+    try:
+        etf_data = db.get_etf_flow(days=1)
+        if etf_data:
+            lev_total = sum(d["market_cap"] for d in etf_data if d.get("etf_type") == "leverage")
+            inv_total = sum(d["market_cap"] for d in etf_data if d.get("etf_type") == "inverse")
+            extras["etf_flow"] = {
+                "leverage_total": lev_total,
+                "inverse_total": inv_total,
             }
-            # v9.0: 프로그램 매매 데이터 추가
-            try:
-                prog_data = db.get_program_trading(days=1, market="KOSPI")
-                if prog_data:
-                    macro_dict["program_trading"] = prog_data[0]
-            except Exception:
-                logger.debug("program_trading context failed", exc_info=True)
-            # v9.0: 신용잔고 데이터 추가
-            try:
-                cred_data = db.get_credit_balance(days=1)
-                if cred_data:
-                    macro_dict["credit_balance"] = cred_data[0]
-            except Exception:
-                logger.debug("credit_balance context failed", exc_info=True)
-            # v9.0: ETF 자금흐름 데이터 추가
+    except Exception:
+        logger.debug("etf_flow context failed", exc_info=True)
+    # v10.2: 유가 분석 컨텍스트 (DB에서 최신 분석 결과 조회)
+    try:
+        oil_rows = db.get_oil_analysis(days=1)
+        if oil_rows:
+            oil = oil_rows[0]
+            regime = oil.get("regime", "neutral")
+            regime_kr = {"bull": "상승", "bear": "하락", "neutral": "횡보", "spike": "급등", "crash": "급락"}
+            oil_lines = [
+                f"유가 레짐: {regime_kr.get(regime, regime)} (강도 {oil.get('regime_strength', 0):.0%})",
+                f"변동성(20일): {oil.get('wti_volatility_20d', 0):.1f}%",
+                f"52주 위치: {oil.get('wti_position_52w', 0):.0%}",
+            ]
+            geo = oil.get("geopolitical_risk", "낮음")
+            if geo != "낮음":
+                oil_lines.append(f"지정학 리스크: {geo}")
             try:
-                etf_data = db.get_etf_flow(days=1)
-                if etf_data:
-                    lev_total = sum(d["market_cap"] for d in etf_data if d.get("etf_type") == "leverage")
-                    inv_total = sum(d["market_cap"] for d in etf_data if d.get("etf_type") == "inverse")
-                    macro_dict["etf_flow"] = {
-                        "leverage_total": lev_total,
-                        "inverse_total": inv_total,
-                    }
+                sigs = json.loads(oil.get("signals_json", "[]"))
+                for sig in sigs[:2]:
+                    oil_lines.append(f"시그널: {sig.get('description', '')}")
             except Exception:
-                logger.debug("etf_flow context failed", exc_info=True)
-            # v10.2: 유가 분석 컨텍스트 (DB에서 최신 분석 결과 조회)
+                pass
+            extras["oil_analysis_context"] = "\n".join(oil_lines)
+    except Exception:
+        logger.debug("oil_analysis context failed", exc_info=True)
+
+    # ── [v12.2] 시장 레짐 컨텍스트 ──
+    try:
+        regime_rows = db.get_market_regime(days=1)
+        if regime_rows:
+            rr = regime_rows[0]
+            regime_lines = []
+            _regime_emoji = {"strong_bull": "🟢🟢", "bull": "🟢", "neutral": "⚪",
+                             "bear": "🔴", "crash": "🔴🔴"}
+            regime_lines.append(f"현재 레짐: {_regime_emoji.get(rr.get('regime', ''), '')} {rr.get('regime', 'neutral')}")
+            regime_lines.append(f"레짐 점수: {rr.get('raw_score', 0):.1f} / 신뢰도: {rr.get('confidence', 0):.0%}")
+            regime_lines.append(f"지속일수: {rr.get('duration_days', 1)}일 / 전환확률: {rr.get('transition_prob', 0):.0%}")
+            if rr.get("description"):
+                regime_lines.append(f"설명: {rr['description']}")
             try:
-                oil_rows = db.get_oil_analysis(days=1)
-                if oil_rows:
-                    oil = oil_rows[0]
-                    regime = oil.get("regime", "neutral")
-                    regime_kr = {"bull": "상승", "bear": "하락", "neutral": "횡보", "spike": "급등", "crash": "급락"}
-                    oil_lines = [
-                        f"유가 레짐: {regime_kr.get(regime, regime)} (강도 {oil.get('regime_strength', 0):.0%})",
-                        f"변동성(20일): {oil.get('wti_volatility_20d', 0):.1f}%",
-                        f"52주 위치: {oil.get('wti_position_52w', 0):.0%}",
-                    ]
-                    geo = oil.get("geopolitical_risk", "낮음")
-                    if geo != "낮음":
-                        oil_lines.append(f"지정학 리스크: {geo}")
-                    import json as _json
-                    try:
-                        sigs = _json.loads(oil.get("signals_json", "[]"))
-                        for sig in sigs[:2]:
-                            oil_lines.append(f"시그널: {sig.get('description', '')}")
-                    except Exception:
-                        pass
-                    macro_dict["oil_analysis_context"] = "\n".join(oil_lines)
+                sigs = json.loads(rr.get("signals_json", "[]"))
+                for sig in sigs[:3]:
+                    regime_lines.append(f"시그널: {sig.get('description', '')}")
             except Exception:
-                logger.debug("oil_analysis context failed", exc_info=True)
-
-            # ── [v12.2] 시장 레짐 컨텍스트 ──
+                pass
             try:
-                regime_rows = db.get_market_regime(days=1)
-                if regime_rows:
-                    rr = regime_rows[0]
-                    import json as _rjson
-                    regime_lines = []
-                    _regime_emoji = {"strong_bull": "🟢🟢", "bull": "🟢", "neutral": "⚪",
-                                     "bear": "🔴", "crash": "🔴🔴"}
-                    regime_lines.append(f"현재 레짐: {_regime_emoji.get(rr.get('regime', ''), '')} {rr.get('regime', 'neutral')}")
-                    regime_lines.append(f"레짐 점수: {rr.get('raw_score', 0):.1f} / 신뢰도: {rr.get('confidence', 0):.0%}")
-                    regime_lines.append(f"지속일수: {rr.get('duration_days', 1)}일 / 전환확률: {rr.get('transition_prob', 0):.0%}")
-                    if rr.get("description"):
-                        regime_lines.append(f"설명: {rr['description']}")
-                    try:
-                        sigs = _rjson.loads(rr.get("signals_json", "[]"))
-                        for sig in sigs[:3]:
-                            regime_lines.append(f"시그널: {sig.get('description', '')}")
-                    except Exception:
-                        pass
-                    try:
-                        guide = _rjson.loads(rr.get("portfolio_guide_json", "{}"))
-                        if guide:
-                            regime_lines.append(f"포지션: {guide.get('position_size', '')}")
-                            regime_lines.append(f"전략: {guide.get('buy_strategy', '')}")
-                    except Exception:
-                        pass
-                    macro_dict["market_regime_context"] = "\n".join(regime_lines)
+                guide = json.loads(rr.get("portfolio_guide_json", "{}"))
+                if guide:
+                    regime_lines.append(f"포지션: {guide.get('position_size', '')}")
+                    regime_lines.append(f"전략: {guide.get('buy_strategy', '')}")
             except Exception:
-                logger.debug("market_regime context failed", exc_info=True)
-        except Exception as e:
-            logger.warning("Failed to get macro for AI context: %s", e)
+                pass
+            extras["market_regime_context"] = "\n".join(regime_lines)
+    except Exception:
+        logger.debug("market_regime context failed", exc_info=True)
+    return extras
 
-    loop = asyncio.get_event_loop()
-    (
-        portfolio, market, recommendations, policies, reports, financials,
-        investor_style, portfolio_solutions, trade_lessons_text,
-        global_news_text, crisis_context,
-    ) = await asyncio.gather(
-        loop.run_in_executor(None, get_portfolio_context, db),
-        loop.run_in_executor(None, get_market_context, macro_dict),
-        loop.run_in_executor(None, get_recommendation_context, db),
-        loop.run_in_executor(None, get_policy_context, None),
-        loop.run_in_executor(None, get_report_context, db),
-        loop.run_in_executor(None, get_financial_context, db),
-        loop.run_in_executor(None, _get_investor_style_context, db),
-        loop.run_in_executor(None, _get_portfolio_solutions_context, db),
-        loop.run_in_executor(None, _get_trade_lessons_context, db),
-        loop.run_in_executor(None, _get_global_news_context, db),
-        loop.run_in_executor(None, _get_crisis_context, macro_dict),
-        return_exceptions=True,
-    )
-    # v9.6.3: 개별 컨텍스트 실패 시 빈 문자열
-    _ctx_names = ["portfolio", "market", "recommendations", "policies", "reports",
-                  "financials", "investor_style", "portfolio_solutions",
-                  "trade_lessons_text", "global_news_text", "crisis_context"]
-    _ctx_results = [portfolio, market, recommendations, policies, reports, financials,
-                    investor_style, portfolio_solutions, trade_lessons_text,
-                    global_news_text, crisis_context]
-    for _i, (_name, _val) in enumerate(zip(_ctx_names, _ctx_results)):
-        if isinstance(_val, Exception):
-            logger.warning("Context %s failed: %s", _name, _val)
-    portfolio = "" if isinstance(portfolio, Exception) else portfolio
-    market = "" if isinstance(market, Exception) else market
-    recommendations = "" if isinstance(recommendations, Exception) else recommendations
-    policies = "" if isinstance(policies, Exception) else policies
-    reports = "" if isinstance(reports, Exception) else reports
-    financials = "" if isinstance(financials, Exception) else financials
-    investor_style = "" if isinstance(investor_style, Exception) else investor_style
-    portfolio_solutions = "" if isinstance(portfolio_solutions, Exception) else portfolio_solutions
-    trade_lessons_text = "" if isinstance(trade_lessons_text, Exception) else trade_lessons_text
-    global_news_text = "" if isinstance(global_news_text, Exception) else global_news_text
-    crisis_context = "" if isinstance(crisis_context, Exception) else crisis_context
-
-    # 실시간 주가 데이터 주입 (yf_client가 있으면)
-    realtime_data = ""
-    if yf_client:
-        try:
-            realtime_data = await _get_realtime_portfolio_data(db, yf_client)
-        except Exception as e:
-            logger.warning("Failed to get realtime portfolio data: %s", e)
 
-    # v9.3: 섹터 동향 주입
+async def _get_sector_rankings_context() -> str:
+    """v9.3: 업종별 동향 요약."""
     try:
         from kstock.ingest.naver_finance import (
             get_sector_rankings, analyze_sector_momentum,
@@ -1013,15 +1229,16 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
         sectors = await get_sector_rankings(limit=10)
         if sectors:
             sec_analysis = analyze_sector_momentum(sectors)
-            sector_ctx = sec_analysis.get("summary", "")
-            if sector_ctx:
-                market = market + "\n\n[업종별 동향]\n" + sector_ctx
+            return sec_analysis.get("summary", "")
     except Exception:
         logger.debug("Sector context injection failed", exc_info=True)
+    return ""
+
 
-    # portfolio에 실시간 데이터 추가
-    if realtime_data:
-        portfolio = portfolio + "\n\n[실시간 기술지표]\n" + realtime_data
+def _get_holdings_signals_context(db) -> str:
+    """보유종목별 산업 생태계 + 수급 + AI 토론 합의 (portfolio 섹션 뒤에 붙는다)."""
+    parts: list[str] = []
+    holdings = None
 
     # v9.0: 산업 생태계 컨텍스트 (보유종목별)
     try:
@@ -1034,13 +1251,14 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
             if ctx:
                 industry_lines.append(ctx)
         if industry_lines:
-            portfolio = portfolio + "\n\n" + "\n".join(industry_lines)
+            parts.append("\n".join(industry_lines))
     except Exception:
         pass
 
     # v9.3: 보유종목별 수급 데이터 컨텍스트
     try:
-        holdings = holdings if 'holdings' in dir() else db.get_active_holdings()
+        if holdings is None:
+            holdings = db.get_active_holdings()
         supply_lines = []
         for h in (holdings or [])[:5]:
             ticker = h.get("ticker", "")
@@ -1054,18 +1272,16 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                     f"외국인 {f_net:+,.0f} / 기관 {i_net:+,.0f}"
                 )
         if supply_lines:
-            portfolio = (
-                portfolio + "\n\n[보유종목 수급현황]\n"
-                + "\n".join(supply_lines)
-            )
+            parts.append("[보유종목 수급현황]\n" + "\n".join(supply_lines))
     except Exception:
         logger.debug("Supply demand context failed", exc_info=True)
 
     # v9.4: AI 토론 합의 컨텍스트 추가
     try:
-        holdings_for_debate = db.get_active_holdings()
+        if holdings is None:
+            holdings = db.get_active_holdings()
         debate_lines = []
-        for h in (holdings_for_debate or [])[:10]:
+        for h in (holdings or [])[:10]:
             ticker = h.get("ticker", "")
             d = db.get_latest_debate(ticker)
             if d:
@@ -1082,25 +1298,27 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                     line += f", 핵심: {arg_text[:40]}"
                 debate_lines.append(line)
         if debate_lines:
-            portfolio = (
-                portfolio + "\n\n[AI 토론 합의]\n"
-                + "\n".join(debate_lines)
-            )
+            parts.append("[AI 토론 합의]\n" + "\n".join(debate_lines))
     except Exception:
         logger.debug("AI debate context injection failed", exc_info=True)
 
-    # v9.0: 한국형 리스크 팩터 → 시장 컨텍스트에 추가
+    return "\n\n".join(parts)
+
+
+def _get_korea_risk_context(
+    db, macro_dict: dict | None, usdkrw_change_pct: float | None = None,
+) -> str:
+    """v9.0: 한국형 리스크 팩터 (시장 섹션 뒤에 붙는다)."""
     try:
         from kstock.signal.korea_risk import assess_korea_risk, format_korea_risk
+        from calendar import monthcalendar
         kr_args = {}
         if macro_dict:
             kr_args["vix"] = macro_dict.get("vix", 0)
             kr_args["usdkrw"] = macro_dict.get("usdkrw", 0)
             # 환율 변동률은 snap에서
-            if macro_client:
-                snap_obj = getattr(macro_client, '_last_snapshot', None)
-                if snap_obj:
-                    kr_args["usdkrw_change_pct"] = getattr(snap_obj, "usdkrw_change_pct", 0)
+            if usdkrw_change_pct is not None:
+                kr_args["usdkrw_change_pct"] = usdkrw_change_pct
         # 신용잔고
         try:
             cred = db.get_credit_balance(days=1)
@@ -1123,9 +1341,6 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
         except Exception:
             pass
         # 만기일
-        from kstock.bot.context_builder import get_futures_expiry_warning
-        from calendar import monthcalendar
-        from datetime import datetime
         now_k = datetime.now(KST)
         cal = monthcalendar(now_k.year, now_k.month)
         thursdays = [week[3] for week in cal if week[3] != 0]
@@ -1138,13 +1353,14 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
         kr_args["day"] = now_k.day
         assessment = assess_korea_risk(**kr_args)
         if assessment.total_risk > 0:
-            risk_text = format_korea_risk(assessment)
-            market = market + "\n\n" + risk_text
+            return format_korea_risk(assessment)
     except Exception:
         logger.debug("Korea risk assessment for context failed", exc_info=True)
+    return ""
+
 
-    # v9.5: 매니저 stance + 멀티에이전트 + 통합 상태 주입
-    manager_stances_text = ""
+def _get_manager_stances_context(db) -> str:
+    """v9.5: 최근 24시간 매니저 stance."""
     try:
         stances = db.get_recent_manager_stances(hours=24)
         if stances:
@@ -1158,11 +1374,14 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                 if s:
                     s_lines.append(f"- {manager_names.get(key, key)}: {s[:80]}")
             if len(s_lines) > 1:
-                manager_stances_text = "\n".join(s_lines)
+                return "\n".join(s_lines)
     except Exception:
         logger.debug("Manager stances context failed", exc_info=True)
+    return ""
 
-    multi_agent_text = ""
+
+def _get_multi_agent_context(db) -> str:
+    """v9.5: 보유종목별 최근 멀티에이전트 점수."""
     try:
         holdings_ma = db.get_active_holdings()
         if holdings_ma:
@@ -1179,12 +1398,14 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                         f"점수 {cs}/215, {v}"
                     )
             if len(ma_lines) > 1:
-                multi_agent_text = "\n".join(ma_lines)
+                return "\n".join(ma_lines)
     except Exception:
         logger.debug("Multi-agent context failed", exc_info=True)
+    return ""
+
 
-    # v9.5.1: 최근 브리핑 (AI 채팅이 자기가 보낸 내용을 알 수 있도록)
-    recent_briefing_text = ""
+def _get_recent_briefing_context(db) -> str:
+    """v9.5.1: 최근 브리핑 (AI 채팅이 자기가 보낸 내용을 알 수 있도록)."""
     try:
         briefings = db.get_recent_briefings(hours=18, limit=2)
         if briefings:
@@ -1197,11 +1418,14 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                     b_type, b_type
                 )
                 b_lines.append(f"[{label} {b_time}]\n{content}")
-            recent_briefing_text = "\n\n".join(b_lines)
+            return "\n\n".join(b_lines)
     except Exception:
         logger.debug("Recent briefing context failed", exc_info=True)
+    return ""
 
-    # v9.5.3: 학습 엔진 — 매니저 성적표 + 매매 프로필 + 이벤트 조정
+
+def _get_learning_context(db) -> str:
+    """v9.5.3: 학습 엔진 — 매니저 성적표 + 매매 프로필 + 이벤트 조정."""
     learning_context = ""
     try:
         from kstock.bot.learning_engine import (
@@ -1262,9 +1486,11 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
             pass
     except Exception:
         logger.debug("Learning context injection failed", exc_info=True)
+    return learning_context
+
 
-    # v9.5.4: 섹터 딥다이브 인텔리전스 주입
-    sector_dive_text = ""
+def _get_sector_intelligence_context(db) -> str:
+    """v9.5.4: 섹터 딥다이브 인텔리전스."""
     try:
         from kstock.bot.sector_intelligence import format_deep_dive_for_context
         deep_dives = db.get_all_recent_deep_dives(hours=48)
@@ -1275,27 +1501,121 @@ async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -
                 if ctx:
                     sd_lines.append(ctx)
             if sd_lines:
-                sector_dive_text = "\n\n".join(sd_lines)
+                return "\n\n".join(sd_lines)
     except Exception:
         logger.debug("Sector deep dive context injection failed", exc_info=True)
+    return ""
+
+
+async def build_full_context_with_macro(db, macro_client=None, yf_client=None) -> dict:
+    """Build context with live macro data from MacroClient (async).
+
+    This is the preferred method - fetches real-time market data
+    from the 3-tier cache (memory -> SQLite -> yfinance).
+
+    v14: every section goes through the shared ContextSectionCache and is
+    rebuilt only when its TTL expires or its invalidation key (holdings
+    version, macro snapshot timestamp, date) changes. Stale sections are
+    rebuilt concurrently; see ``get_context_cache().report()`` for
+    per-section build times and token sizes.
+
+    Args:
+        db: SQLiteStore instance for data access.
+        macro_client: MacroClient instance for live market data.
+        yf_client: YFinanceKRClient instance for real-time stock prices.
+
+    Returns:
+        Dict with all context sections populated with live data.
+    """
+    cache = get_context_cache()
+    t0 = time.perf_counter()
+
+    # Fetch macro snapshot from cache (instant if cached)
+    snap = None
+    macro_dict = None
+    if macro_client:
+        try:
+            snap = await macro_client.get_snapshot()
+            macro_dict = _snapshot_to_macro_dict(snap)
+            macro_dict.update(await cache.aget("macro_extras", db, None, _get_macro_extras, db))
+        except Exception as e:
+            logger.warning("Failed to get macro for AI context: %s", e)
 
+    holdings_key = _holdings_version(db)
+    macro_key = _macro_version(snap, macro_dict)
+    usdkrw_change_pct = None
+    if macro_dict and macro_client:
+        # 환율 변동률은 snap에서
+        snap_obj = getattr(macro_client, "_last_snapshot", None)
+        if snap_obj:
+            usdkrw_change_pct = getattr(snap_obj, "usdkrw_change_pct", 0)
+
+    specs: dict[str, tuple] = {
+        "portfolio": ("portfolio", holdings_key, get_portfolio_context, db),
+        "market": ("market", macro_key, get_market_context, macro_dict),
+        "recommendations": ("recommendations", None, get_recommendation_context, db),
+        "policies": ("policies", None, get_policy_context, None),
+        "reports": ("reports", None, get_report_context, db),
+        "financials": ("financials", holdings_key, get_financial_context, db),
+        "investor_style": ("investor_style", None, _get_investor_style_context, db),
+        "portfolio_solutions": (
+            "portfolio_solutions", holdings_key, _get_portfolio_solutions_context, db,
+        ),
+        "trade_lessons": ("trade_lessons", None, _get_trade_lessons_context, db),
+        "global_news": ("global_news", None, _get_global_news_context, db),
+        "crisis_context": ("crisis", _crisis_version(macro_dict), _get_crisis_context, macro_dict),
+        "sector_rankings": ("sector_rankings", None, _get_sector_rankings_context),
+        "holdings_signals": ("holdings_signals", holdings_key, _get_holdings_signals_context, db),
+        "korea_risk": (
+            "korea_risk", (macro_key, usdkrw_change_pct),
+            _get_korea_risk_context, db, macro_dict, usdkrw_change_pct,
+        ),
+        "manager_stances": ("manager_stances", None, _get_manager_stances_context, db),
+        "multi_agent": ("multi_agent", holdings_key, _get_multi_agent_context, db),
+        "recent_briefing": ("recent_briefing", None, _get_recent_briefing_context, db),
+        "learning": ("learning", None, _get_learning_context, db),
+        "sector_intelligence": ("sector_intelligence", None, _get_sector_intelligence_context, db),
+    }
+    if yf_client:
+        # 실시간 주가 데이터 주입 (yf_client가 있으면)
+        specs["realtime"] = ("realtime", holdings_key, _get_realtime_portfolio_data, db, yf_client)
+    sec = await _gather_sections(db, specs)
+
+    # portfolio에 실시간 데이터 + 산업/수급/토론 추가
+    portfolio = sec["portfolio"]
+    if sec.get("realtime"):
+        portfolio = portfolio + "\n\n[실시간 기술지표]\n" + sec["realtime"]
+    if sec["holdings_signals"]:
+        portfolio = portfolio + "\n\n" + sec["holdings_signals"]
+
+    # v9.3: 섹터 동향 + v9.0: 한국형 리스크 팩터 → 시장 컨텍스트에 추가
+    market = sec["market"]
+    if sec["sector_rankings"]:
+        market = market + "\n\n[업종별 동향]\n" + sec["sector_rankings"]
+    if sec["korea_risk"]:
+        market = market + "\n\n" + sec["korea_risk"]
+
+    logger.debug(
+        "AI context built in %.0fms (%d sections)",
+        (time.perf_counter() - t0) * 1000, len(specs),
+    )
     return {
         "portfolio": portfolio,
         "market": market,
-        "recommendations": recommendations,
-        "policies": policies,
-        "reports": reports,
-        "financials": financials,
-        "investor_style": investor_style,
-        "portfolio_with_solutions": portfolio_solutions,
-        "trade_lessons": trade_lessons_text,
-        "global_news": global_news_text,
-        "crisis_context": crisis_context,
-        "recent_briefing": recent_briefing_text,
-        "manager_stances": manager_stances_text,
-        "multi_agent_scores": multi_agent_text,
-        "learning_context": learning_context,
-        "sector_intelligence": sector_dive_text,
+        "recommendations": sec["recommendations"],
+        "policies": sec["policies"],
+        "reports": sec["reports"],
+        "financials": sec["financials"],
+        "investor_style": sec["investor_style"],
+        "portfolio_with_solutions": sec["portfolio_solutions"],
+        "trade_lessons": sec["trade_lessons"],
+        "global_news": sec["global_news"],
+        "crisis_context": sec["crisis_context"],
+        "recent_briefing": sec["recent_briefing"],
+        "manager_stances": sec["manager_stances"],
+        "multi_agent_scores": sec["multi_agent"],
+        "learning_context": sec["learning"],
+        "sector_intelligence": sec["sector_intelligence"],
     }
 
 
@@ -1428,50 +1748,8 @@ def _get_global_news_context(db) -> str:
     return "\n".join(lines) if lines else "최근 수집된 글로벌 이슈 없음"
 
 
-async def build_manager_shared_context(db, macro_client=None) -> dict:
-    """매니저 공유 컨텍스트 빌더 — 4매니저가 동일한 상황 인식을 갖도록.
-
-    Returns:
-        dict with keys: investor_style, trade_lessons, global_news,
-        policies, crisis_context, portfolio_summary, post_war_rotation
-    """
-    import yaml, os
-
-    loop = asyncio.get_event_loop()
-
-    # 매크로 snapshot (이미 있으면 재사용)
-    macro_dict = None
-    if macro_client:
-        try:
-            snap = await macro_client.get_snapshot()
-            macro_dict = {
-                "vix": getattr(snap, "vix", 0),
-                "usdkrw": getattr(snap, "usdkrw", 0),
-                "fear_greed": getattr(snap, "fear_greed_score", 50),
-                "kospi": getattr(snap, "kospi", 0),
-                "kospi_change_pct": getattr(snap, "kospi_change_pct", 0),
-            }
-        except Exception:
-            logger.debug("manager_shared_context macro failed", exc_info=True)
-
-    # 병렬로 각 섹션 수집
-    investor_style, trade_lessons, global_news, policies, crisis_ctx = await asyncio.gather(
-        loop.run_in_executor(None, _get_investor_style_context, db),
-        loop.run_in_executor(None, _get_trade_lessons_context, db),
-        loop.run_in_executor(None, _get_global_news_context, db),
-        loop.run_in_executor(None, get_policy_context, None),
-        loop.run_in_executor(None, _get_crisis_context, macro_dict),
-        return_exceptions=True,
-    )
-    # v9.6.3: 실패 시 빈 문자열
-    investor_style = "" if isinstance(investor_style, Exception) else investor_style
-    trade_lessons = "" if isinstance(trade_lessons, Exception) else trade_lessons
-    global_news = "" if isinstance(global_news, Exception) else global_news
-    policies = "" if isinstance(policies, Exception) else policies
-    crisis_ctx = "" if isinstance(crisis_ctx, Exception) else crisis_ctx
-
-    # 포트폴리오 전체 요약 (모든 보유종목)
-    portfolio_summary = ""
+def _get_portfolio_summary_context(db) -> str:
+    """포트폴리오 전체 요약 (모든 보유종목)."""
     try:
         holdings = db.get_active_holdings()
         if holdings:
@@ -1480,16 +1758,18 @@ async def build_manager_shared_context(db, macro_client=None) -> dict:
                 ht = h.get("holding_type", "auto")
                 type_label = {"scalp": "단타", "swing": "스윙", "position": "포지션", "long_term": "장기"}.get(ht, ht)
                 lines.append(f"- {h.get('name', '')}({h.get('ticker', '')}): {type_label}, 매수 {h.get('buy_price', 0):,.0f}원, {h.get('quantity', 0)}주")
-            portfolio_summary = "\n".join(lines)
+            return "\n".join(lines)
     except Exception:
         pass
+    return ""
+
 
-    # 전쟁 후 주도주 전환 시나리오
+def _get_post_war_rotation_context() -> str:
+    """전쟁 후 주도주 전환 시나리오 (crisis_events.yaml)."""
     post_war = ""
     try:
-        crisis_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "..", "config", "crisis_events.yaml"
-        )
+        import yaml
+        crisis_path = _crisis_config_path()
         if os.path.exists(crisis_path):
             with open(crisis_path, encoding="utf-8") as f:
                 cdata = yaml.safe_load(f) or {}
@@ -1506,9 +1786,11 @@ async def build_manager_shared_context(db, macro_client=None) -> dict:
                     )
     except Exception:
         pass
+    return post_war
+
 
-    # v9.5: YouTube 인텔리전스 → 매니저 공유 컨텍스트
-    youtube_intel = ""
+def _get_manager_youtube_context(db) -> str:
+    """v9.5: YouTube 인텔리전스 → 매니저 공유 컨텍스트."""
     try:
         yt_data = db.get_recent_youtube_intelligence(hours=24, limit=5)
         if yt_data:
@@ -1531,20 +1813,51 @@ async def build_manager_shared_context(db, macro_client=None) -> dict:
                 if impl:
                     parts.append(f"시사점: {impl[:80]}")
                 yt_lines.append(" | ".join(parts))
-            youtube_intel = "\n".join(yt_lines)
+            return "\n".join(yt_lines)
     except Exception:
         logger.debug("YouTube intelligence for manager context failed", exc_info=True)
+    return ""
 
-    return {
-        "investor_style": investor_style,
-        "trade_lessons": trade_lessons,
-        "global_news": global_news,
-        "policies": policies,
-        "crisis_context": crisis_ctx,
-        "portfolio_summary": portfolio_summary,
-        "post_war_rotation": post_war,
-        "youtube_intelligence": youtube_intel,
-    }
+
+async def build_manager_shared_context(db, macro_client=None) -> dict:
+    """매니저 공유 컨텍스트 빌더 — 4매니저가 동일한 상황 인식을 갖도록.
+
+    v14: 섹션은 채팅 컨텍스트와 같은 ContextSectionCache를 거친다
+    (투자 성향/매매 교훈/뉴스/정책/위기 섹션은 채팅과 공유).
+
+    Returns:
+        dict with keys: investor_style, trade_lessons, global_news,
+        policies, crisis_context, portfolio_summary, post_war_rotation
+    """
+    # 매크로 snapshot (이미 있으면 재사용)
+    macro_dict = None
+    if macro_client:
+        try:
+            snap = await macro_client.get_snapshot()
+            macro_dict = {
+                "vix": getattr(snap, "vix", 0),
+                "usdkrw": getattr(snap, "usdkrw", 0),
+                "fear_greed": getattr(snap, "fear_greed_score", 50),
+                "kospi": getattr(snap, "kospi", 0),
+                "kospi_change_pct": getattr(snap, "kospi_change_pct", 0),
+            }
+        except Exception:
+            logger.debug("manager_shared_context macro failed", exc_info=True)
+
+    crisis_key = _crisis_version(macro_dict)
+    sec = await _gather_sections(db, {
+        "investor_style": ("investor_style", None, _get_investor_style_context, db),
+        "trade_lessons": ("trade_lessons", None, _get_trade_lessons_context, db),
+        "global_news": ("global_news", None, _get_global_news_context, db),
+        "policies": ("policies", None, get_policy_context, None),
+        "crisis_context": ("crisis", crisis_key, _get_crisis_context, macro_dict),
+        "portfolio_summary": (
+            "portfolio_summary", _holdings_version(db), _get_portfolio_summary_context, db,
+        ),
+        "post_war_rotation": ("post_war_rotation", crisis_key[0], _get_post_war_rotation_context),
+        "youtube_intelligence": ("youtube_intel", None, _get_manager_youtube_context, db),
+    })
+    return sec
 
 
 def _get_crisis_context(macro_snapshot: dict | None = None) -> str:
@@ -1558,9 +1871,7 @@ def _get_crisis_context(macro_snapshot: dict | None = None) -> str:
         import os
 
         # 위기 이벤트 로드
-        cal_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "..", "config", "crisis_events.yaml"
-        )
+        cal_path = _crisis_config_path()
         crisis_events = []
         if os.path.exists(cal_path):
             with open(cal_path, encoding="utf-8") as f:
@@ -19,6 +19,8 @@ from datetime import datetime
 
 import httpx
 
+from kstock.bot.response_cache import get_response_cache, response_cache_key
+from kstock.core.token_tracker import calculate_cost
 from kstock.core.tz import KST
 
 logger = logging.getLogger(__name__)
@@ -189,12 +191,33 @@ async def _call_ai(
     max_tokens: int = 300,
     api_key: str = "",
 ) -> str:
-    """Anthropic API 호출 (v10.3.1: 공유 클라이언트 + 재시도)."""
+    """Anthropic API 호출 (v10.3.1: 공유 클라이언트 + 재시도).
+
+    v14: 같은 system/user/model 은 응답 캐시("debate" TTL) 에서 재사용하고,
+    동시에 들어온 동일 호출은 하나로 합친다.
+    """
     if not api_key:
         api_key = os.getenv("ANTHROPIC_API_KEY", "")
     if not api_key:
         return '{"error": "API 키 없음"}'
 
+    key = response_cache_key(
+        "debate", f"claude/{model}", system, user, params=(max_tokens,),
+    )
+    return await get_response_cache().get_or_call(
+        key, "debate",
+        lambda: _call_ai_uncached(system, user, model, max_tokens, api_key),
+    )
+
+
+async def _call_ai_uncached(
+    system: str,
+    user: str,
+    model: str,
+    max_tokens: int,
+    api_key: str,
+) -> tuple[str, float]:
+    """실제 API 호출 → (응답 텍스트, 비용 USD)."""
     client = _get_client()
     max_retries = 2
     for attempt in range(max_retries):
@@ -214,7 +237,14 @@ async def _call_ai(
                 },
             )
             if resp.status_code == 200:
-                return resp.json()["content"][0]["text"].strip()
+                data = resp.json()
+                usage = data.get("usage", {}) or {}
+                cost = calculate_cost(
+                    model,
+                    input_tokens=usage.get("input_tokens", 0) or 0,
+                    output_tokens=usage.get("output_tokens", 0) or 0,
+                )
+                return data["content"][0]["text"].strip(), cost
             # 5xx/429 → 재시도, 4xx → 즉시 실패
             if resp.status_code >= 500 or resp.status_code == 429:
                 if attempt < max_retries - 1:
@@ -224,7 +254,7 @@ async def _call_ai(
                     await asyncio.sleep(delay)
                     continue
             logger.warning("AI call failed: status=%d body=%s", resp.status_code, resp.text[:200])
-            return '{"error": "API 호출 실패"}'
+            return '{"error": "API 호출 실패"}', 0.0
         except (httpx.TimeoutException, httpx.ConnectError) as e:
             if attempt < max_retries - 1:
                 delay = 1.5 * (attempt + 1)
@@ -233,11 +263,11 @@ async def _call_ai(
                 await asyncio.sleep(delay)
                 continue
             logger.warning("AI call exception after retries: %s", e)
-            return f'{{"error": "{e}"}}'
+            return f'{{"error": "{e}"}}', 0.0
         except Exception as e:
             logger.warning("AI call exception: %s", e)
-            return f'{{"error": "{e}"}}'
-    return '{"error": "max retries exceeded"}'
+            return f'{{"error": "{e}"}}', 0.0
+    return '{"error": "max retries exceeded"}', 0.0
 
 
 def _parse_json(text: str) -> dict:
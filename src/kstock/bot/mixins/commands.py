@@ -3,19 +3,50 @@ from __future__ import annotations
 
 import re
 
+import pandas as pd
+
 from kstock import DISPLAY_VERSION
 from kstock.bot.bot_imports import *  # noqa: F403
+from kstock.core.async_pipeline import Stage, run_pipeline
 
 
 _OHLCV_CACHE_TTL = 600  # v9.3.3: 스캔 OHLCV 캐시 10분
+_SCAN_OHLCV_BARS = 125  # 스캔 분석에 쓰는 일봉 수 (≈ 6mo)
 _INTRADAY_SCAN_CACHE_TTL = 120
 _INTRADAY_SCAN_MAX_TICKERS = 24
 _SECTOR_STRENGTH_CACHE_TTL = 900
-_SCAN_ANALYZE_CONCURRENCY = 4
+_SCAN_ANALYZE_CONCURRENCY = 4   # enrich 단계 (KIS/Naver 수급 조회) 워커
+_SCAN_FETCH_CONCURRENCY = 8     # OHLCV/종목정보 fetch 단계 워커
+_SCAN_COMPUTE_WORKERS = 2       # 지표/패턴 계산 스레드 워커
 _SWING_SCAN_MAX_CANDIDATES = 36
 _SWING_SCAN_BATCH_SIZE = 12
 
 
+@dataclass
+class _ScanInputs:
+    """스캔 파이프라인 단계 사이에 넘기는 종목별 중간 결과."""
+
+    ohlcv: pd.DataFrame
+    yf_info: dict
+    info: StockInfo
+    tech: TechnicalIndicators | None = None
+    weekly_trend: str = ""
+    price_target: object = None
+    pattern_report: object = None
+
+
+def _return_3m(ohlcv: pd.DataFrame | None) -> float | None:
+    """최근 60봉 수익률(%) — RS 순위용. 계산 불가 시 None."""
+    if ohlcv is None or ohlcv.empty or "close" not in ohlcv.columns:
+        return None
+    close = ohlcv["close"].astype(float)
+    lookback_3m = min(60, len(close) - 1)
+    if lookback_3m <= 0:
+        return None
+    base = close.iloc[-lookback_3m - 1]
+    return float((close.iloc[-1] - base) / base * 100)
+
+
 class CommandsMixin:
     def _swing_signal_from_scan_result(self, result: ScanResult) -> dict | None:
         """최근 스캔 결과에서 스윙 후보를 빠르게 추출한다."""
@@ -158,15 +189,6 @@ class CommandsMixin:
             if self._is_scan_cache_fresh(cache_ttl):
                 return list(self._last_scan_results)
 
-        # v9.3.3: 캐시가 10분 이상 경과했으면 초기화
-            if _t.monotonic() - getattr(self, '_ohlcv_cache_time', 0) > _OHLCV_CACHE_TTL:
-                self._ohlcv_cache.clear()
-                self._ohlcv_cache_time = _t.monotonic()
-        # v9.6.3: 캐시 크기 제한 (500종목 초과 시 정리)
-            if len(self._ohlcv_cache) > 500:
-                self._ohlcv_cache.clear()
-                self._ohlcv_cache_time = _t.monotonic()
-
             macro = await self.macro_client.get_snapshot()
             sector_cache_age = _t.monotonic() - getattr(self, "_sector_strengths_time", 0)
             if not getattr(self, "_sector_strengths", None) or sector_cache_age > _SECTOR_STRENGTH_CACHE_TTL:
@@ -175,37 +197,45 @@ class CommandsMixin:
 
             scan_universe = self._build_scan_universe(max_tickers=max_tickers)
 
+            # 캐시에 없는 종목만 일괄 다운로드 (lake에 있으면 꼬리 봉만)
+            markets = {s["code"]: s.get("market", "KOSPI") for s in scan_universe}
+
+            async def _batch_fetch(codes: list[str], since: str | None) -> dict:
+                return await self.yf_client.batch_download(
+                    [{"code": c, "market": markets[c]} for c in codes],
+                    period=tail_period(since),
+                )
+
             batched_ohlcv = {}
             try:
-                batched_ohlcv = await self.yf_client.batch_download(scan_universe, period="6mo")
+                batched_ohlcv = await self._ohlcv_cache.get_many(
+                    list(markets), _batch_fetch, max_bars=_SCAN_OHLCV_BARS,
+                )
             except Exception:
                 logger.debug("batch_download pre-scan failed", exc_info=True)
 
             # First pass: collect all 3-month returns for RS ranking
-            all_returns = []
-            pre_results = []
-            for stock in scan_universe:
-                try:
-                    ohlcv = batched_ohlcv.get(stock["code"])
-                    if ohlcv is None or ohlcv.empty:
-                        ohlcv = await self.yf_client.get_ohlcv(
-                            stock["code"], stock.get("market", "KOSPI")
+            # (캐시/배치에 없던 종목은 동시에 개별 fetch)
+            async def _pre_one(stock: dict):
+                ohlcv = batched_ohlcv.get(stock["code"])
+                if ohlcv is None or ohlcv.empty:
+                    try:
+                        ohlcv = await self._get_scan_ohlcv(
+                            stock["code"], stock.get("market", "KOSPI"),
                         )
-                    if ohlcv is not None and not ohlcv.empty and "close" in ohlcv.columns:
-                        self._ohlcv_cache[stock["code"]] = ohlcv
-                        close = ohlcv["close"].astype(float)
-                        lookback_3m = min(60, len(close) - 1)
-                        if lookback_3m > 0:
-                            ret = (close.iloc[-1] - close.iloc[-lookback_3m - 1]) / close.iloc[-lookback_3m - 1] * 100
-                            all_returns.append(float(ret))
-                            pre_results.append((stock, float(ret)))
-                        else:
-                            pre_results.append((stock, 0.0))
-                    else:
-                        pre_results.append((stock, 0.0))
-                except Exception:
-                    logger.debug("_run_scan pre-scan failed for %s", stock.get("code"), exc_info=True)
-                    pre_results.append((stock, 0.0))
+                    except Exception:
+                        logger.debug("_run_scan pre-scan failed for %s", stock.get("code"), exc_info=True)
+                        ohlcv = None
+                return stock, _return_3m(ohlcv)
+
+            pre_out, pre_stats = await run_pipeline(
+                scan_universe, [Stage("prefetch", _pre_one, workers=_SCAN_FETCH_CONCURRENCY)],
+            )
+            ret_by_code = {stock["code"]: ret for stock, ret in pre_out}
+            all_returns = [r for r in ret_by_code.values() if r is not None]
+            pre_results = [
+                (stock, ret_by_code.get(stock["code"]) or 0.0) for stock in scan_universe
+            ]
 
             # v10.0: 사이클당 1회 한국 시장 데이터 수집 (전 종목 공유)
             _ml_market_cache = {}
@@ -232,117 +262,181 @@ class CommandsMixin:
             except Exception:
                 logger.debug("ML market cache collection failed", exc_info=True)
 
-            # Second pass: full analysis with bounded concurrency
-            results = []
-            semaphore = asyncio.Semaphore(_SCAN_ANALYZE_CONCURRENCY)
+            # Second pass: fetch → indicators (thread pool) → flow/enrichment
+            # 스테이지별 워커 풀 + bounded queue, 느린 종목이 다른 종목을 막지 않음
+            rs_total = len(all_returns)
 
-            async def _scan_one(stock: dict, ret_3m: float):
-                async with semaphore:
-                    try:
-                        rs_rank, _ = compute_relative_strength_rank(ret_3m, all_returns)
-                        return await self._analyze_stock(
-                            stock["code"], stock["name"], macro,
-                            market=stock.get("market", "KOSPI"),
-                            sector=stock.get("sector", ""),
-                            category=stock.get("category", ""),
-                            rs_rank=rs_rank,
-                            rs_total=len(all_returns),
-                            ml_market_cache=_ml_market_cache,
-                        )
-                    except Exception as e:
-                        logger.error("Scan error %s: %s", stock.get("code"), e)
-                        return None
-
-            for i in range(0, len(pre_results), _SCAN_ANALYZE_CONCURRENCY):
-                batch = pre_results[i:i + _SCAN_ANALYZE_CONCURRENCY]
-                batch_results = await asyncio.gather(
-                    *[_scan_one(stock, ret_3m) for stock, ret_3m in batch],
-                    return_exceptions=True,
+            async def _fetch_stage(item):
+                stock, ret_3m = item
+                inputs = await self._scan_fetch_inputs(
+                    stock["code"], stock["name"], stock.get("market", "KOSPI"),
                 )
-                for r in batch_results:
-                    if isinstance(r, ScanResult):
-                        results.append(r)
+                return (stock, ret_3m, inputs) if inputs is not None else None
+
+            async def _compute_stage(item):
+                stock, ret_3m, inputs = item
+                return stock, ret_3m, await asyncio.to_thread(self._scan_compute_inputs, inputs)
+
+            async def _enrich_stage(item):
+                stock, ret_3m, inputs = item
+                rs_rank, _ = compute_relative_strength_rank(ret_3m, all_returns)
+                return await self._analyze_stock(
+                    stock["code"], stock["name"], macro,
+                    market=stock.get("market", "KOSPI"),
+                    sector=stock.get("sector", ""),
+                    category=stock.get("category", ""),
+                    rs_rank=rs_rank,
+                    rs_total=rs_total,
+                    ml_market_cache=_ml_market_cache,
+                    inputs=inputs,
+                )
+
+            scan_out, scan_stats = await run_pipeline(pre_results, [
+                Stage("fetch", _fetch_stage, workers=_SCAN_FETCH_CONCURRENCY),
+                Stage("indicators", _compute_stage, workers=_SCAN_COMPUTE_WORKERS),
+                Stage("enrich", _enrich_stage, workers=_SCAN_ANALYZE_CONCURRENCY),
+            ])
+            results = [r for r in scan_out if isinstance(r, ScanResult)]
+            scan_stats.stages = {**pre_stats.stages, **scan_stats.stages}
+            self._last_scan_stage_stats = scan_stats.to_dict()
             results.sort(key=lambda r: r.score.composite, reverse=True)
             self._last_scan_results = results
             self._scan_cache_time = datetime.now(KST)
             self._scan_backoff_until = None
+            cache_stats = self._ohlcv_cache.stats()
             logger.info(
-                "Scan complete: %d/%d tickers in %.2fs",
+                "Scan complete: %d/%d tickers in %.2fs (ohlcv hit %.0f%%, %d fetches, %d lake backfills) [%s]",
                 len(results),
                 len(scan_universe),
                 _t.perf_counter() - started_at,
+                cache_stats["hit_rate"] * 100,
+                cache_stats["fetches"],
+                cache_stats["lake_backfills"],
+                scan_stats.summary(),
             )
             return results
 
+    async def _fetch_ohlcv_since(
+        self, ticker: str, market: str, since: str | None,
+    ) -> pd.DataFrame | None:
+        """OHLCVCache fetcher: yfinance → Naver 폴백. since가 있으면 꼬리 봉만."""
+        ohlcv = None
+        try:
+            ohlcv = await self.yf_client.get_ohlcv(ticker, market, period=tail_period(since))
+        except Exception:
+            logger.debug("yfinance OHLCV failed: %s", ticker, exc_info=True)
+        # v9.3.2: yfinance OHLCV 실패 시 Naver OHLCV 직접 시도
+        if ohlcv is None or ohlcv.empty:
+            try:
+                from kstock.ingest.naver_finance import NaverFinanceClient
+                naver = NaverFinanceClient()
+                ohlcv = await naver.get_ohlcv(ticker, period_days=120)
+                if not ohlcv.empty:
+                    logger.info("Naver OHLCV 직접 폴백 성공: %s (%d행)", ticker, len(ohlcv))
+            except Exception:
+                logger.debug("Naver OHLCV 직접 폴백 실패: %s", ticker, exc_info=True)
+        return ohlcv
+
+    async def _get_scan_ohlcv(self, ticker: str, market: str = "KOSPI") -> pd.DataFrame | None:
+        """공용 OHLCV 캐시 조회 (미스 시 lake + 꼬리 봉, 동시 요청은 1회 fetch)."""
+        return await self._ohlcv_cache.get_or_fetch(
+            ticker,
+            lambda t, since: self._fetch_ohlcv_since(t, market, since),
+            max_bars=_SCAN_OHLCV_BARS,
+        )
+
+    async def _scan_fetch_inputs(
+        self, ticker: str, name: str, market: str = "KOSPI",
+    ) -> _ScanInputs | None:
+        """스캔 fetch 단계: OHLCV(공용 캐시) + 종목정보 + 실시간가."""
+        import asyncio
+        ohlcv, yf_info = await asyncio.gather(
+            self._get_scan_ohlcv(ticker, market),
+            self.yf_client.get_stock_info(ticker, name, market),
+            return_exceptions=True,
+        )
+        # v9.6.3: 개별 실패 처리
+        if isinstance(ohlcv, Exception):
+            logger.debug("OHLCV fetch failed: %s", ohlcv)
+            ohlcv = None
+        if isinstance(yf_info, Exception):
+            logger.debug("yf_info fetch failed: %s", yf_info)
+            yf_info = {}
+        # OHLCV 완전 실패 시 스킵 (가짜 데이터로 분석하지 않음)
+        if ohlcv is None or ohlcv.empty:
+            logger.warning("OHLCV 완전 실패 — %s(%s) 분석 스킵", name, ticker)
+            return None
+
+        # v5.2: 실시간 현재가 우선 조회 (KIS→Naver→yfinance 순)
+        live_price = yf_info.get("current_price", 0)
+        try:
+            realtime = await self._get_price(ticker, base_price=live_price)
+            if realtime > 0:
+                live_price = realtime
+        except Exception:
+            logger.debug("_run_scan_for_stock get_price failed for %s", ticker, exc_info=True)
+        # v9.3.3: OHLCV의 마지막 종가를 최종 fallback으로 사용
+        if live_price <= 0 and "close" in ohlcv.columns and len(ohlcv) > 0:
+            live_price = float(ohlcv["close"].iloc[-1])
+
+        info = StockInfo(
+            ticker=ticker, name=name, market=market,
+            market_cap=yf_info.get("market_cap", 0),
+            per=yf_info.get("per", 0),
+            roe=yf_info.get("roe", 0),
+            debt_ratio=yf_info.get("debt_ratio", 0),
+            consensus_target=yf_info.get("consensus_target", 0),
+            current_price=live_price,
+        )
+        return _ScanInputs(ohlcv=ohlcv, yf_info=yf_info, info=info)
+
+    @staticmethod
+    def _scan_compute_inputs(inputs: _ScanInputs) -> _ScanInputs:
+        """스캔 indicator 단계 (CPU 전용, 워커 스레드에서 실행)."""
+        ohlcv = inputs.ohlcv
+        # v14: 5분 재스캔은 마지막 봉만 바뀌므로 종목별 지표 상태를 재사용
+        tech = get_ohlcv_cache().indicators(inputs.info.ticker, ohlcv)
+
+        # Multi-timeframe
+        weekly_trend = compute_weekly_trend(ohlcv)
+        tech.weekly_trend = weekly_trend
+        tech.mtf_aligned = (weekly_trend == "up" and tech.ema_50 > tech.ema_200)
+        inputs.tech = tech
+        inputs.weekly_trend = weekly_trend
+
+        # v9.4: 패턴 매칭 + 가격 목표 계산
+        try:
+            from kstock.signal.price_target import PriceTargetEngine
+            pt_engine = PriceTargetEngine()
+            inputs.price_target = pt_engine.calculate(ohlcv, inputs.info)
+        except Exception:
+            logger.debug("PriceTarget calc failed for %s", inputs.info.ticker, exc_info=True)
+        try:
+            from kstock.signal.pattern_matcher import PatternMatcher
+            pm = PatternMatcher()
+            inputs.pattern_report = pm.find_similar_patterns(ohlcv)
+        except Exception:
+            logger.debug("PatternMatcher calc failed for %s", inputs.info.ticker, exc_info=True)
+        return inputs
+
     async def _analyze_stock(
         self, ticker: str, name: str, macro: MacroSnapshot,
         market: str = "KOSPI", sector: str = "", category: str = "",
         rs_rank: int = 0, rs_total: int = 1,
         ml_market_cache: dict | None = None,
+        inputs: _ScanInputs | None = None,
     ) -> ScanResult | None:
+        """종목 1개 분석. *inputs*가 있으면 fetch/indicator 단계를 건너뛴다."""
         try:
             import asyncio
-            ohlcv = self._ohlcv_cache.get(ticker)
-            if ohlcv is None or ohlcv.empty:
-                # Fetch OHLCV and stock info in parallel
-                ohlcv, yf_info = await asyncio.gather(
-                    self.yf_client.get_ohlcv(ticker, market),
-                    self.yf_client.get_stock_info(ticker, name, market),
-                    return_exceptions=True,
-                )
-                # v9.6.3: 개별 실패 처리
-                if isinstance(ohlcv, Exception):
-                    logger.debug("OHLCV fetch failed: %s", ohlcv)
-                    ohlcv = None
-                if isinstance(yf_info, Exception):
-                    logger.debug("yf_info fetch failed: %s", yf_info)
-                    yf_info = {}
-                # v9.3.2: yfinance OHLCV 실패 시 Naver OHLCV 직접 시도
-                if (ohlcv is None or ohlcv.empty):
-                    try:
-                        from kstock.ingest.naver_finance import NaverFinanceClient
-                        naver = NaverFinanceClient()
-                        ohlcv = await naver.get_ohlcv(ticker, period_days=120)
-                        if not ohlcv.empty:
-                            logger.info("Naver OHLCV 직접 폴백 성공: %s (%d행)", ticker, len(ohlcv))
-                    except Exception:
-                        logger.debug("Naver OHLCV 직접 폴백 실패: %s", ticker, exc_info=True)
-                # OHLCV 완전 실패 시 스킵 (가짜 데이터로 분석하지 않음)
-                if ohlcv is None or ohlcv.empty:
-                    logger.warning("OHLCV 완전 실패 — %s(%s) 분석 스킵", name, ticker)
+            if inputs is None:
+                inputs = await self._scan_fetch_inputs(ticker, name, market)
+                if inputs is None:
                     return None
-                self._ohlcv_cache[ticker] = ohlcv
-            else:
-                yf_info = await self.yf_client.get_stock_info(ticker, name, market)
-
-            # v5.2: 실시간 현재가 우선 조회 (KIS→Naver→yfinance 순)
-            live_price = yf_info.get("current_price", 0)
-            try:
-                realtime = await self._get_price(ticker, base_price=live_price)
-                if realtime > 0:
-                    live_price = realtime
-            except Exception:
-                logger.debug("_run_scan_for_stock get_price failed for %s", ticker, exc_info=True)
-            # v9.3.3: OHLCV의 마지막 종가를 최종 fallback으로 사용
-            if live_price <= 0 and "close" in ohlcv.columns and len(ohlcv) > 0:
-                live_price = float(ohlcv["close"].iloc[-1])
-
-            info = StockInfo(
-                ticker=ticker, name=name, market=market,
-                market_cap=yf_info.get("market_cap", 0),
-                per=yf_info.get("per", 0),
-                roe=yf_info.get("roe", 0),
-                debt_ratio=yf_info.get("debt_ratio", 0),
-                consensus_target=yf_info.get("consensus_target", 0),
-                current_price=live_price,
-            )
-
-            tech = compute_indicators(ohlcv)
-
-            # Multi-timeframe
-            weekly_trend = compute_weekly_trend(ohlcv)
-            tech.weekly_trend = weekly_trend
-            tech.mtf_aligned = (weekly_trend == "up" and tech.ema_50 > tech.ema_200)
+            if inputs.tech is None:
+                inputs = await asyncio.to_thread(self._scan_compute_inputs, inputs)
+            ohlcv, yf_info, info = inputs.ohlcv, inputs.yf_info, inputs.info
+            tech, weekly_trend = inputs.tech, inputs.weekly_trend
 
             # Sector adjustment
             sector_adj = get_sector_score_adjustment(sector, self._sector_strengths)
@@ -432,11 +526,18 @@ class CommandsMixin:
             # v3.0: policy bonus
             policy_bonus = get_policy_bonus(ticker, sector=sector, market=market)
 
+            # 수급 이력은 한 번만 읽어 주봉 매집 / 이상 거래 탐지가 함께 쓴다
+            # (방금 저장한 행은 write-behind 버퍼에서 겹쳐 읽으므로 flush 없음)
+            sd_data: list[dict] = []
+            try:
+                sd_data = self.db.get_supply_demand(ticker, days=20) if self.db else []
+            except Exception:
+                logger.debug("get_supply_demand failed for %s", ticker, exc_info=True)
+
             # v10.0: 주봉 매집 점수 (종목별)
             weekly_acc_score = 0.0
             try:
                 from kstock.features.weekly_pattern import analyze_weekly_accumulation
-                sd_data = self.db.get_supply_demand(ticker, days=20) if self.db else None
                 acc_result = analyze_weekly_accumulation(ohlcv, supply_data=sd_data)
                 weekly_acc_score = acc_result.total
             except Exception:
@@ -450,10 +551,9 @@ class CommandsMixin:
             try:
                 from kstock.ml.anomaly_detector import AnomalyDetector
                 _ad = AnomalyDetector()
-                _sd_data = self.db.get_supply_demand(ticker, days=20) if self.db else []
                 _short_data = self.db.get_short_selling_latest(ticker) if self.db else None
                 _anomaly = _ad.detect_anomalies(
-                    ticker, ohlcv, _sd_data, short_data=_short_data, name=name,
+                    ticker, ohlcv, sd_data, short_data=_short_data, name=name,
                 )
                 _anomaly_score = _anomaly.anomaly_score
                 _anomaly_type = _anomaly.signal_type_encoded
@@ -524,9 +624,9 @@ class CommandsMixin:
                     )
                     # 피처를 feature_store에 축적 (학습 데이터)
                     try:
-                        from kstock.ml.feature_store import FeatureStore
+                        from kstock.ml.feature_store import open_columnar
                         from kstock.ml.predictor import persist_features
-                        _fs = FeatureStore()
+                        _fs = open_columnar()
                         persist_features(_fs, ticker, _today(), _features_built)
                     except Exception:
                         logger.debug("feature persist failed: %s", ticker, exc_info=True)
@@ -540,7 +640,9 @@ class CommandsMixin:
                         try:
                             import json as _json_ml
                             shap_str = _json_ml.dumps(ml_pred.shap_top3)
-                            self.db.add_prediction(ticker, _today(), ml_pred.probability, shap_str)
+                            self.db.add_prediction(
+                                ticker, _today(), ml_pred.probability, shap_str, defer=True,
+                            )
                         except Exception:
                             logger.debug("ml prediction log failed: %s", ticker, exc_info=True)
                 except Exception:
@@ -631,22 +733,6 @@ class CommandsMixin:
                 is_leverage_etf=(ticker in LEVERAGE_ETFS),
             )
 
-            # v9.4: 패턴 매칭 + 가격 목표 계산
-            pt_result = None
-            pr_result = None
-            try:
-                from kstock.signal.price_target import PriceTargetEngine
-                pt_engine = PriceTargetEngine()
-                pt_result = pt_engine.calculate(ohlcv, info)
-            except Exception:
-                logger.debug("PriceTarget calc failed for %s", ticker, exc_info=True)
-            try:
-                from kstock.signal.pattern_matcher import PatternMatcher
-                pm = PatternMatcher()
-                pr_result = pm.find_similar_patterns(ohlcv)
-            except Exception:
-                logger.debug("PatternMatcher calc failed for %s", ticker, exc_info=True)
-
             return ScanResult(
                 ticker=ticker, name=name, score=score,
                 tech=tech, info=info, flow=flow,
@@ -655,8 +741,8 @@ class CommandsMixin:
                 confidence_score=conf_score,
                 confidence_stars=conf_stars,
                 confidence_label=conf_label,
-                price_target=pt_result,
-                pattern_report=pr_result,
+                price_target=inputs.price_target,
+                pattern_report=inputs.pattern_report,
             )
         except Exception as e:
             logger.error("Analysis failed %s: %s", ticker, e)
@@ -717,6 +803,51 @@ class CommandsMixin:
             return base_price
         return 0.0
 
+    async def _get_prices(
+        self, base_prices: dict[str, float],
+    ) -> dict[str, float]:
+        """여러 종목 현재가. ``_get_price`` 와 같은 KIS 우선 순서 (v14).
+
+        공유 시세 캐시 → KIS REST(동시, http_pool 유량 제한) →
+        DataRouter 배치(Naver polling / yfinance 다종목) → 단건 폴백.
+        """
+        router = getattr(self, "data_router", None)
+        prices: dict[str, float] = {}
+        if router is not None:
+            prices.update(router.peek_quotes(base_prices))
+
+        todo = [t for t in base_prices if t not in prices]
+        if todo:
+            async def _kis(t: str) -> float:
+                try:
+                    return await self.kis.get_current_price(t, 0)
+                except Exception:
+                    logger.debug("_get_prices KIS failed for %s", t, exc_info=True)
+                    return 0.0
+
+            for t, p in zip(todo, await asyncio.gather(*[_kis(t) for t in todo])):
+                if p > 0:
+                    prices[t] = p
+                    if router is not None:
+                        router.put_quote(t, p, "kis_realtime")
+
+        todo = [t for t in base_prices if t not in prices]
+        if todo and router is not None:
+            markets = {
+                s["code"]: s.get("market", "KOSPI")
+                for s in getattr(self, "all_tickers", []) or []
+                if s.get("code") in base_prices
+            }
+            try:
+                prices.update(await router.get_prices(todo, markets=markets))
+            except Exception:
+                logger.debug("_get_prices batch failed", exc_info=True)
+
+        for t in base_prices:
+            if prices.get(t, 0) <= 0:
+                prices[t] = await self._get_price(t, base_prices[t])
+        return prices
+
     async def _get_price_detail(self, ticker: str, base_price: float = 0) -> dict:
         """Get price with day change info. KIS 우선 → yfinance 폴백.
 
@@ -860,12 +991,13 @@ class CommandsMixin:
 
     async def _check_holdings(self, bot) -> None:
         holdings = self.db.get_active_holdings()
+        live = await self._get_prices({h["ticker"]: h["buy_price"] for h in holdings})
         for h in holdings:
             try:
                 ticker = h["ticker"]
                 name = h["name"]
                 buy_price = h["buy_price"]
-                current = await self._get_price(ticker, buy_price)
+                current = live.get(ticker) or await self._get_price(ticker, buy_price)
                 self.db.update_holding(
                     h["id"], current_price=current,
                     pnl_pct=round((current - buy_price) / buy_price * 100, 2),
@@ -913,12 +1045,13 @@ class CommandsMixin:
 
     async def _update_recommendations(self, bot) -> None:
         active_recs = self.db.get_active_recommendations()
+        live = await self._get_prices({r["ticker"]: r["rec_price"] for r in active_recs})
         for rec in active_recs:
             try:
                 ticker = rec["ticker"]
                 name = rec["name"]
                 rec_price = rec["rec_price"]
-                current = await self._get_price(ticker, rec_price)
+                current = live.get(ticker) or await self._get_price(ticker, rec_price)
                 pnl_pct = round((current - rec_price) / rec_price * 100, 2)
                 self.db.update_recommendation(rec["id"], current_price=current, pnl_pct=pnl_pct)
 
@@ -1209,7 +1342,6 @@ class CommandsMixin:
                 return
 
             kr_universe = cfg.get("korea_universe", [])
-            from kstock.features.technical import compute_indicators
             from kstock.signal.herd_detector import detect_herd_pattern
 
             async def _scan_tb(item):
@@ -1222,7 +1354,7 @@ class CommandsMixin:
                     ohlcv = await self.yf_client.get_ohlcv(code, market, period="3mo")
                     if ohlcv is None or ohlcv.empty or len(ohlcv) < 20:
                         return None
-                    tech = compute_indicators(ohlcv)
+                    tech = get_ohlcv_cache().indicators(code, ohlcv)
                     close_s = ohlcv["close"].astype(float)
                     vol_s = ohlcv["volume"].astype(float)
                     close = float(close_s.iloc[-1])
@@ -1432,7 +1564,6 @@ class CommandsMixin:
                     })
                     seen.add(item["code"])
 
-            from kstock.features.technical import compute_indicators
             from kstock.signal.herd_detector import detect_herd_pattern
 
             batched_ohlcv = {}
@@ -1458,7 +1589,7 @@ class CommandsMixin:
                         ohlcv = await self.yf_client.get_ohlcv(ticker, market, period="3mo")
                     if ohlcv is None or ohlcv.empty or len(ohlcv) < 20:
                         return None
-                    tech = compute_indicators(ohlcv)
+                    tech = get_ohlcv_cache().indicators(ticker, ohlcv)
                     close_s = ohlcv["close"].astype(float)
                     vol_s = ohlcv["volume"].astype(float)
                     close = float(close_s.iloc[-1])
@@ -3186,7 +3317,8 @@ class CommandsMixin:
         """Handle /health command - show system health."""
         try:
             self._persist_chat_id(update)
-            checks = run_health_checks(db_path=self.db.db_path)
+            pool_stats = self.db.pool_stats() if hasattr(self.db, "pool_stats") else None
+            checks = run_health_checks(db_path=self.db.db_path, pool_stats=pool_stats)
             msg = format_system_report(checks, db_path=self.db.db_path)
             await update.message.reply_text(msg, reply_markup=get_reply_markup(context))
         except Exception as e:
@@ -49,8 +49,10 @@ class CoreHandlersMixin:
         self._scan_backoff_until: datetime | None = None
         self._sector_strengths: list = []
         self._sector_strengths_time: float = 0.0
-        self._ohlcv_cache: dict = {}      # {ticker: DataFrame}
-        self._ohlcv_cache_time: float = 0  # v9.3.3: 캐시 생성 시각 (monotonic)
+        # 프로세스 공용 OHLCV 캐시 (종목별 TTL + LRU + lake backfill)
+        self._ohlcv_cache = get_ohlcv_cache()
+        # v14: 받은 일봉을 daily_bars 에도 쌓아 리스크/차트가 로컬에서 읽게
+        self._ohlcv_cache.bar_store = self.db
         # v3.0: KIS broker + data router
         self.kis_broker = KisBroker()
         self.data_router = DataRouter(
@@ -76,6 +78,11 @@ class CoreHandlersMixin:
         self.ai_router = self.ai
         # v3.6: KIS WebSocket (실시간 호가)
         self.ws = KISWebSocket()
+        # v14: DataRouter 배치 시세가 구독 종목 체결가 스냅샷을 먼저 쓰도록
+        self.data_router.ws = self.ws
+        # v14: 체결 틱 → 1분/5분 봉 실시간 집계 (장 종료 시 레이크 저장)
+        self.bar_aggregator = BarAggregator(store=IntradayBarStore())
+        self.bar_aggregator.attach(self.ws)
         self._recent_callbacks: dict[tuple[int, int, str], float] = {}
         self._callback_expiry_sec = 12 * 60 * 60
         self._callback_dedupe_sec = 1.5
@@ -184,6 +191,13 @@ class CoreHandlersMixin:
                 await self._control_server.stop()
         except Exception as e:
             logger.warning("ControlServer shutdown error: %s", e)
+        # DB write-behind 버퍼 flush (스캔 중 쌓인 수급/이벤트/예측)
+        try:
+            flushed = self.db.flush_writes()
+            if flushed:
+                logger.info("DB write buffer flushed: %d rows", flushed)
+        except Exception as e:
+            logger.warning("DB write buffer flush error: %s", e)
         # v9.6.3: DB ThreadPoolExecutor 정리
         try:
             from kstock.store._base import StoreBase
@@ -42,7 +42,7 @@ except Exception:
 # 레짐 변경 쿨다운 (초)
 _RESCHEDULE_COOLDOWN = 300  # 5분
 _INTRADAY_SCAN_CACHE_TTL = 180
-_INTRADAY_SCAN_MAX_TICKERS = 18
+_INTRADAY_SCAN_MAX_TICKERS = 24
 
 
 def _is_kr_live_session(now: _dt | None = None) -> bool:
@@ -1203,7 +1203,7 @@ class SchedulerMixin:
                                         break
                                 ohlcv = await self.yf_client.get_ohlcv(ticker, market, period="3mo")
                                 if ohlcv is not None and not ohlcv.empty and len(ohlcv) >= 20:
-                                    tech = compute_indicators(ohlcv)
+                                    tech = get_ohlcv_cache().indicators(ticker, ohlcv)
                                     cp = float(h.get("current_price") or 0)
                                     supply = self.db.get_supply_demand(ticker, days=5)
                                     h["chart_summary"] = build_chart_summary(
@@ -3529,8 +3529,7 @@ class SchedulerMixin:
                         w["ticker"], market, period="3mo",
                     )
                     if ohlcv is not None and not ohlcv.empty and len(ohlcv) >= 20:
-                        from kstock.features.technical import compute_indicators
-                        tech = compute_indicators(ohlcv)
+                        tech = get_ohlcv_cache().indicators(w["ticker"], ohlcv)
                         w["rsi"] = tech.rsi
                         w["bb_pctb"] = tech.bb_pctb
                         w["macd_cross"] = tech.macd_signal_cross
@@ -4500,7 +4499,7 @@ class SchedulerMixin:
             timing_action = ""
             try:
                 ohlcv_cache = getattr(self, "_ohlcv_cache", None) or {}
-                ohlcv = ohlcv_cache.get(ticker) if isinstance(ohlcv_cache, dict) else None
+                ohlcv = ohlcv_cache.get(ticker) if hasattr(ohlcv_cache, "get") else None
                 yf_client = getattr(self, "yf_client", None)
                 if (ohlcv is None or getattr(ohlcv, "empty", True)) and yf_client is not None:
                     ohlcv = yf_client.get_ohlcv(ticker, period="6mo")
@@ -5946,11 +5945,12 @@ class SchedulerMixin:
                 "fear": 150,
                 "panic": 120,
             }.get(regime, _INTRADAY_SCAN_CACHE_TTL)
+            # 파이프라인 스캔(단계별 워커 풀)으로 같은 TTL 안에 더 많은 종목을 본다
             scan_max_tickers = {
-                "calm": 12,
+                "calm": 16,
                 "normal": _INTRADAY_SCAN_MAX_TICKERS,
-                "fear": 20,
-                "panic": 24,
+                "fear": 28,
+                "panic": 32,
             }.get(regime, _INTRADAY_SCAN_MAX_TICKERS)
 
             backoff_until = getattr(self, "_scan_backoff_until", None)
@@ -6038,7 +6038,7 @@ class SchedulerMixin:
                     ohlcv = await self.yf_client.get_ohlcv(ticker, market, period="1mo")
                     if ohlcv is None or ohlcv.empty or len(ohlcv) < 20:
                         continue
-                    tech = compute_indicators(ohlcv)
+                    tech = get_ohlcv_cache().indicators(ticker, ohlcv)
                     cp = float(h.get("current_price") or 0)
                     bp = float(h.get("buy_price") or 0)
                     hold_days = 0
@@ -9373,14 +9373,20 @@ class SchedulerMixin:
 
     async def job_ws_disconnect(self, context: ContextTypes.DEFAULT_TYPE) -> None:
         """장 종료 후 WebSocket 연결 해제."""
-        if not self.ws.is_connected:
-            return
-        try:
-            subs = len(self.ws.get_subscriptions())
-            await self.ws.disconnect()
-            logger.info("WebSocket disconnected (%d subs)", subs)
-        except Exception as e:
-            logger.error("WebSocket disconnect job failed: %s", e)
+        if self.ws.is_connected:
+            try:
+                subs = len(self.ws.get_subscriptions())
+                await self.ws.disconnect()
+                logger.info("WebSocket disconnected (%d subs)", subs)
+            except Exception as e:
+                logger.error("WebSocket disconnect job failed: %s", e)
+        # v14: 당일 1분/5분 봉 Parquet 레이크 저장
+        bars = getattr(self, "bar_aggregator", None)
+        if bars is not None:
+            try:
+                await asyncio.to_thread(bars.persist)
+            except Exception:
+                logger.debug("intraday bar persist failed", exc_info=True)
 
     # == Realtime WebSocket: 급등 감지 + 매도 가이드 ========================
 
@@ -10272,7 +10278,7 @@ class SchedulerMixin:
             try:
                 from kstock.core.advanced_risk import (
                     compute_advanced_var,
-                    compute_dynamic_correlation,
+                    compute_correlation_matrices,
                     format_risk_report,
                 )
                 import pandas as pd
@@ -10281,15 +10287,12 @@ class SchedulerMixin:
                 # 보유 종목의 OHLCV 데이터로 수익률 행렬 구성
                 tickers_held = [h.get("ticker", "") for h in holdings if h.get("ticker")]
                 returns_data = {}
-                for t in tickers_held[:10]:  # 상위 10종목만 (성능)
-                    try:
-                        ohlcv = self.db.get_ohlcv(t, days=120)
-                        if ohlcv and len(ohlcv) >= 30:
-                            closes = [row.get("close", 0) for row in ohlcv]
-                            rets = np.diff(np.log(np.array(closes, dtype=float)))
-                            returns_data[t] = rets
-                    except Exception:
-                        continue
+                # v14: 로컬 일봉(daily_bars)에서 전 보유종목 종가 패널을 한 번에 읽는다
+                close_panel = self.db.get_close_panel(tickers_held, days=120)
+                for t in close_panel.columns:
+                    closes = close_panel[t].dropna().to_numpy(dtype=float)
+                    if len(closes) >= 30:
+                        returns_data[t] = np.diff(np.log(closes))
 
                 if len(returns_data) >= 2:
                     # 수익률 행렬 구성
@@ -10332,31 +10335,24 @@ class SchedulerMixin:
                                 lines.append(f"    {n}: {cv:.2f}%")
                         lines.append("")
 
-                    # 상위 보유종목 간 동적 상관관계
-                    top_tickers = sorted(
-                        port_weights.items(), key=lambda x: -x[1],
-                    )[:3]
-                    if len(top_tickers) >= 2:
-                        corr_items = []
-                        for i in range(len(top_tickers)):
-                            for j in range(i + 1, len(top_tickers)):
-                                t_a, _ = top_tickers[i]
-                                t_b, _ = top_tickers[j]
-                                if t_a in rm.columns and t_b in rm.columns:
-                                    dc = compute_dynamic_correlation(
-                                        rm[t_a].values, rm[t_b].values,
-                                        ticker_a=t_a, ticker_b=t_b,
-                                    )
-                                    regime_emoji = {"normal": "🟢", "stress": "🟡", "crisis": "🔴"}.get(dc.regime, "⚪")
-                                    n_a = next((h["name"] for h in holdings if h.get("ticker") == t_a), t_a)
-                                    n_b = next((h["name"] for h in holdings if h.get("ticker") == t_b), t_b)
-                                    corr_items.append(
-                                        f"  {n_a}-{n_b}: {dc.rolling_60d:.2f} {regime_emoji}"
-                                    )
-                        if corr_items:
-                            lines.append("🔗 종목간 상관관계")
-                            lines.extend(corr_items)
-                            lines.append("")
+                    # v14: 전 보유종목 N² 쌍 상관 행렬 → 가장 높은 상관 5쌍
+                    # (쌍별 결측 허용 — 상장 기간이 짧은 종목도 포함)
+                    log_panel = np.log(close_panel[list(returns_data)].astype(float))
+                    mats = compute_correlation_matrices(log_panel.diff().iloc[1:])
+                    corr_items = []
+                    regime_emojis = {"normal": "🟢", "stress": "🟡", "crisis": "🔴"}
+                    for t_a, t_b, _ in mats.top_pairs(5):
+                        dc = mats.pair(t_a, t_b)
+                        regime_emoji = regime_emojis.get(dc.regime, "⚪")
+                        n_a = next((h["name"] for h in holdings if h.get("ticker") == t_a), t_a)
+                        n_b = next((h["name"] for h in holdings if h.get("ticker") == t_b), t_b)
+                        corr_items.append(
+                            f"  {n_a}-{n_b}: {dc.rolling_60d:.2f} {regime_emoji}"
+                        )
+                    if corr_items:
+                        lines.append("🔗 종목간 상관관계")
+                        lines.extend(corr_items)
+                        lines.append("")
 
             except Exception as e:
                 logger.debug("Advanced risk in EOD report: %s", e)
@@ -10432,7 +10428,8 @@ class SchedulerMixin:
             )
 
             db_path = getattr(self.db, 'db_path', None) or "data/kquant.db"
-            checks = run_health_checks(db_path=db_path)
+            pool_stats = self.db.pool_stats() if hasattr(self.db, "pool_stats") else None
+            checks = run_health_checks(db_path=db_path, pool_stats=pool_stats)
 
             # 실패한 체크만 필터
             failed = [c for c in checks if c.status in ("error", "warning")]
@@ -11203,6 +11200,7 @@ class SchedulerMixin:
                 merge_related_topic_groups,
                 analyze_urgent_news,
                 make_alert_hash,
+                get_news_index,
             )
 
             # 1. RSS 뉴스 수집
@@ -11258,9 +11256,13 @@ class SchedulerMixin:
                     groups = merge_related_topic_groups(groups)
 
                     # DB 기반 중복 방지 (재시작 후에도 유지)
+                    # v14: 최근 알린 사건은 48h LSH 인덱스로 먼저 걸러 DB 재조회 생략
+                    news_index = get_news_index()
                     new_groups = []
                     seen_cycle_topics: set[str] = set()
                     for group in groups:
+                        if news_index.is_alerted(group[0].title, hours=24):
+                            continue
                         h = make_alert_hash(group)
                         title_summary = group[0].title[:100]
                         topic_key = make_alert_hash(group[:1])
@@ -11322,6 +11324,7 @@ class SchedulerMixin:
                                 h = make_alert_hash(group)
                                 title = group[0].title[:100]
                                 self.db.save_sent_alert(h, title)
+                                news_index.mark_alerted(group)
                             logger.info(
                                 "Urgent news alert sent: %d groups (%d items)",
                                 len(new_groups),
@@ -11705,7 +11708,7 @@ class SchedulerMixin:
 
                     # 패턴 매칭
                     if ohlcv is not None and not ohlcv.empty and len(ohlcv) >= 40:
-                        pr = pm.find_similar_patterns(ohlcv)
+                        pr = pm.find_best(ohlcv, ticker=ticker)
                         pattern_summary = format_pattern_for_debate(pr)
 
                     # 가격 목표
@@ -864,7 +864,7 @@ class TradingMixin:
                                 break
                         ohlcv = await self.yf_client.get_ohlcv(ticker, market, period="3mo")
                         if ohlcv is not None and not ohlcv.empty and len(ohlcv) >= 20:
-                            tech = compute_indicators(ohlcv)
+                            tech = get_ohlcv_cache().indicators(ticker, ohlcv)
                             cp = float(h.get("current_price") or 0)
                             supply = self.db.get_supply_demand(ticker, days=5)
                             h["chart_summary"] = build_chart_summary(
@@ -1005,7 +1005,7 @@ class TradingMixin:
 
             if ohlcv is not None and not ohlcv.empty and len(ohlcv) >= 40:
                 pm = PatternMatcher()
-                pr = pm.find_similar_patterns(ohlcv)
+                pr = pm.find_best(ohlcv, ticker=ticker)
                 pattern_summary = format_pattern_for_debate(pr)
 
             if ohlcv is not None and not ohlcv.empty:
@@ -0,0 +1,381 @@
+"""AI 응답 캐시 — 내용 주소 기반 + 동시 호출 합류 (single-flight).
+
+v14: AIRouter.analyze / debate_engine._call_ai 가 공유한다.
+키 = (task, provider/model tier, 생성 파라미터, 데이터 버전 태그,
+정규화한 system·prompt 해시).  같은 데이터로 몇 분 전에 답한 요청
+(아침 브리핑, 매니저 브리핑, 종목 상세 재탭 등) 은 API를 다시 부르지 않는다.
+
+- 메모리 LRU + SQLite 영속 계층 (재시작 후에도 TTL 안이면 재사용)
+- task 별 TTL (SECTION_TTL_SECONDS 와 같은 방식), 0 이면 저장 안 함
+- 동일 키 동시 호출은 첫 호출 결과를 함께 기다린다 (TTL 0 이어도 적용)
+- 적중률 / 절감 지연·비용 통계 → AIRouter.get_status
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_DB = Path("data/ai_response_cache.db")
+
+RESPONSE_TTL_SECONDS: dict[str, float] = {
+    "sentiment": 900,
+    "news_summary": 900,
+    "morning_briefing": 1800,
+    "live_market": 120,
+    "technical_analysis": 600,
+    "fundamental_analysis": 3600,
+    "diagnosis_batch": 600,
+    "sector_analysis": 1800,
+    "deep_analysis": 900,
+    "strategy_synthesis": 900,
+    "pdf_report": 3600,
+    "eod_report": 3600,
+    "us_premarket": 1800,
+    "youtube_synthesis": 3600,
+    "macro_shock_step1": 600,
+    "macro_shock_step2": 600,
+    "macro_shock_combined": 600,
+    "preopen_action": 900,
+    "opening_reality_check": 600,
+    "shock_attribution": 1800,
+    "youtube_screening": 86400,
+    "column_summary": 86400,
+    "daily_synthesis": 3600,
+    "daily_synthesis_quality": 3600,
+    "debate": 1800,
+    # 대화는 재질문 = 재생성 의도 → 저장하지 않고 동시 중복만 합친다
+    "chat": 0,
+    "vision_ocr": 0,
+}
+_DEFAULT_RESPONSE_TTL = 0.0
+_MEMORY_ENTRIES = 256
+_PRUNE_EVERY = 100
+
+# 시:분(:초) 는 매 호출 달라지므로 키에서 제외한다
+_CLOCK_RE = re.compile(r"\b\d{1,2}:\d{2}(?::\d{2})?\b")
+_SPACE_RE = re.compile(r"[ \t]+")
+
+
+def normalize_prompt(text: str) -> str:
+    """키 계산용 정규화 — 줄 끝 공백/연속 공백/빈 줄 정리 + 시각 마스킹."""
+    if not text:
+        return ""
+    text = _CLOCK_RE.sub("<t>", text)
+    lines = [_SPACE_RE.sub(" ", line).strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def response_cache_key(
+    task: str,
+    route: str,
+    system: str,
+    prompt: str,
+    *,
+    data_version: str = "",
+    params: tuple = (),
+) -> str:
+    """요청 내용 기반 캐시 키 (sha256)."""
+    h = hashlib.sha256()
+    for part in (task, route, data_version, repr(params), normalize_prompt(system)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x1f")
+    h.update(normalize_prompt(prompt).encode("utf-8"))
+    return h.hexdigest()
+
+
+def is_cacheable_response(text: str) -> bool:
+    """오류/불가 응답은 저장하지 않는다."""
+    if not text or not text.strip():
+        return False
+    head = text.lstrip()[:40]
+    return not (head.startswith("[AI 응답 불가]") or head.startswith('{"error"'))
+
+
+@dataclass
+class _CachedResponse:
+    text: str
+    expires_at: float  # time.time()
+    latency_ms: float
+    cost_usd: float
+
+
+@dataclass
+class ResponseCacheStats:
+    """응답 캐시 통계."""
+
+    lookups: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    stores: int = 0
+    saved_latency_ms: float = 0.0
+    saved_cost_usd: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class AIResponseCache:
+    """task 별 TTL 응답 캐시 (메모리 LRU + SQLite) + single-flight."""
+
+    def __init__(
+        self,
+        db_path: Path | str | None = RESPONSE_CACHE_DB,
+        ttls: dict[str, float] | None = None,
+        max_memory_entries: int = _MEMORY_ENTRIES,
+    ) -> None:
+        self._ttls = dict(RESPONSE_TTL_SECONDS if ttls is None else ttls)
+        self._max_memory = max_memory_entries
+        self._memory: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._inflight: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Future]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = ResponseCacheStats()
+        self._writes_since_prune = 0
+        self._conn: sqlite3.Connection | None = None
+        if db_path:
+            self._open_disk(Path(db_path))
+
+    # ── 디스크 계층 ──────────────────────────────────────
+
+    def _open_disk(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_responses ("
+                " key TEXT PRIMARY KEY, task TEXT, response TEXT,"
+                " expires_at REAL, latency_ms REAL, cost_usd REAL)"
+            )
+            conn.execute("DELETE FROM ai_responses WHERE expires_at < ?", (time.time(),))
+            conn.commit()
+            self._conn = conn
+        except Exception:
+            logger.warning("AI response cache disk tier disabled (%s)", path, exc_info=True)
+            self._conn = None
+
+    def _disk_get(self, key: str) -> _CachedResponse | None:
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT response, expires_at, latency_ms, cost_usd"
+                " FROM ai_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        except Exception:
+            logger.debug("AI response cache read failed", exc_info=True)
+            return None
+        if not row or row[1] < time.time():
+            return None
+        return _CachedResponse(row[0], row[1], row[2] or 0.0, row[3] or 0.0)
+
+    def _disk_put(self, key: str, task: str, entry: _CachedResponse) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_responses"
+                " (key, task, response, expires_at, latency_ms, cost_usd)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, task, entry.text, entry.expires_at, entry.latency_ms, entry.cost_usd),
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= _PRUNE_EVERY:
+                self._conn.execute(
+                    "DELETE FROM ai_responses WHERE expires_at < ?", (time.time(),),
+                )
+                self._writes_since_prune = 0
+            self._conn.commit()
+        except Exception:
+            logger.debug("AI response cache write failed", exc_info=True)
+
+    # ── 조회 / 저장 ──────────────────────────────────────
+
+    def ttl(self, task: str) -> float:
+        return self._ttls.get(task, _DEFAULT_RESPONSE_TTL)
+
+    def lookup(self, key: str) -> str | None:
+        """만료되지 않은 응답 (메모리 → 디스크).  적중 시 절감 통계 반영."""
+        now = time.time()
+        with self._lock:
+            self._stats.lookups += 1
+            entry = self._memory.get(key)
+            if entry is not None and entry.expires_at >= now:
+                self._memory.move_to_end(key)
+                self._record_hit(entry, "memory")
+                return entry.text
+            if entry is not None:
+                del self._memory[key]
+            entry = self._disk_get(key)
+            if entry is not None:
+                self._remember(key, entry)
+                self._record_hit(entry, "disk")
+                return entry.text
+            return None
+
+    def store(
+        self, key: str, task: str, text: str,
+        latency_ms: float = 0.0, cost_usd: float = 0.0,
+    ) -> None:
+        ttl = self.ttl(task)
+        if ttl <= 0 or not is_cacheable_response(text):
+            return
+        entry = _CachedResponse(text, time.time() + ttl, latency_ms, cost_usd)
+        with self._lock:
+            self._stats.stores += 1
+            self._remember(key, entry)
+            self._disk_put(key, task, entry)
+
+    def _remember(self, key: str, entry: _CachedResponse) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+
+    def _record_hit(self, entry: _CachedResponse, tier: str) -> None:
+        if tier == "memory":
+            self._stats.memory_hits += 1
+        elif tier == "disk":
+            self._stats.disk_hits += 1
+        else:
+            self._stats.coalesced += 1
+        self._stats.saved_latency_ms += entry.latency_ms
+        self._stats.saved_cost_usd += entry.cost_usd
+
+    async def get_or_call(
+        self,
+        key: str,
+        task: str,
+        call: Callable[[], Awaitable[tuple[str, float]]],
+    ) -> str:
+        """캐시 적중이면 바로 반환, 같은 키가 진행 중이면 합류, 아니면 call().
+
+        call() 은 (응답, 비용 USD) 를 돌려준다.  지연은 여기서 잰다.
+        실제 호출은 캐시가 소유한 별도 Task 에서 돌므로, 첫 호출자가 취소돼도
+        (wait_for 타임아웃 등) 합류한 호출자는 결과를 그대로 받는다.
+        """
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight_for_loop()
+        shared = inflight.get(key)
+        if shared is not None and not shared.done():
+            text, latency_ms, cost_usd = await asyncio.shield(shared)
+            with self._lock:
+                self._record_hit(_CachedResponse(text, 0.0, latency_ms, cost_usd), "coalesced")
+            return text
+
+        with self._lock:
+            self._stats.misses += 1
+        shared = asyncio.ensure_future(self._call_and_store(key, task, call))
+        inflight[key] = shared
+        shared.add_done_callback(lambda done: self._call_finished(inflight, key, done))
+        text, _, _ = await asyncio.shield(shared)
+        return text
+
+    def _inflight_for_loop(self) -> dict[str, asyncio.Future]:
+        """진행 중 호출 표 — Future 는 루프에 묶이므로 실행 중 루프별로 둔다."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            inflight = self._inflight.get(loop)
+            if inflight is None:
+                inflight = self._inflight[loop] = {}
+            return inflight
+
+    async def _call_and_store(
+        self,
+        key: str,
+        task: str,
+        call: Callable[[], Awaitable[tuple[str, float]]],
+    ) -> tuple[str, float, float]:
+        t0 = time.perf_counter()
+        text, cost_usd = await call()
+        latency_ms = (time.perf_counter() - t0) * 1000
+        self.store(key, task, text, latency_ms, cost_usd)
+        return text, latency_ms, cost_usd
+
+    @staticmethod
+    def _call_finished(
+        inflight: dict[str, asyncio.Future], key: str, done: asyncio.Future,
+    ) -> None:
+        if inflight.get(key) is done:
+            del inflight[key]
+        if not done.cancelled():
+            done.exception()  # 기다리는 호출자가 없어도 "never retrieved" 경고 방지
+
+    # ── 관리 / 통계 ──────────────────────────────────────
+
+    def invalidate(self, task: str | None = None) -> None:
+        """task 의 (또는 전체) 저장 응답 삭제."""
+        with self._lock:
+            if task is None:
+                self._memory.clear()
+                if self._conn is not None:
+                    self._conn.execute("DELETE FROM ai_responses")
+                    self._conn.commit()
+                return
+            if self._conn is not None:
+                keys = [
+                    row[0] for row in self._conn.execute(
+                        "SELECT key FROM ai_responses WHERE task = ?", (task,),
+                    )
+                ]
+                self._conn.execute("DELETE FROM ai_responses WHERE task = ?", (task,))
+                self._conn.commit()
+                for key in keys:
+                    self._memory.pop(key, None)
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(**vars(self._stats))
+
+    def format_status(self) -> str:
+        """get_status 용 한두 줄 요약 (조회가 없으면 빈 문자열)."""
+        s = self.stats()
+        if not s.lookups:
+            return ""
+        return (
+            f"🧠 응답 캐시: {s.hits}/{s.lookups} 적중 ({s.hit_rate:.0%})"
+            f" | 메모리 {s.memory_hits} · 디스크 {s.disk_hits} · 합류 {s.coalesced}\n"
+            f"   절감: ~{s.saved_latency_ms / 1000:.1f}초 | ~${s.saved_cost_usd:.4f}"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_response_cache: AIResponseCache | None = None
+
+
+def get_response_cache() -> AIResponseCache:
+    """프로세스 공용 AI 응답 캐시."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = AIResponseCache()
+    return _response_cache
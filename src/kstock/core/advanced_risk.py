@@ -4,6 +4,7 @@ risk_engine.py의 기본 VaR/Monte Carlo를 보완하는 고급 분석 모듈.
 - Almgren-Chriss / Kyle 시장충격 모델
 - Implementation Shortfall 기반 TCA
 - DCC-GARCH 간소화 동적 상관관계 + Tail dependency
+- v14: (T × N) 패널 전체 쌍 상관/꼬리 의존 행렬 엔진 + EWMA 증분 상태
 - Cornish-Fisher VaR + Component/Marginal/Incremental VaR
 - Gaussian / t-copula VaR 시뮬레이션
 
@@ -18,6 +19,13 @@ from dataclasses import dataclass, field
 import numpy as np
 import pandas as pd
 
+from kstock.core.monte_carlo import (
+    chunk_rows,
+    cholesky_factor,
+    simulate_streaming,
+    standard_normals,
+)
+
 logger = logging.getLogger(__name__)
 
 # scipy optional (fallback z-score 테이블)
@@ -534,6 +542,278 @@ def _empty_correlation(ticker_a: str, ticker_b: str) -> DynamicCorrelation:
     )
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 3b. Correlation Matrix Engine (v14)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# compute_dynamic_correlation 의 지표를 (T × N) 수익률 패널 전체 N² 쌍에
+# 대해 행렬곱으로 한 번에 계산한다.  NaN은 쌍별 결측(pairwise complete)으로
+# 처리한다.  쌍별 함수와의 차이:
+# - rolling 창은 패널의 마지막 window 행 (쌍별 유효 행이 아님)
+# - σ (위기 임계값) 는 종목별 전체 유효 행 기준
+# - tail dependency 의 Kendall τ 는 최근 ``lookback`` 행만 사용 (τ-a)
+
+_REGIMES = ("normal", "stress", "crisis")
+_CORR_MIN_OBS = 10
+_CRISIS_MIN_OBS = 3
+_REGIME_RECENT = 20
+
+
+def _as_panel(returns) -> tuple[np.ndarray, list[str]]:
+    if isinstance(returns, pd.DataFrame):
+        return returns.to_numpy(dtype=np.float64), [str(c) for c in returns.columns]
+    x = np.asarray(returns, dtype=np.float64)
+    if x.ndim != 2:
+        raise ValueError("returns must be a (T x N) panel")
+    return x, [str(i) for i in range(x.shape[1])]
+
+
+def _masked_corr(x: np.ndarray, mask: np.ndarray, min_obs: int = 2) -> np.ndarray:
+    """행 마스크 하의 쌍별 Pearson 상관 (i,j 둘 다 mask 인 행만).
+
+    정의되지 않는 쌍 (관측 < min_obs, 분산 0) 은 NaN.
+    """
+    m = mask.astype(np.float64)
+    x0 = np.where(mask, x, 0.0)
+    n = m.T @ m
+    sx = x0.T @ m                # sx[i, j] = Σ x_i  (i,j 둘 다 유효한 행)
+    sxx = (x0 * x0).T @ m
+    sxy = x0.T @ x0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = n * sxy - sx * sx.T
+        var = n * sxx - sx * sx
+        denom = np.sqrt(var * var.T)
+        corr = cov / denom
+    # 분산이 수치 오차 수준이면 상수열로 본다
+    scale = np.maximum(n * sxx, 1e-300)
+    degenerate = (var <= 1e-12 * scale) | (var.T <= 1e-12 * scale.T)
+    corr[(n < min_obs) | degenerate | ~np.isfinite(corr)] = np.nan
+    return np.clip(corr, -1.0, 1.0)
+
+
+def correlation_matrix(returns, window: int | None = None, min_obs: int = 2) -> np.ndarray:
+    """(T × N) 수익률 패널의 쌍별 Pearson 상관 행렬 (마지막 ``window`` 행).
+
+    결측은 쌍별로 제외하고, 정의되지 않는 쌍은 NaN.
+    """
+    x, _ = _as_panel(returns)
+    if window:
+        x = x[-window:]
+    return _masked_corr(x, ~np.isnan(x), min_obs=min_obs)
+
+
+def _kendall_tau_matrix(x: np.ndarray) -> np.ndarray:
+    """쌍별 Kendall τ-a (동점/결측 쌍 제외) — 부호 행렬 곱 한 번."""
+    t = x.shape[0]
+    iu, ju = np.triu_indices(t, k=1)
+    s = np.sign(x[ju] - x[iu])             # (T(T-1)/2 × N), NaN 포함 쌍은 NaN
+    s = np.nan_to_num(s, nan=0.0).astype(np.float32)
+    a = np.abs(s)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tau = (s.T @ s) / (a.T @ a)
+    return np.nan_to_num(tau.astype(np.float64), nan=0.0)
+
+
+def _clayton_from_tau(tau: np.ndarray) -> np.ndarray:
+    """Clayton lower tail dependency λ_L = 2^(-1/θ), θ = 2τ/(1-τ)."""
+    out = np.zeros_like(tau)
+    pos = tau > 0
+    theta = 2.0 * tau[pos] / np.maximum(1.0 - tau[pos], 1e-8)
+    out[pos] = 2.0 ** (-1.0 / theta)
+    return np.clip(out, 0.0, 1.0)
+
+
+class EWMACorrelationState:
+    """EWMA(λ) 공분산 상태 — 매일 수익률 한 행으로 O(N²) 갱신.
+
+    Q_t = λ·Q_{t-1} + (1-λ)·d_t d_tᵀ,  d_t = r_t - μ (μ는 초기 패널 평균).
+    상관 = Q_ij / sqrt(Q_ii·Q_jj).  결측 종목은 그날 편차 0으로 둔다.
+    결측 없는 패널에서는 _ewma_correlation 과 같은 값을 낸다.
+    """
+
+    def __init__(self, tickers: list[str], decay: float = 0.94) -> None:
+        self.tickers = list(tickers)
+        self.decay = decay
+        n = len(self.tickers)
+        self.mean = np.zeros(n)
+        self.cov = np.zeros((n, n))
+        self.n_updates = 0
+        self._index = {t: i for i, t in enumerate(self.tickers)}
+
+    @classmethod
+    def from_returns(cls, returns, decay: float = 0.94) -> "EWMACorrelationState":
+        x, tickers = _as_panel(returns)
+        state = cls(tickers, decay)
+        if x.size:
+            with np.errstate(invalid="ignore"):
+                state.mean = np.nan_to_num(np.nanmean(x, axis=0))
+            d = np.nan_to_num(x - state.mean)
+            w = (1 - decay) * decay ** np.arange(len(d) - 1, -1, -1)
+            state.cov = (d * w[:, None]).T @ d
+            state.n_updates = len(d)
+        return state
+
+    def update(self, row) -> None:
+        """하루치 수익률 반영 (ticker→수익률 dict/Series 또는 tickers 순서 배열)."""
+        if isinstance(row, (dict, pd.Series)):
+            r = np.full(len(self.tickers), np.nan)
+            for t, v in row.items():
+                i = self._index.get(str(t))
+                if i is not None:
+                    r[i] = v
+        else:
+            r = np.asarray(row, dtype=np.float64)
+        d = np.nan_to_num(r - self.mean)
+        self.cov *= self.decay
+        self.cov += (1 - self.decay) * np.outer(d, d)
+        self.n_updates += 1
+
+    def corr(self) -> np.ndarray:
+        sd = np.sqrt(np.diag(self.cov))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            c = self.cov / np.outer(sd, sd)
+        c[~np.isfinite(c)] = 0.0
+        np.fill_diagonal(c, 1.0)
+        return np.clip(c, -1.0, 1.0)
+
+
+@dataclass
+class CorrelationMatrices:
+    """N 종목 전체 쌍의 동적 상관관계 행렬 묶음."""
+    tickers: list[str]
+    rolling_60d: np.ndarray
+    rolling_120d: np.ndarray
+    ewma: np.ndarray
+    crisis: np.ndarray
+    tail: np.ndarray
+    regime: np.ndarray            # 0=normal, 1=stress, 2=crisis
+    n_obs: np.ndarray             # 쌍별 유효 관측 수
+    ewma_state: EWMACorrelationState | None = None
+
+    def index(self, ticker: str) -> int:
+        return self.tickers.index(ticker)
+
+    def pair(self, ticker_a: str, ticker_b: str) -> DynamicCorrelation:
+        """쌍 하나를 compute_dynamic_correlation 형식으로."""
+        if ticker_a not in self.tickers or ticker_b not in self.tickers:
+            return _empty_correlation(ticker_a, ticker_b)
+        i, j = self.index(ticker_a), self.index(ticker_b)
+        return DynamicCorrelation(
+            ticker_a=ticker_a,
+            ticker_b=ticker_b,
+            rolling_60d=round(float(self.rolling_60d[i, j]), 4),
+            rolling_120d=round(float(self.rolling_120d[i, j]), 4),
+            crisis_correlation=round(float(self.crisis[i, j]), 4),
+            tail_correlation=round(float(self.tail[i, j]), 4),
+            regime=_REGIMES[int(self.regime[i, j])],
+        )
+
+    def frame(self, kind: str = "rolling_60d") -> pd.DataFrame:
+        """행렬 하나를 종목 라벨 DataFrame으로."""
+        return pd.DataFrame(getattr(self, kind), index=self.tickers, columns=self.tickers)
+
+    def top_pairs(
+        self, k: int = 5, kind: str = "rolling_60d", tickers: list[str] | None = None,
+    ) -> list[tuple[str, str, float]]:
+        """값이 큰 순서로 상위 k 쌍 (i<j).  ``tickers`` 로 후보를 좁힐 수 있다."""
+        m = getattr(self, kind)
+        idx = (
+            np.arange(len(self.tickers)) if tickers is None
+            else np.array([self.index(t) for t in tickers if t in self.tickers], dtype=int)
+        )
+        if len(idx) < 2:
+            return []
+        sub = m[np.ix_(idx, idx)]
+        iu, ju = np.triu_indices(len(idx), k=1)
+        vals = sub[iu, ju]
+        order = np.argsort(-vals, kind="stable")[:k]
+        return [
+            (self.tickers[idx[iu[o]]], self.tickers[idx[ju[o]]], round(float(vals[o]), 4))
+            for o in order
+        ]
+
+    def update(self, row) -> None:
+        """일일 수익률 한 행으로 EWMA 행렬만 증분 갱신 (나머지는 다음 전체 계산 때)."""
+        if self.ewma_state is None:
+            raise ValueError("ewma_state not available")
+        self.ewma_state.update(row)
+        self.ewma = self.ewma_state.corr()
+
+
+def compute_correlation_matrices(
+    returns,
+    lookback: int = 120,
+    decay: float = 0.94,
+) -> CorrelationMatrices:
+    """(T × N) 수익률 패널 → 전체 쌍 rolling-60/120, EWMA, 위기 조건부, Clayton 꼬리 행렬.
+
+    Args:
+        returns: DataFrame(index=날짜, columns=종목) 또는 (T × N) 배열.
+        lookback: rolling 장기 창 + Kendall τ 표본 길이.
+        decay: EWMA λ (RiskMetrics 0.94).
+
+    Returns:
+        CorrelationMatrices — 대각은 1, 관측 10개 미만 쌍은 0/normal.
+    """
+    x, tickers = _as_panel(returns)
+    n = len(tickers)
+    valid = ~np.isnan(x)
+    m = valid.astype(np.float64)
+    n_obs = (m.T @ m).astype(np.int64)
+    enough = n_obs >= _CORR_MIN_OBS
+
+    roll_60 = np.nan_to_num(correlation_matrix(x, window=60))
+    roll_120 = np.nan_to_num(correlation_matrix(x, window=lookback))
+
+    state = EWMACorrelationState.from_returns(
+        pd.DataFrame(x, columns=tickers) if not isinstance(returns, pd.DataFrame) else returns,
+        decay=decay,
+    )
+    ewma = state.corr()
+
+    # 위기 조건부 상관: 두 종목 모두 -2σ 이하인 날만
+    with np.errstate(invalid="ignore"):
+        sigma = np.nanstd(x, axis=0)
+        shock = valid & (x < -2.0 * sigma)
+    s = shock.astype(np.float64)
+    joint_shocks = s.T @ s
+    crisis = np.where(
+        joint_shocks >= _CRISIS_MIN_OBS,
+        np.nan_to_num(_masked_corr(x, shock, min_obs=_CRISIS_MIN_OBS)),
+        np.minimum(ewma * 1.15, 1.0),  # 위기 표본 부족 → EWMA * 1.15
+    )
+
+    tail = _clayton_from_tau(_kendall_tau_matrix(x[-lookback:]))
+
+    # 레짐: 최근 20일 중 둘 중 하나라도 -2σ 이하였던 날의 비율
+    recent = shock[-_REGIME_RECENT:].astype(np.float64)
+    k = max(len(recent), 1)
+    hits = recent.sum(axis=0)
+    either = (hits[:, None] + hits[None, :] - recent.T @ recent) / k
+    regime = np.zeros((n, n), dtype=np.int8)
+    regime[(either > 0.05) | (np.abs(crisis - ewma) > 0.3)] = 1
+    regime[either > 0.15] = 2
+    flat_sigma = (sigma < 1e-12)[:, None] | (sigma < 1e-12)[None, :]
+    regime[flat_sigma] = 0
+
+    for mat in (roll_60, roll_120, ewma, crisis, tail):
+        mat[~enough] = 0.0
+        np.fill_diagonal(mat, 1.0)
+    regime[~enough] = 0
+    np.fill_diagonal(regime, 0)
+
+    return CorrelationMatrices(
+        tickers=tickers,
+        rolling_60d=roll_60,
+        rolling_120d=roll_120,
+        ewma=ewma,
+        crisis=crisis,
+        tail=tail,
+        regime=regime,
+        n_obs=n_obs,
+        ewma_state=state,
+    )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 4. Advanced VaR
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -839,6 +1119,7 @@ def compute_copula_var(
     horizon: int = 1,
     copula_type: str = "gaussian",
     seed: int | None = None,
+    tol: float | None = None,
 ) -> AdvancedVaRResult:
     """Copula 기반 VaR (Gaussian / t-copula).
 
@@ -855,6 +1136,7 @@ def compute_copula_var(
         horizon: 보유 기간 (일)
         copula_type: "gaussian" 또는 "t"
         seed: 랜덤 시드 (재현성)
+        tol: VaR/CVaR 수렴 시 조기 종료 허용 오차 (None=전체 n_sim)
 
     Returns:
         AdvancedVaRResult
@@ -899,18 +1181,19 @@ def compute_copula_var(
         # 양의 정치 행렬 보장
         corr_matrix = _nearest_positive_definite(corr_matrix)
 
-        # Step 3: Simulate
-        if copula_type == "t":
-            sim_returns = _simulate_t_copula(
-                data, corr_matrix, n_sim, n_assets, n_obs, rng, df=5,
-            )
-        else:
-            sim_returns = _simulate_gaussian_copula(
-                data, corr_matrix, n_sim, n_assets, n_obs, rng,
-            )
+        # Step 3+4: 청크 단위 시뮬레이션 → 포트폴리오 수익률로 즉시 축약 (v14)
+        simulate = _simulate_t_copula if copula_type == "t" else _simulate_gaussian_copula
+        factor = cholesky_factor(corr_matrix)
+        sorted_data = np.sort(data, axis=0).astype(np.float32)
+
+        def _chunk(k: int) -> np.ndarray:
+            return simulate(sorted_data, factor, k, rng) @ w_arr
 
-        # Step 4: Portfolio returns
-        port_sim = sim_returns @ w_arr
+        port_sim = simulate_streaming(
+            _chunk, n_sim, chunk_rows(n_assets * 3),
+            confidence=confidence, tol=tol,
+        )[:, 0].astype(np.float64)
+        n_done = len(port_sim)
 
         # Multi-day horizon
         if horizon > 1:
@@ -918,8 +1201,8 @@ def compute_copula_var(
 
         # VaR / CVaR
         sorted_sim = np.sort(port_sim)
-        idx = max(0, int(n_sim * (1 - confidence)))
-        var_pct = -sorted_sim[min(idx, n_sim - 1)]
+        idx = max(0, int(n_done * (1 - confidence)))
+        var_pct = -sorted_sim[min(idx, n_done - 1)]
         tail = sorted_sim[:idx + 1]
         cvar_pct = -np.mean(tail) if len(tail) > 0 else var_pct
 
@@ -940,51 +1223,31 @@ def compute_copula_var(
 
 
 def _simulate_gaussian_copula(
-    data: np.ndarray, corr: np.ndarray,
-    n_sim: int, n_assets: int, n_obs: int,
-    rng: np.random.RandomState,
+    sorted_data: np.ndarray, factor: np.ndarray,
+    n_sim: int, rng: np.random.RandomState,
 ) -> np.ndarray:
-    """Gaussian copula 시뮬레이션."""
-    # Cholesky decomposition
-    L = np.linalg.cholesky(corr)
-
-    # Correlated standard normals
-    z = rng.standard_normal((n_sim, n_assets))
-    corr_z = z @ L.T
+    """Gaussian copula 시뮬레이션 (n_sim × n_assets, float32)."""
+    # Correlated standard normals (antithetic)
+    corr_z = standard_normals(rng, n_sim, factor.shape[0]) @ factor.T.astype(np.float32)
 
     # Transform to uniform via normal CDF
     if _HAS_SCIPY:
         u = sp_stats.norm.cdf(corr_z)
     else:
         u = _approx_norm_cdf(corr_z)
-
-    # Back-transform to original marginals via empirical quantile
-    sim = np.zeros((n_sim, n_assets))
-    for j in range(n_assets):
-        sorted_col = np.sort(data[:, j])
-        indices = np.clip(
-            (u[:, j] * n_obs).astype(int), 0, n_obs - 1,
-        )
-        sim[:, j] = sorted_col[indices]
-
-    return sim
+    return _empirical_quantiles(sorted_data, u)
 
 
 def _simulate_t_copula(
-    data: np.ndarray, corr: np.ndarray,
-    n_sim: int, n_assets: int, n_obs: int,
-    rng: np.random.RandomState, df: int = 5,
+    sorted_data: np.ndarray, factor: np.ndarray,
+    n_sim: int, rng: np.random.RandomState, df: int = 5,
 ) -> np.ndarray:
     """t-copula 시뮬레이션 (heavier tails)."""
-    L = np.linalg.cholesky(corr)
-
-    # Correlated standard normals
-    z = rng.standard_normal((n_sim, n_assets))
-    corr_z = z @ L.T
+    corr_z = standard_normals(rng, n_sim, factor.shape[0]) @ factor.T.astype(np.float32)
 
     # Chi-squared for t-distribution scaling
     chi2 = rng.chisquare(df, size=n_sim)
-    scale = np.sqrt(df / chi2)
+    scale = np.sqrt(df / chi2).astype(np.float32)
 
     # t-distributed variates
     t_vars = corr_z * scale[:, np.newaxis]
@@ -995,17 +1258,14 @@ def _simulate_t_copula(
     else:
         # Fallback: use normal CDF (approximate for moderate df)
         u = _approx_norm_cdf(t_vars / math.sqrt(df / (df - 2)))
+    return _empirical_quantiles(sorted_data, u)
 
-    # Back-transform
-    sim = np.zeros((n_sim, n_assets))
-    for j in range(n_assets):
-        sorted_col = np.sort(data[:, j])
-        indices = np.clip(
-            (u[:, j] * n_obs).astype(int), 0, n_obs - 1,
-        )
-        sim[:, j] = sorted_col[indices]
 
-    return sim
+def _empirical_quantiles(sorted_data: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Uniform → 종목별 경험적 분위수 (열 정렬된 과거 수익률에서 인덱싱)."""
+    n_obs = sorted_data.shape[0]
+    indices = np.clip((u * n_obs).astype(np.intp), 0, n_obs - 1)
+    return np.take_along_axis(sorted_data, indices, axis=0)
 
 
 def _nearest_positive_definite(m: np.ndarray) -> np.ndarray:
@@ -0,0 +1,159 @@
+"""Bounded-queue async pipeline (스테이지별 워커 풀 + 단계별 타이밍).
+
+``asyncio.gather``를 고정 배치로 돌리면 배치 안의 느린 항목 하나가
+배치 전체를 붙잡는다.  여기서는 스테이지마다 워커 N개가 큐에서 항목을
+하나씩 꺼내 처리하고 다음 스테이지 큐로 넘기므로, 빠른 항목은 느린
+항목을 기다리지 않고 끝까지 흘러간다.
+
+- 스테이지 사이 큐는 크기 제한이 있어 앞 단계가 너무 앞서가지 않는다
+  (다운스트림이 막히면 put 대기 = back-pressure, ``blocked_s``로 집계).
+- 스테이지 함수가 None을 반환하면 그 항목은 탈락, 예외는 로그 후 탈락.
+- ``PipelineStats``로 스테이지별 처리 수/소요 시간을 돌려준다.
+
+Usage::
+
+    results, stats = await run_pipeline(items, [
+        Stage("fetch", fetch_one, workers=6),
+        Stage("compute", compute_one, workers=2),
+    ])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Awaitable[Any]]
+    workers: int = 1
+
+
+@dataclass
+class StageStats:
+    items_in: int = 0
+    items_out: int = 0
+    dropped: int = 0          # None 반환
+    errors: int = 0
+    busy_s: float = 0.0       # 워커들이 fn 안에서 보낸 시간 합
+    max_s: float = 0.0        # 항목 하나의 최대 처리 시간
+    blocked_s: float = 0.0    # 다운스트림 큐가 가득 차 기다린 시간
+    wall_s: float = 0.0       # 스테이지 시작~마지막 워커 종료
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["avg_ms"] = round(self.busy_s / max(self.items_in, 1) * 1000, 1)
+        return d
+
+
+@dataclass
+class PipelineStats:
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    wall_s: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "wall_s": round(self.wall_s, 3),
+            "stages": {name: s.to_dict() for name, s in self.stages.items()},
+        }
+
+    def summary(self) -> str:
+        """One log line: ``fetch 40/40 busy 3.1s max 0.8s | ...``."""
+        return " | ".join(
+            f"{name} {s.items_out}/{s.items_in} busy {s.busy_s:.1f}s max {s.max_s:.2f}s"
+            + (f" err {s.errors}" if s.errors else "")
+            for name, s in self.stages.items()
+        )
+
+
+async def run_pipeline(
+    items: Iterable[Any],
+    stages: list[Stage],
+    queue_size: int | None = None,
+) -> tuple[list[Any], PipelineStats]:
+    """Run *items* through *stages*; returns (final outputs, stats).
+
+    Outputs are in completion order, not input order.
+    """
+    t_start = time.perf_counter()
+    stats = PipelineStats(stages={s.name: StageStats() for s in stages})
+    queues: list[asyncio.Queue] = [
+        asyncio.Queue(maxsize=queue_size or max(2, 2 * s.workers)) for s in stages
+    ]
+    results: list[Any] = []
+
+    async def _put(q: asyncio.Queue | None, item: Any, st: StageStats | None) -> None:
+        if q is None:
+            results.append(item)
+            return
+        if q.full() and st is not None:
+            t0 = time.perf_counter()
+            await q.put(item)
+            st.blocked_s += time.perf_counter() - t0
+        else:
+            await q.put(item)
+
+    async def _worker(idx: int) -> None:
+        stage, st = stages[idx], stats.stages[stages[idx].name]
+        q_in = queues[idx]
+        q_out = queues[idx + 1] if idx + 1 < len(stages) else None
+        while True:
+            item = await q_in.get()
+            if item is _DONE:
+                return
+            st.items_in += 1
+            t0 = time.perf_counter()
+            try:
+                out = await stage.fn(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                st.errors += 1
+                logger.debug("pipeline stage %s failed", stage.name, exc_info=True)
+                out = None
+            finally:
+                dt = time.perf_counter() - t0
+                st.busy_s += dt
+                st.max_s = max(st.max_s, dt)
+            if out is None:
+                st.dropped += 1
+                continue
+            st.items_out += 1
+            await _put(q_out, out, st)
+
+    async def _run_stage(idx: int) -> None:
+        t0 = time.perf_counter()
+        n = max(1, stages[idx].workers)
+        await asyncio.gather(*[_worker(idx) for _ in range(n)])
+        stats.stages[stages[idx].name].wall_s = time.perf_counter() - t0
+        if idx + 1 < len(stages):
+            for _ in range(max(1, stages[idx + 1].workers)):
+                await queues[idx + 1].put(_DONE)
+
+    async def _feed() -> None:
+        for item in items:
+            await queues[0].put(item)
+        for _ in range(max(1, stages[0].workers)):
+            await queues[0].put(_DONE)
+
+    if not stages:
+        return list(items), stats
+    tasks = [asyncio.ensure_future(_feed())]
+    tasks += [asyncio.ensure_future(_run_stage(i)) for i in range(len(stages))]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for t in tasks:
+            if not t.done():
+                t.cancel()
+    stats.wall_s = time.perf_counter() - t_start
+    return results, stats
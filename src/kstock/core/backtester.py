@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 USER_NAME = "주호님"
@@ -129,34 +131,29 @@ def compute_metrics(
         else:
             cagr_pct = 0.0
 
+        values = np.asarray(daily_values, dtype=float)
+
         # --- Daily returns ---
-        daily_returns: list[float] = []
-        for i in range(1, num_days):
-            if daily_values[i - 1] > 0:
-                daily_returns.append(daily_values[i] / daily_values[i - 1] - 1.0)
-            else:
-                daily_returns.append(0.0)
+        prev = values[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            daily_returns = np.where(prev > 0, values[1:] / prev - 1.0, 0.0)
 
         # --- MDD (Maximum Drawdown) ---
-        mdd_pct = 0.0
+        peaks = np.maximum.accumulate(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns = np.where(peaks > 0, (values - peaks) / peaks * 100.0, 0.0)
+        mdd_idx = int(np.argmin(drawdowns))
+        mdd_pct = min(float(drawdowns[mdd_idx]), 0.0)
         mdd_date = ""
-        peak = daily_values[0]
-        for i, val in enumerate(daily_values):
-            if val > peak:
-                peak = val
-            if peak > 0:
-                drawdown = (val - peak) / peak * 100.0
-                if drawdown < mdd_pct:
-                    mdd_pct = drawdown
-                    mdd_date = daily_dates[i] if i < len(daily_dates) else ""
+        if mdd_pct < 0 and mdd_idx < len(daily_dates):
+            mdd_date = daily_dates[mdd_idx]
 
         # --- Sharpe Ratio ---
         # Sharpe = (mean_daily_return - rf_daily) / std_daily * sqrt(252)
         rf_daily = risk_free_rate / 252.0
+        mean_ret = float(daily_returns.mean()) if len(daily_returns) else 0.0
         if len(daily_returns) > 1:
-            mean_ret = sum(daily_returns) / len(daily_returns)
-            variance = sum((r - mean_ret) ** 2 for r in daily_returns) / (len(daily_returns) - 1)
-            std_ret = math.sqrt(variance)
+            std_ret = float(daily_returns.std(ddof=1))
             if std_ret > 1e-12:
                 sharpe_ratio = (mean_ret - rf_daily) / std_ret * math.sqrt(252.0)
             else:
@@ -166,12 +163,10 @@ def compute_metrics(
 
         # --- Sortino Ratio ---
         # Uses only downside deviation (returns below rf)
-        downside_diffs = [min(r - rf_daily, 0.0) for r in daily_returns]
+        downside_diffs = np.minimum(daily_returns - rf_daily, 0.0)
         if len(downside_diffs) > 1:
-            downside_var = sum(d ** 2 for d in downside_diffs) / (len(downside_diffs) - 1)
-            downside_std = math.sqrt(downside_var)
+            downside_std = math.sqrt(float((downside_diffs ** 2).sum()) / (len(downside_diffs) - 1))
             if downside_std > 1e-12:
-                mean_ret = sum(daily_returns) / len(daily_returns)
                 sortino_ratio = (mean_ret - rf_daily) / downside_std * math.sqrt(252.0)
             else:
                 sortino_ratio = 0.0
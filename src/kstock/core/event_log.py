@@ -272,23 +272,28 @@ class EventLog:
         if not self.db:
             return False
         try:
-            with self.db._connect() as conn:
-                conn.execute(
-                    """INSERT INTO event_log
+            sql = """INSERT INTO event_log
                        (event_type, severity, message, source, ticker,
                         order_id, data_json, created_at)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        event.event_type.value,
-                        event.severity.value,
-                        event.message,
-                        event.source,
-                        event.ticker,
-                        event.order_id,
-                        json.dumps(event.data, ensure_ascii=False) if event.data else None,
-                        event.timestamp,
-                    ),
-                )
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+            params = (
+                event.event_type.value,
+                event.severity.value,
+                event.message,
+                event.source,
+                event.ticker,
+                event.order_id,
+                json.dumps(event.data, ensure_ascii=False) if event.data else None,
+                event.timestamp,
+            )
+            if hasattr(self.db, "_defer_write"):
+                # 일반 이벤트는 write-behind 버퍼로 모아 기록, 중요 이벤트는 즉시 flush
+                self.db._defer_write(sql, [params])
+                if event.severity in self.IMMEDIATE_FLUSH_SEVERITIES:
+                    self.db.flush_writes()
+            else:
+                with self.db._connect() as conn:
+                    conn.execute(sql, params)
             return True
         except Exception as e:
             # DB 에러가 이벤트 로깅을 막지 않도록
@@ -399,6 +399,49 @@ def check_db_accessible(db_path: str | Path) -> HealthCheck:
     return check
 
 
+def check_db_pool(
+    pool_stats: dict,
+    wait_warn_ms: float = 200.0,
+    wait_error_ms: float = 2000.0,
+) -> HealthCheck:
+    """DB 연결 풀 지표 확인 (StoreBase.pool_stats() 결과).
+
+    평균 대기 시간이 임계치를 넘으면 warning/error — 잠금 경합이나
+    오래 잡고 있는 연결이 있다는 뜻이다.
+    """
+    check = HealthCheck(
+        name="db_pool",
+        checked_at=datetime.now().isoformat(timespec="seconds"),
+    )
+    try:
+        reader = pool_stats.get("reader", {})
+        writer = pool_stats.get("writer", {})
+        worst_wait = max(reader.get("wait_avg_ms", 0.0), writer.get("wait_avg_ms", 0.0))
+        summary = (
+            f"읽기 {reader.get('checkouts', 0)}회(대기 {reader.get('wait_avg_ms', 0.0):.1f}ms, "
+            f"점유 {reader.get('hold_avg_ms', 0.0):.1f}ms) / "
+            f"쓰기 {writer.get('checkouts', 0)}회(대기 {writer.get('wait_avg_ms', 0.0):.1f}ms, "
+            f"점유 {writer.get('hold_avg_ms', 0.0):.1f}ms)"
+        )
+        if worst_wait >= wait_error_ms:
+            check.status = "error"
+            check.message = f"DB 연결 대기 심각: {summary}"
+            logger.error("DB 연결 풀 대기 심각: %.1fms", worst_wait)
+        elif worst_wait >= wait_warn_ms:
+            check.status = "warning"
+            check.message = f"DB 연결 대기 증가: {summary}"
+            logger.warning("DB 연결 풀 대기 증가: %.1fms", worst_wait)
+        else:
+            check.status = "ok"
+            check.message = f"DB 연결 풀 정상: {summary}"
+    except Exception as exc:
+        check.status = "error"
+        check.message = f"DB 연결 풀 확인 실패: {exc}"
+        logger.exception("DB 연결 풀 확인 중 오류 발생")
+
+    return check
+
+
 def check_data_staleness(db_path: str | Path, max_hours: int = 2) -> HealthCheck:
     """DB의 마지막 업데이트 시각 확인. max_hours 이상 지나면 warning.
 
@@ -684,8 +727,14 @@ def check_db_size(db_path: str | Path) -> float:
 # ---------------------------------------------------------------------------
 
 
-def run_health_checks(db_path: Optional[str | Path] = None) -> list[HealthCheck]:
-    """모든 헬스체크를 실행하고 결과 목록을 반환."""
+def run_health_checks(
+    db_path: Optional[str | Path] = None,
+    pool_stats: Optional[dict] = None,
+) -> list[HealthCheck]:
+    """모든 헬스체크를 실행하고 결과 목록을 반환.
+
+    pool_stats: StoreBase.pool_stats() 결과. 주어지면 연결 풀 체크도 포함.
+    """
     checks: list[HealthCheck] = []
 
     try:
@@ -739,6 +788,9 @@ def run_health_checks(db_path: Optional[str | Path] = None) -> list[HealthCheck]
                 checked_at=datetime.now().isoformat(timespec="seconds"),
             ))
 
+    if pool_stats is not None:
+        checks.append(check_db_pool(pool_stats))
+
     return checks
 
 
@@ -114,6 +114,16 @@ def next_market_day(d: date | None = None) -> date:
     return d
 
 
+def prev_market_day(d: date | None = None) -> date:
+    """직전 개장일 반환."""
+    if d is None:
+        d = date.today()
+    d = d - timedelta(days=1)
+    while not is_kr_market_open(d):
+        d -= timedelta(days=1)
+    return d
+
+
 def market_status_text(d: date | None = None) -> str:
     """오늘 시장 상태를 텍스트로 반환."""
     if d is None:
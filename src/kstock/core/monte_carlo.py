@@ -0,0 +1,181 @@
+"""청크 단위 Monte Carlo 시뮬레이션 엔진 (메모리 상한 고정).
+
+risk_engine.run_monte_carlo 와 advanced_risk.compute_copula_var 가 공유한다.
+v14: 한 번에 (simulations × days × n_stocks) 난수를 만들지 않고, float32
+청크로 경로를 생성해 즉시 포트폴리오 수익률(경로당 스칼라)로 축약한다.
+
+- Cholesky 분해는 공분산 행렬 내용 기준으로 캐시 (재분해 없음)
+- 난수: antithetic (기본) / Sobol 준난수 (scipy 있을 때) / plain
+- 선택적 조기 종료: VaR/CVaR 추정치가 수렴하면 남은 청크 생략
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from scipy import stats as sp_stats
+    from scipy.stats import qmc
+    _HAS_SCIPY = True
+except ImportError:
+    sp_stats = None
+    qmc = None
+    _HAS_SCIPY = False
+
+# 청크 하나가 쓸 수 있는 난수 버퍼 상한 (bytes)
+MC_CHUNK_BYTES = 8 * 1024 * 1024
+MC_MIN_CHUNK = 512
+# 조기 종료 판정 전 최소 시뮬레이션 수
+MC_MIN_SIMS = 2000
+SAMPLING_METHODS = ("antithetic", "sobol", "plain")
+
+_CHOLESKY_CACHE_SIZE = 32
+_cholesky_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_cholesky_lock = threading.Lock()
+_cholesky_stats = {"hits": 0, "misses": 0}
+
+
+# ── Cholesky 캐시 ────────────────────────────────────────
+
+def _matrix_key(m: np.ndarray) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(m.shape).encode())
+    h.update(np.ascontiguousarray(m, dtype=np.float64).tobytes())
+    return h.digest()
+
+
+def cholesky_factor(cov: np.ndarray) -> np.ndarray:
+    """공분산(상관) 행렬의 하삼각 Cholesky 인자 — 행렬 내용 기준 캐시.
+
+    양의 정치가 아니면 기존 run_monte_carlo 와 같이 대각에
+    |최소 고유값| + 1e-8 을 더해 보정한 뒤 분해한다.
+    반환 배열은 읽기 전용 (캐시 공유).
+    """
+    cov = np.atleast_2d(np.asarray(cov, dtype=np.float64))
+    key = _matrix_key(cov)
+    with _cholesky_lock:
+        hit = _cholesky_cache.get(key)
+        if hit is not None:
+            _cholesky_cache.move_to_end(key)
+            _cholesky_stats["hits"] += 1
+            return hit
+        _cholesky_stats["misses"] += 1
+
+    try:
+        factor = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        min_eig = float(np.min(np.linalg.eigvalsh(cov)))
+        shift = abs(min_eig) + 1e-8 if min_eig < 0 else 1e-8
+        factor = np.linalg.cholesky(cov + np.eye(len(cov)) * shift)
+    factor.setflags(write=False)
+
+    with _cholesky_lock:
+        _cholesky_cache[key] = factor
+        while len(_cholesky_cache) > _CHOLESKY_CACHE_SIZE:
+            _cholesky_cache.popitem(last=False)
+    return factor
+
+
+def cholesky_cache_info() -> dict:
+    with _cholesky_lock:
+        return {**_cholesky_stats, "size": len(_cholesky_cache)}
+
+
+def clear_cholesky_cache() -> None:
+    with _cholesky_lock:
+        _cholesky_cache.clear()
+        _cholesky_stats.update(hits=0, misses=0)
+
+
+# ── 난수 생성 ────────────────────────────────────────────
+
+def chunk_rows(row_floats: int, budget_bytes: int = MC_CHUNK_BYTES) -> int:
+    """float32 행 하나가 row_floats 개일 때 예산 안에 들어가는 청크 행 수 (짝수)."""
+    rows = max(MC_MIN_CHUNK, budget_bytes // max(1, row_floats * 4))
+    return rows - rows % 2
+
+
+def standard_normals(
+    rng: np.random.RandomState,
+    n: int,
+    dim: int,
+    method: str = "antithetic",
+) -> np.ndarray:
+    """(n × dim) float32 표준정규 난수.
+
+    - antithetic: 절반을 뽑고 부호 반전 쌍을 붙인다 (분산 감소)
+    - sobol: scrambled Sobol 점 → 역정규 CDF (scipy 없으면 antithetic)
+    - plain: 일반 의사난수
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"unknown sampling method: {method}")
+    if method == "sobol" and _HAS_SCIPY:
+        sampler = qmc.Sobol(d=dim, scramble=True, seed=rng.randint(2**31 - 1))
+        m = max(1, math.ceil(math.log2(max(n, 2))))
+        u = sampler.random_base2(m)[:n]
+        u = np.clip(u, 1e-7, 1 - 1e-7)
+        return sp_stats.norm.ppf(u).astype(np.float32)
+    if method in ("antithetic", "sobol"):
+        half = rng.standard_normal(((n + 1) // 2, dim)).astype(np.float32)
+        return np.concatenate([half, -half])[:n]
+    return rng.standard_normal((n, dim)).astype(np.float32)
+
+
+# ── 꼬리 통계 / 스트리밍 드라이버 ───────────────────────
+
+def tail_stats(samples: np.ndarray, confidence: float = 0.95) -> tuple[float, float]:
+    """(VaR 분위수, CVaR) — 수익률 단위, 손실이면 음수.
+
+    VaR = (1-confidence) 분위수, CVaR = 그 이하 표본 평균.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.size == 0:
+        return 0.0, 0.0
+    q = float(np.percentile(samples, (1 - confidence) * 100))
+    tail = samples[samples <= q]
+    return q, float(tail.mean()) if tail.size else q
+
+
+def simulate_streaming(
+    sample_chunk: Callable[[int], np.ndarray],
+    n_sim: int,
+    chunk_size: int,
+    n_outputs: int = 1,
+    confidence: float = 0.95,
+    tol: float | None = None,
+    min_sims: int = MC_MIN_SIMS,
+) -> np.ndarray:
+    """sample_chunk(k) → (k × n_outputs) 포트폴리오 수익률을 청크 단위로 모은다.
+
+    결과 버퍼는 (n_sim × n_outputs) float32 뿐이므로 메모리는 종목 수와
+    무관하다.  tol 이 주어지면 청크마다 모든 출력 열의 VaR/CVaR 상대 변화가
+    tol 이하가 되는 시점 (min_sims 이상) 에 멈추고 채워진 부분만 반환한다.
+    """
+    if tol is not None:
+        # 수렴 판정 간격 — 큰 청크 하나로 끝나지 않도록
+        chunk_size = min(chunk_size, max(MC_MIN_CHUNK, min_sims // 2))
+    out = np.empty((n_sim, n_outputs), dtype=np.float32)
+    filled = 0
+    prev: np.ndarray | None = None
+    while filled < n_sim:
+        k = min(chunk_size, n_sim - filled)
+        out[filled:filled + k] = np.asarray(sample_chunk(k), dtype=np.float32).reshape(k, n_outputs)
+        filled += k
+        if tol is None or filled >= n_sim:
+            continue
+        cur = np.array([tail_stats(out[:filled, j], confidence) for j in range(n_outputs)])
+        if prev is not None and filled >= min_sims:
+            change = np.abs(cur - prev) / np.maximum(np.abs(prev), 1e-9)
+            if float(change.max()) <= tol:
+                logger.debug("Monte Carlo converged at %d/%d sims", filled, n_sim)
+                break
+        prev = cur
+    return out[:filled]
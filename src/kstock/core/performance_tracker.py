@@ -12,6 +12,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from kstock.core.tz import KST
 
 logger = logging.getLogger(__name__)
@@ -765,6 +767,188 @@ def format_live_scorecard(tracks: list[RecommendationTrack]) -> str:
 # ---------------------------------------------------------------------------
 # 9. Rolling risk-adjusted metrics (v6.3)
 # ---------------------------------------------------------------------------
+# v14: cumulative-sum / strided-window kernels. Each ``rolling_*_array``
+# accepts a (T,) series or a (T, S) panel of S strategies and returns an
+# array of the same shape. Windows that are not full (warm-up or NaN
+# padding in a panel) are 0.0, as in the list API. The list functions
+# below are thin wrappers kept for existing callers.
+
+_SQRT_252 = math.sqrt(252)
+
+
+def _as_float_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sums along axis 0: out[i] = sum(x[i-window+1 : i+1]).
+
+    Rows before the first full window are undefined (filled by callers).
+    """
+    c = np.cumsum(x, axis=0)
+    out = c.copy()
+    out[window:] = c[window:] - c[:-window]
+    return out
+
+
+def _full_windows(x: np.ndarray, window: int) -> np.ndarray:
+    """Boolean mask of rows whose trailing window is complete and NaN-free."""
+    valid = (~np.isnan(x)).astype(np.float64)
+    full = _rolling_sum(valid, window) >= window - 0.5
+    full[: window - 1] = False
+    return full
+
+
+def _constant_windows(x: np.ndarray, window: int) -> np.ndarray:
+    """Boolean mask of rows whose trailing window holds a single value.
+
+    Counts value changes (0/1, so the cumulative sum is exact) instead of
+    trusting the variance: cumsum cancellation leaves a residue on flat
+    windows (e.g. a fully-cash stretch) that would otherwise blow up ratios.
+    """
+    x = np.nan_to_num(x)
+    if window <= 1:
+        return np.ones(x.shape, dtype=bool)
+    changed = np.zeros(x.shape)
+    changed[1:] = x[1:] != x[:-1]
+    return _rolling_sum(changed, window - 1) < 0.5
+
+
+def _rolling_mean_var(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """Trailing-window mean and population variance (NaN treated as 0)."""
+    x = np.nan_to_num(x)
+    # Center by the column mean so the cumulative sums stay small.
+    xc = x - x.mean(axis=0)
+    s1 = _rolling_sum(xc, window) / window
+    s2 = _rolling_sum(xc * xc, window) / window
+    var = np.maximum(s2 - s1 * s1, 0.0)
+    var[_constant_windows(x, window)] = 0.0
+    return s1 + x.mean(axis=0), var
+
+
+def _finish(values: np.ndarray, full: np.ndarray, decimals: int) -> np.ndarray:
+    out = np.where(full, values, 0.0)
+    return np.round(np.nan_to_num(out, nan=0.0, posinf=0.0, neginf=0.0), decimals)
+
+
+def rolling_sharpe_array(
+    daily_returns,
+    window: int = 60,
+    risk_free_rate: float = 0.035,
+) -> np.ndarray:
+    """Vectorized rolling annualized Sharpe ratio ((T,) or (T, S))."""
+    r = _as_float_array(daily_returns)
+    if r.shape[0] < window:
+        return np.zeros_like(r)
+    mean, var = _rolling_mean_var(r, window)
+    std = np.sqrt(var)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sharpe = (mean - risk_free_rate / 252.0) / std * _SQRT_252
+    return _finish(np.where(std < 1e-12, 0.0, sharpe), _full_windows(r, window), 6)
+
+
+def rolling_sortino_array(
+    daily_returns,
+    window: int = 60,
+    risk_free_rate: float = 0.035,
+) -> np.ndarray:
+    """Vectorized rolling annualized Sortino ratio ((T,) or (T, S))."""
+    r = _as_float_array(daily_returns)
+    if r.shape[0] < window:
+        return np.zeros_like(r)
+    r0 = np.nan_to_num(r)
+    neg = r0 < 0
+    mean = _rolling_sum(r0, window) / window
+    n_down = _rolling_sum(neg.astype(np.float64), window)
+    sq_down = _rolling_sum(np.where(neg, r0 * r0, 0.0), window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dd = np.where(n_down > 0.5, np.sqrt(sq_down / n_down), 0.0001)
+    sortino = (mean - risk_free_rate / 252.0) / dd * _SQRT_252
+    return _finish(sortino, _full_windows(r, window), 6)
+
+
+def rolling_information_ratio_array(
+    portfolio_returns,
+    benchmark_returns,
+    window: int = 60,
+) -> np.ndarray:
+    """Vectorized rolling annualized information ratio (no risk-free leg)."""
+    p, b = _align_pair(portfolio_returns, benchmark_returns)
+    active = p - b
+    if active.shape[0] < window:
+        return np.zeros_like(active)
+    mean, var = _rolling_mean_var(active, window)
+    std = np.sqrt(var)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ir = mean / std * _SQRT_252
+    return _finish(np.where(std < 1e-12, 0.0, ir), _full_windows(active, window), 6)
+
+
+def rolling_beta_array(
+    portfolio_returns,
+    benchmark_returns,
+    window: int = 60,
+) -> np.ndarray:
+    """Vectorized rolling beta; a (T,) benchmark broadcasts over a (T, S) panel."""
+    p, b = _align_pair(portfolio_returns, benchmark_returns)
+    if b.ndim < p.ndim:
+        b = np.broadcast_to(b[:, None], p.shape)
+    if p.shape[0] < window:
+        return np.zeros_like(p)
+    full = _full_windows(p + b, window)
+    p0, b0 = np.nan_to_num(p), np.nan_to_num(b)
+    pc = p0 - p0.mean(axis=0)
+    bc = b0 - b0.mean(axis=0)
+    mp = _rolling_sum(pc, window) / window
+    mb = _rolling_sum(bc, window) / window
+    cov = _rolling_sum(pc * bc, window) / window - mp * mb
+    sbb = _rolling_sum(bc * bc, window) / window
+    var_b = np.maximum(sbb - mb * mb, 0.0)
+    var_b[_constant_windows(b0, window)] = 0.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        beta = np.where(var_b < 1e-18, 1.0, cov / var_b)
+    return _finish(beta, full, 6)
+
+
+def rolling_volatility_array(daily_returns, window: int = 60) -> np.ndarray:
+    """Vectorized rolling annualized volatility in percent."""
+    r = _as_float_array(daily_returns)
+    if r.shape[0] < window:
+        return np.zeros_like(r)
+    _, var = _rolling_mean_var(r, window)
+    return _finish(np.sqrt(var) * _SQRT_252 * 100, _full_windows(r, window), 4)
+
+
+def rolling_max_drawdown_array(daily_values, window: int = 60) -> np.ndarray:
+    """Max drawdown (percent, <= 0) inside each trailing window of NAV values.
+
+    Uses a strided (zero-copy) window view; out[i] covers values[i-window+1 : i+1].
+    """
+    v = _as_float_array(daily_values)
+    out = np.zeros_like(v)
+    if v.shape[0] < window:
+        return out
+    views = np.lib.stride_tricks.sliding_window_view(v, window, axis=0)  # (T-w+1, [S,] w)
+    peak = np.maximum.accumulate(views, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dd = np.where(peak > 0, (views - peak) / peak * 100, 0.0)
+    out[window - 1:] = np.nan_to_num(dd, nan=0.0).min(axis=-1)
+    return _finish(out, _full_windows(v, window), 4)
+
+
+def _align_pair(a, b) -> tuple[np.ndarray, np.ndarray]:
+    """Truncate two return series/panels to their common leading length."""
+    a, b = _as_float_array(a), _as_float_array(b)
+    length = min(a.shape[0], b.shape[0])
+    return a[:length], b[:length]
+
+
+def _simple_returns(values: np.ndarray) -> np.ndarray:
+    """NAV → simple returns along axis 0 (0.0 where the previous NAV is 0)."""
+    prev, cur = values[:-1], values[1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(prev != 0, (cur - prev) / prev, np.where(np.isnan(prev), np.nan, 0.0))
+
 
 def compute_rolling_sharpe(
     daily_returns: list[float],
@@ -782,28 +966,9 @@ def compute_rolling_sharpe(
         List of rolling Sharpe values. First (window-1) values are 0.0.
         Empty list if input is empty.
     """
-    n = len(daily_returns)
-    if n == 0:
+    if len(daily_returns) == 0:
         return []
-    if n < window:
-        return [0.0] * n
-
-    rf_daily = risk_free_rate / 252.0
-    sqrt_252 = math.sqrt(252)
-    result = [0.0] * (window - 1)
-
-    for i in range(window - 1, n):
-        w = daily_returns[i - window + 1 : i + 1]
-        mean_r = sum(w) / window
-        variance = sum((r - mean_r) ** 2 for r in w) / window
-        std_r = math.sqrt(variance) if variance > 0 else 0.0
-        if std_r < 1e-12:
-            result.append(0.0)
-        else:
-            sharpe = (mean_r - rf_daily) / std_r * sqrt_252
-            result.append(round(sharpe, 6))
-
-    return result
+    return rolling_sharpe_array(daily_returns, window, risk_free_rate).tolist()
 
 
 def compute_rolling_sortino(
@@ -821,28 +986,9 @@ def compute_rolling_sortino(
     Returns:
         List of rolling Sortino values. First (window-1) values are 0.0.
     """
-    n = len(daily_returns)
-    if n == 0:
+    if len(daily_returns) == 0:
         return []
-    if n < window:
-        return [0.0] * n
-
-    rf_daily = risk_free_rate / 252.0
-    sqrt_252 = math.sqrt(252)
-    result = [0.0] * (window - 1)
-
-    for i in range(window - 1, n):
-        w = daily_returns[i - window + 1 : i + 1]
-        mean_r = sum(w) / window
-        downside = [r for r in w if r < 0]
-        if downside:
-            dd = math.sqrt(sum(r ** 2 for r in downside) / len(downside))
-        else:
-            dd = 0.0001
-        sortino = (mean_r - rf_daily) / dd * sqrt_252
-        result.append(round(sortino, 6))
-
-    return result
+    return rolling_sortino_array(daily_returns, window, risk_free_rate).tolist()
 
 
 def compute_information_ratio(
@@ -860,32 +1006,9 @@ def compute_information_ratio(
     Returns:
         List of rolling IR values. First (window-1) values are 0.0.
     """
-    length = min(len(portfolio_returns), len(benchmark_returns))
-    if length == 0:
+    if min(len(portfolio_returns), len(benchmark_returns)) == 0:
         return []
-
-    active = [
-        portfolio_returns[i] - benchmark_returns[i] for i in range(length)
-    ]
-
-    if length < window:
-        return [0.0] * length
-
-    sqrt_252 = math.sqrt(252)
-    result = [0.0] * (window - 1)
-
-    for i in range(window - 1, length):
-        w = active[i - window + 1 : i + 1]
-        mean_a = sum(w) / window
-        variance = sum((a - mean_a) ** 2 for a in w) / window
-        std_a = math.sqrt(variance) if variance > 0 else 0.0
-        if std_a < 1e-12:
-            result.append(0.0)
-        else:
-            ir = mean_a / std_a * sqrt_252
-            result.append(round(ir, 6))
-
-    return result
+    return rolling_information_ratio_array(portfolio_returns, benchmark_returns, window).tolist()
 
 
 def compute_rolling_beta(
@@ -903,27 +1026,122 @@ def compute_rolling_beta(
     Returns:
         List of rolling beta values. First (window-1) values are 0.0.
     """
-    length = min(len(portfolio_returns), len(benchmark_returns))
-    if length == 0:
+    if min(len(portfolio_returns), len(benchmark_returns)) == 0:
         return []
-    if length < window:
-        return [0.0] * length
-
-    result = [0.0] * (window - 1)
-
-    for i in range(window - 1, length):
-        rp = portfolio_returns[i - window + 1 : i + 1]
-        rb = benchmark_returns[i - window + 1 : i + 1]
-        mean_p = sum(rp) / window
-        mean_b = sum(rb) / window
-        cov = sum((rp[j] - mean_p) * (rb[j] - mean_b) for j in range(window)) / window
-        var_b = sum((rb[j] - mean_b) ** 2 for j in range(window)) / window
-        if var_b < 1e-18:
-            result.append(1.0)
-        else:
-            result.append(round(cov / var_b, 6))
+    return rolling_beta_array(portfolio_returns, benchmark_returns, window).tolist()
+
+
+@dataclass
+class RollingMetricsBatch:
+    """Rolling metrics for S NAV series at once; each array is (T-1, S) (v14)."""
+
+    names: list[str]
+    dates: list[str]
+    sharpe: np.ndarray
+    sortino: np.ndarray
+    information_ratio: np.ndarray
+    beta: np.ndarray
+    alpha: np.ndarray
+    volatility_pct: np.ndarray
+    max_drawdown_pct: np.ndarray
+
+    def latest(self) -> dict[str, RollingMetrics]:
+        """Last-row RollingMetrics per series (what the weekly report shows)."""
+        if not self.names or self.sharpe.shape[0] == 0:
+            return {}
+        return {name: self.metrics(name)[-1] for name in self.names}
+
+    def metrics(self, name: str) -> list[RollingMetrics]:
+        """RollingMetrics list for one series, same shape as compute_rolling_metrics."""
+        j = self.names.index(name)
+        return [
+            RollingMetrics(
+                date=self.dates[i] if i < len(self.dates) else "",
+                rolling_sharpe=float(self.sharpe[i, j]),
+                rolling_sortino=float(self.sortino[i, j]),
+                rolling_information_ratio=float(self.information_ratio[i, j]),
+                rolling_beta=float(self.beta[i, j]),
+                rolling_alpha=float(self.alpha[i, j]),
+                rolling_volatility_pct=float(self.volatility_pct[i, j]),
+                rolling_max_drawdown_pct=float(self.max_drawdown_pct[i, j]),
+            )
+            for i in range(self.sharpe.shape[0])
+        ]
+
+
+def compute_rolling_metrics_batch(
+    nav_series: dict[str, list[float]],
+    daily_dates: list[str] | None = None,
+    benchmark_values: list[float] | None = None,
+    window: int = 60,
+    risk_free_rate: float = 0.035,
+) -> RollingMetricsBatch:
+    """Compute rolling metrics for many strategies / shadow portfolios at once.
+
+    NAV series of different lengths are right-aligned (they share the most
+    recent date) and NaN-padded in front; windows touching the padding are
+    0.0 like the warm-up period. ``daily_dates`` (optional) label the
+    longest series and are aligned the same way.
+
+    Args:
+        nav_series: {name: daily NAV values}, e.g. per-manager NAV or
+            ShadowPortfolioSummary.nav_curve.
+        daily_dates: Date strings for the longest series.
+        benchmark_values: Optional benchmark NAV, right-aligned too.
+        window: Rolling window size in days.
+        risk_free_rate: Annual risk-free rate.
+    """
+    names = list(nav_series)
+    length = max((len(v) for v in nav_series.values()), default=0)
+    if benchmark_values:
+        length = max(length, len(benchmark_values))
+    panel = np.full((length, len(names)), np.nan)
+    for j, name in enumerate(names):
+        values = _as_float_array(nav_series[name])
+        if len(values):
+            panel[length - len(values):, j] = values
+
+    returns = _simple_returns(panel) if length >= 2 else np.zeros((0, len(names)))
+    dates = list(daily_dates or [])[-length:][1:]
+    if len(dates) < len(returns):
+        dates = [""] * (len(returns) - len(dates)) + dates
+
+    if benchmark_values and len(benchmark_values) >= 2:
+        bench_nav = np.full(length, np.nan)
+        bench_nav[length - len(benchmark_values):] = _as_float_array(benchmark_values)
+        bench = _simple_returns(bench_nav)
+        beta = rolling_beta_array(returns, bench, window)
+        ir = rolling_information_ratio_array(returns, bench[:, None], window)
+        mean_b = _rolling_sum(np.nan_to_num(bench), window) / window * 252
+    else:
+        beta = np.zeros_like(returns)
+        ir = np.zeros_like(returns)
+        mean_b = np.zeros(len(returns))
+
+    alpha = np.zeros_like(returns)
+    if len(returns) >= window:
+        mean_p = _rolling_sum(np.nan_to_num(returns), window) / window * 252
+        alpha = _finish(
+            mean_p - risk_free_rate - beta * (mean_b[:, None] - risk_free_rate),
+            _full_windows(returns, window), 6,
+        )
 
-    return result
+    # A NAV window reaches one row before its first return; mask by the
+    # returns so padded series start at the same row as the single-series API.
+    mdd = rolling_max_drawdown_array(panel[1:], window)
+    mdd = np.where(_full_windows(returns, window), mdd, 0.0)
+
+    return RollingMetricsBatch(
+        names=names,
+        dates=dates,
+        sharpe=rolling_sharpe_array(returns, window, risk_free_rate),
+        sortino=rolling_sortino_array(returns, window, risk_free_rate),
+        information_ratio=ir,
+        beta=beta,
+        alpha=alpha,
+        volatility_pct=rolling_volatility_array(returns, window),
+        max_drawdown_pct=mdd,
+    )
 
 
 def compute_rolling_metrics(
@@ -949,100 +1167,50 @@ def compute_rolling_metrics(
     if len(daily_values) < 2:
         return []
 
-    # Convert values to returns
-    returns: list[float] = []
-    for i in range(1, len(daily_values)):
-        prev = daily_values[i - 1]
-        if prev != 0:
-            returns.append((daily_values[i] - prev) / prev)
-        else:
-            returns.append(0.0)
-
+    values = _as_float_array(daily_values)
+    returns = _simple_returns(values)
+    n = len(returns)
     dates = daily_dates[1:]  # align with returns
 
-    bench_returns: list[float] | None = None
-    if benchmark_values and len(benchmark_values) >= 2:
-        bench_returns = []
-        for i in range(1, len(benchmark_values)):
-            prev = benchmark_values[i - 1]
-            if prev != 0:
-                bench_returns.append((benchmark_values[i] - prev) / prev)
-            else:
-                bench_returns.append(0.0)
+    sharpe = rolling_sharpe_array(returns, window, risk_free_rate)
+    sortino = rolling_sortino_array(returns, window, risk_free_rate)
 
-    sharpe = compute_rolling_sharpe(returns, window, risk_free_rate)
-    sortino = compute_rolling_sortino(returns, window, risk_free_rate)
+    # Benchmark legs only cover the common prefix; beyond it they are 0.0.
+    ir = np.zeros(n)
+    beta = np.zeros(n)
+    mean_b = np.zeros(n)
+    if benchmark_values and len(benchmark_values) >= 2:
+        bench = _simple_returns(_as_float_array(benchmark_values))
+        common = min(n, len(bench))
+        ir[:common] = rolling_information_ratio_array(returns, bench, window)
+        beta[:common] = rolling_beta_array(returns, bench, window)
+        if common >= window:
+            mean_b[:common] = _rolling_sum(bench[:common], window) / window * 252
 
-    if bench_returns:
-        ir = compute_information_ratio(returns, bench_returns, window)
-        beta = compute_rolling_beta(returns, bench_returns, window)
-    else:
-        ir = [0.0] * len(returns)
-        beta = [0.0] * len(returns)
-
-    # Rolling volatility and max drawdown
-    sqrt_252 = math.sqrt(252)
-    vol_list: list[float] = []
-    mdd_list: list[float] = []
-
-    for i in range(len(returns)):
-        if i < window - 1:
-            vol_list.append(0.0)
-            mdd_list.append(0.0)
-        else:
-            w = returns[i - window + 1 : i + 1]
-            mean_w = sum(w) / window
-            variance = sum((r - mean_w) ** 2 for r in w) / window
-            vol = math.sqrt(variance) * sqrt_252 * 100  # annualized pct
-            vol_list.append(round(vol, 4))
-
-            # Max drawdown within window (using values)
-            val_start = i - window + 1 + 1  # +1 because values are offset by 1
-            val_end = i + 1 + 1
-            window_values = daily_values[val_start:val_end]
-            peak = window_values[0] if window_values else 1.0
-            max_dd = 0.0
-            for v in window_values:
-                if v > peak:
-                    peak = v
-                dd = (v - peak) / peak * 100 if peak > 0 else 0.0
-                if dd < max_dd:
-                    max_dd = dd
-            mdd_list.append(round(max_dd, 4))
+    vol = rolling_volatility_array(returns, window)
+    mdd = rolling_max_drawdown_array(values[1:], window)
 
     # Rolling alpha = portfolio_return - beta * benchmark_return (annualized)
-    alpha_list: list[float] = []
-    rf_daily = risk_free_rate / 252.0
-    for i in range(len(returns)):
-        if i < window - 1:
-            alpha_list.append(0.0)
-        else:
-            w_p = returns[i - window + 1 : i + 1]
-            mean_p = sum(w_p) / window * 252
-            b = beta[i] if i < len(beta) else 0.0
-            if bench_returns and i < len(bench_returns):
-                w_b = bench_returns[max(0, i - window + 1) : i + 1]
-                mean_b = sum(w_b) / len(w_b) * 252 if w_b else 0.0
-            else:
-                mean_b = 0.0
-            a = mean_p - risk_free_rate - b * (mean_b - risk_free_rate)
-            alpha_list.append(round(a, 6))
-
-    # Build RollingMetrics list
-    metrics: list[RollingMetrics] = []
-    for i in range(len(returns)):
-        metrics.append(RollingMetrics(
+    alpha = np.zeros(n)
+    if n >= window:
+        mean_p = _rolling_sum(returns, window) / window * 252
+        alpha[window - 1:] = np.round(
+            mean_p - risk_free_rate - beta * (mean_b - risk_free_rate), 6,
+        )[window - 1:]
+
+    return [
+        RollingMetrics(
             date=dates[i] if i < len(dates) else "",
-            rolling_sharpe=sharpe[i] if i < len(sharpe) else 0.0,
-            rolling_sortino=sortino[i] if i < len(sortino) else 0.0,
-            rolling_information_ratio=ir[i] if i < len(ir) else 0.0,
-            rolling_beta=beta[i] if i < len(beta) else 0.0,
-            rolling_alpha=alpha_list[i] if i < len(alpha_list) else 0.0,
-            rolling_volatility_pct=vol_list[i] if i < len(vol_list) else 0.0,
-            rolling_max_drawdown_pct=mdd_list[i] if i < len(mdd_list) else 0.0,
-        ))
-
-    return metrics
+            rolling_sharpe=float(sharpe[i]),
+            rolling_sortino=float(sortino[i]),
+            rolling_information_ratio=float(ir[i]),
+            rolling_beta=float(beta[i]),
+            rolling_alpha=float(alpha[i]),
+            rolling_volatility_pct=float(vol[i]),
+            rolling_max_drawdown_pct=float(mdd[i]),
+        )
+        for i in range(n)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -1084,6 +1252,7 @@ class ShadowPortfolioSummary:
     strongest_manager: str = ""
     weakest_manager: str = ""
     trade_results: list[ShadowTradeResult] = field(default_factory=list)
+    nav_curve: list[float] = field(default_factory=list)
 
 
 def simulate_shadow_portfolio(
@@ -1236,16 +1405,12 @@ def simulate_shadow_portfolio(
         1,
     ) if trade_returns else 0.0
 
-    peak = nav_curve[0] if nav_curve else initial_nav
-    max_dd = 0.0
-    for value in nav_curve:
-        if value > peak:
-            peak = value
-        if peak > 0:
-            drawdown = (value - peak) / peak * 100.0
-            if drawdown < max_dd:
-                max_dd = drawdown
-    summary.max_drawdown_pct = round(max_dd, 2)
+    summary.nav_curve = nav_curve
+    curve = np.asarray(nav_curve, dtype=np.float64)
+    peak = np.maximum.accumulate(curve)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        drawdown = np.where(peak > 0, (curve - peak) / peak * 100.0, 0.0)
+    summary.max_drawdown_pct = round(min(0.0, float(drawdown.min())), 2)
 
     if manager_returns:
         ranked = sorted(
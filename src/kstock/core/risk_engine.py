@@ -2,6 +2,7 @@
 
 기존 risk_manager.py의 기본 리스크 체크를 보완하는 고급 분석 모듈.
 v12.5: RiskEngine.evaluate() 단일 진입점 + ManagerRiskPolicy.apply() 추가.
+v14: Monte Carlo 를 청크 스트리밍 엔진(core/monte_carlo)으로 전환 + 기간 스윕.
 """
 from __future__ import annotations
 
@@ -13,6 +14,14 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 
+from kstock.core.monte_carlo import (
+    SAMPLING_METHODS,
+    chunk_rows,
+    cholesky_factor,
+    simulate_streaming,
+    standard_normals,
+)
+
 logger = logging.getLogger(__name__)
 
 # scipy z-score fallback
@@ -156,13 +165,25 @@ def calculate_real_correlation(
     return returns_df.corr()
 
 
+# yfinance period → 대략적 거래일 수 (로컬 일봉 조회 길이)
+_PERIOD_BARS = {"1mo": 21, "3mo": 63, "6mo": 125, "1y": 250}
+
+
 async def _fetch_price_histories(
     tickers: list[dict],
     period: str = "6mo",
 ) -> dict[str, pd.Series]:
-    """yfinance에서 종목별 종가 히스토리 가져오기 (비동기)."""
+    """종목별 종가 히스토리 가져오기 (비동기).
+
+    v14: 로컬 일봉(daily_bars)이 충분하면 직전 마감 세션까지 빠진 꼬리만,
+    나머지 종목은 전체를 yfinance에서 받아 로컬 저장소에 쌓는다.
+    인덱스는 tz 없는 날짜로 맞춘다.
+    """
     import yfinance as yf
+    from kstock.ingest.ohlcv_cache import get_ohlcv_cache
 
+    cache = get_ohlcv_cache()
+    n_bars = _PERIOD_BARS.get(period, 125)
     loop = asyncio.get_event_loop()
     result = {}
     for t in tickers:
@@ -170,12 +191,27 @@ async def _fetch_price_histories(
         market = t.get("market", "KOSPI")
         suffix = ".KS" if market.upper() == "KOSPI" else ".KQ"
         symbol = f"{ticker}{suffix}"
+        local = await asyncio.to_thread(
+            cache.local_bars, ticker, n_bars, int(n_bars * 0.9),
+            lambda p, s=symbol: yf.Ticker(s).history(period=p),
+        )
+        if local is not None:
+            result[ticker] = pd.Series(
+                local["close"].to_numpy(dtype=float),
+                index=pd.to_datetime(local["date"]),
+                name=ticker,
+            )
+            continue
         try:
             hist = await loop.run_in_executor(
                 None, lambda s=symbol: yf.Ticker(s).history(period=period)
             )
             if not hist.empty and len(hist) >= 20:
+                if hist.index.tz is not None:
+                    hist.index = hist.index.tz_localize(None)
+                hist.index = hist.index.normalize()
                 result[ticker] = hist["Close"]
+                await asyncio.to_thread(cache.store_bars, ticker, hist)
         except Exception as e:
             logger.debug("Failed to fetch %s: %s", symbol, e)
     return result
@@ -298,32 +334,77 @@ def run_monte_carlo(
     cov_matrix: np.ndarray,
     days: int = 20,
     simulations: int = 10000,
+    *,
+    method: str = "antithetic",
+    tol: float | None = None,
+    seed: int | None = None,
 ) -> MonteCarloResult:
     """Monte Carlo 시뮬레이션으로 포트폴리오 수익 분포 예측."""
-    n_stocks = len(weights)
+    return run_monte_carlo_sweep(
+        portfolio_value, weights, mean_returns, cov_matrix,
+        horizons=(days,), simulations=simulations,
+        method=method, tol=tol, seed=seed,
+    )[days]
+
+
+def run_monte_carlo_sweep(
+    portfolio_value: float,
+    weights: np.ndarray,
+    mean_returns: np.ndarray,
+    cov_matrix: np.ndarray,
+    horizons: tuple[int, ...] = (1, 5, 20),
+    simulations: int = 10000,
+    *,
+    method: str = "antithetic",
+    tol: float | None = None,
+    seed: int | None = None,
+) -> dict[int, MonteCarloResult]:
+    """v14: 여러 보유 기간을 같은 경로로 한 번에 시뮬레이션 (청크 스트리밍).
+
+    일별 리밸런싱 포트폴리오의 일수익률은 w·r_t 이므로 종목 공분산의
+    Cholesky 인자 L (캐시) 로 σ_p = ‖Lᵀw‖ 를 구해 경로당 스칼라만 생성한다.
+    청크 버퍼는 (chunk × max(horizons)) float32 로 종목 수와 무관하다.
+    """
+    # 잘못된 인자는 아래 단순 정규 fallback 에 묻히지 않게 먼저 거른다
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"unknown sampling method: {method}")
+    horizons = tuple(sorted({int(h) for h in horizons if int(h) > 0})) or (1,)
+    max_days = horizons[-1]
+    rng = np.random.RandomState(seed)
+    weights = np.asarray(weights, dtype=np.float64)
 
-    # Ensure positive definite covariance matrix
     try:
-        cov_pd = cov_matrix.copy()
-        eigvals = np.linalg.eigvalsh(cov_pd)
-        if np.min(eigvals) < 0:
-            cov_pd += np.eye(n_stocks) * (abs(np.min(eigvals)) + 1e-8)
-
-        # Vectorized simulation
-        random_returns = np.random.multivariate_normal(
-            mean_returns, cov_pd, (simulations, days),
-        )
-        portfolio_daily = np.tensordot(random_returns, weights, axes=(2, 0))
-        cumulative = np.prod(1 + portfolio_daily, axis=1)
-        results = (cumulative - 1) * 100
+        factor = cholesky_factor(np.atleast_2d(cov_matrix))
+        port_mean = float(np.dot(weights, mean_returns))
+        port_std = float(np.linalg.norm(factor.T @ weights))
+        cols = [h - 1 for h in horizons]
+
+        def _chunk(k: int) -> np.ndarray:
+            z = standard_normals(rng, k, max_days, method)
+            daily = port_mean + port_std * z
+            return np.cumprod(1 + daily, axis=1)[:, cols] - 1
+
+        paths = simulate_streaming(
+            _chunk, simulations, chunk_rows(max_days),
+            n_outputs=len(horizons), tol=tol,
+        ) * 100
     except Exception as e:
         logger.warning("Monte Carlo fallback to simple: %s", e)
         portfolio_mean = float(np.dot(weights, mean_returns))
         portfolio_std = float(np.sqrt(weights @ cov_matrix @ weights))
-        results = np.random.normal(
-            portfolio_mean * days, portfolio_std * np.sqrt(days), simulations,
-        ) * 100
+        paths = np.column_stack([
+            np.random.normal(portfolio_mean * h, portfolio_std * np.sqrt(h), simulations)
+            for h in horizons
+        ]) * 100
+
+    return {
+        h: _monte_carlo_result(portfolio_value, paths[:, i].astype(np.float64))
+        for i, h in enumerate(horizons)
+    }
 
+
+def _monte_carlo_result(portfolio_value: float, results: np.ndarray) -> MonteCarloResult:
+    """시뮬레이션 수익률(%) 표본 → MonteCarloResult."""
     var_95_pct = float(np.percentile(results, 5))
     var_99_pct = float(np.percentile(results, 1))
     cvar_mask = results <= var_95_pct
@@ -342,7 +423,7 @@ def run_monte_carlo(
         expected_return_pct=round(float(np.median(results)), 2),
         best_case_pct=round(float(np.percentile(results, 95)), 2),
         worst_case_pct=round(float(np.percentile(results, 5)), 2),
-        simulations=simulations,
+        simulations=len(results),
         distribution=distribution,
     )
 
@@ -513,7 +594,7 @@ async def generate_advanced_risk_report(
             )
             # Monte Carlo
             report.monte_carlo = run_monte_carlo(
-                portfolio_value, weights, mean_returns, cov_matrix,
+                portfolio_value, weights, mean_returns, cov_matrix, tol=0.005,
             )
     except Exception as e:
         logger.error("Parametric VaR / Monte Carlo error: %s", e)
@@ -102,14 +102,35 @@ def _format_price(v, _):
 # ═══════════════════════════════════════════════════════════════
 
 def _fetch_ohlcv(ticker: str, days: int) -> pd.DataFrame:
-    """Fetch OHLCV data via yfinance."""
+    """Fetch OHLCV data: local daily bars first, else yfinance.
+
+    v14: 로컬 일봉(daily_bars)이 충분하면 yfinance는 직전 마감 세션까지
+    빠진 꼬리만 받는다.  yfinance로 받은 봉은 로컬 저장소에 쌓는다.
+    """
     import yfinance as yf
+    from kstock.ingest.ohlcv_cache import get_ohlcv_cache
+
+    def _tail(period: str) -> pd.DataFrame | None:
+        for suffix in (".KS", ".KQ"):
+            hist = yf.Ticker(f"{ticker}{suffix}").history(period=period)
+            if hist is not None and not hist.empty:
+                return hist
+        return None
+
+    cache = get_ohlcv_cache()
+    # yfinance 6mo ≈ 120봉이 상한이므로 그 이상은 요구하지 않는다
+    local = cache.local_bars(ticker, days, min_bars=min(days, 120), fetch_tail=_tail)
+    if local is not None:
+        df = local.set_index(pd.to_datetime(local["date"])).drop(columns=["date"])
+        df.columns = [c.capitalize() for c in df.columns]
+        return df
     for suffix in (".KS", ".KQ"):
         symbol = f"{ticker}{suffix}"
         try:
             tf = yf.Ticker(symbol)
             hist = tf.history(period="6mo")
             if hist is not None and not hist.empty and len(hist) >= 10:
+                cache.store_bars(ticker, hist)
                 return hist.tail(days).copy()
         except Exception:
             logger.debug("yfinance fetch failed for %s", symbol, exc_info=True)
@@ -5,6 +5,7 @@ Computes RSI(14), BB(20,2), MACD(12,26,9), ATR(14) without external TA libraries
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 
 import numpy as np
@@ -317,6 +318,547 @@ def compute_indicators(df: pd.DataFrame) -> TechnicalIndicators:
     )
 
 
+@dataclass
+class IndicatorSeries:
+    """Full-history indicator arrays for O(1) per-bar lookup.
+
+    ``series.at(i)`` equals ``compute_indicators(df.iloc[:i + 1])`` but every
+    indicator is computed once over the whole frame instead of per prefix.
+    All underlying indicators are causal (EWM adjust=False, trailing rolling
+    windows), so the value at bar i never depends on later bars.
+    """
+
+    cols: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.cols["close"])
+
+    def at(self, i: int) -> TechnicalIndicators:
+        """Return the indicators as seen on bar ``i`` (negative index allowed)."""
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"bar index {i} out of range for {n} bars")
+        c = self.cols
+        close = float(c["close"][i])
+
+        rsi_val = float(c["rsi"][i])
+        if np.isnan(rsi_val):
+            rsi_val = 50.0
+
+        bb_l, bb_m, bb_u = c["bb_lower"][i], c["bb_mid"][i], c["bb_upper"][i]
+        if not np.isnan(bb_l) and not np.isnan(bb_u):
+            bb_bandwidth = (bb_u - bb_l) / bb_m if bb_m != 0 else 0.0
+            bb_range = bb_u - bb_l
+            bb_pctb = (close - bb_l) / bb_range if bb_range != 0 else 0.5
+        else:
+            bb_pctb = 0.5
+            bb_bandwidth = 0.0
+
+        macd_hist_val = _nan_to(c["macd_hist"][i], 0.0)
+        macd_hist_prev = _nan_to(c["macd_hist"][i - 1], 0.0) if i > 0 else 0.0
+        if macd_hist_val > 0 and macd_hist_prev <= 0:
+            macd_cross = 1
+        elif macd_hist_val < 0 and macd_hist_prev >= 0:
+            macd_cross = -1
+        else:
+            macd_cross = 0
+
+        atr_val = _nan_to(c["atr"][i], 0.0)
+        atr_pct = (atr_val / close * 100) if close != 0 else 0.0
+
+        ema_50_val = float(c["ema_50"][i])
+        ema_200_val = float(c["ema_200"][i])
+        golden = False
+        dead = False
+        if i >= 1:
+            prev_50 = float(c["ema_50"][i - 1])
+            prev_200 = float(c["ema_200_prev"][i])
+            if ema_50_val > ema_200_val and prev_50 <= prev_200:
+                golden = True
+            elif ema_50_val < ema_200_val and prev_50 >= prev_200:
+                dead = True
+
+        vol_avg_20 = c["vol_avg_20"][i]
+        vol_ratio = float(c["volume"][i] / vol_avg_20) if vol_avg_20 > 0 else 1.0
+
+        bb_squeeze = bool(i + 1 >= 20 and c["bb_bw"][i] < c["bb_bw_avg_20"][i] * 0.7)
+
+        ma5_val = float(c["ma5"][i]) if i + 1 >= 5 else close
+        ma20_val = float(c["ma20"][i]) if i + 1 >= 20 else close
+        ma60_val = float(c["ma60"][i]) if i + 1 >= 60 else 0.0
+        ma120_val = float(c["ma120"][i]) if i + 1 >= 120 else 0.0
+
+        return TechnicalIndicators(
+            rsi=round(rsi_val, 2),
+            bb_pctb=round(float(bb_pctb), 4),
+            bb_bandwidth=round(float(bb_bandwidth), 4),
+            macd_histogram=round(macd_hist_val, 4),
+            macd_signal_cross=macd_cross,
+            atr=round(atr_val, 2),
+            atr_pct=round(atr_pct, 2),
+            ema_50=round(ema_50_val, 2),
+            ema_200=round(ema_200_val, 2),
+            golden_cross=golden,
+            dead_cross=dead,
+            high_52w=round(float(c["high_52w"][i]), 0),
+            high_20d=round(float(c["high_20d"][i]), 0),
+            volume_ratio=round(vol_ratio, 2),
+            bb_squeeze=bb_squeeze,
+            return_3m_pct=round(float(c["return_3m"][i]), 2),
+            ma5=round(ma5_val, 2),
+            ma20=round(ma20_val, 2),
+            ma60=round(ma60_val, 2),
+            ma120=round(ma120_val, 2),
+            macd=round(_nan_to(c["macd_line"][i], 0.0), 4),
+            macd_signal=round(_nan_to(c["macd_signal"][i], 0.0), 4),
+            rsi_divergence=int(c["rsi_div"][i]),
+            macd_divergence=int(c["macd_div"][i]),
+        )
+
+
+def _nan_to(value: float, default: float) -> float:
+    value = float(value)
+    return default if np.isnan(value) else value
+
+
+def _divergence_series(
+    close: pd.Series, osc: pd.Series, min_gap: float, lookback: int = 20,
+) -> np.ndarray:
+    """Vectorized _detect_*_divergence over every bar (same half-window rule)."""
+    half = lookback // 2
+    late_low = close.rolling(lookback - half).min()
+    late_high = close.rolling(lookback - half).max()
+    early_low = close.rolling(half).min().shift(lookback - half)
+    early_high = close.rolling(half).max().shift(lookback - half)
+    osc_late_low = osc.rolling(lookback - half).min()
+    osc_late_high = osc.rolling(lookback - half).max()
+    osc_early_low = osc.rolling(half).min().shift(lookback - half)
+    osc_early_high = osc.rolling(half).max().shift(lookback - half)
+
+    bullish = (late_low < early_low) & (osc_late_low > osc_early_low + min_gap)
+    bearish = (late_high > early_high) & (osc_late_high < osc_early_high - min_gap)
+    out = np.where(bullish, 1, np.where(bearish, -1, 0))
+
+    has_nan = osc.isna().astype(int).rolling(lookback, min_periods=1).sum() > 0
+    enough = np.arange(len(close)) + 1 >= lookback + 5
+    out[has_nan.to_numpy() | ~enough] = 0
+    return out
+
+
+def compute_indicator_series(df: pd.DataFrame) -> IndicatorSeries:
+    """Compute every bar's TechnicalIndicators in one vectorized pass.
+
+    Replaces the ``compute_indicators(df.iloc[:i + 1])`` per-bar pattern in
+    backtests (O(n²)) with a single O(n) computation plus O(1) lookups.
+
+    Args:
+        df: DataFrame with columns close, high, low, volume (same as
+            compute_indicators).
+
+    Returns:
+        IndicatorSeries; ``series.at(i)`` matches compute_indicators on the
+        prefix ending at bar i.
+    """
+    close = df["close"].astype(float).reset_index(drop=True)
+    high = df["high"].astype(float).reset_index(drop=True)
+    low = df["low"].astype(float).reset_index(drop=True)
+    vol = df["volume"].astype(float).reset_index(drop=True)
+    n = len(close)
+    bars = np.arange(n) + 1  # prefix length at each bar
+
+    rsi_series = _rsi(close, length=14)
+    bb_lower, bb_mid, bb_upper = _bbands(close, length=20, std=2)
+    macd_line_s, signal_line_s, macd_hist = _macd(close, fast=12, slow=26, signal=9)
+    atr_series = _atr(high, low, close, length=14)
+    bb_bw = (bb_upper - bb_lower) / bb_mid
+
+    # compute_indicators uses span=200 once 200 bars exist, span=100 from
+    # 100 bars, and span=len(prefix) before that — the last one is not
+    # prefix-invariant, so those (at most 99) bars are computed directly.
+    ema_50 = close.ewm(span=50, adjust=False).mean().to_numpy()
+    ema_200_full = close.ewm(span=200, adjust=False).mean().to_numpy()
+    ema_100_full = close.ewm(span=100, adjust=False).mean().to_numpy()
+    ema_200 = np.where(bars >= 200, ema_200_full, ema_100_full)
+    ema_200_prev = np.full(n, np.nan)
+    ema_200_prev[1:] = np.where(bars[1:] >= 200, ema_200_full[:-1], ema_100_full[:-1])
+    for i in range(min(n, 99)):
+        ema_short = close.iloc[:i + 1].ewm(span=i + 1, adjust=False).mean().to_numpy()
+        ema_200[i] = ema_short[-1]
+        if i >= 1:
+            ema_200_prev[i] = ema_short[-2]
+
+    lag_3m = np.minimum(60, bars - 1)
+    base_idx = np.arange(n) - lag_3m
+    closes = close.to_numpy()
+    base = closes[base_idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return_3m = np.where(lag_3m > 0, (closes - base) / base * 100, 0.0)
+
+    cols = {
+        "close": closes,
+        "volume": vol.to_numpy(),
+        "rsi": rsi_series.to_numpy(),
+        "bb_lower": bb_lower.to_numpy(),
+        "bb_mid": bb_mid.to_numpy(),
+        "bb_upper": bb_upper.to_numpy(),
+        "bb_bw": bb_bw.to_numpy(),
+        "bb_bw_avg_20": bb_bw.rolling(20, min_periods=1).mean().to_numpy(),
+        "macd_line": macd_line_s.to_numpy(),
+        "macd_signal": signal_line_s.to_numpy(),
+        "macd_hist": macd_hist.to_numpy(),
+        "atr": atr_series.to_numpy(),
+        "ema_50": ema_50,
+        "ema_200": ema_200,
+        "ema_200_prev": ema_200_prev,
+        "high_52w": high.rolling(252, min_periods=1).max().to_numpy(),
+        "high_20d": high.rolling(20, min_periods=1).max().to_numpy(),
+        "vol_avg_20": vol.rolling(20, min_periods=1).mean().to_numpy(),
+        "return_3m": return_3m,
+        "ma5": close.rolling(5).mean().to_numpy(),
+        "ma20": close.rolling(20).mean().to_numpy(),
+        "ma60": close.rolling(60).mean().to_numpy(),
+        "ma120": close.rolling(120).mean().to_numpy(),
+        "rsi_div": _divergence_series(close, rsi_series, min_gap=2),
+        "macd_div": _divergence_series(close, macd_hist, min_gap=0),
+    }
+    return IndicatorSeries(cols=cols)
+
+
+# ── Streaming indicator state ───────────────────────────────────────────────
+
+
+def _ewm_alpha(span: float | None = None, alpha: float | None = None) -> float:
+    """Smoothing factor exactly as pandas ``ewm`` derives it (via center of mass)."""
+    com = (span - 1) / 2 if span is not None else (1 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+
+def _ewm_step(prev: float | None, x: float, a: float) -> float:
+    """One ``ewm(adjust=False)`` step in pandas' operation order."""
+    if prev is None or prev == x:
+        return x
+    f = 1.0 - a
+    return (f * prev + a * x) / (f + a)
+
+
+_A_RSI = _ewm_alpha(alpha=1 / 14)
+_A_12, _A_26, _A_9 = _ewm_alpha(span=12), _ewm_alpha(span=26), _ewm_alpha(span=9)
+_A_50, _A_100, _A_200 = _ewm_alpha(span=50), _ewm_alpha(span=100), _ewm_alpha(span=200)
+
+
+@dataclass(frozen=True)
+class _Acc:
+    """EWM accumulators after ``n`` bars."""
+
+    n: int = 0
+    close: float = 0.0
+    gain: float | None = None
+    loss: float | None = None
+    ema_12: float | None = None
+    ema_26: float | None = None
+    signal: float | None = None
+    ema_50: float | None = None
+    ema_100: float | None = None
+    ema_200: float | None = None
+
+    def step(self, close: float, high: float, low: float) -> tuple[_Acc, float, float]:
+        """Advance one bar. Returns (accumulators, RSI, true range)."""
+        if self.n:
+            delta = close - self.close
+            tr = max(high - low, abs(high - self.close), abs(low - self.close))
+        else:
+            delta = 0.0
+            tr = high - low
+        gain = _ewm_step(self.gain, delta if delta > 0 else 0.0, _A_RSI)
+        loss = _ewm_step(self.loss, -delta if delta < 0 else 0.0, _A_RSI)
+        ema_12 = _ewm_step(self.ema_12, close, _A_12)
+        ema_26 = _ewm_step(self.ema_26, close, _A_26)
+        acc = _Acc(
+            n=self.n + 1, close=close, gain=gain, loss=loss,
+            ema_12=ema_12, ema_26=ema_26,
+            signal=_ewm_step(self.signal, ema_12 - ema_26, _A_9),
+            ema_50=_ewm_step(self.ema_50, close, _A_50),
+            ema_100=_ewm_step(self.ema_100, close, _A_100),
+            ema_200=_ewm_step(self.ema_200, close, _A_200),
+        )
+        rsi = 100 - (100 / (1 + gain / loss)) if acc.n >= 14 and loss != 0 else np.nan
+        return acc, rsi, tr
+
+    @property
+    def macd_line(self) -> float:
+        return self.ema_12 - self.ema_26
+
+    @property
+    def hist(self) -> float:
+        return self.ema_12 - self.ema_26 - self.signal
+
+
+def _divergence_last(close: np.ndarray, osc: np.ndarray, min_gap: float, lookback: int = 20) -> int:
+    """_detect_*_divergence on the trailing ``lookback`` values."""
+    if len(osc) < lookback or np.isnan(osc).any():
+        return 0
+    half = lookback // 2
+    if close[half:].min() < close[:half].min() and osc[half:].min() > osc[:half].min() + min_gap:
+        return 1
+    if close[half:].max() > close[:half].max() and osc[half:].max() < osc[:half].max() - min_gap:
+        return -1
+    return 0
+
+
+class IndicatorState:
+    """Streaming ``compute_indicators`` for one ticker.
+
+    Holds the EWM accumulators (RSI, MACD, EMA 50/100/200) as of the
+    second-to-last bar plus short tails of the rolling-window inputs.  The
+    last bar is kept apart, so revising today's bar intraday is one O(1)
+    re-step and a new bar only commits the previous one.
+
+    ``indicators()`` equals ``compute_indicators(df)`` for the frame the state
+    was fed.  EWMs are seeded at the frame's first bar, so ``sync`` rebuilds
+    when the first bar (or bar count) no longer lines up.
+    """
+
+    _CLOSES = 120    # ma120; also covers 3m return (61) and the <100-bar EMA
+    _HIGHS = 252
+    _WINDOW = 20     # BB, volume avg, divergences, bandwidth avg
+
+    def __init__(self) -> None:
+        self._acc = _Acc()                    # committed (all bars but the last)
+        self._closes: deque[float] = deque(maxlen=self._CLOSES)
+        self._highs: deque[float] = deque(maxlen=self._HIGHS)
+        self._vols: deque[float] = deque(maxlen=self._WINDOW)
+        self._trs: deque[float] = deque(maxlen=14)
+        self._rsis: deque[float] = deque(maxlen=self._WINDOW)
+        self._hists: deque[float] = deque(maxlen=self._WINDOW)
+        self._bws: deque[float] = deque(maxlen=self._WINDOW)
+        self._first: tuple | None = None      # (key, close) of bar 0
+        self._prev_key: tuple | None = None   # (key, close) of the last committed bar
+        self._bar: tuple | None = None        # (key, close, high, low, volume)
+        self._last: tuple | None = None       # (acc, rsi, tr, bw) for the last bar
+        self._cached: TechnicalIndicators | None = None
+
+    def __len__(self) -> int:
+        return self._acc.n + (self._bar is not None)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> IndicatorState:
+        state = cls()
+        keys = _bar_keys(df)
+        cols = [df[c].astype(float).to_numpy() for c in ("close", "high", "low", "volume")]
+        for key, c, h, lo, v in zip(keys, *cols):
+            state.push(c, h, lo, v, key=key)
+        return state
+
+    # -- updates -----------------------------------------------------------------
+
+    def push(self, close: float, high: float, low: float, volume: float, key=None) -> None:
+        """Append a new bar; the previous last bar becomes final."""
+        if self._bar is not None:
+            self._commit()
+        else:
+            self._first = (key, float(close))
+        self._set_last(key, close, high, low, volume)
+
+    def revise(self, close: float, high: float, low: float, volume: float) -> None:
+        """Replace the last bar (today's bar updated intraday)."""
+        if self._bar is None:
+            self.push(close, high, low, volume)
+        else:
+            self._set_last(self._bar[0], close, high, low, volume)
+
+    def _set_last(self, key, close, high, low, volume) -> None:
+        close, high, low, volume = float(close), float(high), float(low), float(volume)
+        if self._acc.n == 0:
+            self._first = (key, close)
+        acc, rsi, tr = self._acc.step(close, high, low)
+        window = self._tail(self._closes, self._WINDOW, close)
+        if len(window) == self._WINDOW:
+            mid = window.mean()
+            sd = window.std(ddof=1)
+            bw = ((mid + 2 * sd) - (mid - 2 * sd)) / mid if mid != 0 else np.nan
+        else:
+            mid = sd = bw = np.nan
+        self._bar = (key, close, high, low, volume)
+        self._last = (acc, rsi, tr, bw, mid, sd)
+        self._cached = None
+
+    def _commit(self) -> None:
+        key, close, high, _, volume = self._bar
+        acc, rsi, tr, bw, _, _ = self._last
+        self._closes.append(close)
+        self._highs.append(high)
+        self._vols.append(volume)
+        self._trs.append(tr)
+        self._rsis.append(rsi)
+        self._hists.append(acc.hist)
+        self._bws.append(bw)
+        self._acc = acc
+        self._prev_key = (key, close)
+        self._bar = None
+
+    def sync(self, df: pd.DataFrame) -> bool:
+        """Bring the state in line with *df*.
+
+        Returns True when it was an O(1) update (last bar revised, or one new
+        bar appended), False when the state had to be rebuilt.
+        """
+        n = len(df)
+        if n == 0:
+            self.__init__()
+            return False
+        keys = _bar_keys(df)
+        close = df["close"].astype(float)
+        high, low, vol = df["high"], df["low"], df["volume"]
+        if self._first == (keys[0], float(close.iloc[0])) and self._bar is not None:
+            if n == len(self) and (n == 1 or self._prev_key == (keys[-2], float(close.iloc[-2]))):
+                if self._bar[0] == keys[-1]:
+                    self.revise(close.iloc[-1], high.iloc[-1], low.iloc[-1], vol.iloc[-1])
+                    return True
+            elif n == len(self) + 1 and self._bar[0] == keys[-2] and (
+                n == 2 or self._prev_key == (keys[-3], float(close.iloc[-3]))
+            ):
+                self.revise(close.iloc[-2], high.iloc[-2], low.iloc[-2], vol.iloc[-2])
+                self.push(close.iloc[-1], high.iloc[-1], low.iloc[-1], vol.iloc[-1], key=keys[-1])
+                return True
+        fresh = IndicatorState.from_frame(df)
+        self.__dict__.update(fresh.__dict__)
+        return False
+
+    # -- output ------------------------------------------------------------------
+
+    @staticmethod
+    def _tail(dq: deque, k: int, last: float) -> np.ndarray:
+        """Last ``k - 1`` committed values followed by *last*."""
+        vals = list(dq)[-(k - 1):] if k > 1 else []
+        vals.append(last)
+        return np.asarray(vals, dtype=float)
+
+    def _ema_200(self, acc: _Acc) -> tuple[float, float]:
+        """(current, previous) of compute_indicators' EMA "200" series."""
+        n = acc.n
+        if n >= 200:
+            return acc.ema_200, self._acc.ema_200
+        if n >= 100:
+            return acc.ema_100, self._acc.ema_100
+        # span=len(frame): not recursive in n, so replay (< 100 bars)
+        a = _ewm_alpha(span=n)
+        prev = cur = None
+        for c in [*self._closes, acc.close]:
+            prev, cur = cur, _ewm_step(cur, c, a)
+        return cur, prev
+
+    def indicators(self) -> TechnicalIndicators:
+        """Latest ``TechnicalIndicators`` (cached until the next update)."""
+        if self._cached is not None:
+            return self._cached
+        if self._bar is None:
+            raise ValueError("IndicatorState has no bars")
+        _, close, high, _, volume = self._bar
+        acc, rsi, tr, bw, mid, sd = self._last
+        n = acc.n
+        prev = self._acc
+
+        rsi_val = 50.0 if np.isnan(rsi) else float(rsi)
+
+        if not np.isnan(mid):
+            bb_l, bb_u = mid - 2 * sd, mid + 2 * sd
+            bb_bandwidth = (bb_u - bb_l) / mid if mid != 0 else 0.0
+            bb_range = bb_u - bb_l
+            bb_pctb = (close - bb_l) / bb_range if bb_range != 0 else 0.5
+        else:
+            bb_pctb = 0.5
+            bb_bandwidth = 0.0
+
+        hist = acc.hist
+        hist_prev = prev.hist if prev.n else 0.0
+        if hist > 0 and hist_prev <= 0:
+            macd_cross = 1
+        elif hist < 0 and hist_prev >= 0:
+            macd_cross = -1
+        else:
+            macd_cross = 0
+
+        trs = self._tail(self._trs, 14, tr)
+        atr_val = float(trs.mean()) if len(trs) == 14 else 0.0
+        atr_pct = (atr_val / close * 100) if close != 0 else 0.0
+
+        ema_50_val = acc.ema_50
+        ema_200_val, ema_200_prev = self._ema_200(acc)
+        golden = dead = False
+        if n >= 2:
+            if ema_50_val > ema_200_val and prev.ema_50 <= ema_200_prev:
+                golden = True
+            elif ema_50_val < ema_200_val and prev.ema_50 >= ema_200_prev:
+                dead = True
+
+        highs = self._tail(self._highs, self._HIGHS, high)
+        vols = self._tail(self._vols, self._WINDOW, volume)
+        vol_avg_20 = vols.mean()
+        vol_ratio = float(volume / vol_avg_20) if vol_avg_20 > 0 else 1.0
+
+        bb_squeeze = False
+        if n >= 20:
+            bws = self._tail(self._bws, self._WINDOW, bw)
+            if not np.isnan(bws).all() and bw < np.nanmean(bws) * 0.7:
+                bb_squeeze = True
+
+        closes = self._tail(self._closes, self._CLOSES + 1, close)
+        lookback_3m = min(60, n - 1)
+        if lookback_3m > 0:
+            base = closes[-lookback_3m - 1]
+            ret_3m = (close - base) / base * 100
+        else:
+            ret_3m = 0.0
+
+        ma5_val = float(closes[-5:].mean()) if n >= 5 else close
+        ma20_val = float(closes[-20:].mean()) if n >= 20 else close
+        ma60_val = float(closes[-60:].mean()) if n >= 60 else 0.0
+        ma120_val = float(closes[-120:].mean()) if n >= 120 else 0.0
+
+        rsi_div = macd_div = 0
+        if n >= 25:
+            tail_close = closes[-20:]
+            rsi_div = _divergence_last(tail_close, self._tail(self._rsis, 20, rsi), min_gap=2)
+            macd_div = _divergence_last(tail_close, self._tail(self._hists, 20, hist), min_gap=0)
+
+        self._cached = TechnicalIndicators(
+            rsi=round(rsi_val, 2),
+            bb_pctb=round(float(bb_pctb), 4),
+            bb_bandwidth=round(float(bb_bandwidth), 4),
+            macd_histogram=round(hist, 4),
+            macd_signal_cross=macd_cross,
+            atr=round(atr_val, 2),
+            atr_pct=round(atr_pct, 2),
+            ema_50=round(ema_50_val, 2),
+            ema_200=round(ema_200_val, 2),
+            golden_cross=golden,
+            dead_cross=dead,
+            high_52w=round(float(highs.max()), 0),
+            high_20d=round(float(highs[-20:].max()), 0),
+            volume_ratio=round(vol_ratio, 2),
+            bb_squeeze=bb_squeeze,
+            return_3m_pct=round(float(ret_3m), 2),
+            ma5=round(ma5_val, 2),
+            ma20=round(ma20_val, 2),
+            ma60=round(ma60_val, 2),
+            ma120=round(ma120_val, 2),
+            macd=round(acc.macd_line, 4),
+            macd_signal=round(acc.signal, 4),
+            rsi_divergence=rsi_div,
+            macd_divergence=macd_div,
+        )
+        return self._cached
+
+
+def _bar_keys(df: pd.DataFrame) -> list:
+    """Per-bar identity used to line a frame up with an ``IndicatorState``."""
+    if "date" in df.columns:
+        return [str(d)[:10] for d in df["date"].tolist()]
+    return list(df.index)
+
+
 def normalize_indicators(
     tech: TechnicalIndicators,
     weights: dict[str, float] | None = None,
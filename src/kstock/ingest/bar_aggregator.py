@@ -0,0 +1,318 @@
+"""Live intraday bar aggregator on top of the KIS WebSocket tick feed.
+
+v14: 체결 틱을 종목별 1분/5분 OHLCV+VWAP 봉으로 실시간 집계한다.
+급등 감지 / 장중 모니터 / VWAP·TWAP 실행 로직이 일봉 재조회나 시세 폴링
+없이 몇 초 안에 반응할 수 있게 하는 것이 목적.
+
+- ``attach(ws)``: ``KISWebSocket.on_update`` 콜백을 걸고, 콜백이 올 때마다
+  ``ws.tick_store.since(ticker, seq)`` 로 새 틱만 읽는다.  콜백은 폭주 시
+  종목별로 병합되지만 틱 링 버퍼에는 전부 남으므로 봉 거래량이 빠지지 않는다.
+- 봉 구간은 거래소 체결 시각(HHMMSS) 기준, 없으면 수신 시각(KST).
+- 당일 봉은 메모리에 두고 ``persist()`` (장 종료 시) 로 Parquet 레이크에
+  ``IntradayBarStore`` 형식으로 저장한다.  날짜가 바뀌면 전날 세션을 비우고,
+  아직 저장하지 않은 세션이면 이벤트 루프 밖 (executor) 에서 저장한다.
+
+Usage::
+
+    bars = BarAggregator(store=IntradayBarStore())
+    bars.attach(ws)
+    df = bars.get_bars("005930", "1m", n=30)   # datetime/open/high/low/close/volume/vwap/trades
+    bars.session_vwap("005930")
+    bars.persist()                               # 장 마감 후
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Iterable
+
+import pandas as pd
+
+from kstock.core.tz import KST
+
+logger = logging.getLogger(__name__)
+
+INTERVALS: dict[str, int] = {"1m": 60, "5m": 300}
+BAR_COLUMNS = ["datetime", "open", "high", "low", "close", "volume", "vwap", "trades"]
+
+
+class _Bar:
+    """진행 중인 봉 하나 (틱마다 제자리 갱신)."""
+
+    __slots__ = ("start", "open", "high", "low", "close", "volume", "pv", "trades")
+
+    def __init__(self, start: int, price: float, volume: int) -> None:
+        self.start = start            # 세션 기준 초 (HH*3600+MM*60+SS, 구간 시작)
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.pv = price * volume
+        self.trades = 1
+
+    def add(self, price: float, volume: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.pv += price * volume
+        self.trades += 1
+
+    def row(self) -> tuple:
+        vwap = self.pv / self.volume if self.volume else self.close
+        return (self.start, self.open, self.high, self.low, self.close,
+                self.volume, vwap, self.trades)
+
+
+class _Series:
+    """한 종목·한 주기의 당일 봉."""
+
+    __slots__ = ("seconds", "closed", "current")
+
+    def __init__(self, seconds: int) -> None:
+        self.seconds = seconds
+        self.closed: list[tuple] = []
+        self.current: _Bar | None = None
+
+    def add(self, sec: int, price: float, volume: int) -> None:
+        start = sec - sec % self.seconds
+        cur = self.current
+        if cur is not None and start == cur.start:
+            cur.add(price, volume)
+            return
+        if cur is not None:
+            if start < cur.start:       # 늦게 온 틱은 진행 중 봉에 합친다
+                cur.add(price, volume)
+                return
+            self.closed.append(cur.row())
+        self.current = _Bar(start, price, volume)
+
+    def close(self) -> None:
+        if self.current is not None:
+            self.closed.append(self.current.row())
+            self.current = None
+
+    def rows(self, include_partial: bool = True) -> list[tuple]:
+        if include_partial and self.current is not None:
+            return [*self.closed, self.current.row()]
+        return self.closed
+
+
+class _Session:
+    """한 종목의 당일 상태 (주기별 봉 + 세션 VWAP)."""
+
+    __slots__ = ("day", "series", "volume", "pv", "ticks", "saved_ticks")
+
+    def __init__(self, day: str, intervals: Iterable[int]) -> None:
+        self.day = day
+        self.series = {s: _Series(s) for s in intervals}
+        self.volume = 0
+        self.pv = 0.0
+        self.ticks = 0
+        self.saved_ticks = -1  # persist() 가 저장한 시점의 ticks
+
+    @property
+    def persisted(self) -> bool:
+        return self.saved_ticks == self.ticks
+
+
+class BarAggregator:
+    """종목별 1분/5분 봉 실시간 집계기."""
+
+    def __init__(
+        self,
+        intervals: Iterable[str] = ("1m", "5m"),
+        store: Any = None,
+    ) -> None:
+        self.intervals = {name: INTERVALS[name] for name in intervals}
+        self.store = store
+        self._sessions: dict[str, _Session] = {}
+        self._seq: dict[str, int] = {}
+        self._ws: Any = None
+        self._lock = threading.Lock()
+        self._roll_writes: set[asyncio.Future] = set()
+
+    # -- 입력 ------------------------------------------------------------------
+
+    def attach(self, ws: Any) -> None:
+        """``KISWebSocket`` 체결 콜백에 연결한다 (한 번만)."""
+        if self._ws is ws:
+            return
+        self._ws = ws
+        ws.on_update(self._on_ws_update)
+
+    def _on_ws_update(self, event_type: str, ticker: str, data: Any) -> None:
+        if event_type != "price" or self._ws is None:
+            return
+        ticks, seq = self._ws.tick_store.since(ticker, self._seq.get(ticker, 0))
+        self._seq[ticker] = seq
+        if len(ticks):
+            self.add_ticks(ticker, ticks)
+
+    def add_ticks(self, ticker: str, ticks: Any) -> None:
+        """``tick_store.TICK_DTYPE`` 배열을 순서대로 반영."""
+        for ts, price, vol, hhmmss in zip(
+            ticks["ts"].tolist(), ticks["price"].tolist(),
+            ticks["trade_vol"].tolist(), ticks["hhmmss"].tolist(),
+        ):
+            self.on_tick(ticker, price, vol, ts=ts, hhmmss=hhmmss)
+
+    def on_tick(
+        self,
+        ticker: str,
+        price: float,
+        volume: int,
+        ts: float | None = None,
+        hhmmss: int | None = None,
+    ) -> None:
+        """체결 틱 하나 반영.
+
+        Args:
+            price: 체결가.
+            volume: 체결 수량.
+            ts: 수신 시각 (epoch sec, 세션 날짜 판정용). 기본 현재 시각.
+            hhmmss: 거래소 체결 시각 (예: 90105). 없으면 ts의 KST 시각.
+        """
+        if price <= 0:
+            return
+        now = datetime.fromtimestamp(ts if ts is not None else time.time(), KST)
+        if hhmmss:
+            sec = hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100
+        else:
+            sec = now.hour * 3600 + now.minute * 60 + now.second
+        day = now.strftime("%Y-%m-%d")
+
+        rolled: _Session | None = None
+        with self._lock:
+            sess = self._sessions.get(ticker)
+            if sess is None or sess.day != day:
+                rolled = sess
+                sess = self._sessions[ticker] = _Session(day, self.intervals.values())
+            for series in sess.series.values():
+                series.add(sec, price, volume)
+            sess.volume += volume
+            sess.pv += price * volume
+            sess.ticks += 1
+        if rolled is not None:
+            self._roll(ticker, rolled)
+
+    def _roll(self, ticker: str, sess: _Session) -> None:
+        """날짜가 바뀐 종목: 전날 세션을 버리고, 저장 전이면 저장한다.
+
+        세션은 이미 ``_sessions`` 에서 빠졌으므로 락 밖에서 다룬다.  장 시작
+        틱 폭주 중에 이벤트 루프를 막지 않도록 쓰기는 executor 로 넘긴다.
+        """
+        if self.store is None or sess.persisted:
+            return
+        for series in sess.series.values():
+            series.close()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(ticker, sess.day, self._session_frames(sess))
+            return
+        fut = loop.run_in_executor(
+            None, lambda: self._write(ticker, sess.day, self._session_frames(sess)),
+        )
+        self._roll_writes.add(fut)
+        fut.add_done_callback(self._roll_writes.discard)
+
+    # -- 조회 ------------------------------------------------------------------
+
+    def get_bars(
+        self,
+        ticker: str,
+        interval: str = "1m",
+        n: int | None = None,
+        include_partial: bool = True,
+    ) -> pd.DataFrame:
+        """당일 최근 *n* 봉 (``BAR_COLUMNS``; datetime은 KST naive)."""
+        seconds = self.intervals[interval]
+        with self._lock:
+            sess = self._sessions.get(ticker)
+            if sess is None:
+                return pd.DataFrame(columns=BAR_COLUMNS)
+            rows = sess.series[seconds].rows(include_partial)
+            rows = rows[-n:] if n else list(rows)
+            day = sess.day
+        return self._frame(day, rows)
+
+    def last_bar(self, ticker: str, interval: str = "1m") -> dict | None:
+        """진행 중(없으면 마지막 완성) 봉."""
+        with self._lock:
+            sess = self._sessions.get(ticker)
+            if sess is None:
+                return None
+            rows = sess.series[self.intervals[interval]].rows(True)
+            if not rows:
+                return None
+            return self._frame(sess.day, rows[-1:]).iloc[0].to_dict()
+
+    def session_vwap(self, ticker: str) -> float:
+        """당일 누적 VWAP (체결 없으면 0)."""
+        sess = self._sessions.get(ticker)
+        if sess is None or sess.volume <= 0:
+            return 0.0
+        return sess.pv / sess.volume
+
+    def tickers(self) -> list[str]:
+        return list(self._sessions)
+
+    @staticmethod
+    def _frame(day: str, rows: list[tuple]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=["sec", *BAR_COLUMNS[1:]])
+        df.insert(0, "datetime", pd.Timestamp(day) + pd.to_timedelta(df.pop("sec"), unit="s"))
+        return df
+
+    # -- 저장 ------------------------------------------------------------------
+
+    def close_session(self) -> None:
+        """진행 중인 봉을 모두 마감한다 (장 종료)."""
+        with self._lock:
+            for sess in self._sessions.values():
+                for series in sess.series.values():
+                    series.close()
+
+    def _session_frames(self, sess: _Session) -> list[tuple[str, pd.DataFrame]]:
+        out = []
+        for name, seconds in self.intervals.items():
+            rows = sess.series[seconds].rows(include_partial=True)
+            if rows:
+                out.append((name, self._frame(sess.day, rows)))
+        return out
+
+    def _write(self, ticker: str, day: str, frames: list[tuple[str, pd.DataFrame]]) -> int:
+        written = 0
+        for name, df in frames:
+            try:
+                self.store.save_session(ticker, name, day, df)
+                written += 1
+            except Exception:
+                logger.debug("bar persist failed for %s %s", ticker, name, exc_info=True)
+        return written
+
+    def persist(self, close: bool = True) -> int:
+        """당일 봉을 레이크에 저장. 저장한 (종목, 주기) 파일 수를 반환."""
+        if self.store is None:
+            return 0
+        if close:
+            self.close_session()
+        with self._lock:
+            snapshot = [
+                (ticker, sess, sess.ticks, self._session_frames(sess))
+                for ticker, sess in self._sessions.items()
+                if not sess.persisted
+            ]
+        written = 0
+        for ticker, sess, ticks, frames in snapshot:
+            n = self._write(ticker, sess.day, frames)
+            written += n
+            if n == len(frames):
+                # 저장 이후 새 틱이 오면 ticks 가 늘어 다시 미저장 상태가 된다
+                sess.saved_ticks = ticks
+        logger.info("Intraday bars persisted: %d files (%d tickers)", written, len(snapshot))
+        return written
@@ -9,9 +9,8 @@ import logging
 import os
 from datetime import datetime
 
-import httpx
-
 from kstock.core.tz import KST
+from kstock.ingest.http_pool import get_http_pool
 
 logger = logging.getLogger(__name__)
 DART_BASE = "https://opendart.fss.or.kr/api"
@@ -52,7 +51,7 @@ class DartClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15) as client:
+            async with get_http_pool().session(timeout=15) as client:
                 resp = await client.get(
                     f"{DART_BASE}/list.json", params=params,
                 )
@@ -9,15 +9,18 @@ Priority:
 
 v5.0: PIT(Point-in-Time) 소스 태깅 + 지연 추적 통합.
 v5.1: 폴백 데이터 매수 차단 — 지연 소스(yfinance/naver)로 신규 매수 의사결정 금지.
+v14: 다종목 배치 API(get_prices/get_ohlcv_many) + 동일 요청 single-flight
+     + 잡 간 공유 단기 시세 캐시.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, Iterable
 
 from kstock.core.market_calendar import is_kr_market_open
 from kstock.core.tz import KST
@@ -43,6 +46,24 @@ SOURCE_DELAY_SECONDS = {
     "none": 0,
 }
 
+# v14: 시세 공유 캐시 TTL — 같은 5분 주기 안의 여러 잡이 같은 종목을 다시 묻지 않게
+QUOTE_TTL_SECONDS = 15.0
+# v14: WebSocket 스냅샷을 실시간 시세로 인정하는 최대 경과 시간
+WS_QUOTE_MAX_AGE = 60.0
+# v14: 배치 OHLCV에서 종목별 Naver 폴백 동시 요청 수
+_NAVER_OHLCV_CONCURRENCY = 4
+
+_PERIOD_DAYS = {"1mo": 30, "3mo": 90, "6mo": 180, "1y": 365}
+
+
+@dataclass
+class Quote:
+    """공유 시세 캐시 항목."""
+
+    price: float
+    source: str
+    fetched_at: float  # time.monotonic()
+
 
 @dataclass
 class DataSource:
@@ -64,14 +85,22 @@ class DataRouter:
         kis_broker: "BrokerProtocol | None" = None,
         yf_client: "MarketDataProvider | None" = None,
         db: Any = None,
+        ws: Any = None,
+        quote_ttl: float = QUOTE_TTL_SECONDS,
     ) -> None:
         self.kis = kis_broker
         self.yf = yf_client
         self.db = db
+        self.ws = ws  # v14: KISWebSocket (체결가 스냅샷)
         self._naver = None  # lazy init
         self._source = self._detect_source()
         self._fallback_count = 0  # Naver 폴백 사용 횟수
         self._last_source_used: str = ""  # v5.0: 마지막 사용 소스
+        # v14: 공유 시세 캐시 + in-flight 요청 (single-flight)
+        self.quote_ttl = quote_ttl
+        self._quotes: dict[str, Quote] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._batch_stats = {"quote_hits": 0, "coalesced": 0, "batch_fetches": 0}
 
     def _get_naver_client(self):
         """NaverFinanceClient lazy 초기화."""
@@ -213,11 +242,155 @@ class DataRouter:
             return None
         return PortfolioSnapshot.from_legacy_dict(raw)
 
+    # ── v14: 공유 시세 캐시 / single-flight ─────────────────────────
+
+    def _fresh_quote(self, ticker: str) -> Quote | None:
+        q = self._quotes.get(ticker)
+        if q is not None and time.monotonic() - q.fetched_at < self.quote_ttl:
+            return q
+        return None
+
+    def put_quote(self, ticker: str, price: float, source: str) -> None:
+        """외부에서 얻은 시세를 공유 캐시에 넣는다 (예: KIS REST 단건 조회)."""
+        if price > 0 and source:
+            self._quotes[ticker] = Quote(price, source, time.monotonic())
+
+    def peek_quotes(self, tickers: Iterable[str]) -> dict[str, float]:
+        """캐시에 있는 신선한 시세만 (네트워크 요청 없음)."""
+        out = {}
+        for t in tickers:
+            q = self._fresh_quote(t)
+            if q is not None:
+                out[t] = q.price
+        return out
+
+    def invalidate_quotes(self, tickers: Iterable[str] | None = None) -> None:
+        """공유 시세 캐시 무효화 (전체 또는 일부)."""
+        if tickers is None:
+            self._quotes.clear()
+            return
+        for t in tickers:
+            self._quotes.pop(t, None)
+
+    def _claim(self, keys: Iterable[Hashable]) -> tuple[list, dict]:
+        """*keys* 를 내가 가져올 것과 이미 진행 중인(기다릴) 것으로 나눈다."""
+        loop = asyncio.get_running_loop()
+        mine, waits = [], {}
+        for key in keys:
+            fut = self._inflight.get(key)
+            if fut is not None and not fut.done() and fut.get_loop() is loop:
+                waits[key] = fut
+            else:
+                self._inflight[key] = loop.create_future()
+                mine.append(key)
+        return mine, waits
+
+    def _launch(
+        self,
+        keys: Iterable[Hashable],
+        fetch: Callable[[], Awaitable[Any]],
+        split: Callable[[Any], dict],
+        default: Any,
+    ) -> asyncio.Future:
+        """*keys* 의 조회를 라우터 소유 Task 로 돌리고, 끝나면 키별 Future 를 채운다.
+
+        호출자(첫 요청자 포함)는 ``asyncio.shield`` 로 기다리므로 첫 요청자가
+        취소돼도 조회는 계속되고 합류자는 실제 결과(또는 예외)를 받는다.
+        """
+        futs = {key: self._inflight[key] for key in keys}
+        task = asyncio.ensure_future(fetch())
+
+        def _done(t: asyncio.Future) -> None:
+            exc = None if t.cancelled() else t.exception()
+            results = split(t.result()) if not t.cancelled() and exc is None else {}
+            for key, fut in futs.items():
+                if self._inflight.get(key) is fut:
+                    del self._inflight[key]
+                if fut.done():
+                    continue
+                if t.cancelled():
+                    fut.cancel()
+                elif exc is not None:
+                    fut.set_exception(exc)
+                    fut.exception()  # 합류자가 없어도 "never retrieved" 경고 방지
+                else:
+                    fut.set_result(results.get(key, default))
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _await_others(self, waits: dict) -> dict:
+        out = {}
+        for key, fut in waits.items():
+            self._batch_stats["coalesced"] += 1
+            out[key] = await asyncio.shield(fut)
+        return out
+
+    async def _single_flight(
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]], default: Any,
+    ) -> Any:
+        """같은 *key* 로 진행 중인 요청이 있으면 그 결과를 같이 기다린다."""
+        mine, waits = self._claim([key])
+        if waits:
+            return (await self._await_others(waits))[key]
+        task = self._launch(mine, fetch, lambda r: {key: r}, default)
+        return await asyncio.shield(task)
+
+    def batch_stats(self) -> dict:
+        """v14: 캐시 hit / 병합된 요청 / 배치 호출 수."""
+        return {**self._batch_stats, "cached_quotes": len(self._quotes)}
+
+    # ── 시세 ───────────────────────────────────────────────────────
+
+    def _ws_quote(self, ticker: str) -> float:
+        """WebSocket 최근 체결가 (WS_QUOTE_MAX_AGE 이내만)."""
+        if self.ws is None:
+            return 0.0
+        try:
+            rp = self.ws.get_price(ticker)
+        except Exception:
+            logger.debug("_ws_quote: WebSocket snapshot failed for %s", ticker, exc_info=True)
+            return 0.0
+        if rp is None or rp.price <= 0:
+            return 0.0
+        if time.time() - (rp.updated_at or 0) > WS_QUOTE_MAX_AGE:
+            return 0.0
+        return float(rp.price)
+
     async def get_price(self, ticker: str, market: str = "KOSPI") -> float:
         """Get current price from best source (3-tier fallback).
 
         v5.0: 소스 태깅 + 지연 추적.
+        v14: 공유 시세 캐시(``quote_ttl``) + 동일 종목 동시 요청 병합.
         """
+        q = self._fresh_quote(ticker)
+        if q is not None:
+            self._batch_stats["quote_hits"] += 1
+            self._last_source_used = q.source
+            return q.price
+        price = await self._single_flight(
+            ("price", ticker), lambda: self._fetch_price(ticker, market), 0.0,
+        )
+        q = self._fresh_quote(ticker)
+        if q is not None:
+            self._last_source_used = q.source
+        return price
+
+    async def _fetch_price(self, ticker: str, market: str = "KOSPI") -> float:
+        """소스 체인으로 현재가 조회 후 공유 캐시에 저장."""
+        price = await self._fetch_price_uncached(ticker, market)
+        if price > 0:
+            self.put_quote(ticker, price, self._last_source_used)
+        return price
+
+    async def _fetch_price_uncached(self, ticker: str, market: str = "KOSPI") -> float:
+        """KIS(WebSocket → REST) → Naver(장중) → yfinance → Naver."""
+        # 0. KIS WebSocket 스냅샷 (구독 종목)
+        price = self._ws_quote(ticker)
+        if price > 0:
+            self._last_source_used = "kis_realtime"
+            return price
+
         # 1. KIS
         if self.kis_connected:
             t0 = time.monotonic()
@@ -287,12 +460,205 @@ class DataRouter:
 
         return 0.0
 
+    async def get_prices(
+        self,
+        tickers: Iterable[str],
+        markets: dict[str, str] | None = None,
+    ) -> dict[str, float]:
+        """v14: 여러 종목 현재가를 소스별 다종목 조회로 한 번에.
+
+        순서는 ``get_price`` 와 같다: WebSocket 스냅샷 → KIS REST(종목별)
+        → Naver polling(장중) → ``yf.download`` 다종목 → Naver polling.
+        캐시된 종목은 요청하지 않고, 다른 잡이 이미 요청 중인 종목은 그
+        결과를 기다린다.  가격을 못 구한 종목은 결과에서 빠진다.
+        """
+        tickers = [t for t in dict.fromkeys(tickers) if t]
+        out: dict[str, float] = {}
+        missing: list[str] = []
+        for t in tickers:
+            q = self._fresh_quote(t)
+            if q is not None:
+                self._batch_stats["quote_hits"] += 1
+                out[t] = q.price
+            else:
+                missing.append(t)
+        if not missing:
+            return out
+
+        mine, waits = self._claim([("price", t) for t in missing])
+        if mine:
+            task = self._launch(
+                mine,
+                lambda: self._fetch_prices_batch([k[1] for k in mine], markets or {}),
+                lambda r: {("price", t): p for t, p in r.items()},
+                0.0,
+            )
+            out.update(await asyncio.shield(task))
+        for (_, t), price in (await self._await_others(waits)).items():
+            if price > 0:
+                out[t] = price
+        return out
+
+    async def _fetch_prices_batch(
+        self, tickers: list[str], markets: dict[str, str],
+    ) -> dict[str, float]:
+        self._batch_stats["batch_fetches"] += 1
+        got: dict[str, tuple[float, str]] = {}
+
+        def _remaining() -> list[str]:
+            return [t for t in tickers if t not in got]
+
+        def _take(prices: dict[str, float], source: str, elapsed: float, asked: list[str]) -> None:
+            per = elapsed / max(len(asked), 1)
+            for t in asked:
+                p = float(prices.get(t, 0) or 0)
+                if p > 0:
+                    got[t] = (p, source)
+                self._record_fetch(source, t, p > 0, per)
+
+        # 0. KIS WebSocket 스냅샷
+        if self.ws is not None:
+            for t in _remaining():
+                p = self._ws_quote(t)
+                if p > 0:
+                    got[t] = (p, "kis_realtime")
+
+        # 1. KIS REST (다종목 엔드포인트가 없어 종목별)
+        if self.kis_connected:
+            for t in _remaining():
+                t0 = time.monotonic()
+                p = self.kis.get_realtime_price(t)
+                _take({t: p}, "kis_realtime", (time.monotonic() - t0) * 1000, [t])
+
+        naver = self._get_naver_client()
+        batch_naver = naver is not None and hasattr(naver, "get_current_prices")
+
+        # 2. Naver polling (장중 정확도 우선)
+        if batch_naver and _remaining() and self._is_kr_live_session():
+            asked = _remaining()
+            try:
+                t0 = time.monotonic()
+                prices = await naver.get_current_prices(asked)
+                _take(prices, "naver", (time.monotonic() - t0) * 1000, asked)
+            except Exception:
+                logger.debug("get_prices: Naver polling failed", exc_info=True)
+
+        # 3. yfinance 다종목 다운로드
+        if self.yf and _remaining():
+            asked = _remaining()
+            t0 = time.monotonic()
+            try:
+                if hasattr(self.yf, "get_current_prices"):
+                    prices = await self.yf.get_current_prices(asked, markets)
+                else:
+                    vals = await asyncio.gather(
+                        *[self.yf.get_current_price(t, markets.get(t, "KOSPI")) for t in asked],
+                        return_exceptions=True,
+                    )
+                    prices = {
+                        t: v for t, v in zip(asked, vals) if isinstance(v, (int, float))
+                    }
+                _take(prices, "yfinance", (time.monotonic() - t0) * 1000, asked)
+            except Exception:
+                logger.debug("get_prices: yfinance batch failed", exc_info=True)
+
+        # 4. Naver (비장중 또는 yfinance 실패 시 폴백)
+        if batch_naver and _remaining():
+            asked = _remaining()
+            try:
+                t0 = time.monotonic()
+                prices = await naver.get_current_prices(asked)
+                _take(prices, "naver", (time.monotonic() - t0) * 1000, asked)
+            except Exception:
+                logger.debug("get_prices: Naver polling fallback failed", exc_info=True)
+
+        sources = {src for _, src in got.values()}
+        if sources:
+            # 섞였으면 가장 지연이 큰 소스로 표시 (매수 차단 판단이 보수적으로)
+            self._last_source_used = max(sources, key=lambda s: SOURCE_DELAY_SECONDS.get(s, 0))
+            if "naver" in sources:
+                self._fallback_count += 1
+        for t, (p, src) in got.items():
+            self.put_quote(t, p, src)
+        return {t: p for t, (p, _) in got.items()}
+
+    async def get_ohlcv_many(
+        self,
+        tickers: Iterable[str],
+        market: str = "KOSPI",
+        period: str = "6mo",
+        markets: dict[str, str] | None = None,
+    ) -> dict[str, "pd.DataFrame"]:
+        """v14: 여러 종목 OHLCV — ``yf.download`` 다종목 1회 + Naver 종목별 폴백.
+
+        같은 (종목, 기간) 요청이 진행 중이면 병합한다. 실패 종목은 빠진다.
+        """
+        tickers = [t for t in dict.fromkeys(tickers) if t]
+        mk = {t: (markets or {}).get(t, market) for t in tickers}
+        mine, waits = self._claim([("ohlcv", t, period) for t in tickers])
+        out: dict[str, Any] = {}
+        if mine:
+            task = self._launch(
+                mine,
+                lambda: self._fetch_ohlcv_batch([k[1] for k in mine], mk, period),
+                lambda r: {("ohlcv", t, period): df for t, df in r.items()},
+                None,
+            )
+            out.update(await asyncio.shield(task))
+        for (_, t, _), df in (await self._await_others(waits)).items():
+            if df is not None and not df.empty:
+                out[t] = df
+        return out
+
+    async def _fetch_ohlcv_batch(
+        self, tickers: list[str], markets: dict[str, str], period: str,
+    ) -> dict[str, "pd.DataFrame"]:
+        self._batch_stats["batch_fetches"] += 1
+        out: dict[str, Any] = {}
+
+        # 1. yfinance 다종목
+        if self.yf and hasattr(self.yf, "get_ohlcv_many"):
+            t0 = time.monotonic()
+            try:
+                frames = await self.yf.get_ohlcv_many(tickers, markets, period)
+            except Exception:
+                logger.debug("get_ohlcv_many: yfinance batch failed", exc_info=True)
+                frames = {}
+            per = (time.monotonic() - t0) * 1000 / max(len(tickers), 1)
+            for t in tickers:
+                df = frames.get(t)
+                ok = df is not None and not df.empty
+                self._record_fetch("yfinance", t, ok, per, record_count=len(df) if ok else 1)
+                if ok:
+                    out[t] = self._tag_ohlcv(df, "yfinance", t)
+            if out:
+                self._last_source_used = "yfinance"
+
+        # 2. 나머지는 종목별: 배치에서 빠진 종목은 Naver, 배치 미지원이면 전체 체인
+        rest = [t for t in tickers if t not in out]
+        if rest:
+            sem = asyncio.Semaphore(_NAVER_OHLCV_CONCURRENCY)
+            if self.yf and hasattr(self.yf, "get_ohlcv_many"):
+                single = self._fetch_ohlcv_naver
+            else:
+                single = self._fetch_ohlcv
+
+            async def _one(t: str):
+                async with sem:
+                    return t, await single(t, markets.get(t, "KOSPI"), period)
+
+            for t, df in await asyncio.gather(*[_one(t) for t in rest]):
+                if df is not None and not df.empty:
+                    out[t] = df
+        return out
+
     async def get_ohlcv(
         self, ticker: str, market: str = "KOSPI", period: str = "6mo"
     ) -> "pd.DataFrame":
         """Get OHLCV data with fallback.
 
         v5.0: PIT 소스 태깅 자동 적용.
+        v14: 같은 (종목, 기간) 동시 요청은 한 번만 가져온다.
 
         Returns:
             DataFrame with columns: date, open, high, low, close, volume
@@ -300,6 +666,17 @@ class DataRouter:
         """
         import pandas as pd
 
+        df = await self._single_flight(
+            ("ohlcv", ticker, period),
+            lambda: self._fetch_ohlcv(ticker, market, period),
+            None,
+        )
+        return df if df is not None else pd.DataFrame()
+
+    async def _fetch_ohlcv(
+        self, ticker: str, market: str = "KOSPI", period: str = "6mo"
+    ) -> "pd.DataFrame":
+        """yfinance → Naver 체인."""
         # 1. yfinance
         if self.yf:
             try:
@@ -320,11 +697,18 @@ class DataRouter:
                 self._record_fetch("yfinance", ticker, False, 0)
 
         # 2. Naver Finance
+        return await self._fetch_ohlcv_naver(ticker, market, period)
+
+    async def _fetch_ohlcv_naver(
+        self, ticker: str, market: str = "KOSPI", period: str = "6mo"
+    ) -> "pd.DataFrame":
+        import pandas as pd
+
         naver = self._get_naver_client()
         if naver:
             try:
                 t0 = time.monotonic()
-                period_days = {"1mo": 30, "3mo": 90, "6mo": 180, "1y": 365}.get(period, 120)
+                period_days = _PERIOD_DAYS.get(period, 120)
                 df = await naver.get_ohlcv(ticker, period_days)
                 elapsed = (time.monotonic() - t0) * 1000
                 if not df.empty:
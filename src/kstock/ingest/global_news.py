@@ -12,14 +12,23 @@ v10.4: Whisper 자막 추출 + 심화 YouTube 학습 파이프라인
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import re
+import time
 import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Iterable, Iterator
 from urllib.parse import urlparse
 
+import numpy as np
+
 from kstock.core.tz import KST
 
 logger = logging.getLogger(__name__)
@@ -845,89 +854,160 @@ def _build_urgent_analysis_fallback(groups: list[list[NewsItem]], db=None) -> st
     return "\n".join(lines)
 
 
-def _parse_rss(xml_text: str, feed: dict) -> list[NewsItem]:
-    """RSS XML 파싱 → NewsItem 리스트. RSS 2.0 + Atom(YouTube) 지원."""
-    items = []
+_RSS_MAX_ENTRIES = 10
+_RSS_CHUNK_CHARS = 16384
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_YT_NS = "{http://www.youtube.com/xml/schemas/2015}"
+
+
+def _local_tag(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _entry_text(entry: ET.Element, *tags: str) -> str:
+    for tag in tags:
+        el = entry.find(tag)
+        if el is not None and el.text and el.text.strip():
+            return el.text.strip()
+    return ""
+
+
+def _entry_id(entry: ET.Element, item: NewsItem) -> str:
+    """피드 항목 식별자: guid / Atom id / videoId → 링크 → 제목."""
+    return (
+        _entry_text(entry, "guid", f"{_ATOM_NS}id", "id", f"{_YT_NS}videoId")
+        or item.url
+        or item.title
+    )
+
+
+def _pub_ts(published: str) -> float | None:
+    """RFC 822(RSS) / ISO 8601(Atom) 발행 시각 → epoch. 실패 시 None."""
+    if not published:
+        return None
     try:
-        root = ET.fromstring(xml_text)
-        # RSS 2.0 또는 Atom
-        channel = root.find("channel")
-        if channel is not None:
-            entries = channel.findall("item")
-        else:
-            # Atom feed (YouTube 등)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
-            entries = root.findall("atom:entry", ns)
-            if not entries:
-                entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-            if not entries:
-                entries = root.findall("entry")
-
-        for entry in entries[:10]:
-            title = ""
-            link = ""
-            pub_date = ""
-
-            # Atom namespace 태그 시도 (YouTube Atom 피드용)
-            atom_ns = "{http://www.w3.org/2005/Atom}"
-            t = entry.find(f"{atom_ns}title")
-            if t is None:
-                t = entry.find("title")
-            if t is not None and t.text:
-                title = t.text.strip()
-
-            # Link: Atom은 href 속성, RSS 2.0은 text
-            l = entry.find(f"{atom_ns}link")
-            if l is None:
-                l = entry.find("link")
-            if l is not None:
-                link = (l.get("href", "") or l.text or "").strip()
-
-            # Published date
-            p = entry.find("pubDate")
-            if p is not None and p.text:
-                pub_date = p.text.strip()
-            if not pub_date:
-                for tag in [f"{atom_ns}published", f"{atom_ns}updated",
-                            "published", "updated"]:
-                    p2 = entry.find(tag)
-                    if p2 is not None and p2.text:
-                        pub_date = p2.text.strip()
-                        break
-
-            if not title:
+        return parsedate_to_datetime(published).timestamp()
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        dt = datetime.fromisoformat(published.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    return dt.timestamp()
+
+
+def _entry_to_item(entry: ET.Element, feed: dict) -> NewsItem | None:
+    """RSS ``<item>`` / Atom ``<entry>`` 하나 → NewsItem (제목 없으면 None)."""
+    title = ""
+    link = ""
+    pub_date = ""
+
+    # Atom namespace 태그 시도 (YouTube Atom 피드용)
+    t = entry.find(f"{_ATOM_NS}title")
+    if t is None:
+        t = entry.find("title")
+    if t is not None and t.text:
+        title = t.text.strip()
+
+    # Link: Atom은 href 속성, RSS 2.0은 text
+    l = entry.find(f"{_ATOM_NS}link")
+    if l is None:
+        l = entry.find("link")
+    if l is not None:
+        link = (l.get("href", "") or l.text or "").strip()
+
+    # Published date
+    p = entry.find("pubDate")
+    if p is not None and p.text:
+        pub_date = p.text.strip()
+    if not pub_date:
+        for tag in [f"{_ATOM_NS}published", f"{_ATOM_NS}updated",
+                    "published", "updated"]:
+            p2 = entry.find(tag)
+            if p2 is not None and p2.text:
+                pub_date = p2.text.strip()
+                break
+
+    if not title:
+        return None
+
+    impact, urgent = _compute_impact(title)
+
+    # YouTube 피드: 소스명에 🎬 아이콘 추가 + video_id 추출
+    source_name = feed["name"]
+    is_youtube = "youtube" in feed.get("category", "")
+    vid = ""
+    if is_youtube:
+        source_name = f"🎬{source_name}"
+        # YouTube video ID 추출 (yt:videoId 태그 또는 URL에서)
+        vid_el = entry.find(f"{_YT_NS}videoId")
+        if vid_el is not None and vid_el.text:
+            vid = vid_el.text.strip()
+        elif link:
+            vid_match = re.search(r'[?&]v=([a-zA-Z0-9_-]{11})', link)
+            if vid_match:
+                vid = vid_match.group(1)
+
+    return NewsItem(
+        title=title,
+        source=source_name,
+        url=link,
+        published=pub_date,
+        category=feed.get("category", "market"),
+        lang=feed.get("lang", "ko"),
+        impact_score=impact,
+        is_urgent=urgent,
+        video_id=vid,
+    )
+
+
+def _iter_rss_entries(
+    xml_text: str,
+    feed: dict,
+    known_ids: set[str] | frozenset[str] = frozenset(),
+    stop_before_ts: float | None = None,
+) -> Iterator[tuple[str, NewsItem]]:
+    """피드 항목을 앞에서부터 (id, NewsItem) 으로 낸다.
+
+    v14: 문서를 한 번에 트리로 만들지 않고 청크 단위 pull 파싱한다.
+    ``known_ids`` 에 있는 항목이나 ``stop_before_ts`` 보다 오래된 항목은
+    건너뛴다.  검색/관련도 정렬 피드는 최신순이 아니어서 (상단 고정 기사 등)
+    그 아래 새 항목이 있을 수 있으므로, 나머지 문서를 읽지 않고 멈추는 것은
+    ``feed["sorted"]`` 로 최신순이 보장된 피드에서만 한다 (YouTube 채널
+    Atom 피드는 업로드 최신순이라 기본 True).
+    """
+    stop_early = bool(feed.get("sorted", str(feed.get("category", "")).startswith("youtube")))
+    parser = ET.XMLPullParser(events=("end",))
+    seen = 0
+    for pos in range(0, max(len(xml_text), 1), _RSS_CHUNK_CHARS):
+        parser.feed(xml_text[pos:pos + _RSS_CHUNK_CHARS])
+        for _, el in parser.read_events():
+            if _local_tag(el.tag) not in ("item", "entry"):
                 continue
+            seen += 1
+            item = _entry_to_item(el, feed)
+            if item is not None:
+                entry_id = _entry_id(el, item)
+                ts = _pub_ts(item.published) if stop_before_ts is not None else None
+                if entry_id in known_ids or (ts is not None and ts < stop_before_ts):
+                    if stop_early:
+                        return
+                else:
+                    yield entry_id, item
+            el.clear()
+            if seen >= _RSS_MAX_ENTRIES:
+                return
+    parser.close()
 
-            impact, urgent = _compute_impact(title)
-
-            # YouTube 피드: 소스명에 🎬 아이콘 추가 + video_id 추출
-            source_name = feed["name"]
-            is_youtube = "youtube" in feed.get("category", "")
-            vid = ""
-            if is_youtube:
-                source_name = f"🎬{source_name}"
-                # YouTube video ID 추출 (yt:videoId 태그 또는 URL에서)
-                yt_ns = "{http://www.youtube.com/xml/schemas/2015}"
-                vid_el = entry.find(f"{yt_ns}videoId")
-                if vid_el is not None and vid_el.text:
-                    vid = vid_el.text.strip()
-                elif link:
-                    vid_match = re.search(r'[?&]v=([a-zA-Z0-9_-]{11})', link)
-                    if vid_match:
-                        vid = vid_match.group(1)
-
-            items.append(NewsItem(
-                title=title,
-                source=source_name,
-                url=link,
-                published=pub_date,
-                category=feed.get("category", "market"),
-                lang=feed.get("lang", "ko"),
-                impact_score=impact,
-                is_urgent=urgent,
-                video_id=vid,
-            ))
 
+def _parse_rss(xml_text: str, feed: dict) -> list[NewsItem]:
+    """RSS XML 파싱 → NewsItem 리스트. RSS 2.0 + Atom(YouTube) 지원."""
+    items: list[NewsItem] = []
+    try:
+        for _, item in _iter_rss_entries(xml_text, feed):
+            items.append(item)
     except ET.ParseError as e:
         logger.debug("RSS parse error for %s: %s", feed["name"], e)
     except Exception as e:
@@ -936,6 +1016,139 @@ def _parse_rss(xml_text: str, feed: dict) -> list[NewsItem]:
     return items
 
 
+# v14: 피드별 조건부 GET 상태 (ETag/Last-Modified + 마지막 항목 + 워터마크).
+# 304면 본문 없이 직전 항목을 그대로 쓰고, 200이어도 이미 본 항목에서
+# 파싱을 멈춘 뒤 새 항목만 앞에 붙인다.  재시작 후에도 이어지도록 JSON 저장.
+FEED_STATE_PATH = Path("data/rss_feed_state.json")
+_FEED_STATE: dict[str, dict] = {}
+_FEED_STATE_META: dict[str, object] = {"loaded": False, "dirty": False}
+_FEED_FETCH_STATS: dict[str, int] = {
+    "requests": 0,
+    "not_modified": 0,
+    "bytes_downloaded": 0,
+    "bytes_saved": 0,
+    "items_parsed": 0,
+    "items_reused": 0,
+}
+
+
+def _load_feed_state(path: Path | None = None) -> None:
+    if _FEED_STATE_META["loaded"]:
+        return
+    _FEED_STATE_META["loaded"] = True
+    path = path or FEED_STATE_PATH
+    try:
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                _FEED_STATE.update(data)
+    except Exception:
+        logger.debug("RSS feed state load failed: %s", path, exc_info=True)
+
+
+def _save_feed_state(path: Path | None = None) -> None:
+    if not _FEED_STATE_META["dirty"]:
+        return
+    path = path or FEED_STATE_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(_FEED_STATE, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+        _FEED_STATE_META["dirty"] = False
+    except Exception:
+        logger.debug("RSS feed state save failed: %s", path, exc_info=True)
+
+
+def _conditional_headers(state: dict | None) -> dict[str, str]:
+    """직전 응답 검증자 → If-None-Match / If-Modified-Since (캐시 항목 있을 때만)."""
+    headers = {"User-Agent": "K-Quant/6.0 NewsBot"}
+    if not state or not state.get("items"):
+        return headers
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def _cached_feed_items(state: dict) -> list[NewsItem]:
+    # 호출 측이 제목 번역 등으로 항목을 고치므로 매번 새 객체를 만든다
+    fields = NewsItem.__dataclass_fields__
+    return [
+        NewsItem(**{k: v for k, v in row.items() if k in fields})
+        for row in state.get("items", [])
+    ]
+
+
+def _response_size(resp) -> int:
+    content = getattr(resp, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return len((getattr(resp, "text", "") or "").encode("utf-8"))
+
+
+def _update_feed_state(feed: dict, resp) -> list[NewsItem]:
+    """200 응답 반영: 새 항목만 파싱해 직전 항목 앞에 붙이고 상태 갱신."""
+    key = _feed_backoff_key(feed)
+    prev = _FEED_STATE.get(key) or {}
+    prev_rows = prev.get("items") or []
+    known = {row.get("id") for row in prev_rows if row.get("id")}
+    watermark = prev.get("watermark") or {}
+
+    fresh: list[tuple[str, NewsItem]] = []
+    try:
+        fresh = list(_iter_rss_entries(
+            resp.text, feed, known_ids=known,
+            stop_before_ts=watermark.get("ts") if known else None,
+        ))
+    except ET.ParseError as e:
+        logger.debug("RSS parse error for %s: %s", feed["name"], e)
+        return []
+    except Exception as e:
+        logger.debug("RSS processing error for %s: %s", feed["name"], e)
+        return []
+
+    fresh_ids = {entry_id for entry_id, _ in fresh}
+    rows = [{"id": entry_id, **asdict(item)} for entry_id, item in fresh]
+    reused = [row for row in prev_rows if row.get("id") not in fresh_ids]
+    rows = (rows + reused)[:_RSS_MAX_ENTRIES]
+    _FEED_FETCH_STATS["items_parsed"] += len(fresh)
+    _FEED_FETCH_STATS["items_reused"] += len(rows) - min(len(fresh), len(rows))
+
+    headers = getattr(resp, "headers", None) or {}
+    state = {
+        "etag": headers.get("etag", ""),
+        "last_modified": headers.get("last-modified", ""),
+        "bytes": _response_size(resp),
+        "items": rows,
+        "watermark": watermark,
+    }
+    if rows:
+        # 최신순이 아닌 피드도 있으므로 시각 기준은 가장 최근 항목
+        stamps = [ts for ts in (_pub_ts(row["published"]) for row in rows) if ts is not None]
+        state["watermark"] = {"id": rows[0]["id"], "ts": max(stamps) if stamps else None}
+    if state != prev:
+        _FEED_STATE[key] = state
+        _FEED_STATE_META["dirty"] = True
+    return _cached_feed_items(state)
+
+
+def get_feed_fetch_stats() -> dict[str, int]:
+    """RSS 조건부 GET 통계 (요청/304/다운로드·절약 바이트/파싱·재사용 항목)."""
+    return {**_FEED_FETCH_STATS, "feeds_cached": len(_FEED_STATE)}
+
+
+def reset_feed_cache(clear_state: bool = False) -> None:
+    """통계 초기화 (clear_state=True면 피드 상태도 비운다)."""
+    for k in _FEED_FETCH_STATS:
+        _FEED_FETCH_STATS[k] = 0
+    if clear_state:
+        _FEED_STATE.clear()
+        _FEED_STATE_META["loaded"] = True
+        _FEED_STATE_META["dirty"] = False
+
+
 async def fetch_global_news(
     max_per_feed: int = 5,
     feeds: list[dict] | None = None,
@@ -950,14 +1163,15 @@ async def fetch_global_news(
     Returns:
         NewsItem 리스트 (impact_score 내림차순 정렬)
     """
-    import httpx
+    from kstock.ingest.http_pool import get_http_pool
 
     target_feeds = feeds or RSS_FEEDS
     if include_youtube and not feeds:
         target_feeds = target_feeds + YOUTUBE_FEEDS
     all_items: list[NewsItem] = []
+    _load_feed_state()
 
-    async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+    async with get_http_pool().session(timeout=10) as client:
         async def _fetch_one(feed: dict) -> list[NewsItem]:
             if _feed_is_disabled(feed):
                 logger.debug("RSS disabled skip %s (%s)", feed["name"], feed["url"])
@@ -965,14 +1179,23 @@ async def fetch_global_news(
             if _feed_is_in_backoff(feed):
                 logger.debug("RSS backoff skip %s (%s)", feed["name"], feed["url"])
                 return []
+            state = _FEED_STATE.get(_feed_backoff_key(feed))
             try:
                 resp = await client.get(
                     feed["url"],
-                    headers={"User-Agent": "K-Quant/6.0 NewsBot"},
+                    headers=_conditional_headers(state),
                 )
+                _FEED_FETCH_STATS["requests"] += 1
+                if resp.status_code == 304 and state and state.get("items"):
+                    _mark_feed_success(feed)
+                    _FEED_FETCH_STATS["not_modified"] += 1
+                    _FEED_FETCH_STATS["bytes_saved"] += int(state.get("bytes", 0))
+                    _FEED_FETCH_STATS["items_reused"] += len(state["items"])
+                    return _cached_feed_items(state)[:max_per_feed]
                 if resp.status_code == 200:
                     _mark_feed_success(feed)
-                    return _parse_rss(resp.text, feed)[:max_per_feed]
+                    _FEED_FETCH_STATS["bytes_downloaded"] += _response_size(resp)
+                    return _update_feed_state(feed, resp)[:max_per_feed]
                 _mark_feed_failure(feed, status_code=resp.status_code)
             except Exception as e:
                 _mark_feed_failure(feed, status_code=None)
@@ -986,6 +1209,8 @@ async def fetch_global_news(
         for result in results:
             if isinstance(result, list):
                 all_items.extend(result)
+    _save_feed_state()
+    logger.debug("RSS fetch stats: %s", get_feed_fetch_stats())
 
     # v12.1: hours_lookback 시간 필터링
     if hours_lookback > 0:
@@ -1260,63 +1485,157 @@ def _same_topic_cluster(t1: str, t2: str) -> bool:
     return False
 
 
-def group_similar_news(items: list[NewsItem], threshold: float = 0.4) -> list[list[NewsItem]]:
-    """유사한 뉴스를 그룹으로 묶기.
+# v14: MinHash/LSH — 후보 쌍만 골라 정확한 Jaccard로 확인한다 (전체 쌍 비교 제거).
+# 서명은 고정 시드라 재시작해도 같은 제목 → 같은 서명.
+_MH_NUM_PERM = 128
+_MH_PRIME = 4294967291  # 2^32 미만 최대 소수: a*x+b 가 uint64 안에서 넘치지 않음
+_MH_RNG = np.random.default_rng(0x4E455753)
+_MH_A = _MH_RNG.integers(1, _MH_PRIME, size=_MH_NUM_PERM, dtype=np.uint64)
+_MH_B = _MH_RNG.integers(0, _MH_PRIME, size=_MH_NUM_PERM, dtype=np.uint64)
+_MH_EMPTY = np.full(_MH_NUM_PERM, _MH_PRIME, dtype=np.uint64)
+
+NEWS_INDEX_WINDOW_HOURS = 48
+NEWS_DUP_THRESHOLD = 0.5
+
+
+def _title_tokens(title: str) -> frozenset[str]:
+    """``_title_similarity`` 과 같은 단어 집합."""
+    return frozenset(_normalize_title(title).split())
 
-    같은 이벤트에 대한 여러 헤드라인을 하나로 통합.
-    v12.2: Jaccard 유사도 + 주제 클러스터 기반 이중 그룹핑.
-    """
-    if not items:
-        return []
 
-    groups: list[list[NewsItem]] = []
-    used = set()
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _minhash(tokens: Iterable[str]) -> np.ndarray:
+    """단어 집합의 MinHash 서명 (uint64[_MH_NUM_PERM])."""
+    hv = np.fromiter(
+        (zlib.crc32(t.encode("utf-8")) for t in tokens), dtype=np.uint64,
+    )
+    if hv.size == 0:
+        return _MH_EMPTY
+    return ((np.outer(hv, _MH_A) + _MH_B) % _MH_PRIME).min(axis=0)
+
+
+def _lsh_rows(threshold: float, num_perm: int = _MH_NUM_PERM, recall: float = 0.99) -> int:
+    """Jaccard ``threshold`` 쌍을 ``recall`` 이상 후보로 잡는 최대 밴드 행 수."""
+    for rows in (8, 4, 2):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            return rows
+    return 1
+
+
+class _LSHBuckets:
+    """밴드별 해시 버킷 (서명 → 후보 id)."""
+
+    def __init__(self, rows: int) -> None:
+        self.rows = rows
+        self.bands = _MH_NUM_PERM // rows
+        self._buckets: list[dict[bytes, set]] = [{} for _ in range(self.bands)]
+
+    def _keys(self, sig: np.ndarray) -> list[bytes]:
+        r = self.rows
+        return [sig[b * r:(b + 1) * r].tobytes() for b in range(self.bands)]
+
+    def add(self, key, sig: np.ndarray) -> list[bytes]:
+        band_keys = self._keys(sig)
+        for bucket, bk in zip(self._buckets, band_keys):
+            bucket.setdefault(bk, set()).add(key)
+        return band_keys
+
+    def remove(self, key, band_keys: list[bytes]) -> None:
+        for bucket, bk in zip(self._buckets, band_keys):
+            members = bucket.get(bk)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del bucket[bk]
+
+    def candidates(self, sig: np.ndarray) -> set:
+        out: set = set()
+        for bucket, bk in zip(self._buckets, self._keys(sig)):
+            members = bucket.get(bk)
+            if members:
+                out |= members
+        return out
+
+
+def _topic_cluster_ids(title: str) -> frozenset[int]:
+    """제목이 걸리는 ``_TOPIC_CLUSTERS`` 번호들 (둘이 겹치면 같은 주제)."""
+    lowered = title.lower()
+    return frozenset(
+        i for i, cluster in enumerate(_TOPIC_CLUSTERS)
+        if any(kw.lower() in lowered for kw in cluster)
+    )
+
+
+def _cluster_titles(titles: list[str], threshold: float) -> list[list[int]]:
+    """제목 목록을 탐욕적으로 묶는다 (기준 제목과 유사/같은 주제인 것).
 
-    for i, item in enumerate(items):
+    이전의 전체 쌍 비교와 같은 규칙이지만, 후보는 LSH 버킷과 주제 클러스터
+    버킷에서만 뽑는다.
+    """
+    tokens = [_title_tokens(t) for t in titles]
+    clusters = [_topic_cluster_ids(t) for t in titles]
+    sigs = [_minhash(tok) for tok in tokens]
+    lsh = _LSHBuckets(_lsh_rows(threshold))
+    by_topic: dict[int, list[int]] = {}
+    for i, (tok, sig) in enumerate(zip(tokens, sigs)):
+        if tok:
+            lsh.add(i, sig)
+        for c in clusters[i]:
+            by_topic.setdefault(c, []).append(i)
+
+    groups: list[list[int]] = []
+    used: set[int] = set()
+    for i in range(len(titles)):
         if i in used:
             continue
-        group = [item]
         used.add(i)
-        for j, other in enumerate(items):
+        group = [i]
+        same_topic = {j for c in clusters[i] for j in by_topic[c]}
+        cands = same_topic | (lsh.candidates(sigs[i]) if tokens[i] else set())
+        for j in sorted(cands):
             if j in used:
                 continue
-            # Jaccard 유사도 OR 같은 주제 클러스터면 그룹핑
-            if (_title_similarity(item.title, other.title) >= threshold
-                    or _same_topic_cluster(item.title, other.title)):
-                group.append(other)
+            if j in same_topic or _jaccard(tokens[i], tokens[j]) >= threshold:
+                group.append(j)
                 used.add(j)
         groups.append(group)
-
     return groups
 
 
+def group_similar_news(items: list[NewsItem], threshold: float = 0.4) -> list[list[NewsItem]]:
+    """유사한 뉴스를 그룹으로 묶기.
+
+    같은 이벤트에 대한 여러 헤드라인을 하나로 통합.
+    v12.2: Jaccard 유사도 + 주제 클러스터 기반 이중 그룹핑.
+    v14: 후보는 MinHash/LSH + 주제 클러스터 버킷에서만 (O(n²) 비교 제거).
+    """
+    if not items:
+        return []
+    return [
+        [items[i] for i in idx]
+        for idx in _cluster_titles([item.title for item in items], threshold)
+    ]
+
+
 def merge_related_topic_groups(groups: list[list[NewsItem]]) -> list[list[NewsItem]]:
     """대표 제목 기준으로 같은 사건군 그룹을 한 번 더 합친다.
 
     1차 그룹핑 후에도 제목 표현이 달라 여러 묶음으로 남는 경우가 있어,
     같은 토픽 클러스터/유사 대표 제목이면 한 그룹으로 병합한다.
     """
+    groups = [g for g in groups if g]
     if not groups:
         return []
 
     merged: list[list[NewsItem]] = []
-    used: set[int] = set()
-
-    for i, group in enumerate(groups):
-        if i in used:
-            continue
-        combined = list(group)
-        used.add(i)
-        rep_title = group[0].title if group else ""
-
-        for j, other in enumerate(groups):
-            if j in used or not other:
-                continue
-            other_title = other[0].title
-            if _same_topic_cluster(rep_title, other_title) or _title_similarity(rep_title, other_title) >= 0.22:
-                combined.extend(other)
-                used.add(j)
-
+    for idx in _cluster_titles([g[0].title for g in groups], 0.22):
+        combined = [item for i in idx for item in groups[i]]
         deduped: list[NewsItem] = []
         seen = set()
         for item in sorted(combined, key=lambda x: (x.impact_score, x.title), reverse=True):
@@ -1330,6 +1649,113 @@ def merge_related_topic_groups(groups: list[list[NewsItem]]) -> list[list[NewsIt
     return merged
 
 
+@dataclass
+class _IndexedNews:
+    title: str
+    tokens: frozenset[str]
+    ts: float
+    band_keys: list[bytes]
+    alerted_at: float = 0.0
+
+
+class NewsLSHIndex:
+    """최근 ``window_hours`` 헤드라인의 MinHash/LSH 슬라이딩 윈도 인덱스.
+
+    수집 주기를 넘어 유지되며, 새 제목과 거의 같은 (단어 Jaccard ≥
+    ``threshold``) 과거 항목을 버킷 조회만으로 찾는다.  이미 알림을 보낸
+    사건은 ``is_alerted`` 로 DB 재조회 없이 걸러낸다.
+    """
+
+    def __init__(
+        self,
+        window_hours: float = NEWS_INDEX_WINDOW_HOURS,
+        threshold: float = NEWS_DUP_THRESHOLD,
+    ) -> None:
+        self.window_s = window_hours * 3600
+        self.threshold = threshold
+        self._lsh = _LSHBuckets(_lsh_rows(threshold))
+        self._entries: dict[int, _IndexedNews] = {}
+        self._by_key: dict[frozenset[str], int] = {}
+        self._order: deque[tuple[float, int]] = deque()
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        cutoff = now - self.window_s
+        while self._order and self._order[0][0] < cutoff:
+            ts, eid = self._order.popleft()
+            entry = self._entries.get(eid)
+            if entry is None or entry.ts != ts:
+                continue            # 다시 본 항목 (뒤쪽에 새 기록이 있음)
+            del self._entries[eid]
+            self._by_key.pop(entry.tokens, None)
+            self._lsh.remove(eid, entry.band_keys)
+
+    def query(self, title: str, now: float | None = None) -> list[_IndexedNews]:
+        """윈도 안에서 *title* 과 거의 같은 항목 (유사도 높은 순)."""
+        now = time.time() if now is None else now
+        self._evict(now)
+        tokens = _title_tokens(title)
+        if not tokens:
+            return []
+        scored = []
+        for eid in self._lsh.candidates(_minhash(tokens)):
+            entry = self._entries[eid]
+            sim = _jaccard(tokens, entry.tokens)
+            if sim >= self.threshold:
+                scored.append((sim, entry))
+        scored.sort(key=lambda x: -x[0])
+        return [e for _, e in scored]
+
+    def add(self, title: str, now: float | None = None, alerted: bool = False) -> None:
+        """항목 추가 (같은 단어 집합이면 시각만 갱신)."""
+        now = time.time() if now is None else now
+        self._evict(now)
+        tokens = _title_tokens(title)
+        if not tokens:
+            return
+        eid = self._by_key.get(tokens)
+        if eid is not None:
+            entry = self._entries[eid]
+            entry.ts = now
+        else:
+            eid = self._next_id
+            self._next_id += 1
+            entry = _IndexedNews(title, tokens, now, self._lsh.add(eid, _minhash(tokens)))
+            self._entries[eid] = entry
+            self._by_key[tokens] = eid
+        if alerted:
+            entry.alerted_at = now
+        self._order.append((now, eid))
+
+    def add_many(self, items: Iterable[NewsItem], now: float | None = None) -> None:
+        for item in items:
+            self.add(item.title, now=now)
+
+    def mark_alerted(self, items: Iterable[NewsItem], now: float | None = None) -> None:
+        for item in items:
+            self.add(item.title, now=now, alerted=True)
+
+    def is_alerted(self, title: str, hours: float | None = None, now: float | None = None) -> bool:
+        """*title* 과 같은 사건을 최근 ``hours`` (기본 윈도) 안에 알렸는지."""
+        now = time.time() if now is None else now
+        since = now - (self.window_s if hours is None else hours * 3600)
+        return any(e.alerted_at and e.alerted_at >= since for e in self.query(title, now))
+
+
+_news_index: NewsLSHIndex | None = None
+
+
+def get_news_index() -> NewsLSHIndex:
+    """프로세스 공용 48시간 뉴스 인덱스."""
+    global _news_index
+    if _news_index is None:
+        _news_index = NewsLSHIndex()
+    return _news_index
+
+
 async def analyze_urgent_news(groups: list[list[NewsItem]], db=None) -> str:
     """AI로 긴급 뉴스 그룹을 분석하여 한국 시장 영향 해석.
 
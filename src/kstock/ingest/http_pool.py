@@ -0,0 +1,303 @@
+"""Shared async HTTP session pool for ingest clients (KIS/Naver/DART/RSS).
+
+요청마다 ``httpx.AsyncClient``를 새로 열면 매번 TCP+TLS 핸드셰이크를
+다시 한다.  여기서는 호스트별로 keep-alive 커넥션 풀을 가진 클라이언트를
+하나씩 유지하고, 호스트별 토큰 버킷(``ops.rate_limit.AsyncRateLimiter``)으로
+API 유량 제한을 지키며, 엔드포인트별 지연 히스토그램을 모은다.
+
+- 클라이언트/리미터는 이벤트 루프별로 만든다 (httpx/asyncio 객체는 루프에
+  묶이므로 테스트처럼 ``asyncio.run``을 여러 번 돌려도 안전).
+- ``h2`` 패키지가 있으면 HTTP/2를 켠다 (없으면 HTTP/1.1 keep-alive).
+
+Usage::
+
+    pool = get_http_pool()
+    resp = await pool.get(url, params=params, endpoint="kis.inquire-price")
+
+    async with pool.session(timeout=10) as client:   # 기존 AsyncClient 자리
+        resp = await client.get(url, headers=headers)
+
+    pool.stats()   # {"kis.inquire-price": {"count": .., "p50_ms": .., ...}}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from kstock.ops.rate_limit import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """호스트별 커넥션 풀/유량 제한 설정."""
+
+    rate: int = 20                 # period_s 동안 허용 요청 수
+    period_s: float = 1.0
+    max_connections: int = 20
+    max_keepalive: int = 10
+    timeout_s: float = 15.0
+    http2: bool = True
+
+
+# 키는 호스트명 (하위 도메인도 매칭: "finance.naver.com" → api.finance.naver.com)
+DEFAULT_HOST_POLICIES: dict[str, HostPolicy] = {
+    # KIS 유량 제한: 실전 20건/초, 모의 2건/초 (경계에서 EGW00201 방지용 여유 1건)
+    "openapi.koreainvestment.com": HostPolicy(rate=19, max_connections=10),
+    "openapivts.koreainvestment.com": HostPolicy(rate=2, max_connections=4),
+    "finance.naver.com": HostPolicy(rate=10, max_connections=10, timeout_s=10.0),
+    "opendart.fss.or.kr": HostPolicy(rate=10, max_connections=4),
+}
+_DEFAULT_POLICY = HostPolicy()
+
+# 지연 히스토그램 버킷 상한 (ms). 마지막 칸은 그 이상 전부.
+_BUCKETS_MS: tuple[float, ...] = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램 (엔드포인트 하나)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(_BUCKETS_MS) + 1))
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, ms: float, ok: bool = True) -> None:
+        i = 0
+        while i < len(_BUCKETS_MS) and ms > _BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if not ok:
+            self.errors += 1
+
+    def percentile(self, q: float) -> float:
+        """q(0~1) 분위수가 속한 버킷의 상한 (ms). 최상위 칸은 max_ms."""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target and c:
+                return _BUCKETS_MS[i] if i < len(_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip([*map(str, _BUCKETS_MS), "inf"], self.counts)),
+        }
+
+
+@dataclass
+class _LoopState:
+    clients: dict[str, Any] = field(default_factory=dict)
+    limiters: dict[str, AsyncRateLimiter] = field(default_factory=dict)
+
+
+class HttpPool:
+    """호스트별 keep-alive 클라이언트 + 토큰 버킷 + 지연 통계."""
+
+    def __init__(self, policies: dict[str, HostPolicy] | None = None) -> None:
+        self._policies = dict(DEFAULT_HOST_POLICIES)
+        if policies:
+            self._policies.update(policies)
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._throttle_s: dict[str, float] = {}
+
+    # -- 설정 ---------------------------------------------------------------
+
+    def policy_for(self, host: str) -> HostPolicy:
+        host = host.lower()
+        if host in self._policies:
+            return self._policies[host]
+        for key, policy in self._policies.items():
+            if host.endswith("." + key):
+                return policy
+        return _DEFAULT_POLICY
+
+    def set_policy(self, host: str, policy: HostPolicy) -> None:
+        """정책 변경. 이미 만든 리미터/클라이언트는 다음 루프부터 반영."""
+        self._policies[host.lower()] = policy
+
+    # -- 루프별 자원 ----------------------------------------------------------
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = _LoopState()
+            self._loops[loop] = state
+        return state
+
+    def client(self, host: str) -> Any:
+        """*host* 전용 keep-alive 클라이언트 (현재 루프)."""
+        state = self._state()
+        client = state.clients.get(host)
+        if client is not None:
+            return client
+        policy = self.policy_for(host)
+        client = httpx.AsyncClient(
+            http2=policy.http2 and _HAS_H2,
+            limits=httpx.Limits(
+                max_connections=policy.max_connections,
+                max_keepalive_connections=policy.max_keepalive,
+                keepalive_expiry=30.0,
+            ),
+            timeout=policy.timeout_s,
+            follow_redirects=True,
+        )
+        state.clients[host] = client
+        return client
+
+    def limiter(self, host: str) -> AsyncRateLimiter:
+        state = self._state()
+        lim = state.limiters.get(host)
+        if lim is None:
+            policy = self.policy_for(host)
+            lim = AsyncRateLimiter(max_calls=policy.rate, period_seconds=policy.period_s)
+            state.limiters[host] = lim
+        return lim
+
+    # -- 요청 -----------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        endpoint: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """유량 제한을 지켜 요청하고 지연을 기록한다. 예외는 그대로 올린다.
+
+        Args:
+            method: ``"GET"`` / ``"POST"`` ...
+            url: 전체 URL.
+            endpoint: 통계 키 (기본 ``host/path``).
+            **kwargs: ``params``, ``headers``, ``json``, ``timeout`` 등 httpx 인자.
+        """
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        key = endpoint or f"{host}{parts.path}"
+
+        t0 = time.perf_counter()
+        await self.limiter(host).acquire()
+        waited = time.perf_counter() - t0
+        if waited > 0.001:
+            self._throttle_s[host] = self._throttle_s.get(host, 0.0) + waited
+
+        send = getattr(self.client(host), method.lower())
+        hist = self._histograms.setdefault(key, LatencyHistogram())
+        t1 = time.perf_counter()
+        try:
+            resp = await send(url, **kwargs)
+        except Exception:
+            hist.observe((time.perf_counter() - t1) * 1000, ok=False)
+            raise
+        status = getattr(resp, "status_code", 200)
+        hist.observe((time.perf_counter() - t1) * 1000, ok=status < 400)
+        return resp
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("POST", url, **kwargs)
+
+    def session(self, timeout: float | None = None) -> PooledSession:
+        """``async with httpx.AsyncClient(...) as client`` 자리에 쓰는 세션.
+
+        종료 시 커넥션을 닫지 않고 풀에 돌려준다.
+        """
+        return PooledSession(self, timeout)
+
+    # -- 통계/정리 -------------------------------------------------------------
+
+    def stats(self) -> dict[str, dict]:
+        """엔드포인트별 지연 통계 + 호스트별 유량 제한 대기 시간."""
+        out = {key: h.to_dict() for key, h in sorted(self._histograms.items())}
+        if self._throttle_s:
+            out["_throttled_s"] = {h: round(s, 3) for h, s in self._throttle_s.items()}
+        return out
+
+    def reset_stats(self) -> None:
+        self._histograms.clear()
+        self._throttle_s.clear()
+
+    async def aclose(self) -> None:
+        """현재 루프의 클라이언트를 모두 닫는다."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is None:
+            return
+        for client in state.clients.values():
+            close = getattr(client, "aclose", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception:
+                logger.debug("http pool client close failed", exc_info=True)
+
+
+class PooledSession:
+    """``HttpPool`` 위의 얇은 client 호환 래퍼 (get/post + async with)."""
+
+    def __init__(self, pool: HttpPool, timeout: float | None = None) -> None:
+        self._pool = pool
+        self._timeout = timeout
+
+    async def __aenter__(self) -> PooledSession:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        return await self._pool.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        return await self.request("POST", url, **kwargs)
+
+
+_pool: HttpPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpPool:
+    """프로세스 공용 ``HttpPool``."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HttpPool()
+    return _pool
@@ -25,6 +25,7 @@ import pandas as pd
 from dotenv import load_dotenv
 
 from kstock.core.tz import KST
+from kstock.ingest.http_pool import get_http_pool
 
 load_dotenv(override=True)
 logger = logging.getLogger(__name__)
@@ -84,7 +85,7 @@ class KISClient:
             return True
 
         try:
-            token_data = await asyncio.to_thread(self._fetch_token_sync)
+            token_data = await self._fetch_token()
             self._access_token = token_data["access_token"]
             expires_in = int(token_data.get("expires_in", 86400))
             self._token_expires = datetime.now(KST) + timedelta(seconds=expires_in - 60)
@@ -94,29 +95,28 @@ class KISClient:
             logger.error("KIS token fetch failed: %s", e)
             return False
 
-    def _fetch_token_sync(self) -> dict:
-        """Synchronous token fetch - runs in thread pool."""
+    async def _fetch_token(self) -> dict:
+        """Fetch an OAuth token over the shared keep-alive pool."""
         url = f"{self.base_url}/oauth2/tokenP"
         body = {
             "grant_type": "client_credentials",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
-        with httpx.Client(timeout=10) as client:
-            resp = client.post(url, json=body)
-            if resp.status_code != 200:
-                try:
-                    err_data = resp.json()
-                    err_code = err_data.get("error_code", "")
-                    err_desc = err_data.get("error_description", "")
-                    logger.error(
-                        "KIS token error: HTTP %d, code=%s, desc=%s",
-                        resp.status_code, err_code, err_desc,
-                    )
-                except Exception:
-                    logger.debug("_fetch_token_sync: failed to parse error response", exc_info=True)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await get_http_pool().post(url, json=body, timeout=10, endpoint="kis.token")
+        if resp.status_code != 200:
+            try:
+                err_data = resp.json()
+                err_code = err_data.get("error_code", "")
+                err_desc = err_data.get("error_description", "")
+                logger.error(
+                    "KIS token error: HTTP %d, code=%s, desc=%s",
+                    resp.status_code, err_code, err_desc,
+                )
+            except Exception:
+                logger.debug("_fetch_token: failed to parse error response", exc_info=True)
+        resp.raise_for_status()
+        return resp.json()
 
     def _auth_headers(self, tr_id: str) -> dict:
         """Build authentication headers for API calls."""
@@ -129,35 +129,39 @@ class KISClient:
         }
 
     # ------------------------------------------------------------------
-    # Real API calls (sync, run in thread pool)
+    # Real API calls (shared keep-alive pool + KIS rate limit)
     # ------------------------------------------------------------------
 
-    def _api_get_sync(self, path: str, tr_id: str, params: dict) -> dict:
-        """Generic synchronous GET request to KIS API (v9.6.3: 재시도)."""
-        import time as _time
+    async def _api_get(self, path: str, tr_id: str, params: dict) -> dict:
+        """Generic GET request to KIS API (v9.6.3: 재시도).
+
+        호스트별 keep-alive 풀과 KIS 유량 제한(토큰 버킷)은 ``http_pool``이 담당.
+        """
         url = f"{self.base_url}{path}"
         headers = self._auth_headers(tr_id)
         max_retries = 2
         for attempt in range(max_retries):
             try:
-                with httpx.Client(timeout=15) as client:
-                    resp = client.get(url, headers=headers, params=params)
-                    if resp.status_code >= 500 or resp.status_code == 429:
-                        if attempt < max_retries - 1:
-                            _time.sleep(1.5 * (attempt + 1))
-                            continue
-                    resp.raise_for_status()
-                    return resp.json()
+                resp = await get_http_pool().get(
+                    url, headers=headers, params=params, timeout=15,
+                    endpoint=f"kis.{path.rsplit('/', 1)[-1]}",
+                )
+                if resp.status_code >= 500 or resp.status_code == 429:
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(1.5 * (attempt + 1))
+                        continue
+                resp.raise_for_status()
+                return resp.json()
             except (httpx.TimeoutException, httpx.ConnectError):
                 if attempt < max_retries - 1:
-                    _time.sleep(1.5 * (attempt + 1))
+                    await asyncio.sleep(1.5 * (attempt + 1))
                     continue
                 raise
         return {}
 
-    def _fetch_current_price_sync(self, ticker: str) -> dict:
+    async def _fetch_current_price(self, ticker: str) -> dict:
         """Fetch current stock price from KIS API."""
-        return self._api_get_sync(
+        return await self._api_get(
             "/uapi/domestic-stock/v1/quotations/inquire-price",
             "FHKST01010100",
             {
@@ -166,10 +170,10 @@ class KISClient:
             },
         )
 
-    def _fetch_daily_price_sync(self, ticker: str, period: str = "D",
-                                 adj_prc: str = "1") -> dict:
+    async def _fetch_daily_price(self, ticker: str, period: str = "D",
+                                  adj_prc: str = "1") -> dict:
         """Fetch daily OHLCV from KIS API."""
-        return self._api_get_sync(
+        return await self._api_get(
             "/uapi/domestic-stock/v1/quotations/inquire-daily-price",
             "FHKST01010400",
             {
@@ -180,9 +184,9 @@ class KISClient:
             },
         )
 
-    def _fetch_investor_sync(self, ticker: str) -> dict:
+    async def _fetch_investor(self, ticker: str) -> dict:
         """Fetch investor trading data (외인/기관 매매동향)."""
-        return self._api_get_sync(
+        return await self._api_get(
             "/uapi/domestic-stock/v1/quotations/inquire-investor",
             "FHKST01010900",
             {
@@ -191,14 +195,14 @@ class KISClient:
             },
         )
 
-    def _fetch_balance_sync(self) -> dict:
+    async def _fetch_balance(self) -> dict:
         """Fetch account balance from KIS API."""
         acct_parts = self.account_no.split("-")
         cano = acct_parts[0] if len(acct_parts) >= 1 else ""
         acnt_prdt_cd = acct_parts[1] if len(acct_parts) >= 2 else "01"
 
         tr_id = "VTTC8434R" if self._is_virtual else "TTTC8434R"
-        return self._api_get_sync(
+        return await self._api_get(
             "/uapi/domestic-stock/v1/trading/inquire-balance",
             tr_id,
             {
@@ -216,8 +220,8 @@ class KISClient:
             },
         )
 
-    def _fetch_short_selling_sync(self, ticker: str,
-                                   start_date: str, end_date: str) -> dict:
+    async def _fetch_short_selling(self, ticker: str,
+                                    start_date: str, end_date: str) -> dict:
         """Fetch daily short selling data from KIS API.
 
         모의투자/실전 구분 없이 현재 토큰으로 조회합니다.
@@ -230,12 +234,13 @@ class KISClient:
             "FID_INPUT_DATE_1": start_date,
             "FID_INPUT_DATE_2": end_date,
         }
-        with httpx.Client(timeout=15) as client:
-            resp = client.get(url, headers=headers, params=params)
-            if resp.status_code != 200:
-                logger.debug("Short selling API %d for %s", resp.status_code, ticker)
-                return {"rt_cd": "-1", "output2": []}
-            return resp.json()
+        resp = await get_http_pool().get(
+            url, headers=headers, params=params, timeout=15, endpoint="kis.daily-short-sale",
+        )
+        if resp.status_code != 200:
+            logger.debug("Short selling API %d for %s", resp.status_code, ticker)
+            return {"rt_cd": "-1", "output2": []}
+        return resp.json()
 
     # ------------------------------------------------------------------
     # Public async methods
@@ -245,7 +250,7 @@ class KISClient:
         """Get real-time current price. KIS API only — no mock data."""
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(self._fetch_current_price_sync, ticker)
+                data = await self._fetch_current_price(ticker)
                 output = data.get("output", {})
                 price = float(output.get("stck_prpr", 0))
                 if price > 0:
@@ -270,7 +275,7 @@ class KISClient:
         result = {"price": 0.0, "prev_close": 0.0, "day_change": 0.0, "day_change_pct": 0.0}
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(self._fetch_current_price_sync, ticker)
+                data = await self._fetch_current_price(ticker)
                 output = data.get("output", {})
                 price = float(output.get("stck_prpr", 0))
                 if price > 0:
@@ -295,9 +300,7 @@ class KISClient:
         """Fetch OHLCV data for a ticker."""
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(
-                    self._fetch_daily_price_sync, ticker
-                )
+                data = await self._fetch_daily_price(ticker)
                 output = data.get("output", [])
                 if output and isinstance(output, list) and len(output) >= 5:
                     return self._parse_daily_ohlcv(output, days)
@@ -311,9 +314,7 @@ class KISClient:
         """Fetch stock fundamental info."""
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(
-                    self._fetch_current_price_sync, ticker
-                )
+                data = await self._fetch_current_price(ticker)
                 output = data.get("output", {})
                 if output:
                     return StockInfo(
@@ -348,8 +349,7 @@ class KISClient:
             try:
                 end_dt = datetime.now(KST)
                 start_dt = end_dt - timedelta(days=days + 10)
-                data = await asyncio.to_thread(
-                    self._fetch_short_selling_sync,
+                data = await self._fetch_short_selling(
                     ticker,
                     start_dt.strftime("%Y%m%d"),
                     end_dt.strftime("%Y%m%d"),
@@ -382,9 +382,7 @@ class KISClient:
         """Fetch foreign investor flow data."""
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(
-                    self._fetch_investor_sync, ticker
-                )
+                data = await self._fetch_investor(ticker)
                 output = data.get("output", [])
                 if output and isinstance(output, list):
                     return self._parse_investor_flow(output, "frgn", days)
@@ -398,9 +396,7 @@ class KISClient:
         """Fetch institutional investor flow data."""
         if await self._ensure_token():
             try:
-                data = await asyncio.to_thread(
-                    self._fetch_investor_sync, ticker
-                )
+                data = await self._fetch_investor(ticker)
                 output = data.get("output", [])
                 if output and isinstance(output, list):
                     return self._parse_investor_flow(output, "orgn", days)
@@ -417,7 +413,7 @@ class KISClient:
         if not await self._ensure_token():
             return None
         try:
-            data = await asyncio.to_thread(self._fetch_balance_sync)
+            data = await self._fetch_balance()
             output1 = data.get("output1", [])
             output2 = data.get("output2", [{}])
             summary = output2[0] if output2 else {}
@@ -18,13 +18,14 @@ import json
 import logging
 import os
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import Any, Callable
 
 import httpx
 
 from kstock.core.tz import KST
+from kstock.ingest.tick_store import DEFAULT_TICK_CAPACITY, TickStore
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +37,20 @@ WS_URL_REAL = "ws://ops.koreainvestment.com:21000"
 TR_REALTIME_PRICE = "H0STCNT0"    # 실시간 체결가
 TR_REALTIME_ORDERBOOK = "H0STASP0"  # 실시간 호가 (10단계)
 
+# H0STCNT0 필드 인덱스 ('^' 구분, 레코드당 46필드). 쓰는 필드만 디코딩한다.
+_P_TICKER, _P_TIME, _P_PRICE, _P_SIGN, _P_CHANGE, _P_CHANGE_PCT = 0, 1, 2, 3, 4, 5
+_P_TRADE_VOL, _P_VOLUME = 12, 13
+_P_ASK, _P_BID, _P_TOTAL_ASK, _P_TOTAL_BID = 25, 26, 27, 28
+_PRICE_USED = _P_TOTAL_BID + 1      # split maxsplit 상한 (뒤 필드는 통째로 남김)
+_PRICE_MIN_FIELDS = 40              # 잘린 프레임 거르기 (기존 기준 유지)
 
-@dataclass
+# 콜백 디스패치 큐 상한 (종목×이벤트 단위로 병합되므로 넘칠 일은 드물다)
+_DISPATCH_MAX_PENDING = 4096
+
+
+@dataclass(slots=True)
 class RealtimePrice:
-    """실시간 체결 데이터."""
+    """실시간 체결 데이터 (종목당 한 객체를 틱마다 갱신, 콜백에는 사본)."""
     ticker: str
     price: float
     change: float
@@ -148,7 +159,7 @@ class Orderbook:
 class KISWebSocket:
     """KIS WebSocket 클라이언트 — 실시간 호가/체결가."""
 
-    def __init__(self) -> None:
+    def __init__(self, tick_capacity: int = DEFAULT_TICK_CAPACITY) -> None:
         self._app_key = os.getenv("KIS_APP_KEY", "")
         self._app_secret = os.getenv("KIS_APP_SECRET", "")
         self._is_virtual = os.getenv("KIS_VIRTUAL", "true").lower() == "true"
@@ -168,6 +179,12 @@ class KISWebSocket:
         self._last_receive_error_log_ts: float = 0.0
         self._last_receive_error_text: str = ""
         self._last_disconnect_reason: str = ""
+        # v14: 종목별 최근 N틱 링 버퍼 + 수신 루프 밖 콜백 디스패치
+        self._ticks = TickStore(tick_capacity)
+        self._pending: dict[tuple[str, str], Any] = {}
+        self._dispatch_event: asyncio.Event | None = None
+        self._dispatch_task: asyncio.Task | None = None
+        self._dispatch_stats = {"queued": 0, "coalesced": 0, "dispatched": 0, "dropped": 0}
 
     def _get_connect_lock(self) -> asyncio.Lock:
         if self._connect_lock is None:
@@ -268,6 +285,13 @@ class KISWebSocket:
                 pass
             except Exception:
                 logger.debug("disconnect: recv_task cleanup failed", exc_info=True)
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._dispatch_task
+            self._dispatch_task = None
+            self._dispatch_event = None
+        self._flush_callbacks()
         if self._ws:
             with contextlib.suppress(Exception):
                 await self._ws.close()
@@ -306,6 +330,7 @@ class KISWebSocket:
         await self._send_unsubscribe(TR_REALTIME_PRICE, ticker)
         await self._send_unsubscribe(TR_REALTIME_ORDERBOOK, ticker)
         self._subscriptions.discard(ticker)
+        self._ticks.drop(ticker)
         return True
 
     async def _send_subscribe(self, tr_id: str, ticker: str) -> bool:
@@ -468,18 +493,24 @@ class KISWebSocket:
         logger.info("KIS WebSocket reconnected: restored %d tickers", restored)
 
     def _parse_realtime_data(self, raw: str) -> None:
-        """실시간 데이터 파싱 (파이프 구분 형식)."""
+        """실시간 데이터 파싱 (파이프 구분 형식).
+
+        ``0|H0STCNT0|003|rec^rec^rec`` 처럼 한 프레임에 여러 레코드가 올 수 있다.
+        """
         try:
-            parts = raw.split("|")
+            parts = raw.split("|", 3)
             if len(parts) < 4:
                 return
 
             tr_id = parts[1]
-            data_count = int(parts[2])
+            data_count = int(parts[2]) if parts[2].isdigit() else 1
             data_str = parts[3]
 
             if tr_id == TR_REALTIME_PRICE:
-                self._parse_price(data_str)
+                if data_count <= 1:
+                    self._parse_price(data_str)
+                else:
+                    self._parse_price_multi(data_str, data_count)
             elif tr_id == TR_REALTIME_ORDERBOOK:
                 self._parse_orderbook(data_str)
 
@@ -487,58 +518,79 @@ class KISWebSocket:
             logger.debug("Parse error: %s", e)
 
     def _parse_price(self, data: str) -> None:
-        """실시간 체결가 파싱 (H0STCNT0)."""
+        """실시간 체결가 파싱 (H0STCNT0, 레코드 1건).
+
+        앞쪽 29필드만 쪼개고 (나머지는 한 덩어리), 종목별 ``RealtimePrice``
+        객체를 제자리 갱신한 뒤 틱 링 버퍼에 한 칸 쓴다.
+        """
+        fields = data.split("^", _PRICE_USED)
+        if len(fields) <= _PRICE_USED:
+            return
+        if _PRICE_USED + 1 + fields[_PRICE_USED].count("^") < _PRICE_MIN_FIELDS:
+            return
+        self._apply_price(fields)
+
+    def _parse_price_multi(self, data: str, count: int) -> None:
+        """여러 레코드가 이어 붙은 체결 프레임. 레코드 길이로 잘라 순서대로 반영."""
         fields = data.split("^")
-        if len(fields) < 40:
+        width = len(fields) // count
+        if width < _PRICE_MIN_FIELDS:
             return
+        for i in range(count):
+            self._apply_price(fields[i * width:(i + 1) * width])
 
+    def _apply_price(self, fields: list[str]) -> None:
         try:
-            ticker = fields[0]
-            price = float(fields[2]) if fields[2] else 0
-            change = float(fields[4]) if fields[4] else 0
-            change_pct = float(fields[5]) if fields[5] else 0
-            # 부호 처리
-            sign = fields[3]  # 1=상한, 2=상승, 3=보합, 4=하한, 5=하락
-            if sign in ("4", "5"):
+            ticker = fields[_P_TICKER]
+            price = float(fields[_P_PRICE] or 0)
+            change = float(fields[_P_CHANGE] or 0)
+            change_pct = float(fields[_P_CHANGE_PCT] or 0)
+            # 부호 처리: 1=상한, 2=상승, 3=보합, 4=하한, 5=하락
+            if fields[_P_SIGN] in ("4", "5"):
                 change = -abs(change)
                 change_pct = -abs(change_pct)
 
-            volume = int(fields[13]) if fields[13] else 0
-            trade_vol = int(fields[12]) if fields[12] else 0
-            trade_time = fields[1][:6] if fields[1] else ""
-            # 시간 포맷: HHMMSS → HH:MM:SS
-            if len(trade_time) == 6:
-                trade_time = f"{trade_time[:2]}:{trade_time[2:4]}:{trade_time[4:6]}"
+            volume = int(fields[_P_VOLUME] or 0)
+            trade_vol = int(fields[_P_TRADE_VOL] or 0)
+            hhmmss = fields[_P_TIME][:6]
+            ask_price = float(fields[_P_ASK] or 0)
+            bid_price = float(fields[_P_BID] or 0)
+            total_ask = int(fields[_P_TOTAL_ASK] or 0)
+            total_bid = int(fields[_P_TOTAL_BID] or 0)
+        except (ValueError, IndexError) as e:
+            logger.debug("Price parse error: %s", e)
+            return
 
-            ask_price = float(fields[25]) if len(fields) > 25 and fields[25] else 0
-            bid_price = float(fields[26]) if len(fields) > 26 and fields[26] else 0
-            total_ask = int(fields[27]) if len(fields) > 27 and fields[27] else 0
-            total_bid = int(fields[28]) if len(fields) > 28 and fields[28] else 0
+        # 시간 포맷: HHMMSS → HH:MM:SS
+        trade_time = f"{hhmmss[:2]}:{hhmmss[2:4]}:{hhmmss[4:6]}" if len(hhmmss) == 6 else hhmmss
+        now = time.time()
 
-            self._prices[ticker] = RealtimePrice(
-                ticker=ticker,
-                price=price,
-                change=change,
-                change_pct=change_pct,
-                volume=volume,
-                trade_volume=trade_vol,
-                trade_time=trade_time,
-                bid_price=bid_price,
-                ask_price=ask_price,
-                total_ask_vol=total_ask,
-                total_bid_vol=total_bid,
-                updated_at=time.time(),
+        rp = self._prices.get(ticker)
+        if rp is None:
+            rp = self._prices[ticker] = RealtimePrice(
+                ticker=ticker, price=price, change=change, change_pct=change_pct,
+                volume=volume, trade_volume=trade_vol, trade_time=trade_time,
+                bid_price=bid_price, ask_price=ask_price,
+                total_ask_vol=total_ask, total_bid_vol=total_bid, updated_at=now,
             )
-
-            # 콜백 실행
-            for cb in self._callbacks:
-                try:
-                    cb("price", ticker, self._prices[ticker])
-                except Exception:
-                    logger.debug("_parse_price: callback failed for %s", ticker, exc_info=True)
-
-        except (ValueError, IndexError) as e:
-            logger.debug("Price parse error: %s", e)
+        else:
+            rp.price = price
+            rp.change = change
+            rp.change_pct = change_pct
+            rp.volume = volume
+            rp.trade_volume = trade_vol
+            rp.trade_time = trade_time
+            rp.bid_price = bid_price
+            rp.ask_price = ask_price
+            rp.total_ask_vol = total_ask
+            rp.total_bid_vol = total_bid
+            rp.updated_at = now
+
+        self._ticks.append(
+            ticker, now, price, trade_vol, volume, bid_price, ask_price,
+            int(hhmmss) if hhmmss.isdigit() else 0,
+        )
+        self._enqueue_callback("price", ticker, rp)
 
     def _parse_orderbook(self, data: str) -> None:
         """실시간 호가 파싱 (H0STASP0)."""
@@ -583,15 +635,71 @@ class KISWebSocket:
                 updated_at=time.time(),
             )
 
-            for cb in self._callbacks:
-                try:
-                    cb("orderbook", ticker, self._orderbooks[ticker])
-                except Exception:
-                    logger.debug("_parse_orderbook: callback failed for %s", ticker, exc_info=True)
+            self._enqueue_callback("orderbook", ticker, self._orderbooks[ticker])
 
         except (ValueError, IndexError) as e:
             logger.debug("Orderbook parse error: %s", e)
 
+    # ── Callback Dispatch ────────────────────────────────────────────────────
+
+    def _enqueue_callback(self, event: str, ticker: str, data: Any) -> None:
+        """콜백을 수신 루프 밖으로 넘긴다.
+
+        대기 중인 (이벤트, 종목) 항목이 있으면 최신 데이터로 덮어써서 장 시작
+        직후 같은 폭주 구간에도 콜백은 종목당 한 번만 돈다.  누락 없이 모든
+        틱이 필요하면 ``get_ticks`` / ``tick_store.since`` 를 쓴다.
+        실행 중인 이벤트 루프가 없으면 (동기 호출/테스트) 바로 실행한다.
+        """
+        if not self._callbacks:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._run_callbacks(event, ticker, data)
+            return
+
+        key = (event, ticker)
+        stats = self._dispatch_stats
+        if key in self._pending:
+            stats["coalesced"] += 1
+        elif len(self._pending) >= _DISPATCH_MAX_PENDING:
+            stats["dropped"] += 1
+            return
+        else:
+            stats["queued"] += 1
+        self._pending[key] = data
+
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_event = asyncio.Event()
+            self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+        self._dispatch_event.set()
+
+    async def _dispatch_loop(self) -> None:
+        """대기 콜백을 배치로 꺼내 실행한다 (배치 사이에 루프 양보)."""
+        event = self._dispatch_event
+        while True:
+            await event.wait()
+            event.clear()
+            self._flush_callbacks()
+            await asyncio.sleep(0)
+
+    def _flush_callbacks(self) -> None:
+        pending, self._pending = self._pending, {}
+        for (ev, ticker), data in pending.items():
+            self._run_callbacks(ev, ticker, data)
+
+    def _run_callbacks(self, event: str, ticker: str, data: Any) -> None:
+        self._dispatch_stats["dispatched"] += 1
+        if isinstance(data, RealtimePrice):
+            # 종목 객체는 틱마다 제자리 갱신되므로, await 뒤에 값을 읽는 콜백
+            # (급등 알림 등) 이 이후 틱 값을 보지 않게 디스패치 시점 사본을 넘긴다
+            data = replace(data)
+        for cb in self._callbacks:
+            try:
+                cb(event, ticker, data)
+            except Exception:
+                logger.debug("callback failed for %s %s", event, ticker, exc_info=True)
+
     # ── Public Data Access ───────────────────────────────────────────────────
 
     def get_price(self, ticker: str) -> RealtimePrice | None:
@@ -606,6 +714,19 @@ class KISWebSocket:
         """모든 구독 종목 체결가."""
         return dict(self._prices)
 
+    def get_ticks(self, ticker: str, n: int | None = None):
+        """최근 *n* 체결 틱 (``tick_store.TICK_DTYPE`` 구조화 배열, 오래된 → 최신)."""
+        return self._ticks.last(ticker, n)
+
+    @property
+    def tick_store(self) -> TickStore:
+        """종목별 틱 링 버퍼 (``since(ticker, seq)`` 로 증분 소비)."""
+        return self._ticks
+
+    def get_dispatch_stats(self) -> dict[str, int]:
+        """콜백 큐 통계 (queued/coalesced/dispatched/dropped + 현재 대기)."""
+        return {**self._dispatch_stats, "pending": len(self._pending)}
+
     def on_update(self, callback: Callable) -> None:
         """실시간 업데이트 콜백 등록.
 
@@ -20,6 +20,7 @@ import pandas as pd
 
 from kstock.core.tz import KST
 from kstock.core.circuit_breaker import get_breaker
+from kstock.ingest.http_pool import get_http_pool
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,9 @@ _CACHE_TTL = timedelta(minutes=3)
 _SISE_JSON_URL = "https://api.finance.naver.com/siseJson.naver"
 _ITEM_MAIN_URL = "https://finance.naver.com/item/main.naver?code={code}"
 _ITEM_SISE_URL = "https://finance.naver.com/item/sise.naver?code={code}"
+# 다종목 실시간 시세 (한 요청에 여러 종목, 쉼표 구분)
+_POLLING_URL = "https://polling.finance.naver.com/api/realtime"
+_POLLING_BATCH = 50
 
 _HEADERS = {
     "User-Agent": (
@@ -70,8 +74,7 @@ class NaverFinanceClient:
             return cached[1] if cached else 0.0
 
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with get_http_pool().session(timeout=10.0) as client:
                 url = _ITEM_SISE_URL.format(code=code)
                 resp = await client.get(url, headers=_HEADERS)
                 resp.raise_for_status()
@@ -86,6 +89,47 @@ class NaverFinanceClient:
 
         return 0.0
 
+    async def get_current_prices(self, codes: list[str]) -> dict[str, float]:
+        """여러 종목 현재가를 polling 엔드포인트로 한 번에 조회.
+
+        캐시(3분)에 있는 종목은 요청하지 않는다.  실패한 종목은 결과에서 빠진다.
+        """
+        now = datetime.now(KST)
+        result: dict[str, float] = {}
+        missing: list[str] = []
+        for code in dict.fromkeys(codes):
+            cached = _naver_price_cache.get(code)
+            if cached and now - cached[0] < _CACHE_TTL and cached[1] > 0:
+                result[code] = cached[1]
+            else:
+                missing.append(code)
+        if not missing or not _naver_breaker.can_execute():
+            return result
+
+        async with get_http_pool().session(timeout=10.0) as client:
+            for i in range(0, len(missing), _POLLING_BATCH):
+                chunk = missing[i:i + _POLLING_BATCH]
+                try:
+                    resp = await client.get(
+                        _POLLING_URL,
+                        params={"query": "SERVICE_ITEM:" + ",".join(chunk)},
+                        headers=_HEADERS,
+                        endpoint="naver.polling",
+                    )
+                    resp.raise_for_status()
+                    prices = _parse_polling_json(resp.text)
+                    _naver_breaker.record_success()
+                except Exception as e:
+                    _naver_breaker.record_failure()
+                    logger.debug("Naver polling fetch failed (%d codes): %s", len(chunk), e)
+                    continue
+                for code in chunk:
+                    price = prices.get(code, 0.0)
+                    if price > 0:
+                        _naver_price_cache[code] = (now, price)
+                        result[code] = price
+        return result
+
     async def get_ohlcv(
         self, code: str, period_days: int = 120
     ) -> pd.DataFrame:
@@ -101,7 +145,6 @@ class NaverFinanceClient:
                 return cached_df
 
         try:
-            import httpx
             end_date = now.strftime("%Y%m%d")
             start_date = (now - timedelta(days=period_days * 1.5)).strftime("%Y%m%d")
 
@@ -113,7 +156,7 @@ class NaverFinanceClient:
                 "timeframe": "day",
             }
 
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with get_http_pool().session(timeout=15.0) as client:
                 resp = await client.get(
                     _SISE_JSON_URL, params=params, headers=_HEADERS
                 )
@@ -157,8 +200,7 @@ class NaverFinanceClient:
         }
 
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with get_http_pool().session(timeout=10.0) as client:
                 url = _ITEM_MAIN_URL.format(code=code)
                 resp = await client.get(url, headers=_HEADERS)
                 resp.raise_for_status()
@@ -208,6 +250,31 @@ def _parse_current_price(html: str) -> float:
     return 0.0
 
 
+def _parse_polling_json(text: str) -> dict[str, float]:
+    """polling.finance.naver.com 응답 → {종목코드: 현재가}.
+
+    ``{"result": {"areas": [{"name": "SERVICE_ITEM",
+    "datas": [{"cd": "005930", "nv": 71000, ...}]}]}}``
+    """
+    import json
+
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return {}
+    out: dict[str, float] = {}
+    for area in (data.get("result") or {}).get("areas") or []:
+        for item in area.get("datas") or []:
+            code = str(item.get("cd", ""))
+            try:
+                price = float(item.get("nv") or 0)
+            except (TypeError, ValueError):
+                continue
+            if code and price > 0:
+                out[code] = price
+    return out
+
+
 def _parse_sise_json(text: str) -> pd.DataFrame:
     """siseJson.naver 응답 파싱.
 
@@ -416,17 +483,16 @@ async def get_investor_trading(code: str, days: int = 20) -> list[dict]:
             return cached_data
 
     try:
-        import httpx
         from bs4 import BeautifulSoup
     except ImportError:
-        logger.debug("httpx/bs4 not available for investor trading")
+        logger.debug("bs4 not available for investor trading")
         return []
 
     results: list[dict] = []
     pages_needed = max(1, (days // 20) + 1)
 
     try:
-        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        async with get_http_pool().session(timeout=10) as client:
             for page in range(1, pages_needed + 1):
                 resp = await client.get(
                     _FRGN_URL.format(code=code, page=page),
@@ -655,14 +721,13 @@ async def get_sector_rankings(limit: int = 15) -> list[dict]:
             return cached_data
 
     try:
-        import httpx
         from bs4 import BeautifulSoup
     except ImportError:
         return []
 
     results: list[dict] = []
     try:
-        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        async with get_http_pool().session(timeout=10) as client:
             resp = await client.get(_SECTOR_LIST_URL, headers=_HEADERS)
             if resp.status_code != 200:
                 return []
@@ -806,15 +871,14 @@ async def get_stock_news(code: str, limit: int = 5) -> list[dict]:
         [{title, date, source, url}, ...]
     """
     try:
-        import httpx
         from bs4 import BeautifulSoup
     except ImportError:
-        logger.debug("httpx/bs4 not available for news")
+        logger.debug("bs4 not available for news")
         return []
 
     results = []
     try:
-        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+        async with get_http_pool().session(timeout=10) as client:
             resp = await client.get(
                 _NEWS_URL.format(code=code),
                 headers=_HEADERS,
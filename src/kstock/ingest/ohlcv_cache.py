@@ -0,0 +1,588 @@
+"""Process-wide OHLCV cache shared by scan, charts, diagnosis and backtests.
+
+Replaces the per-bot ``_ohlcv_cache`` dict that was wiped wholesale every
+10 minutes / 500 tickers.
+
+- 종목별 TTL: 각 항목이 자기 만료 시각을 가진다 (KST 날짜가 바뀌면 만료).
+- LRU 메모리 한도: DataFrame 메모리 합이 ``max_bytes``를 넘으면
+  가장 오래 안 쓴 종목부터 제거한다.
+- single-flight: 같은 종목을 동시에 요청하면 fetch는 한 번만 돈다.
+- Parquet lake backfill: lake에 과거 봉이 있으면 마지막 날짜 이후
+  꼬리 봉만 받아 합치고, 받은 꼬리는 lake에 append 한다.
+- ``stats()``: hit/miss/fetch 지연 카운터 (헬스체크·로그용).
+- ``indicators(ticker, df)``: 종목별 ``IndicatorState`` 를 함께 보관해
+  장중 재스캔에서 마지막 봉만 바뀌면 지표를 O(1)로 갱신한다.
+- ``bar_store``: 받은 봉을 SQLite ``daily_bars`` 에도 upsert 하고,
+  ``local_bars()`` 로 리스크/차트가 yfinance 대신 로컬 봉을 읽는다.
+  로컬 봉이 직전 완료 KRX 세션까지 없으면 빠진 꼬리만 받아 합친다.
+
+Dict-style ``get`` / ``[]`` / ``items()`` are kept so existing readers that
+treat the cache as ``{ticker: DataFrame}`` keep working.
+
+Usage::
+
+    cache = get_ohlcv_cache()
+    df = await cache.get_or_fetch("005930", fetch)          # fetch(ticker, since)
+    frames = await cache.get_many(codes, fetch_batch)       # fetch_batch(codes, since)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Awaitable, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from kstock.core.market_calendar import is_kr_market_open, prev_market_day
+from kstock.core.tz import KST
+from kstock.features.technical import IndicatorState, TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_S = 600.0
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# lake에서 읽어올 과거 기간 (≈ 1년 + 여유)
+LAKE_LOOKBACK_DAYS = 400
+# lake 데이터가 이보다 짧으면 꼬리만 받지 않고 전체를 다시 받는다
+MIN_BASE_BARS = 60
+# 마지막 봉이 이보다 오래됐으면 꼬리 대신 전체를 받는다
+MAX_TAIL_GAP_DAYS = 170
+# 보관할 종목별 지표 상태 수 (LRU)
+MAX_INDICATOR_STATES = 4096
+# KRX 정규장 마감 (이 시각 이후면 당일 일봉이 완료된 것으로 본다)
+KRX_SESSION_CLOSE = dtime(15, 30)
+
+# fetch(ticker, since): since=None → 전체, 'YYYY-MM-DD' → 그 날짜 이후 봉
+Fetcher = Callable[[str, Optional[str]], Awaitable[Optional[pd.DataFrame]]]
+BatchFetcher = Callable[[list[str], Optional[str]], Awaitable[dict[str, pd.DataFrame]]]
+
+
+def tail_period(since: str | None, today: datetime | None = None) -> str:
+    """yfinance ``period`` string that covers bars from *since* to today."""
+    if not since:
+        return "6mo"
+    today = today or datetime.now(KST)
+    gap = (today.date() - datetime.strptime(since[:10], "%Y-%m-%d").date()).days
+    if gap <= 4:
+        return "5d"
+    if gap <= 25:
+        return "1mo"
+    if gap <= 80:
+        return "3mo"
+    return "6mo"
+
+
+def last_completed_session(now: datetime | None = None) -> date:
+    """마지막으로 마감된 KRX 거래일 (장중/휴장일이면 직전 개장일)."""
+    now = now or datetime.now(KST)
+    today = now.date()
+    if is_kr_market_open(today) and now.time() >= KRX_SESSION_CLOSE:
+        return today
+    return prev_market_day(today)
+
+
+def bars_frame(df: pd.DataFrame | None) -> pd.DataFrame:
+    """yfinance 형식 (DatetimeIndex + ``Open/High/...``) 등 → ``date`` + 소문자 OHLCV."""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    out = df.rename(columns=str.lower)
+    if "date" not in out.columns:
+        idx = pd.DatetimeIndex(out.index)
+        if idx.tz is not None:
+            idx = idx.tz_localize(None)
+        out = out.reset_index(drop=True)
+        out.insert(0, "date", idx.strftime("%Y-%m-%d"))
+    cols = [c for c in ("date", "open", "high", "low", "close", "volume") if c in out.columns]
+    return out[cols]
+
+
+def merge_bars(base: pd.DataFrame | None, tail: pd.DataFrame | None) -> pd.DataFrame:
+    """Concatenate two OHLCV frames; rows from *tail* win on the same date."""
+    frames = [f for f in (base, tail) if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    df = pd.concat(frames, ignore_index=True)
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
+        df = df.drop_duplicates(subset="date", keep="last").sort_values("date")
+    return df.reset_index(drop=True)
+
+
+def _first_key(df: pd.DataFrame) -> str:
+    if df.empty:
+        return ""
+    return str(df["date"].iloc[0])[:10] if "date" in df.columns else str(df.index[0])
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    fetches: int = 0
+    fetch_errors: int = 0
+    coalesced: int = 0        # single-flight로 다른 요청의 fetch를 기다린 횟수
+    lake_backfills: int = 0   # lake + 꼬리 봉으로 채운 횟수
+    evictions: int = 0
+    indicator_updates: int = 0   # IndicatorState O(1) 갱신
+    indicator_rebuilds: int = 0  # 프레임이 안 맞아 전체 재계산
+    fetch_total_s: float = 0.0
+    fetch_max_s: float = 0.0
+
+    def record_fetch(self, elapsed: float, ok: bool) -> None:
+        self.fetches += 1
+        if not ok:
+            self.fetch_errors += 1
+        self.fetch_total_s += elapsed
+        self.fetch_max_s = max(self.fetch_max_s, elapsed)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        lookups = self.hits + self.misses
+        d["hit_rate"] = round(self.hits / lookups, 4) if lookups else 0.0
+        d["fetch_avg_ms"] = round(self.fetch_total_s / max(self.fetches, 1) * 1000, 3)
+        return d
+
+
+@dataclass
+class _Entry:
+    df: pd.DataFrame
+    expires: float            # time.monotonic() 기준
+    day: str                  # 생성 시 KST 날짜
+    nbytes: int
+
+
+def _frame_bytes(df: pd.DataFrame) -> int:
+    try:
+        return int(df.memory_usage(index=True, deep=True).sum())
+    except Exception:
+        return 0
+
+
+class OHLCVCache:
+    """TTL + byte-bounded LRU cache of OHLCV frames keyed by ticker."""
+
+    def __init__(
+        self,
+        ttl_s: float = DEFAULT_TTL_S,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        lake=None,
+        lake_writeback: bool = True,
+        bar_store=None,
+    ) -> None:
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.lake = lake                    # ParquetStore | None
+        self.lake_writeback = lake_writeback
+        self.bar_store = bar_store          # SQLiteStore (daily_bars) | None
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._indicator_states: OrderedDict[str, tuple[threading.Lock, IndicatorState]] = OrderedDict()
+        self._stats = CacheStats()
+
+    # ── dict 호환 ─────────────────────────────────────────────
+    def _fresh(self, ticker: str) -> Optional[pd.DataFrame]:
+        """Fresh frame or None; drops an expired entry. Caller holds the lock."""
+        entry = self._entries.get(ticker)
+        if entry is None:
+            return None
+        today = datetime.now(KST).strftime("%Y-%m-%d")
+        if time.monotonic() >= entry.expires or entry.day != today:
+            self._drop(ticker)
+            return None
+        self._entries.move_to_end(ticker)
+        return entry.df
+
+    def _drop(self, ticker: str) -> None:
+        entry = self._entries.pop(ticker, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+
+    def get(self, ticker: str, default=None, max_bars: int | None = None):
+        """Fresh cached frame (no fetch). Counts a hit or miss."""
+        with self._lock:
+            df = self._fresh(ticker)
+            if df is None:
+                self._stats.misses += 1
+                return default
+            self._stats.hits += 1
+        return df.tail(max_bars).reset_index(drop=True) if max_bars else df
+
+    def put(self, ticker: str, df: pd.DataFrame, ttl_s: float | None = None) -> None:
+        """Store *df* for *ticker*; empty frames are ignored."""
+        if df is None or df.empty:
+            return
+        entry = _Entry(
+            df=df,
+            expires=time.monotonic() + (self.ttl_s if ttl_s is None else ttl_s),
+            day=datetime.now(KST).strftime("%Y-%m-%d"),
+            nbytes=_frame_bytes(df),
+        )
+        with self._lock:
+            self._drop(ticker)
+            self._entries[ticker] = entry
+            self._bytes += entry.nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old, _ = next(iter(self._entries.items()))
+                self._drop(old)
+                self._stats.evictions += 1
+
+    def invalidate(self, ticker: str | None = None) -> None:
+        """Drop one ticker, or everything when *ticker* is None."""
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+                self._indicator_states.clear()
+                self._bytes = 0
+            else:
+                self._drop(ticker)
+                for key in [k for k in self._indicator_states if k.split("@", 1)[0] == ticker]:
+                    del self._indicator_states[key]
+
+    clear = invalidate
+
+    def __getitem__(self, ticker: str) -> pd.DataFrame:
+        df = self.get(ticker)
+        if df is None:
+            raise KeyError(ticker)
+        return df
+
+    def __setitem__(self, ticker: str, df: pd.DataFrame) -> None:
+        self.put(ticker, df)
+
+    def __contains__(self, ticker: object) -> bool:
+        with self._lock:
+            return isinstance(ticker, str) and self._fresh(ticker) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return [t for t in list(self._entries) if self._fresh(t) is not None]
+
+    def items(self) -> list[tuple[str, pd.DataFrame]]:
+        with self._lock:
+            out = []
+            for t in list(self._entries):
+                df = self._fresh(t)
+                if df is not None:
+                    out.append((t, df))
+            return out
+
+    # ── lake ─────────────────────────────────────────────────
+    def _lake_bases(self, tickers: list[str]) -> dict[str, pd.DataFrame]:
+        """Recent lake bars per ticker (one panel scan); short histories skipped."""
+        if self.lake is None or not tickers:
+            return {}
+        start = (datetime.now(KST) - timedelta(days=LAKE_LOOKBACK_DAYS)).strftime("%Y-%m-%d")
+        try:
+            panel = self.lake.load_panel(tickers, start=start)
+        except Exception:
+            logger.debug("OHLCV lake read failed", exc_info=True)
+            return {}
+        out = {}
+        for t, g in panel.groupby("ticker", sort=False):
+            if len(g) >= MIN_BASE_BARS:
+                out[str(t)] = g.drop(columns=["ticker"]).reset_index(drop=True)
+        return out
+
+    def _writeback(self, frames: dict[str, pd.DataFrame]) -> None:
+        for t, df in frames.items():
+            if df is None or df.empty or "date" not in df.columns:
+                continue
+            if self.lake is not None and self.lake_writeback:
+                try:
+                    self.lake.append(t, df)
+                except Exception:
+                    logger.debug("OHLCV lake append failed for %s", t, exc_info=True)
+            self.store_bars(t, df)
+
+    # ── 로컬 일봉 (SQLite daily_bars) ─────────────────────────
+    def store_bars(self, ticker: str, df: pd.DataFrame | None) -> None:
+        """받은 일봉을 ``bar_store`` 에 upsert (없으면 무시)."""
+        if self.bar_store is None or df is None or df.empty:
+            return
+        try:
+            self.bar_store.save_daily_bars(ticker, df)
+        except Exception:
+            logger.debug("daily bar save failed for %s", ticker, exc_info=True)
+
+    def local_bars(
+        self,
+        ticker: str,
+        bars: int,
+        min_bars: int | None = None,
+        fetch_tail: Callable[[str], Optional[pd.DataFrame]] | None = None,
+    ) -> Optional[pd.DataFrame]:
+        """``bar_store`` 의 최근 *bars* 개 일봉 (``date`` + 소문자 OHLCV).
+
+        봉이 ``min_bars`` (기본 *bars*) 보다 적으면 None.  마지막 봉이 직전
+        완료 KRX 세션보다 앞서면 ``fetch_tail(period)`` (yfinance ``period``
+        문자열을 받아 그 기간 봉을 반환) 로 빠진 날만 받아 저장·병합하고,
+        ``fetch_tail`` 이 없거나 실패하면 None — 호출 측이 원격에서 받는다.
+        """
+        if self.bar_store is None:
+            return None
+        try:
+            df = self.bar_store.get_ohlcv_df(ticker, bars)
+        except Exception:
+            logger.debug("daily bar read failed for %s", ticker, exc_info=True)
+            return None
+        if df is None or len(df) < (bars if min_bars is None else min_bars):
+            return None
+        last = str(df["date"].iloc[-1])[:10]
+        if datetime.strptime(last, "%Y-%m-%d").date() >= last_completed_session():
+            return df
+        if fetch_tail is None:
+            return None
+        try:
+            tail = bars_frame(fetch_tail(tail_period(last)))
+        except Exception:
+            logger.debug("daily bar tail fetch failed for %s", ticker, exc_info=True)
+            return None
+        if tail.empty:
+            return None
+        tail = tail[tail["date"] >= last]
+        self.store_bars(ticker, tail)
+        return merge_bars(df, tail).tail(bars).reset_index(drop=True)
+
+    @staticmethod
+    def _since(base: pd.DataFrame | None) -> str | None:
+        """Last lake date to fetch from, or None when a full fetch is needed."""
+        if base is None or base.empty:
+            return None
+        last = str(base["date"].iloc[-1])[:10]
+        gap = (datetime.now(KST).date() - datetime.strptime(last, "%Y-%m-%d").date()).days
+        return last if gap <= MAX_TAIL_GAP_DAYS else None
+
+    # ── single-flight ─────────────────────────────────────────
+    def _claim(self, tickers: Iterable[str]) -> tuple[list[str], dict[str, asyncio.Future]]:
+        """Split *tickers* into ones this caller fetches and in-flight ones to await."""
+        loop = asyncio.get_running_loop()
+        mine, waits = [], {}
+        with self._lock:
+            for t in tickers:
+                fut = self._inflight.get(t)
+                if fut is not None and not fut.done() and fut.get_loop() is loop:
+                    waits[t] = fut
+                else:
+                    self._inflight[t] = loop.create_future()
+                    mine.append(t)
+        return mine, waits
+
+    def _release(self, results: dict[str, Optional[pd.DataFrame]]) -> None:
+        with self._lock:
+            for t, df in results.items():
+                fut = self._inflight.pop(t, None)
+                if fut is not None and not fut.done():
+                    fut.set_result(df)
+
+    async def _await_others(self, waits: dict[str, asyncio.Future]) -> dict[str, pd.DataFrame]:
+        out = {}
+        for t, fut in waits.items():
+            with self._lock:
+                self._stats.coalesced += 1
+            df = await asyncio.shield(fut)
+            if df is not None and not df.empty:
+                out[t] = df
+        return out
+
+    # ── fetch ─────────────────────────────────────────────────
+    async def _timed(self, coro: Awaitable):
+        t0 = time.perf_counter()
+        ok = False
+        try:
+            result = await coro
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self._stats.record_fetch(time.perf_counter() - t0, ok)
+
+    async def get_or_fetch(
+        self,
+        ticker: str,
+        fetch: Fetcher,
+        max_bars: int | None = None,
+        ttl_s: float | None = None,
+    ) -> Optional[pd.DataFrame]:
+        """Cached frame, else lake bars + ``fetch(ticker, since)`` tail.
+
+        Concurrent callers for the same ticker share one fetch.  Returns
+        None when nothing could be fetched.
+        """
+        df = self.get(ticker, max_bars=max_bars)
+        if df is not None:
+            return df
+        mine, waits = self._claim([ticker])
+        if waits:
+            got = await self._await_others(waits)
+            df = got.get(ticker)
+            return df.tail(max_bars).reset_index(drop=True) if df is not None and max_bars else df
+
+        result: Optional[pd.DataFrame] = None
+        try:
+            base = (await asyncio.to_thread(self._lake_bases, [ticker])).get(ticker)
+            since = self._since(base)
+            try:
+                tail = await self._timed(fetch(ticker, since))
+            except Exception:
+                logger.debug("OHLCV fetch failed for %s", ticker, exc_info=True)
+                tail = None
+            if tail is not None and not tail.empty:
+                result = merge_bars(base if since else None, tail)
+                if since:
+                    with self._lock:
+                        self._stats.lake_backfills += 1
+                self.put(ticker, result, ttl_s)
+                await asyncio.to_thread(self._writeback, {ticker: tail})
+            elif since:
+                # 꼬리 조회 실패: lake 봉을 돌려주되 캐시하지는 않는다
+                result = base
+        finally:
+            self._release({ticker: result})
+        if result is not None and max_bars:
+            return result.tail(max_bars).reset_index(drop=True)
+        return result
+
+    async def get_many(
+        self,
+        tickers: Iterable[str],
+        fetch_batch: BatchFetcher,
+        max_bars: int | None = None,
+        ttl_s: float | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """Bulk variant of :meth:`get_or_fetch` for scans.
+
+        Misses with enough lake history are fetched in one batch call with
+        ``since`` = the oldest of their last lake dates (tail only); the rest
+        in one full-history batch call.  Tickers the batch could not provide
+        are simply absent from the result (callers fall back to
+        :meth:`get_or_fetch`).
+        """
+        tickers = list(dict.fromkeys(tickers))
+        out: dict[str, pd.DataFrame] = {}
+        missing = []
+        for t in tickers:
+            df = self.get(t)
+            if df is not None:
+                out[t] = df
+            else:
+                missing.append(t)
+
+        if missing:
+            mine, waits = self._claim(missing)
+            results: dict[str, Optional[pd.DataFrame]] = {t: None for t in mine}
+            try:
+                bases = await asyncio.to_thread(self._lake_bases, mine)
+                sinces = {t: self._since(bases.get(t)) for t in mine}
+                tail_group = [t for t in mine if sinces[t] is not None]
+                full_group = [t for t in mine if sinces[t] is None]
+                tails: dict[str, pd.DataFrame] = {}
+                for group, since in (
+                    (tail_group, min((sinces[t] for t in tail_group), default=None)),
+                    (full_group, None),
+                ):
+                    if not group:
+                        continue
+                    try:
+                        tails.update(await self._timed(fetch_batch(group, since)) or {})
+                    except Exception:
+                        logger.debug("OHLCV batch fetch failed (%d)", len(group), exc_info=True)
+                for t in mine:
+                    tail = tails.get(t)
+                    if tail is None or tail.empty:
+                        continue
+                    df = merge_bars(bases.get(t) if sinces[t] else None, tail)
+                    if sinces[t]:
+                        with self._lock:
+                            self._stats.lake_backfills += 1
+                    self.put(t, df, ttl_s)
+                    results[t] = df
+                await asyncio.to_thread(
+                    self._writeback, {t: tails[t] for t in mine if t in tails},
+                )
+            finally:
+                self._release(results)
+            out.update({t: df for t, df in results.items() if df is not None})
+            out.update(await self._await_others(waits))
+
+        if max_bars:
+            out = {t: df.tail(max_bars).reset_index(drop=True) for t, df in out.items()}
+        return out
+
+    # ── 지표 ──────────────────────────────────────────────────
+    def indicators(self, ticker: str, df: pd.DataFrame) -> TechnicalIndicators:
+        """``compute_indicators(df)`` via the ticker's cached ``IndicatorState``.
+
+        같은 프레임의 마지막 봉만 바뀌었거나 봉이 하나 늘었으면 O(1) 갱신,
+        아니면 (첫 봉이 밀린 새 창 등) 상태를 다시 만든다.
+        """
+        # 기간(3mo/6mo…)이 다른 프레임은 EWM 시작점이 달라 상태를 따로 둔다
+        key = f"{ticker}@{_first_key(df)}"
+        with self._lock:
+            item = self._indicator_states.get(key)
+            if item is None:
+                item = (threading.Lock(), IndicatorState())
+                self._indicator_states[key] = item
+                while len(self._indicator_states) > MAX_INDICATOR_STATES:
+                    self._indicator_states.popitem(last=False)
+            else:
+                self._indicator_states.move_to_end(key)
+        lock, state = item
+        with lock:
+            incremental = state.sync(df)
+            tech = state.indicators()
+        with self._lock:
+            if incremental:
+                self._stats.indicator_updates += 1
+            else:
+                self._stats.indicator_rebuilds += 1
+        return tech
+
+    # ── 관리 ──────────────────────────────────────────────────
+    def stats(self) -> dict:
+        """Counters plus current size (entries / bytes)."""
+        with self._lock:
+            d = self._stats.to_dict()
+            d["entries"] = len(self._entries)
+            d["bytes"] = self._bytes
+            d["inflight"] = len(self._inflight)
+            d["indicator_states"] = len(self._indicator_states)
+        d["max_bytes"] = self.max_bytes
+        return d
+
+
+_shared: OHLCVCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_ohlcv_cache() -> OHLCVCache:
+    """The process-wide cache, backed by the default Parquet lake.
+
+    The bot sets ``bar_store`` to its SQLiteStore at startup.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            lake = None
+            try:
+                from kstock.store.parquet_store import ParquetStore
+                lake = ParquetStore()
+            except Exception:
+                logger.debug("Parquet lake unavailable for OHLCV cache", exc_info=True)
+            _shared = OHLCVCache(lake=lake)
+        return _shared
@@ -0,0 +1,151 @@
+"""Per-ticker tick ring buffers (NumPy structured arrays).
+
+KIS WebSocket 체결 틱을 종목별 고정 크기 링 버퍼에 쌓는다.  틱 하나는
+56바이트 레코드 한 칸이라 종목당 N개를 보관해도 메모리가 일정하고,
+틱마다 파이썬 객체를 새로 만들지 않는다.
+
+- ``seq``: 종목별 누적 틱 번호.  소비자(분봉 집계 등)는 마지막으로 본
+  ``seq`` 를 기억해 두었다가 ``since(seq)`` 로 새 틱만 가져간다.
+- 링이 한 바퀴 넘게 돌면 가장 오래된 틱부터 덮어쓴다.
+
+Usage::
+
+    store = TickStore(capacity=2048)
+    store.append("005930", ts, price, trade_vol, cum_vol, bid, ask, hhmmss)
+    ticks = store.last("005930", 100)   # 구조화 배열 (오래된 → 최신)
+    ticks["price"], ticks["trade_vol"]
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+TICK_DTYPE = np.dtype([
+    ("ts", "f8"),          # 수신 시각 (epoch sec)
+    ("price", "f8"),       # 체결가
+    ("trade_vol", "i8"),   # 체결 수량
+    ("cum_vol", "i8"),     # 누적 거래량
+    ("bid", "f8"),         # 매수호가
+    ("ask", "f8"),         # 매도호가
+    ("hhmmss", "i4"),      # 체결 시각 HHMMSS (거래소 기준)
+])
+
+DEFAULT_TICK_CAPACITY = 2048
+
+
+class TickRing:
+    """한 종목의 최근 ``capacity`` 틱."""
+
+    __slots__ = ("_buf", "_cap", "seq")
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY) -> None:
+        self._cap = max(1, int(capacity))
+        self._buf = np.zeros(self._cap, dtype=TICK_DTYPE)
+        self.seq = 0  # 지금까지 들어온 틱 수
+
+    def __len__(self) -> int:
+        return min(self.seq, self._cap)
+
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
+    @property
+    def nbytes(self) -> int:
+        return self._buf.nbytes
+
+    def append(
+        self,
+        ts: float,
+        price: float,
+        trade_vol: int,
+        cum_vol: int,
+        bid: float,
+        ask: float,
+        hhmmss: int,
+    ) -> None:
+        self._buf[self.seq % self._cap] = (ts, price, trade_vol, cum_vol, bid, ask, hhmmss)
+        self.seq += 1
+
+    def last(self, n: int | None = None) -> np.ndarray:
+        """최근 *n* 틱 복사본 (오래된 → 최신). n=None이면 보관분 전체."""
+        size = len(self)
+        n = size if n is None else max(0, min(int(n), size))
+        if n == 0:
+            return self._buf[:0].copy()
+        end = self.seq % self._cap
+        start = (self.seq - n) % self._cap
+        if start < end:
+            return self._buf[start:end].copy()
+        return np.concatenate([self._buf[start:], self._buf[:end]])
+
+    def since(self, seq: int) -> tuple[np.ndarray, int]:
+        """``seq`` 이후 틱과 새 seq.  덮어써져 잃은 틱은 건너뛴다.
+
+        ``seq`` 가 현재보다 크면 (링을 버리고 새로 만든 경우) 처음부터 읽는다.
+        """
+        if seq > self.seq:
+            seq = 0
+        missed = max(0, self.seq - max(seq, 0))
+        return self.last(missed), self.seq
+
+    def latest(self) -> np.void | None:
+        if self.seq == 0:
+            return None
+        return self._buf[(self.seq - 1) % self._cap]
+
+
+class TickStore:
+    """종목별 ``TickRing`` 모음."""
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY) -> None:
+        self.capacity = capacity
+        self._rings: dict[str, TickRing] = {}
+
+    def ring(self, ticker: str) -> TickRing:
+        r = self._rings.get(ticker)
+        if r is None:
+            r = self._rings[ticker] = TickRing(self.capacity)
+        return r
+
+    def append(
+        self,
+        ticker: str,
+        ts: float,
+        price: float,
+        trade_vol: int,
+        cum_vol: int,
+        bid: float,
+        ask: float,
+        hhmmss: int,
+    ) -> None:
+        self.ring(ticker).append(ts, price, trade_vol, cum_vol, bid, ask, hhmmss)
+
+    def last(self, ticker: str, n: int | None = None) -> np.ndarray:
+        r = self._rings.get(ticker)
+        return r.last(n) if r is not None else np.zeros(0, dtype=TICK_DTYPE)
+
+    def since(self, ticker: str, seq: int) -> tuple[np.ndarray, int]:
+        r = self._rings.get(ticker)
+        if r is None:
+            return np.zeros(0, dtype=TICK_DTYPE), seq
+        return r.since(seq)
+
+    def drop(self, ticker: str) -> None:
+        self._rings.pop(ticker, None)
+
+    def clear(self) -> None:
+        self._rings.clear()
+
+    def tickers(self) -> list[str]:
+        return list(self._rings)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._rings
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(r.nbytes for r in self._rings.values())
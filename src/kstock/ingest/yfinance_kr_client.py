@@ -50,6 +50,12 @@ def _is_cache_stale_date(cached_time: datetime) -> bool:
     return ct.astimezone(KST).date() < now.date()
 
 
+def _price_key(symbol: str, period: str) -> str:
+    """_price_cache 키. 기본 6mo는 심볼 그대로 (현재가 폴백이 이 키를 읽음),
+    짧은 꼬리 조회(5d 등)는 별도 키로 둬서 6mo 캐시를 덮어쓰지 않는다."""
+    return symbol if period == "6mo" else f"{symbol}:{period}"
+
+
 def _yf_ticker(code: str, market: str = "KOSPI") -> str:
     """Convert Korean stock code to yfinance symbol."""
     suffix = ".KS" if market.upper() == "KOSPI" else ".KQ"
@@ -93,11 +99,12 @@ class YFinanceKRClient:
     ) -> pd.DataFrame:
         """Fetch OHLCV data for a Korean stock."""
         symbol = _yf_ticker(code, market)
+        key = _price_key(symbol, period)
         now = datetime.now(KST)
 
         # Check cache (v4.1: KST 타임존 + 날짜 경계 무효화)
-        if symbol in _price_cache:
-            cached_time, cached_df = _price_cache[symbol]
+        if key in _price_cache:
+            cached_time, cached_df = _price_cache[key]
             if (not _is_cache_stale_date(cached_time)
                     and now - cached_time < _CACHE_TTL
                     and not cached_df.empty):
@@ -106,8 +113,8 @@ class YFinanceKRClient:
         # v4.0: 서킷 브레이커 체크
         if _yf_breaker and not _yf_breaker.can_execute():
             logger.debug("yfinance circuit OPEN, using cache/fallback for %s", symbol)
-            if symbol in _price_cache:
-                return _price_cache[symbol][1]
+            if key in _price_cache:
+                return _price_cache[key][1]
             return await self._naver_fallback_ohlcv(code)
 
         try:
@@ -124,7 +131,7 @@ class YFinanceKRClient:
                 "volume": hist["Volume"].astype(int).values,
             })
             df = df.reset_index(drop=True)
-            _price_cache[symbol] = (now, df)
+            _price_cache[key] = (now, df)
             if _yf_breaker:
                 _yf_breaker.record_success()
             return df
@@ -133,8 +140,8 @@ class YFinanceKRClient:
             logger.warning("yfinance OHLCV failed for %s: %s", symbol, e)
             if _yf_breaker:
                 _yf_breaker.record_failure()
-            if symbol in _price_cache:
-                return _price_cache[symbol][1]
+            if key in _price_cache:
+                return _price_cache[key][1]
             return await self._naver_fallback_ohlcv(code)
 
     @staticmethod
@@ -324,7 +331,7 @@ class YFinanceKRClient:
                     }).reset_index(drop=True)
                     code = code_map[symbol]
                     result[code] = df
-                    _price_cache[symbol] = (now, df)
+                    _price_cache[_price_key(symbol, period)] = (now, df)
                 except Exception:
                     logger.debug("batch_download: parse failed for symbol %s", symbol, exc_info=True)
         except Exception as e:
@@ -332,6 +339,49 @@ class YFinanceKRClient:
 
         return result
 
+    async def get_ohlcv_many(
+        self,
+        codes: list[str],
+        markets: dict[str, str] | None = None,
+        period: str = "6mo",
+    ) -> dict[str, pd.DataFrame]:
+        """여러 종목 OHLCV. 신선한 캐시는 그대로, 나머지는 ``yf.download`` 1회.
+
+        실패한 종목은 결과에서 빠진다 (폴백은 호출자 몫).
+        """
+        markets = markets or {}
+        now = datetime.now(KST)
+        result: dict[str, pd.DataFrame] = {}
+        missing: list[dict] = []
+        for code in dict.fromkeys(codes):
+            key = _price_key(_yf_ticker(code, markets.get(code, "KOSPI")), period)
+            cached = _price_cache.get(key)
+            if (cached and not _is_cache_stale_date(cached[0])
+                    and now - cached[0] < _CACHE_TTL and not cached[1].empty):
+                result[code] = cached[1]
+            else:
+                missing.append({"code": code, "market": markets.get(code, "KOSPI")})
+        if missing and (_yf_breaker is None or _yf_breaker.can_execute()):
+            fetched = await self.batch_download(missing, period=period)
+            if _yf_breaker:
+                if fetched:
+                    _yf_breaker.record_success()
+                else:
+                    _yf_breaker.record_failure()
+            result.update(fetched)
+        return result
+
+    async def get_current_prices(
+        self, codes: list[str], markets: dict[str, str] | None = None,
+    ) -> dict[str, float]:
+        """여러 종목 최근 종가를 ``yf.download`` 한 번으로 조회 (5일 꼬리)."""
+        frames = await self.get_ohlcv_many(codes, markets, period="5d")
+        return {
+            code: float(df["close"].iloc[-1])
+            for code, df in frames.items()
+            if not df.empty and float(df["close"].iloc[-1]) > 0
+        }
+
 
 
 # v9.3.3: Mock data generators removed — all fallbacks use real Naver Finance data.
@@ -14,9 +14,8 @@ import logging
 import os
 import time
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
 
 import numpy as np
 
@@ -454,6 +453,12 @@ class AutoTrainer:
                 save_ensemble_model(trained_model)
             except Exception as e:
                 logger.debug("Ensemble model save failed: %s", e)
+            # 모델 교체: 캐시된 SHAP explainer 폐기
+            try:
+                from kstock.ml.predictor import invalidate_explainers
+                invalidate_explainers()
+            except Exception:
+                logger.debug("SHAP explainer invalidation skipped", exc_info=True)
 
             # DB에 성능 기록
             if self.db:
@@ -575,15 +580,19 @@ class AutoTrainer:
         """feature_store에서 D+5 실제 수익률이 확정된 데이터를 학습용으로 수집.
 
         v10.1: 매일 스캔 시 축적된 46개 피처 + OHLCV 기반 실제 수익률 매칭.
+        피처는 컬럼형 스토어 get_panel 한 번, 라벨은 종가 패널 한 번 로드 후 벡터화 계산
+        (kstock.ml.labels) — (날짜, 종목)마다 pykrx를 호출하지 않는다.
         """
         try:
-            from kstock.ml.feature_store import FeatureStore
+            from kstock.ml.feature_store import open_columnar
+            from kstock.ml.labels import build_label_builder
         except ImportError:
             return []
 
         training_data = []
         try:
-            fs = FeatureStore()
+            # 행 단위 벡터 디코드 — EAV 재조립보다 빠르다 (scripts/bench_feature_store.py)
+            fs = open_columnar()
 
             # D+8일(영업일 5일+여유) 이전 데이터만 사용 (수익률 확정)
             cutoff = (date.today() - timedelta(days=8)).strftime("%Y-%m-%d")
@@ -592,31 +601,28 @@ class AutoTrainer:
             if not dates:
                 return []
 
-            for date_str in dates:
-                tickers = fs.get_tickers_for_date(date_str)
-                for ticker in tickers:
-                    features = fs.get_features_dict(ticker, date_str)
-                    if not features or len(features) < 30:
-                        continue
-
-                    # D+5 실제 수익률 계산
-                    actual_return = self._calc_actual_return(ticker, date_str, days=5)
-                    if actual_return is None:
-                        continue
-
-                    features["target"] = 1 if actual_return > 3.0 else 0
-
-                    # v10.1: Triple Barrier 라벨 (medium target)
-                    tb_label = self._calc_triple_barrier_label(ticker, date_str)
-                    if tb_label is not None:
-                        features["target_medium"] = tb_label
-
-                    # v10.1: 텐배거 라벨 (60일 +30%)
-                    tb60_return = self._calc_actual_return(ticker, date_str, days=60)
-                    if tb60_return is not None:
-                        features["target_tenbagger"] = 1 if tb60_return > 30.0 else 0
+            panel = fs.get_panel(dates)
+            columns = list(panel.columns)
+            samples: list[tuple[str, str, dict]] = []
+            for (date_str, ticker), values in zip(panel.index, panel.to_numpy()):
+                features = {
+                    k: float(v) for k, v in zip(columns, values) if not np.isnan(v)
+                }
+                if len(features) < 30:
+                    continue
+                samples.append((date_str, ticker, features))
 
-                    training_data.append(features)
+            labeler = build_label_builder(
+                [(d, t) for d, t, _ in samples], db=self.db,
+            )
+            for date_str, ticker, features in samples:
+                # target (D+5 > 3%), target_medium (Triple Barrier),
+                # target_tenbagger (60일 +30%)
+                labels = labeler.labels(ticker, date_str)
+                if "target" not in labels:
+                    continue
+                features.update(labels)
+                training_data.append(features)
 
             logger.info("Feature store training data: %d samples from %d dates", len(training_data), len(dates))
         except Exception as e:
@@ -624,48 +630,6 @@ class AutoTrainer:
 
         return training_data
 
-    def _calc_actual_return(self, ticker: str, base_date: str, days: int = 5) -> float | None:
-        """base_date 기준 D+days 실제 수익률(%) 계산.
-
-        OHLCV 데이터에서 base_date의 종가와 D+days 종가 비교.
-        """
-        if not self.db:
-            return None
-
-        # 1) recommendation_results에서 검색 (빠름)
-        try:
-            recs = self.db.get_recommendation_results(limit=500)
-            for r in recs:
-                if r.get("ticker") == ticker:
-                    created = r.get("created_at", "")
-                    if created and created[:10] == base_date:
-                        ret = r.get("day5_return")
-                        if ret is not None:
-                            return float(ret)
-        except Exception:
-            pass
-
-        # 2) pykrx로 직접 조회 (fallback)
-        try:
-            from pykrx import stock as pykrx_stock
-            base_dt = datetime.strptime(base_date, "%Y-%m-%d")
-            end_dt = base_dt + timedelta(days=days + 5)
-
-            df = pykrx_stock.get_market_ohlcv(
-                base_dt.strftime("%Y%m%d"),
-                end_dt.strftime("%Y%m%d"),
-                ticker,
-            )
-            if df is not None and len(df) > days:
-                base_price = float(df.iloc[0]["종가"])
-                target_price = float(df.iloc[days]["종가"])
-                if base_price > 0:
-                    return (target_price - base_price) / base_price * 100
-        except Exception:
-            pass
-
-        return None
-
     async def daily_incremental_update(self) -> AutoTrainResult:
         """매일 22:00 실행 — D-5 확정 데이터로 점진 학습.
 
@@ -770,35 +734,6 @@ class AutoTrainer:
                 message=f"❌ 점진 학습 실패: {e}",
             )
 
-    def _calc_triple_barrier_label(
-        self, ticker: str, base_date: str,
-    ) -> int | None:
-        """Triple Barrier 라벨 계산 (29일/±9%).
-
-        pykrx에서 base_date 이후 30+일 종가를 가져와 라벨링.
-        """
-        try:
-            from pykrx import stock as pykrx_stock
-            from kstock.ml.predictor import triple_barrier_label
-            from datetime import datetime
-
-            base_dt = datetime.strptime(base_date, "%Y-%m-%d")
-            end_dt = base_dt + timedelta(days=50)  # 29 거래일 + 여유
-
-            df = pykrx_stock.get_market_ohlcv(
-                base_dt.strftime("%Y%m%d"),
-                end_dt.strftime("%Y%m%d"),
-                ticker,
-            )
-            if df is None or len(df) < 30:
-                return None
-
-            closes = df["종가"].values.astype(float)
-            return triple_barrier_label(closes, 0, window=29, profit_barrier=0.09, loss_barrier=0.09)
-
-        except Exception:
-            return None
-
     def format_train_report(self) -> str:
         """최근 학습 히스토리 텔레그램 포맷."""
         if not self._history:
@@ -3,6 +3,15 @@
 Stores per-ticker, per-date feature values with category & source metadata.
 Supports batch writes, history queries, cross-section lookups, and TTL cleanup.
 
+Two layouts share the same API:
+
+- ``FeatureStore``: one row per (ticker, date, feature_name) (EAV).
+- ``ColumnarFeatureStore``: one wide row per (ticker, date) holding a packed
+  float64 vector, with a ``feature_columns`` registry mapping names to vector
+  slots.  Bulk reads (``get_panel``) decode whole rows with NumPy instead of
+  rebuilding dicts value by value.  ``migrate_to_columnar`` copies an
+  existing EAV database across; ``open_columnar`` does so once on first use.
+
 Backwards-compatible module-level ``add_feature`` / ``get_features`` are
 provided so existing call sites continue to work without changes.
 """
@@ -14,7 +23,10 @@ import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -268,6 +280,35 @@ class FeatureStore:
         )
         return {row[0]: row[1] for row in cur.fetchall()}
 
+    def get_panel(
+        self,
+        dates: Sequence[str],
+        tickers: Sequence[str] | None = None,
+        features: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Bulk read: DataFrame indexed by (date, ticker), one column per feature.
+
+        Missing values are NaN.  ``tickers`` / ``features`` default to all.
+        """
+        rows: list[tuple] = []
+        for chunk in _chunks(list(dates), _SQL_IN_CHUNK):
+            marks = ",".join("?" * len(chunk))
+            rows.extend(self.conn.execute(
+                f"SELECT date, ticker, feature_name, value FROM features "
+                f"WHERE date IN ({marks})",
+                chunk,
+            ).fetchall())
+        df = pd.DataFrame(rows, columns=["date", "ticker", "feature_name", "value"])
+        if tickers is not None:
+            df = df[df["ticker"].isin(set(tickers))]
+        if features is not None:
+            df = df[df["feature_name"].isin(set(features))]
+        panel = df.pivot(index=["date", "ticker"], columns="feature_name", values="value")
+        panel.columns.name = None
+        if features is not None:
+            panel = panel.reindex(columns=list(features))
+        return panel.sort_index()
+
     # -- maintenance ---------------------------------------------------------
 
     def cleanup_stale(self, ttl_days: int | None = None) -> int:
@@ -313,6 +354,458 @@ class FeatureStore:
         )
 
 
+# ---------------------------------------------------------------------------
+# ColumnarFeatureStore (wide rows)
+# ---------------------------------------------------------------------------
+
+DEFAULT_COLUMNAR_DB_PATH = "data/features_wide.db"
+_SQL_IN_CHUNK = 500
+
+_CREATE_COLUMNS_TABLE = """
+CREATE TABLE IF NOT EXISTS feature_columns (
+    idx      INTEGER PRIMARY KEY,
+    name     TEXT    NOT NULL UNIQUE,
+    category TEXT    DEFAULT '',
+    source   TEXT    DEFAULT ''
+)
+"""
+
+_CREATE_ROWS_TABLE = """
+CREATE TABLE IF NOT EXISTS feature_rows (
+    date        TEXT    NOT NULL,
+    ticker      TEXT    NOT NULL,
+    vec         BLOB    NOT NULL,
+    n_values    INTEGER NOT NULL,
+    computed_at TEXT    DEFAULT '',
+    PRIMARY KEY (date, ticker)
+)
+"""
+
+_CREATE_IDX_ROWS_TICKER = (
+    "CREATE INDEX IF NOT EXISTS idx_feature_rows_ticker "
+    "ON feature_rows(ticker, date)"
+)
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ColumnarFeatureStore:
+    """Wide-row feature store: one packed vector per (ticker, date).
+
+    Slot ``i`` of every vector holds the feature registered with ``idx = i``
+    in ``feature_columns``; NaN marks a feature that was not recorded (the
+    EAV layout cannot store NaN either, so the two are equivalent).  Vectors
+    written before a column was added are shorter and read back NaN-padded.
+
+    Category/source metadata is kept per feature column rather than per
+    value.
+
+    Parameters
+    ----------
+    db_path : str | Path
+        Path to the SQLite database file.  Use ``":memory:"`` for testing.
+    ttl_days : int
+        Default time-to-live for cleanup operations.
+    """
+
+    def __init__(self, db_path: str | Path = DEFAULT_COLUMNAR_DB_PATH, ttl_days: int = 365):
+        self.db_path = str(db_path)
+        self.ttl_days = ttl_days
+        self._conn: sqlite3.Connection | None = None
+        self._columns: dict[str, int] = {}
+        self._names: list[str] = []
+        self._meta: dict[str, tuple[str, str]] = {}
+        self._init_db()
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def _init_db(self) -> None:
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE_COLUMNS_TABLE)
+        self._conn.execute(_CREATE_ROWS_TABLE)
+        self._conn.execute(_CREATE_IDX_ROWS_TICKER)
+        self._conn.commit()
+        self._load_columns()
+
+    def _load_columns(self) -> None:
+        rows = self._conn.execute(
+            "SELECT idx, name, category, source FROM feature_columns ORDER BY idx"
+        ).fetchall()
+        self._columns = {name: idx for idx, name, _, _ in rows}
+        self._names = [name for _, name, _, _ in rows]
+        self._meta = {name: (cat or "", src or "") for _, name, cat, src in rows}
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._init_db()
+        assert self._conn is not None
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @property
+    def feature_names(self) -> list[str]:
+        """Registered feature columns in slot order."""
+        return list(self._names)
+
+    # -- vector helpers ------------------------------------------------------
+
+    def _column(self, name: str, category: str = "", source: str = "") -> int:
+        """Slot index for *name*, registering a new column if needed."""
+        idx = self._columns.get(name)
+        if idx is None:
+            idx = len(self._names)
+            self.conn.execute(
+                "INSERT INTO feature_columns (idx, name, category, source) "
+                "VALUES (?, ?, ?, ?)",
+                (idx, name, category, source),
+            )
+            self._columns[name] = idx
+            self._names.append(name)
+            self._meta[name] = (category, source)
+        elif (category or source) and self._meta.get(name) != (category, source):
+            self.conn.execute(
+                "UPDATE feature_columns SET category = ?, source = ? WHERE idx = ?",
+                (category, source, idx),
+            )
+            self._meta[name] = (category, source)
+        return idx
+
+    def _decode(self, blob: bytes, width: int | None = None) -> np.ndarray:
+        width = len(self._names) if width is None else width
+        vec = np.frombuffer(blob, dtype=np.float64)
+        if len(vec) >= width:
+            return vec[:width]
+        out = np.full(width, np.nan)
+        out[: len(vec)] = vec
+        return out
+
+    def _decode_many(self, blobs: list[bytes]) -> np.ndarray:
+        """Stack blobs into a (n_rows, n_columns) float64 matrix."""
+        width = len(self._names)
+        if not blobs:
+            return np.empty((0, width))
+        full = width * 8
+        if all(len(b) == full for b in blobs):
+            return np.frombuffer(b"".join(blobs), dtype=np.float64).reshape(len(blobs), width)
+        return np.vstack([self._decode(b, width) for b in blobs])
+
+    def _upsert_rows(
+        self,
+        updates: dict[tuple[str, str], dict[int, float]],
+        computed_at: dict[tuple[str, str], str],
+    ) -> None:
+        """Merge slot updates into existing rows and write them back."""
+        by_date: dict[str, list[str]] = {}
+        for d, t in updates:
+            by_date.setdefault(d, []).append(t)
+        existing: dict[tuple[str, str], bytes] = {}
+        for d, tickers in by_date.items():
+            for chunk in _chunks(tickers, _SQL_IN_CHUNK):
+                marks = ",".join("?" * len(chunk))
+                for t, blob in self.conn.execute(
+                    f"SELECT ticker, vec FROM feature_rows WHERE date = ? AND ticker IN ({marks})",
+                    [d, *chunk],
+                ):
+                    existing[(d, t)] = blob
+
+        width = len(self._names)
+        out = []
+        for key, slots in updates.items():
+            blob = existing.get(key)
+            vec = self._decode(blob, width).copy() if blob is not None else np.full(width, np.nan)
+            for idx, value in slots.items():
+                vec[idx] = value
+            out.append((
+                key[0], key[1], vec.tobytes(), int(np.count_nonzero(~np.isnan(vec))),
+                computed_at[key],
+            ))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO feature_rows (date, ticker, vec, n_values, computed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            out,
+        )
+
+    # -- write operations ----------------------------------------------------
+
+    def add_feature(
+        self,
+        ticker: str,
+        date: str,
+        name: str,
+        value: float,
+        category: str = "",
+        source: str = "",
+    ) -> None:
+        """Insert or replace a single feature value."""
+        self.add_feature_row(ticker, date, {name: value}, category=category, source=source)
+
+    def add_feature_row(
+        self,
+        ticker: str,
+        date: str,
+        features: dict[str, float],
+        category: str = "",
+        source: str = "",
+    ) -> int:
+        """Insert or replace all *features* of one (ticker, date) in one write.
+
+        Returns the number of values written.
+        """
+        if not features:
+            return 0
+        now = datetime.utcnow().isoformat(timespec="seconds")
+        slots = {self._column(n, category, source): float(v) for n, v in features.items()}
+        self._upsert_rows({(date, ticker): slots}, {(date, ticker): now})
+        self.conn.commit()
+        return len(slots)
+
+    def add_features_batch(self, records: List[FeatureRecord]) -> int:
+        """Insert or replace a batch of feature records.
+
+        Records are grouped per (ticker, date) so each wide row is written
+        once.  Returns the number of records written.
+        """
+        if not records:
+            return 0
+
+        now = datetime.utcnow().isoformat(timespec="seconds")
+        updates: dict[tuple[str, str], dict[int, float]] = {}
+        computed_at: dict[tuple[str, str], str] = {}
+        for r in records:
+            key = (r.date, r.ticker)
+            idx = self._column(r.feature_name, r.category, r.source)
+            updates.setdefault(key, {})[idx] = float(r.value)
+            computed_at[key] = r.computed_at or now
+        self._upsert_rows(updates, computed_at)
+        self.conn.commit()
+        return len(records)
+
+    # -- read operations -----------------------------------------------------
+
+    def _row(self, ticker: str, date: str) -> np.ndarray | None:
+        row = self.conn.execute(
+            "SELECT vec FROM feature_rows WHERE date = ? AND ticker = ?",
+            (date, ticker),
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_features(self, ticker: str, date: str) -> FeatureSet:
+        """Retrieve all features for a ticker on a given date."""
+        fs = FeatureSet(ticker=ticker, date=date)
+        fs.features = self.get_features_dict(ticker, date)
+        for name in fs.features:
+            fs.categories[name], fs.sources[name] = self._meta.get(name, ("", ""))
+        fs.is_complete = len(fs.features) > 0
+        return fs
+
+    def get_features_dict(self, ticker: str, date_str: str) -> dict[str, float]:
+        """종목+날짜의 피처를 {name: value} dict로 반환 (학습 데이터용)."""
+        vec = self._row(ticker, date_str)
+        if vec is None:
+            return {}
+        return {
+            self._names[i]: float(vec[i]) for i in np.flatnonzero(~np.isnan(vec))
+        }
+
+    def get_feature_history(
+        self,
+        ticker: str,
+        feature_name: str,
+        start_date: str,
+        end_date: str,
+    ) -> List[Tuple[str, float]]:
+        """Return ``(date, value)`` pairs for a single feature over a date range."""
+        idx = self._columns.get(feature_name)
+        if idx is None:
+            return []
+        rows = self.conn.execute(
+            "SELECT date, vec FROM feature_rows "
+            "WHERE ticker = ? AND date BETWEEN ? AND ? ORDER BY date ASC",
+            (ticker, start_date, end_date),
+        ).fetchall()
+        out = []
+        for d, blob in rows:
+            v = self._decode(blob, idx + 1)[idx]
+            if not np.isnan(v):
+                out.append((d, float(v)))
+        return out
+
+    def get_cross_section(self, date: str, feature_name: str) -> dict:
+        """Return ``{ticker: value}`` for all tickers on a given date."""
+        idx = self._columns.get(feature_name)
+        if idx is None:
+            return {}
+        rows = self.conn.execute(
+            "SELECT ticker, vec FROM feature_rows WHERE date = ?", (date,)
+        ).fetchall()
+        if not rows:
+            return {}
+        values = self._decode_many([b for _, b in rows])[:, idx]
+        return {
+            t: float(v) for (t, _), v in zip(rows, values) if not np.isnan(v)
+        }
+
+    def get_available_dates(self, before: str = "", limit: int = 60) -> list[str]:
+        """feature_store에 기록된 고유 날짜 목록 (최신순)."""
+        if before:
+            cur = self.conn.execute(
+                "SELECT DISTINCT date FROM feature_rows "
+                "WHERE date < ? ORDER BY date DESC LIMIT ?",
+                (before, limit),
+            )
+        else:
+            cur = self.conn.execute(
+                "SELECT DISTINCT date FROM feature_rows ORDER BY date DESC LIMIT ?",
+                (limit,),
+            )
+        return [row[0] for row in cur.fetchall()]
+
+    def get_tickers_for_date(self, date_str: str) -> list[str]:
+        """특정 날짜에 피처가 저장된 종목 코드 목록."""
+        cur = self.conn.execute(
+            "SELECT ticker FROM feature_rows WHERE date = ? AND n_values > 0",
+            (date_str,),
+        )
+        return [row[0] for row in cur.fetchall()]
+
+    def get_panel(
+        self,
+        dates: Sequence[str],
+        tickers: Sequence[str] | None = None,
+        features: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """Bulk read: DataFrame indexed by (date, ticker), one column per feature.
+
+        Missing values are NaN.  ``tickers`` / ``features`` default to all.
+        ``get_panel(...).to_numpy()`` gives the raw (rows, features) matrix.
+        """
+        rows: list[tuple] = []
+        for chunk in _chunks(list(dates), _SQL_IN_CHUNK):
+            marks = ",".join("?" * len(chunk))
+            rows.extend(self.conn.execute(
+                f"SELECT date, ticker, vec FROM feature_rows WHERE date IN ({marks})",
+                chunk,
+            ).fetchall())
+        if tickers is not None:
+            wanted = set(tickers)
+            rows = [r for r in rows if r[1] in wanted]
+        matrix = self._decode_many([r[2] for r in rows])
+        names = self._names
+        if features is not None:
+            cols = [self._columns.get(f, -1) for f in features]
+            picked = np.full((len(rows), len(cols)), np.nan)
+            for j, c in enumerate(cols):
+                if c >= 0:
+                    picked[:, j] = matrix[:, c]
+            matrix, names = picked, list(features)
+        index = pd.MultiIndex.from_tuples(
+            [(r[0], r[1]) for r in rows], names=["date", "ticker"],
+        )
+        panel = pd.DataFrame(matrix, index=index, columns=list(names))
+        if features is None:
+            panel = panel.dropna(axis=1, how="all")
+        return panel.sort_index()
+
+    # -- maintenance ---------------------------------------------------------
+
+    def cleanup_stale(self, ttl_days: int | None = None) -> int:
+        """Delete rows older than *ttl_days*.  Returns deleted value count."""
+        ttl = ttl_days if ttl_days is not None else self.ttl_days
+        cutoff = (datetime.utcnow() - timedelta(days=ttl)).strftime("%Y-%m-%d")
+        deleted = self.conn.execute(
+            "SELECT COALESCE(SUM(n_values), 0) FROM feature_rows WHERE date < ?",
+            (cutoff,),
+        ).fetchone()[0]
+        self.conn.execute("DELETE FROM feature_rows WHERE date < ?", (cutoff,))
+        self.conn.commit()
+        return int(deleted)
+
+    def get_stats(self) -> FeatureStats:
+        """Return aggregate statistics about the store."""
+        c = self.conn
+        total, tickers, dmin, dmax = c.execute(
+            "SELECT COALESCE(SUM(n_values), 0), COUNT(DISTINCT ticker), MIN(date), MAX(date) "
+            "FROM feature_rows"
+        ).fetchone()
+        used = np.zeros(len(self._names), dtype=bool)
+        for (blob,) in c.execute("SELECT vec FROM feature_rows"):
+            used |= ~np.isnan(self._decode(blob))
+        cutoff = (
+            datetime.utcnow() - timedelta(days=self.ttl_days)
+        ).strftime("%Y-%m-%d")
+        stale = c.execute(
+            "SELECT COALESCE(SUM(n_values), 0) FROM feature_rows WHERE date < ?", (cutoff,)
+        ).fetchone()[0]
+        return FeatureStats(
+            total_records=int(total),
+            unique_tickers=tickers,
+            unique_features=int(used.sum()),
+            date_range=(dmin or "", dmax or ""),
+            stale_records=int(stale),
+        )
+
+
+def migrate_to_columnar(
+    source: FeatureStore,
+    target: ColumnarFeatureStore,
+) -> int:
+    """Copy every value from an EAV ``FeatureStore`` into *target*.
+
+    Streams one date at a time so a large ``data/features.db`` never has to
+    fit in memory.  Safe to re-run: values are upserted.
+
+    Returns the number of values copied.
+    """
+    copied = 0
+    dates = [
+        row[0] for row in source.conn.execute(
+            "SELECT DISTINCT date FROM features ORDER BY date"
+        )
+    ]
+    for d in dates:
+        rows = source.conn.execute(
+            "SELECT ticker, date, feature_name, value, category, source, computed_at "
+            "FROM features WHERE date = ?",
+            (d,),
+        ).fetchall()
+        copied += target.add_features_batch([FeatureRecord(*r) for r in rows])
+    logger.info("migrate_to_columnar: %d values over %d dates", copied, len(dates))
+    return copied
+
+
+def open_columnar(
+    db_path: str | Path = DEFAULT_COLUMNAR_DB_PATH,
+    legacy_path: str | Path = "data/features.db",
+) -> ColumnarFeatureStore:
+    """Open the columnar store, seeding it once from a legacy EAV database.
+
+    The copy only runs while *db_path* holds no rows, so history written
+    before the switch is still there for training without re-copying on
+    every open.
+    """
+    store = ColumnarFeatureStore(db_path)
+    if Path(legacy_path).exists() and not store.get_available_dates(limit=1):
+        legacy = FeatureStore(legacy_path)
+        try:
+            migrate_to_columnar(legacy, store)
+        finally:
+            legacy.close()
+    return store
+
+
 # ---------------------------------------------------------------------------
 # Backward-compatible module-level API
 # ---------------------------------------------------------------------------
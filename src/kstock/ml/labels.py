@@ -0,0 +1,274 @@
+"""Bulk training-label builder (close-price panel → vectorized labels).
+
+AutoTrainer used to compute labels per (date, ticker): two D+N return
+lookups and one triple-barrier lookup, each a separate pykrx call.  This
+module loads one close-price series per ticker for the whole date range
+(local Parquet lake first, one pykrx call per missing ticker otherwise)
+and computes every label for every bar with NumPy.
+
+Bar semantics match the per-pair code: offsets count the ticker's *own*
+trading bars starting at the first bar on/after ``base_date``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 라벨 정의 (AutoTrainer v10.1과 동일)
+SHORT_DAYS = 5
+SHORT_THRESHOLD_PCT = 3.0
+TENBAGGER_DAYS = 60
+TENBAGGER_THRESHOLD_PCT = 30.0
+TB_WINDOW = 29
+TB_BARRIER = 0.09
+
+# 마지막 base_date 이후 필요한 달력일 (60 거래일 + 휴장 여유)
+_FORWARD_CALENDAR_DAYS = 100
+
+CloseFetcher = Callable[[str, str, str], Optional[pd.Series]]
+
+
+# ---------------------------------------------------------------------------
+# Vectorized label kernels
+# ---------------------------------------------------------------------------
+
+
+def forward_return_pct(close: np.ndarray, days: int) -> np.ndarray:
+    """D+days return (%) for every bar; NaN where fewer than days bars follow."""
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(len(close), np.nan)
+    if len(close) <= days:
+        return out
+    base = close[:-days]
+    fwd = close[days:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ret = (fwd - base) / base * 100
+    out[:-days] = np.where(base > 0, ret, np.nan)
+    return out
+
+
+def triple_barrier_labels(
+    close: np.ndarray,
+    window: int = TB_WINDOW,
+    profit_barrier: float = TB_BARRIER,
+    loss_barrier: float = TB_BARRIER,
+) -> np.ndarray:
+    """``predictor.triple_barrier_label`` for every bar at once.
+
+    Returns a float array: 1/0 label, NaN where fewer than ``window + 1``
+    bars are available from the entry bar (the per-pair code required 30
+    bars for the 29-day window).
+    """
+    p = np.asarray(close, dtype=np.float64)
+    n = len(p)
+    out = np.full(n, np.nan)
+    m = n - window            # entries with a full window ahead
+    if m <= 0:
+        return out
+
+    entry = p[:m]
+    # windows[i] = p[i+1 : i+window+1]
+    windows = np.lib.stride_tricks.sliding_window_view(p[1:], window)[:m]
+    upper = entry * (1.0 + profit_barrier)
+    lower = entry * (1.0 - loss_barrier)
+    hit_up = windows >= upper[:, None]
+    hit_dn = windows <= lower[:, None]
+    first_up = np.where(hit_up.any(axis=1), hit_up.argmax(axis=1), window)
+    first_dn = np.where(hit_dn.any(axis=1), hit_dn.argmax(axis=1), window)
+
+    final_up = windows[:, -1] > entry
+    label = np.where(
+        first_up < window,
+        np.where(first_up <= first_dn, 1.0, 0.0),
+        np.where(first_dn < window, 0.0, final_up.astype(float)),
+    )
+    out[:m] = np.where(entry > 0, label, 0.0)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Close-price panel
+# ---------------------------------------------------------------------------
+
+
+def _pykrx_close(ticker: str, start: str, end: str) -> Optional[pd.Series]:
+    """One pykrx call for the whole range → close series indexed 'YYYY-MM-DD'."""
+    try:
+        from pykrx import stock as pykrx_stock
+    except ImportError:
+        return None
+    df = pykrx_stock.get_market_ohlcv(
+        start.replace("-", ""), end.replace("-", ""), ticker,
+    )
+    if df is None or df.empty:
+        return None
+    s = df["종가"].astype(float)
+    s.index = pd.to_datetime(s.index).strftime("%Y-%m-%d")
+    return s
+
+
+def _lake_closes(lake_dir: Path, tickers: list[str], start: str, end: str) -> dict[str, pd.Series]:
+    """All tickers' closes from the Parquet lake in one dataset scan."""
+    from kstock.store.parquet_store import ParquetStore
+
+    try:
+        df = ParquetStore(lake_dir).load_panel(tickers, start, end, columns=["close"])
+    except Exception:
+        logger.debug("lake panel read failed", exc_info=True)
+        return {}
+    return {
+        str(t): pd.Series(g["close"].astype(float).to_numpy(), index=g["date"].to_numpy())
+        for t, g in df.groupby("ticker", sort=False)
+    }
+
+
+def load_close_panel(
+    tickers: Iterable[str],
+    start: str,
+    end: str,
+    lake_dir: Optional[Path] = None,
+    fetch: Optional[CloseFetcher] = _pykrx_close,
+) -> pd.DataFrame:
+    """Close prices (dates × tickers) for ``start..end`` ('YYYY-MM-DD').
+
+    Tickers in the Parquet lake are read in one ``load_panel`` scan; for
+    the rest ``fetch`` is called once per ticker for the full range
+    (pass ``fetch=None`` to stay offline).  NaN = no bar that day.
+    """
+    from kstock.store.parquet_store import DEFAULT_LAKE_DIR
+
+    lake_dir = DEFAULT_LAKE_DIR if lake_dir is None else lake_dir
+    tickers = list(dict.fromkeys(tickers))
+    lake = _lake_closes(lake_dir, tickers, start, end) if lake_dir.exists() else {}
+    series: dict[str, pd.Series] = {}
+    fetched = 0
+    for ticker in tickers:
+        s = lake.get(ticker)
+        if s is None and fetch is not None:
+            try:
+                s = fetch(ticker, start, end)
+                fetched += 1
+            except Exception:
+                logger.debug("close fetch failed for %s", ticker, exc_info=True)
+                s = None
+        if s is not None and not s.empty:
+            series[ticker] = s[~s.index.duplicated(keep="last")]
+    logger.info(
+        "close panel: %d/%d tickers (%d fetched) %s..%s",
+        len(series), len(tickers), fetched, start, end,
+    )
+    if not series:
+        return pd.DataFrame()
+    return pd.DataFrame(series).sort_index()
+
+
+# ---------------------------------------------------------------------------
+# LabelBuilder
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _TickerLabels:
+    dates: np.ndarray                 # ticker's own bar dates (sorted str)
+    ret_short: np.ndarray
+    ret_tenbagger: np.ndarray
+    triple_barrier: np.ndarray
+
+
+@dataclass
+class LabelBuilder:
+    """Precomputed labels for every bar of every ticker in a close panel.
+
+    Args:
+        close: Close panel from ``load_close_panel``.
+        known_returns: Optional {(ticker, date): D+5 return %} overrides
+            (e.g. evaluated recommendation_results), used before the panel.
+    """
+
+    close: pd.DataFrame
+    known_returns: dict[tuple[str, str], float] = field(default_factory=dict)
+    _cache: dict[str, _TickerLabels] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        index = np.asarray(self.close.index, dtype=object)
+        for ticker in self.close.columns:
+            col = self.close[ticker].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(col)
+            c = col[valid]
+            self._cache[ticker] = _TickerLabels(
+                dates=index[valid].astype(str),
+                ret_short=forward_return_pct(c, SHORT_DAYS),
+                ret_tenbagger=forward_return_pct(c, TENBAGGER_DAYS),
+                triple_barrier=triple_barrier_labels(c),
+            )
+
+    def labels(self, ticker: str, base_date: str) -> dict[str, int]:
+        """{'target', 'target_medium', 'target_tenbagger'} for one pair.
+
+        Keys are omitted when the label cannot be determined (not enough
+        forward bars); an empty dict means no short-horizon label.
+        """
+        out: dict[str, int] = {}
+        known = self.known_returns.get((ticker, base_date))
+        t = self._cache.get(ticker)
+        pos = -1
+        if t is not None:
+            pos = int(np.searchsorted(t.dates, base_date, side="left"))
+            if pos >= len(t.dates):
+                pos = -1
+
+        short = known
+        if short is None and pos >= 0 and not np.isnan(t.ret_short[pos]):
+            short = float(t.ret_short[pos])
+        if short is None:
+            return out
+        out["target"] = 1 if short > SHORT_THRESHOLD_PCT else 0
+
+        if pos >= 0:
+            tb = t.triple_barrier[pos]
+            if not np.isnan(tb):
+                out["target_medium"] = int(tb)
+            r60 = t.ret_tenbagger[pos]
+            if not np.isnan(r60):
+                out["target_tenbagger"] = 1 if r60 > TENBAGGER_THRESHOLD_PCT else 0
+        return out
+
+
+def build_label_builder(
+    pairs: list[tuple[str, str]],
+    db=None,
+    lake_dir: Optional[Path] = None,
+    fetch: Optional[CloseFetcher] = _pykrx_close,
+) -> LabelBuilder:
+    """LabelBuilder covering all (date, ticker) *pairs* with one panel load."""
+    if not pairs:
+        return LabelBuilder(close=pd.DataFrame())
+    dates = sorted({d for d, _ in pairs})
+    tickers = sorted({t for _, t in pairs})
+    end = (
+        datetime.strptime(dates[-1], "%Y-%m-%d") + timedelta(days=_FORWARD_CALENDAR_DAYS)
+    ).strftime("%Y-%m-%d")
+    close = load_close_panel(tickers, dates[0], end, lake_dir=lake_dir, fetch=fetch)
+
+    known: dict[tuple[str, str], float] = {}
+    if db is not None:
+        try:
+            oldest = datetime.strptime(dates[0], "%Y-%m-%d")
+            days = (datetime.utcnow() - oldest).days + 1
+            for r in db.get_recommendation_results(days=days):
+                ret = r.get("day5_return")
+                created = r.get("created_at") or ""
+                if ret is not None and created:
+                    known[(r.get("ticker", ""), created[:10])] = float(ret)
+        except Exception:
+            logger.debug("recommendation_results label lookup failed", exc_info=True)
+    return LabelBuilder(close=close, known_returns=known)
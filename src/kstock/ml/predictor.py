@@ -16,7 +16,7 @@ import logging
 import math
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any
+from typing import Any, Iterable
 
 import numpy as np
 
@@ -497,8 +497,11 @@ def persist_features(
 ) -> None:
     """Persist computed features to the feature store for later ML training.
 
+    All features are written in one batch (one commit per ticker instead of
+    one per feature).
+
     Args:
-        feature_store: FeatureStore instance.
+        feature_store: FeatureStore or ColumnarFeatureStore instance.
         ticker: Stock ticker code.
         date_str: Date string (YYYY-MM-DD).
         features: Dict of 46 feature values.
@@ -506,8 +509,10 @@ def persist_features(
     if not feature_store or not ticker:
         return
     try:
-        for fname, fval in features.items():
-            feature_store.add_feature(
+        from kstock.ml.feature_store import FeatureRecord
+
+        feature_store.add_features_batch([
+            FeatureRecord(
                 ticker=ticker,
                 date=date_str,
                 feature_name=fname,
@@ -515,6 +520,8 @@ def persist_features(
                 category="ml_v10",
                 source="scan_engine",
             )
+            for fname, fval in features.items()
+        ])
     except Exception:
         logger.debug("persist_features failed for %s", ticker, exc_info=True)
 
@@ -827,6 +834,8 @@ def train_model(
     importance.sort(key=lambda t: t[1], reverse=True)
 
     logger.info("Training complete. Walk-forward: %s", wf_metrics)
+    # 새 모델로 교체되므로 이전 모델의 explainer는 더 이상 쓰지 않는다
+    invalidate_explainers()
 
     return {
         "model": {"lgb": lgb_model, "xgb": xgb_model},
@@ -941,12 +950,16 @@ def predict(
 def predict_batch(
     features_list: list[dict[str, float]],
     model: dict[str, Any] | None = None,
+    explain: bool | Iterable[int] = True,
 ) -> list[PredictionResult]:
     """Batch prediction for multiple stocks.
 
     Args:
         features_list: List of feature dicts.
         model: Dict with ``"lgb"`` and ``"xgb"`` sub-models.
+        explain: ``True`` = 전 행 SHAP top-3 (배치 행렬 한 번에 계산),
+            ``False`` = 생략 (나중에 ``explain_results``로 필요한 행만),
+            행 인덱스 iterable = 해당 행만 설명.
 
     Returns:
         List of ``PredictionResult`` in the same order as input.
@@ -974,14 +987,20 @@ def predict_batch(
 
     probs = _ensemble_predict(lgb_model, xgb_model, X)
 
+    if explain is True:
+        explanations = explain_batch(lgb_model or xgb_model, X)
+    elif explain is False:
+        explanations = [[] for _ in features_list]
+    else:
+        explanations = explain_batch(lgb_model or xgb_model, X, rows=explain)
+
     results: list[PredictionResult] = []
-    for i, fd in enumerate(features_list):
+    for i in range(len(features_list)):
         prob = float(np.clip(probs[i], 0.0, 1.0))
-        shap_top3 = get_shap_explanation(lgb_model or xgb_model, fd)
         results.append(PredictionResult(
             probability=round(prob, 4),
             label=_probability_to_label(prob),
-            shap_top3=shap_top3,
+            shap_top3=explanations[i],
         ))
 
     return results
@@ -1085,50 +1104,88 @@ def retrain_if_needed(
 # ---------------------------------------------------------------------------
 
 
-def get_shap_explanation(
-    model: Any | None,
-    features: dict[str, float],
-) -> list[tuple[str, float]]:
-    """Return the top-3 most impactful features for a single prediction.
+# 로드된 모델 객체별 TreeExplainer 캐시.  explainer 생성(트리 전체 파싱)이
+# shap_values 계산보다 비싸므로 예측마다 새로 만들지 않는다.
+# id 재사용을 막으려고 모델 참조도 함께 보관하고, 모델 교체 시
+# ``invalidate_explainers()``로 비운다.
+_EXPLAINER_CACHE_MAX = 4
+_explainers: dict[int, tuple[Any, Any]] = {}
 
-    Uses SHAP ``TreeExplainer`` when available; otherwise falls back to
-    the model's ``feature_importances_`` attribute.
 
-    Returns:
-        List of ``(feature_name, importance)`` tuples, length <= 3.
+def invalidate_explainers(model: Any | None = None) -> None:
+    """Drop cached SHAP explainers (all, or only those for *model*).
+
+    ``train_model`` / ``AutoTrainer`` 가 모델을 교체할 때 호출한다.
+    *model* 은 sub-model 또는 ``{"lgb": ..., "xgb": ...}`` dict.
     """
     if model is None:
-        return []
+        _explainers.clear()
+        return
+    subs = model.values() if isinstance(model, dict) else [model]
+    for m in subs:
+        if m is not None:
+            _explainers.pop(id(m), None)
 
-    X_single = np.array(
-        [[features.get(f, 0.0) for f in FEATURE_NAMES]],
-        dtype=np.float32,
-    )
 
-    # Try SHAP TreeExplainer
-    if _HAS_SHAP:
-        try:
-            explainer = shap.TreeExplainer(model)
-            shap_values = explainer.shap_values(X_single)
-
-            # shap_values may be a list (for binary classifiers) or ndarray
-            if isinstance(shap_values, list):
-                vals = np.abs(shap_values[1][0])  # positive class
-            elif shap_values.ndim == 3:
-                vals = np.abs(shap_values[0, :, 1])
-            else:
-                vals = np.abs(shap_values[0])
-
-            ranked = sorted(
-                zip(FEATURE_NAMES, vals),
-                key=lambda t: t[1],
-                reverse=True,
-            )
-            return [(name, round(float(v), 4)) for name, v in ranked[:3]]
-        except Exception as exc:
-            logger.debug("SHAP explanation failed: %s", exc)
+def _get_explainer(model: Any) -> Any | None:
+    """Cached ``shap.TreeExplainer`` for *model* (None if unavailable)."""
+    if not _HAS_SHAP or model is None:
+        return None
+    hit = _explainers.get(id(model))
+    if hit is not None and hit[0] is model:
+        return hit[1]
+    try:
+        explainer = shap.TreeExplainer(model)
+    except Exception as exc:
+        logger.debug("SHAP explainer build failed: %s", exc)
+        return None
+    if len(_explainers) >= _EXPLAINER_CACHE_MAX:
+        _explainers.pop(next(iter(_explainers)))
+    _explainers[id(model)] = (model, explainer)
+    return explainer
+
+
+def _model_n_features(model: Any, default: int) -> int:
+    """Number of input features the model was trained on."""
+    try:
+        if hasattr(model, "num_feature"):
+            return int(model.num_feature())
+        return int(getattr(model, "n_features_in_", default))
+    except Exception:
+        return default
+
+
+def _shap_matrix(model: Any, X: np.ndarray) -> np.ndarray | None:
+    """|SHAP| values for every row of *X* in one call, shape ``(n, f)``."""
+    explainer = _get_explainer(model)
+    if explainer is None or len(X) == 0:
+        return None
+    nf = _model_n_features(model, X.shape[1])
+    X_m = X[:, :nf] if X.shape[1] > nf else X
+    try:
+        shap_values = explainer.shap_values(X_m)
+        # shap_values may be a list (for binary classifiers) or ndarray
+        if isinstance(shap_values, list):
+            vals = shap_values[1]  # positive class
+        else:
+            vals = np.asarray(shap_values)
+            if vals.ndim == 3:
+                vals = vals[:, :, 1]
+        return np.abs(np.asarray(vals, dtype=np.float64).reshape(len(X_m), -1))
+    except Exception as exc:
+        logger.debug("SHAP explanation failed: %s", exc)
+        return None
 
-    # Fallback: global feature importances
+
+def _top3(values: np.ndarray, scale: float = 1.0) -> list[tuple[str, float]]:
+    """Top-3 ``(feature_name, value / scale)`` by value, stable on ties."""
+    n = min(len(values), len(FEATURE_NAMES))
+    order = np.argsort(-np.asarray(values[:n], dtype=np.float64), kind="stable")[:3]
+    return [(FEATURE_NAMES[i], round(float(values[i] / scale), 4)) for i in order]
+
+
+def _importance_top3(model: Any) -> list[tuple[str, float]]:
+    """Fallback: global feature importances (row-independent)."""
     try:
         # LightGBM Booster
         if hasattr(model, "feature_importance"):
@@ -1139,18 +1196,95 @@ def get_shap_explanation(
         else:
             return []
 
-        total = float(np.sum(raw)) or 1.0
-        ranked = sorted(
-            zip(FEATURE_NAMES, raw),
-            key=lambda t: t[1],
-            reverse=True,
-        )
-        return [(name, round(float(v / total), 4)) for name, v in ranked[:3]]
+        raw = np.asarray(raw, dtype=np.float64)
+        return _top3(raw, float(np.sum(raw)) or 1.0)
     except Exception as exc:
         logger.debug("Feature importance fallback failed: %s", exc)
         return []
 
 
+def explain_batch(
+    model: Any | None,
+    X: np.ndarray,
+    rows: Iterable[int] | None = None,
+) -> list[list[tuple[str, float]]]:
+    """Top-3 attributions for rows of *X* with a single SHAP call.
+
+    Args:
+        model: LGB/XGB sub-model.
+        X: Feature matrix ``(n, len(FEATURE_NAMES))``.
+        rows: 설명할 행 인덱스.  None이면 전체.  나머지 행은 ``[]``.
+
+    Returns:
+        List of length ``len(X)``; each entry is ``[(feature, value), ...]``.
+    """
+    out: list[list[tuple[str, float]]] = [[] for _ in range(len(X))]
+    if model is None or len(X) == 0:
+        return out
+    idx = list(range(len(X))) if rows is None else sorted(
+        {int(i) for i in rows if 0 <= int(i) < len(X)}
+    )
+    if not idx:
+        return out
+
+    vals = _shap_matrix(model, X[idx])
+    if vals is not None:
+        for k, i in enumerate(idx):
+            out[i] = _top3(vals[k])
+        return out
+
+    fallback = _importance_top3(model)
+    for i in idx:
+        out[i] = list(fallback)
+    return out
+
+
+def explain_results(
+    results: list[PredictionResult],
+    features_list: list[dict[str, float]],
+    model: dict[str, Any] | None,
+    rows: Iterable[int],
+) -> list[PredictionResult]:
+    """Lazily fill ``shap_top3`` for the chosen *rows* of a batch.
+
+    ``predict_batch(..., explain=False)`` 후 실제로 표시/알림할 종목만
+    골라 설명을 붙일 때 사용한다 (결과 객체를 제자리에서 갱신).
+    """
+    rows = [i for i in rows if 0 <= i < len(results) and not results[i].shap_top3]
+    sub = (model.get("lgb") or model.get("xgb")) if model else None
+    if not rows or sub is None:
+        return results
+    X = np.array(
+        [[features_list[i].get(f, 0.0) for f in FEATURE_NAMES] for i in rows],
+        dtype=np.float32,
+    )
+    for i, top in zip(rows, explain_batch(sub, X)):
+        results[i].shap_top3 = top
+    return results
+
+
+def get_shap_explanation(
+    model: Any | None,
+    features: dict[str, float],
+) -> list[tuple[str, float]]:
+    """Return the top-3 most impactful features for a single prediction.
+
+    Uses a cached SHAP ``TreeExplainer`` when available; otherwise falls
+    back to the model's ``feature_importances_`` attribute.
+
+    Returns:
+        List of ``(feature_name, importance)`` tuples, length <= 3.
+    """
+    if model is None:
+        return []
+
+    X_single = np.array(
+        [[features.get(f, 0.0) for f in FEATURE_NAMES]],
+        dtype=np.float32,
+    )
+    return explain_batch(model, X_single)[0]
+
+
 # ---------------------------------------------------------------------------
 # Telegram formatting
 # ---------------------------------------------------------------------------
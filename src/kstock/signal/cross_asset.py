@@ -28,6 +28,8 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from kstock.core.advanced_risk import correlation_matrix
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,10 +170,26 @@ def compute_asset_correlations(
     results: List[AssetCorrelation] = []
     assets = sorted(returns_map.keys())
 
+    # Fast path: a gap-free aligned panel lets every window be a single
+    # N x N matrix product instead of N^2 pandas rolling correlations.
+    matrices: Dict[int, np.ndarray] = {}
+    panel = pd.DataFrame(returns_map)[assets]
+    if not panel.isna().to_numpy().any():
+        values = panel.to_numpy(dtype=np.float64)
+        nan_matrix = np.full((len(assets), len(assets)), np.nan)
+        for w in windows:
+            matrices[w] = (
+                correlation_matrix(values, window=w) if len(values) >= w else nan_matrix
+            )
+    index = {name: i for i, name in enumerate(assets)}
+
     for a, b in combinations(assets, 2):
         corrs: Dict[int, float] = {}
         for w in windows:
-            corrs[w] = _rolling_corr_last(returns_map[a], returns_map[b], w)
+            if matrices:
+                corrs[w] = float(matrices[w][index[a], index[b]])
+            else:
+                corrs[w] = _rolling_corr_last(returns_map[a], returns_map[b], w)
 
         c30 = corrs.get(30, np.nan)
         c90 = corrs.get(90, np.nan)
@@ -4,18 +4,31 @@ v9.4: 현재 차트 패턴을 과거 데이터와 비교하여
 "이 패턴이 과거 N번 나타났고, X% 확률로 Y일 후 Z% 변동" 인사이트 제공.
 
 DTW는 numpy만 사용하여 구현 (외부 라이브러리 불필요).
+
+- ``dtw_distances``: 쿼리 1개 vs 윈도우 N개를 한 번에 계산하는 벡터화 DP
+  (선택적으로 Sakoe-Chiba band).
+- ``PatternIndex``: 유니버스 전체 Parquet 이력의 정규화 윈도우 인덱스.
+  LB_Keogh 하한으로 후보를 거르고 남은 후보만 banded DTW로 정밀 계산해
+  "전 종목 10년 중 가장 비슷한 10개 구간"을 1초 안에 찾는다.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_INDEX_PATH = Path("data/pattern_index.npz")
+FORWARD_DAYS = (5, 10, 20)
+
 
 # ── 데이터 클래스 ────────────────────────────────────────────
 
@@ -28,6 +41,7 @@ class PatternMatch:
     forward_5d_return: float = 0.0
     forward_10d_return: float = 0.0
     forward_20d_return: float = 0.0
+    ticker: str = ""               # 유니버스 검색 시 매칭 종목 (단일 종목 검색은 "")
 
 
 @dataclass
@@ -48,21 +62,79 @@ class PatternReport:
 
 # ── DTW 구현 (numpy) ─────────────────────────────────────────
 
-def _dtw_distance(s1: np.ndarray, s2: np.ndarray) -> float:
-    """Dynamic Time Warping 거리 계산.
+def dtw_distances(
+    query: np.ndarray, windows: np.ndarray, band: Optional[int] = None,
+) -> np.ndarray:
+    """Dynamic Time Warping 거리 (|a-b| 비용), 쿼리 1개 vs 윈도우 여러 개.
 
-    O(n*m) 기본 구현. 20x20 윈도우에서 충분히 빠름.
-    """
-    n, m = len(s1), len(s2)
-    dtw = np.full((n + 1, m + 1), np.inf)
-    dtw[0, 0] = 0.0
+    DP 행을 윈도우 축으로 벡터화해 n*m 번의 배열 연산으로 끝낸다.
+
+    Args:
+        query: (n,) 쿼리 시리즈
+        windows: (W, m) 또는 (m,) 비교 시리즈
+        band: Sakoe-Chiba 반경 (|i-j| <= band). None이면 제약 없음.
 
+    Returns:
+        (W,) 거리 배열 (windows가 1차원이면 길이 1, 항상 float64)
+    """
+    q = np.asarray(query, dtype=np.float64)
+    w = np.atleast_2d(np.asarray(windows))
+    n, m = len(q), w.shape[1]
+    if band is not None:
+        band = max(int(band), abs(n - m))
+    # DP는 (m+1, W) 행렬로 두어 열 j 갱신이 연속 메모리 연산이 되게 한다.
+    # float32 윈도우(PatternIndex)는 float32로 계산해 메모리 대역폭을 아낀다.
+    dtype = np.float32 if w.dtype == np.float32 else np.float64
+    wt = np.ascontiguousarray(w.T, dtype=dtype)
+    q = q.astype(dtype)
+    prev = np.full((m + 1, w.shape[0]), np.inf, dtype=dtype)
+    prev[0] = 0.0
+    cur = np.full_like(prev, np.inf)
+    best = np.empty(w.shape[0], dtype=dtype)
     for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            cost = abs(s1[i - 1] - s2[j - 1])
-            dtw[i, j] = cost + min(dtw[i - 1, j], dtw[i, j - 1], dtw[i - 1, j - 1])
+        lo, hi = 1, m
+        if band is not None:
+            lo, hi = max(1, i - band), min(m, i + band)
+        cur[lo - 1] = np.inf
+        if hi < m:
+            cur[hi + 1] = np.inf
+        for j in range(lo, hi + 1):
+            np.minimum(prev[j], cur[j - 1], out=best)
+            np.minimum(best, prev[j - 1], out=best)
+            np.subtract(wt[j - 1], q[i - 1], out=cur[j])
+            np.abs(cur[j], out=cur[j])
+            cur[j] += best
+        prev, cur = cur, prev
+    return prev[m].astype(np.float64)
+
+
+def _dtw_distance(s1: np.ndarray, s2: np.ndarray) -> float:
+    """Dynamic Time Warping 거리 계산 (두 시리즈)."""
+    return float(dtw_distances(s1, s2)[0])
 
-    return float(dtw[n, m])
+
+def lb_keogh(query: np.ndarray, windows: np.ndarray, band: int) -> np.ndarray:
+    """LB_Keogh 하한: banded DTW(|a-b| 비용) 거리보다 항상 작거나 같다.
+
+    쿼리의 ±band 상·하한 envelope 밖으로 벗어난 만큼을 더하되, DTW 경로가
+    반드시 지나는 양 끝점은 envelope 대신 실제 차이를 쓴다 (LB_Kim 결합).
+    """
+    w = np.atleast_2d(windows)
+    q = np.asarray(query, dtype=w.dtype)
+    n = len(q)
+    idx = np.arange(n)
+    lo = np.clip(idx - band, 0, n - 1)
+    hi = np.clip(idx + band, 0, n - 1)
+    upper = np.array([q[a:b + 1].max() for a, b in zip(lo, hi)], dtype=w.dtype)
+    lower = np.array([q[a:b + 1].min() for a, b in zip(lo, hi)], dtype=w.dtype)
+    upper[[0, -1]] = q[[0, -1]]
+    lower[[0, -1]] = q[[0, -1]]
+    over = w - upper
+    np.maximum(over, 0, out=over)
+    under = lower - w
+    np.maximum(under, 0, out=under)
+    over += under
+    return over.sum(axis=1, dtype=np.float64)
 
 
 def _normalize_series(prices: np.ndarray) -> np.ndarray:
@@ -74,6 +146,30 @@ def _normalize_series(prices: np.ndarray) -> np.ndarray:
     return (prices - mn) / (mx - mn)
 
 
+def _normalize_windows(windows: np.ndarray) -> np.ndarray:
+    """(W, n) 윈도우를 행별 0~1 정규화 (``_normalize_series``의 벡터판)."""
+    mn = windows.min(axis=1, keepdims=True)
+    rng = windows.max(axis=1, keepdims=True) - mn
+    flat = rng < 1e-8
+    out = (windows - mn) / np.where(flat, 1.0, rng)
+    out[flat[:, 0]] = 0.0
+    return out
+
+
+def _sliding_windows(closes: np.ndarray, lookback: int, count: int) -> np.ndarray:
+    """closes[i:i+lookback] for i in range(count), as a (count, lookback) view."""
+    return np.lib.stride_tricks.sliding_window_view(closes, lookback)[:count]
+
+
+def _forward_returns(closes: np.ndarray, end_idx: np.ndarray, days: int) -> np.ndarray:
+    """end_idx 이후 days일 수익률 (범위 밖/비정상 가격은 0)."""
+    fut = end_idx + days
+    ok = (fut < len(closes)) & (closes[end_idx] > 0)
+    out = np.zeros(len(end_idx))
+    out[ok] = (closes[fut[ok]] - closes[end_idx[ok]]) / closes[end_idx[ok]]
+    return out
+
+
 # ── 패턴 매칭 엔진 ───────────────────────────────────────────
 
 class PatternMatcher:
@@ -131,61 +227,77 @@ class PatternMatcher:
             return report
 
         report.total_windows = total_windows
-        distances = []
-
-        for i in range(total_windows):
-            window = _normalize_series(closes[i : i + lb])
-            dist = _dtw_distance(current, window)
-            distances.append((i, dist))
+        windows = _normalize_windows(_sliding_windows(closes, lb, total_windows))
+        distances = dtw_distances(current, windows)
 
         # DTW 거리를 유사도(0~1)로 변환
-        if not distances:
-            return report
-
-        max_dist = max(d for _, d in distances) or 1.0
-        similarities = [
-            (idx, 1.0 - dist / max_dist)
-            for idx, dist in distances
-        ]
+        max_dist = distances.max() or 1.0
+        sims = 1.0 - distances / max_dist
 
-        # 유사도 상위 top_k 선택
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_matches = [
-            (idx, sim) for idx, sim in similarities[:self.top_k]
-            if sim >= self.min_similarity
-        ]
+        # 유사도 상위 top_k 선택 (동점은 앞선 윈도우 우선)
+        order = np.argsort(-sims, kind="stable")[: self.top_k]
+        top = order[sims[order] >= self.min_similarity]
+        end_idx = top + lb - 1
+        fwd = {d: _forward_returns(closes, end_idx, d) for d in FORWARD_DAYS}
 
         matches = []
-        for idx, sim in top_matches:
-            end_idx = idx + lb - 1
-            # forward returns
-            fr_5d = self._forward_return(closes, end_idx, 5)
-            fr_10d = self._forward_return(closes, end_idx, 10)
-            fr_20d = self._forward_return(closes, end_idx, 20)
-
-            match_date = str(dates[idx]) if idx < len(dates) else ""
-            match_end = str(dates[end_idx]) if end_idx < len(dates) else ""
-
+        for k, idx in enumerate(top):
+            match_date = str(dates[idx])
+            match_end = str(dates[end_idx[k]])
             matches.append(PatternMatch(
                 match_date=match_date[:10],  # YYYY-MM-DD
                 match_end_date=match_end[:10],
-                similarity=round(sim, 3),
-                forward_5d_return=round(fr_5d, 4),
-                forward_10d_return=round(fr_10d, 4),
-                forward_20d_return=round(fr_20d, 4),
+                similarity=round(float(sims[idx]), 3),
+                forward_5d_return=round(float(fwd[5][k]), 4),
+                forward_10d_return=round(float(fwd[10][k]), 4),
+                forward_20d_return=round(float(fwd[20][k]), 4),
             ))
 
         report.matches = matches
+        _fill_stats(report)
+        return report
+
+    def find_best(self, ohlcv: pd.DataFrame, ticker: str = "") -> PatternReport:
+        """유니버스 인덱스가 있으면 전 종목 검색, 없으면 자기 이력 검색."""
+        index = get_pattern_index()
+        if index is not None and len(index):
+            report = self.find_similar_across_universe(ohlcv, index, ticker=ticker)
+            if report.matches:
+                return report
+        report = self.find_similar_patterns(ohlcv)
+        report.ticker = ticker
+        return report
 
-        # 통계 산출
-        if matches:
-            report.avg_5d_return = np.mean([m.forward_5d_return for m in matches])
-            report.avg_10d_return = np.mean([m.forward_10d_return for m in matches])
-            report.avg_20d_return = np.mean([m.forward_20d_return for m in matches])
-            report.positive_5d_pct = sum(1 for m in matches if m.forward_5d_return > 0) / len(matches) * 100
-            report.positive_10d_pct = sum(1 for m in matches if m.forward_10d_return > 0) / len(matches) * 100
-            report.positive_20d_pct = sum(1 for m in matches if m.forward_20d_return > 0) / len(matches) * 100
+    def find_similar_across_universe(
+        self,
+        ohlcv: pd.DataFrame,
+        index: "PatternIndex",
+        ticker: str = "",
+    ) -> PatternReport:
+        """최근 lookback일 패턴을 유니버스 인덱스 전체에서 검색.
 
+        *ticker*를 주면 그 종목의 현재 구간과 겹치는 윈도우는 제외한다.
+        """
+        report = PatternReport(ticker=ticker)
+        if ohlcv is None or ohlcv.empty or "close" not in ohlcv.columns:
+            return report
+        closes = ohlcv["close"].values.astype(float)
+        lb = index.lookback
+        if len(closes) < lb:
+            return report
+        dates = ohlcv["date"].astype(str).values if "date" in ohlcv.columns else None
+        exclude_from = dates[-lb][:10] if dates is not None else None
+        if dates is not None:
+            report.current_window = f"{dates[-lb]}~{dates[-1]}"
+        report.total_windows = len(index)
+        report.matches = [
+            m for m in index.search(
+                closes[-lb:], k=self.top_k,
+                exclude_ticker=ticker or None, exclude_from=exclude_from,
+            )
+            if m.similarity >= self.min_similarity
+        ]
+        _fill_stats(report)
         return report
 
     def _forward_return(self, closes: np.ndarray, end_idx: int, days: int) -> float:
@@ -227,6 +339,277 @@ class PatternMatcher:
         return " / ".join(lines) if lines else ""
 
 
+def _fill_stats(report: PatternReport) -> None:
+    """매칭 목록으로 평균 수익률/상승 확률 통계 산출."""
+    matches = report.matches
+    if not matches:
+        return
+    report.avg_5d_return = np.mean([m.forward_5d_return for m in matches])
+    report.avg_10d_return = np.mean([m.forward_10d_return for m in matches])
+    report.avg_20d_return = np.mean([m.forward_20d_return for m in matches])
+    report.positive_5d_pct = sum(1 for m in matches if m.forward_5d_return > 0) / len(matches) * 100
+    report.positive_10d_pct = sum(1 for m in matches if m.forward_10d_return > 0) / len(matches) * 100
+    report.positive_20d_pct = sum(1 for m in matches if m.forward_20d_return > 0) / len(matches) * 100
+
+
+# ── 유니버스 패턴 인덱스 ─────────────────────────────────────
+
+class PatternIndex:
+    """전 종목 정규화 윈도우 인덱스 (LB_Keogh + banded DTW 검색).
+
+    윈도우는 ``step``일 간격으로 잘라 float32로 보관한다 (2,000종목 × 10년,
+    step=5 기준 약 100만 윈도우 / 80MB).  ``save``/``load``로 .npz 한 파일에
+    저장한다.
+    """
+
+    def __init__(
+        self,
+        windows: np.ndarray,
+        tickers: np.ndarray,
+        ticker_idx: np.ndarray,
+        start_dates: np.ndarray,
+        end_dates: np.ndarray,
+        forward: np.ndarray,
+        lookback: int = 20,
+        step: int = 5,
+        band: int = 2,
+        built_at: str = "",
+    ) -> None:
+        self.windows = windows                # (W, lookback) float32, 0~1 정규화
+        self.tickers = tickers                # (T,) 종목코드
+        self.ticker_idx = ticker_idx          # (W,) int32 → tickers
+        self.start_dates = start_dates        # (W,) 'YYYY-MM-DD'
+        self.end_dates = end_dates            # (W,)
+        self.forward = forward                # (W, 3) float32: 5/10/20일 수익률
+        self.lookback = lookback
+        self.step = step
+        self.band = band
+        self.built_at = built_at
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+    # ── 빌드 ────────────────────────────────────────────────
+    @classmethod
+    def from_closes(
+        cls,
+        closes: dict[str, pd.Series],
+        lookback: int = 20,
+        step: int = 5,
+        band: int = 2,
+    ) -> "PatternIndex":
+        """{ticker: close Series (index=date str)} → 인덱스.
+
+        forward 20일 수익률을 계산할 수 있는 윈도우만 넣는다.
+        """
+        max_fwd = max(FORWARD_DAYS)
+        tickers = sorted(closes)
+        parts: dict[str, list] = {k: [] for k in ("w", "t", "s", "e", "f")}
+        for ti, ticker in enumerate(tickers):
+            s = closes[ticker].dropna()
+            c = s.to_numpy(dtype=np.float64)
+            count = len(c) - lookback - max_fwd + 1
+            if count <= 0:
+                continue
+            starts = np.arange(0, count, step)
+            raw = np.lib.stride_tricks.sliding_window_view(c, lookback)[starts]
+            ends = starts + lookback - 1
+            dates = np.asarray(s.index.astype(str))
+            parts["w"].append(_normalize_windows(raw).astype(np.float32))
+            parts["t"].append(np.full(len(starts), ti, dtype=np.int32))
+            parts["s"].append(dates[starts])
+            parts["e"].append(dates[ends])
+            parts["f"].append(np.stack(
+                [_forward_returns(c, ends, d) for d in FORWARD_DAYS], axis=1,
+            ).astype(np.float32))
+        if not parts["w"]:
+            empty = np.empty((0, lookback), dtype=np.float32)
+            return cls(empty, np.array(tickers, dtype=str), np.empty(0, np.int32),
+                       np.empty(0, dtype=str), np.empty(0, dtype=str),
+                       np.empty((0, len(FORWARD_DAYS)), np.float32), lookback, step, band)
+        return cls(
+            windows=np.concatenate(parts["w"]),
+            tickers=np.array(tickers, dtype=str),
+            ticker_idx=np.concatenate(parts["t"]),
+            start_dates=np.concatenate(parts["s"]).astype(str),
+            end_dates=np.concatenate(parts["e"]).astype(str),
+            forward=np.concatenate(parts["f"]),
+            lookback=lookback, step=step, band=band,
+            built_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+    @classmethod
+    def build(
+        cls,
+        lake=None,
+        tickers: Iterable[str] | None = None,
+        years: int = 10,
+        lookback: int = 20,
+        step: int = 5,
+        band: int = 2,
+    ) -> "PatternIndex":
+        """Parquet lake에서 최근 *years*년 종가를 한 번에 읽어 인덱스 생성."""
+        if lake is None:
+            from kstock.store.parquet_store import ParquetStore
+            lake = ParquetStore()
+        tickers = list(tickers) if tickers is not None else lake.list_tickers()
+        start = (datetime.now() - timedelta(days=int(years * 365.25))).strftime("%Y-%m-%d")
+        panel = lake.load_panel(tickers, start=start, columns=["close"])
+        closes = {
+            str(t): pd.Series(g["close"].to_numpy(dtype=float), index=g["date"].to_numpy())
+            for t, g in panel.groupby("ticker", sort=False)
+        }
+        index = cls.from_closes(closes, lookback=lookback, step=step, band=band)
+        logger.info(
+            "pattern index built: %d windows, %d tickers (lookback=%d step=%d)",
+            len(index), len(closes), lookback, step,
+        )
+        return index
+
+    # ── 저장 ────────────────────────────────────────────────
+    def save(self, path: Path = DEFAULT_INDEX_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "lookback": self.lookback, "step": self.step,
+            "band": self.band, "built_at": self.built_at,
+        }
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp, windows=self.windows, tickers=self.tickers, ticker_idx=self.ticker_idx,
+            start_dates=self.start_dates, end_dates=self.end_dates, forward=self.forward,
+            meta=np.array(json.dumps(meta)),
+        )
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDEX_PATH) -> Optional["PatternIndex"]:
+        path = Path(path)
+        if not path.exists():
+            return None
+        with np.load(path, allow_pickle=False) as z:
+            meta = json.loads(str(z["meta"]))
+            return cls(
+                windows=z["windows"], tickers=z["tickers"], ticker_idx=z["ticker_idx"],
+                start_dates=z["start_dates"], end_dates=z["end_dates"], forward=z["forward"],
+                **meta,
+            )
+
+    # ── 검색 ────────────────────────────────────────────────
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude_ticker: str | None = None,
+        exclude_from: str | None = None,
+        chunk: int = 2048,
+    ) -> list[PatternMatch]:
+        """가장 가까운 k개 윈도우 (종목당 겹치는 구간은 1개만).
+
+        LB_Keogh 하한이 가장 작은 ``chunk``개를 먼저 정밀 DTW 계산해 임계
+        거리를 정하고, 하한이 그 임계값 이하인 후보만 추가로 계산한다
+        (하한 > 임계값인 윈도우는 정답 후보가 될 수 없으므로 결과는 전수
+        검색과 같다).
+
+        유사도 = 1 - 거리/lookback (0 하한).  정규화된 시리즈에서 스텝당
+        비용이 최대 1이므로 lookback이 자연스러운 스케일이다.
+
+        Args:
+            query: 최근 lookback일 종가 (정규화 전)
+            exclude_ticker/exclude_from: 이 종목의 이 날짜 이후로 끝나는
+                윈도우는 제외 (현재 구간과의 자기 매칭 방지)
+        """
+        if len(self) == 0:
+            return []
+        q = _normalize_series(np.asarray(query, dtype=np.float64)[-self.lookback:])
+        lb = lb_keogh(q, self.windows, self.band)
+        if exclude_ticker is not None:
+            hit = np.nonzero(self.tickers == exclude_ticker)[0]
+            if len(hit):
+                mask = self.ticker_idx == hit[0]
+                if exclude_from:
+                    mask &= self.end_dates >= exclude_from
+                lb[mask] = np.inf
+
+        # 같은 종목의 겹치는 윈도우가 top-k를 채우지 않도록 여유 있게 후보를 둔다
+        overlap = -(-self.lookback // max(self.step, 1))
+        keep = k * overlap
+        finite = np.nonzero(np.isfinite(lb))[0]
+        if len(finite) == 0:
+            return []
+        dist = np.full(len(lb), np.nan)  # 정밀 DTW 거리 (nan = 아직 계산 안 함)
+
+        def _compute(idx: np.ndarray) -> None:
+            idx = idx[np.isnan(dist[idx])]
+            if len(idx):
+                dist[idx] = dtw_distances(q, self.windows[idx], band=self.band)
+
+        while True:
+            # 1) 하한이 가장 작은 max(chunk, keep)개를 정밀 계산해 keep번째 거리(임계값)를 얻고
+            n_seed = min(max(chunk, keep), len(finite))
+            _compute(finite[np.argpartition(lb[finite], n_seed - 1)[:n_seed]])
+            done = finite[~np.isnan(dist[finite])]
+            thr = np.partition(dist[done], min(keep, len(done)) - 1)[min(keep, len(done)) - 1]
+            # 2) 하한이 임계값 이하인 나머지만 한 번 더 계산 (하한 > 임계값은 top 불가)
+            _compute(finite[lb[finite] <= thr])
+            done = finite[~np.isnan(dist[finite])]
+            top = done[np.argsort(dist[done], kind="stable")[:keep]]
+            matches = self._distinct_matches(top, dist[top], k)
+            # 겹침 제거로 k개가 안 되면 후보 풀을 두 배로 넓혀 다시 고른다
+            if len(matches) >= k or keep >= len(finite):
+                return matches
+            keep *= 2
+
+    def _distinct_matches(
+        self, best_idx: np.ndarray, best_dist: np.ndarray, k: int,
+    ) -> list[PatternMatch]:
+        """거리순 후보에서 종목당 겹치지 않는 윈도우만 최대 k개."""
+        matches: list[PatternMatch] = []
+        taken: dict[int, list[int]] = {}
+        for i, dist in zip(best_idx, best_dist):
+            t = int(self.ticker_idx[i])
+            # 같은 종목의 겹치는 구간은 가장 가까운 것 하나만
+            if any(abs(int(i) - j) * self.step < self.lookback for j in taken.get(t, [])):
+                continue
+            taken.setdefault(t, []).append(int(i))
+            f5, f10, f20 = (float(x) for x in self.forward[i])
+            matches.append(PatternMatch(
+                match_date=str(self.start_dates[i])[:10],
+                match_end_date=str(self.end_dates[i])[:10],
+                similarity=round(max(0.0, 1.0 - float(dist) / self.lookback), 3),
+                forward_5d_return=round(f5, 4),
+                forward_10d_return=round(f10, 4),
+                forward_20d_return=round(f20, 4),
+                ticker=str(self.tickers[t]),
+            ))
+            if len(matches) >= k:
+                break
+        return matches
+
+
+_index_cache: dict[str, tuple[float, Optional[PatternIndex]]] = {}
+
+
+def get_pattern_index(path: Path = DEFAULT_INDEX_PATH) -> Optional[PatternIndex]:
+    """디스크 인덱스를 한 번만 로드 (파일이 바뀌면 다시 로드). 없으면 None."""
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    key = str(path)
+    cached = _index_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        try:
+            cached = (mtime, PatternIndex.load(path))
+        except Exception:
+            logger.warning("pattern index load failed: %s", path, exc_info=True)
+            cached = (mtime, None)
+        _index_cache[key] = cached
+    return cached[1]
+
+
 # ── 포맷팅 ───────────────────────────────────────────────────
 
 def format_pattern_report(report: PatternReport) -> str:
@@ -252,7 +635,7 @@ def format_pattern_report(report: PatternReport) -> str:
     lines.append("상위 유사 패턴:")
     for i, m in enumerate(report.matches[:3], 1):
         lines.append(
-            f"  {i}. {m.match_date}~{m.match_end_date} "
+            f"  {i}. {m.ticker + ' ' if m.ticker else ''}{m.match_date}~{m.match_end_date} "
             f"(유사도 {m.similarity:.0%}) → "
             f"5일 {m.forward_5d_return:+.1%}, "
             f"20일 {m.forward_20d_return:+.1%}"
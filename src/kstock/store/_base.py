@@ -11,6 +11,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Generator, TypeVar
 
+from kstock.store._pool import DEFAULT_MAX_READERS, SQLitePool
+from kstock.store._write_buffer import WriteBuffer
+
 T = TypeVar("T")
 
 
@@ -1499,6 +1502,18 @@ CREATE TABLE IF NOT EXISTS market_regime (
 
 CREATE INDEX IF NOT EXISTS idx_market_regime_date
     ON market_regime(date);
+
+-- v14: 로컬 일봉 저장소 (수집기가 받은 봉을 증분 upsert, get_ohlcv/get_close_panel)
+CREATE TABLE IF NOT EXISTS daily_bars (
+    ticker  TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    open    REAL DEFAULT 0,
+    high    REAL DEFAULT 0,
+    low     REAL DEFAULT 0,
+    close   REAL NOT NULL,
+    volume  REAL DEFAULT 0,
+    PRIMARY KEY (ticker, date)
+) WITHOUT ROWID;
 """
 
 
@@ -1506,10 +1521,14 @@ class StoreBase:
     """DB 연결, 스키마 초기화, job_runs 메서드를 제공하는 기반 클래스."""
 
     _thread_pool: ThreadPoolExecutor | None = None
+    # 읽기 풀 크기와 맞춰 executor 스레드가 reader를 기다리며 놀지 않게 한다
+    _executor_workers: int = DEFAULT_MAX_READERS
 
     def __init__(self, db_path: Path = DEFAULT_DB_PATH) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLitePool(self.db_path)
+        self._writes = WriteBuffer(self._pool)
         self._init_schema()
 
     # ── async executor (동기 DB 호출을 이벤트루프 블로킹 없이 실행) ──
@@ -1523,7 +1542,7 @@ class StoreBase:
         """
         if StoreBase._thread_pool is None:
             StoreBase._thread_pool = ThreadPoolExecutor(
-                max_workers=2, thread_name_prefix="db"
+                max_workers=StoreBase._executor_workers, thread_name_prefix="db"
             )
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
@@ -1532,14 +1551,34 @@ class StoreBase:
 
     @contextmanager
     def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        try:
+        """쓰기용 연결 (풀의 단일 writer). 종료 시 commit, 예외 시 rollback."""
+        with self._pool.write() as conn:
+            yield conn
+
+    @contextmanager
+    def _read(self) -> Generator[sqlite3.Connection, None, None]:
+        """읽기 전용 연결 (reader 풀). SELECT만 하는 조회 메서드용."""
+        with self._pool.read() as conn:
             yield conn
-            conn.commit()
-        finally:
-            conn.close()
+
+    def _defer_write(self, sql: str, rows: list[tuple]) -> None:
+        """고빈도 INSERT를 write-behind 버퍼에 넣는다 (executemany로 일괄 flush)."""
+        self._writes.add_many(sql, rows)
+
+    def flush_writes(self) -> int:
+        """버퍼에 쌓인 쓰기를 즉시 기록. 기록한 행 수 반환."""
+        return self._writes.flush()
+
+    def pool_stats(self) -> dict:
+        """연결 풀 지표 (대기/점유 시간, 체크아웃 수) — 헬스체크용."""
+        stats = self._pool.stats()
+        stats["write_buffer"] = self._writes.stats()
+        return stats
+
+    def close(self) -> None:
+        """버퍼를 flush 하고 풀의 모든 연결을 닫는다."""
+        self._writes.close()
+        self._pool.close()
 
     def _init_schema(self) -> None:
         with self._connect() as conn:
@@ -1710,7 +1749,7 @@ class StoreBase:
             )
 
     def get_last_job_run(self, job_name: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM job_runs WHERE job_name=? ORDER BY run_date DESC LIMIT 1",
                 (job_name,),
@@ -1719,7 +1758,7 @@ class StoreBase:
 
     def get_job_runs(self, run_date: str) -> list[dict]:
         """특정 날짜의 모든 잡 실행 기록 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM job_runs WHERE run_date=? ORDER BY started_at DESC",
                 (run_date,),
@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import json
 import logging
-import sqlite3
 from datetime import datetime, timedelta
 
 from kstock.core.tz import KST
@@ -42,7 +41,7 @@ class DebateMixin:
             inserted row id
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cur = conn.execute(
                     """INSERT OR REPLACE INTO ai_debates
                     (ticker, name, verdict, confidence, consensus_level,
@@ -116,8 +115,7 @@ class DebateMixin:
     def get_latest_debate(self, ticker: str) -> dict | None:
         """최신 토론 결과 조회."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 row = conn.execute(
                     """SELECT * FROM ai_debates
                     WHERE ticker = ?
@@ -138,8 +136,7 @@ class DebateMixin:
         """종목 토론 이력 조회."""
         try:
             cutoff = (datetime.now(KST) - timedelta(days=days)).strftime("%Y-%m-%d")
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 rows = conn.execute(
                     """SELECT id, ticker, name, verdict, confidence,
                               consensus_level, price_target, stop_loss,
@@ -163,8 +160,7 @@ class DebateMixin:
         """최근 N시간 내 모든 토론 결과 조회."""
         try:
             cutoff = (datetime.now(KST) - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 rows = conn.execute(
                     """SELECT id, ticker, name, verdict, confidence,
                               consensus_level, price_target, stop_loss, created_at
@@ -194,7 +190,7 @@ class DebateMixin:
         """예측 정확도 결과 저장."""
         try:
             now = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     """INSERT INTO debate_accuracy
                     (debate_id, ticker, predicted_verdict, predicted_target,
@@ -218,8 +214,7 @@ class DebateMixin:
         """
         try:
             cutoff = (datetime.now(KST) - timedelta(days=min_age_days)).strftime("%Y-%m-%d")
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 rows = conn.execute(
                     """SELECT d.id, d.ticker, d.verdict, d.price_target,
                               d.confidence, d.created_at
@@ -243,8 +238,7 @@ class DebateMixin:
         """
         try:
             cutoff = (datetime.now(KST) - timedelta(days=days)).strftime("%Y-%m-%d")
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._read() as conn:
                 rows = conn.execute(
                     """SELECT a.predicted_verdict, a.predicted_target,
                               a.actual_price_5d, a.actual_price_10d,
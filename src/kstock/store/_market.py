@@ -119,7 +119,7 @@ class MarketMixin:
             return None
 
     def get_recent_reports(self, limit: int = 10, ticker: str = "") -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             if ticker:
                 rows = conn.execute(
                     "SELECT * FROM reports WHERE ticker=? ORDER BY date DESC LIMIT ?",
@@ -138,7 +138,7 @@ class MarketMixin:
         if not tickers:
             return []
         placeholders = ",".join("?" for _ in tickers)
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 f"SELECT * FROM reports WHERE ticker IN ({placeholders}) "
                 "ORDER BY date DESC LIMIT ?",
@@ -148,7 +148,7 @@ class MarketMixin:
 
     def get_reports_target_upgrades(self, days: int = 7, limit: int = 10) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """SELECT * FROM reports
                    WHERE date >= ? AND target_price > 0 AND prev_target_price > 0
@@ -161,7 +161,7 @@ class MarketMixin:
 
     def get_reports_target_downgrades(self, days: int = 7, limit: int = 10) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """SELECT * FROM reports
                    WHERE date >= ? AND target_price > 0 AND prev_target_price > 0
@@ -177,7 +177,7 @@ class MarketMixin:
             return []
         conditions = " OR ".join("title LIKE ?" for _ in keywords)
         params = [f"%{kw}%" for kw in keywords]
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 f"SELECT * FROM reports WHERE ({conditions}) ORDER BY date DESC LIMIT ?",
                 (*params, limit),
@@ -186,7 +186,7 @@ class MarketMixin:
 
     def get_reports_today(self, limit: int = 10) -> list[dict]:
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM reports WHERE date=? ORDER BY created_at DESC LIMIT ?",
                 (today, limit),
@@ -224,7 +224,7 @@ class MarketMixin:
             )
 
     def get_consensus(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM consensus WHERE ticker=?", (ticker,)
             ).fetchone()
@@ -256,7 +256,7 @@ class MarketMixin:
             return cursor.lastrowid
 
     def get_earnings(self, ticker: str, limit: int = 4) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM earnings WHERE ticker=? ORDER BY created_at DESC LIMIT ?",
                 (ticker, limit),
@@ -292,7 +292,7 @@ class MarketMixin:
                 )
 
     def get_financials(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM financials WHERE ticker=? ORDER BY created_at DESC LIMIT 1",
                 (ticker,),
@@ -332,58 +332,215 @@ class MarketMixin:
             logger.warning("add_supply_demand failed: %s", ticker, exc_info=True)
             return None
 
+    _SUPPLY_DEMAND_UPSERT = """
+        INSERT INTO supply_demand
+            (ticker, date, foreign_net, institution_net, retail_net,
+             program_net, short_balance, short_ratio, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(ticker, date) DO UPDATE SET
+            foreign_net = excluded.foreign_net,
+            institution_net = excluded.institution_net,
+            retail_net = excluded.retail_net,
+            created_at = excluded.created_at
+    """
+
     def bulk_save_supply_demand(self, ticker: str, rows: list[dict]) -> int:
         """투자자별 매매동향 일괄 저장.
 
+        스캔 중 종목마다 호출되므로 write-behind 버퍼에 넣고
+        여러 종목을 한 트랜잭션으로 모아 기록한다.
+
         Args:
             ticker: 종목코드
             rows: [{date, foreign_net, institution_net, ...}, ...]
 
         Returns:
-            저장된 행 수
+            저장(대기열 등록)된 행 수
         """
         now = datetime.utcnow().isoformat()
-        saved = 0
         try:
-            with self._connect() as conn:
-                for r in rows:
-                    conn.execute(
-                        """
-                        INSERT INTO supply_demand
-                            (ticker, date, foreign_net, institution_net, retail_net,
-                             program_net, short_balance, short_ratio, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(ticker, date) DO UPDATE SET
-                            foreign_net = excluded.foreign_net,
-                            institution_net = excluded.institution_net,
-                            retail_net = excluded.retail_net,
-                            created_at = excluded.created_at
-                        """,
-                        (
-                            ticker,
-                            r.get("date", ""),
-                            r.get("foreign_net", 0),
-                            r.get("institution_net", 0),
-                            r.get("retail_net", 0),
-                            r.get("program_net", 0),
-                            r.get("short_balance", 0),
-                            r.get("short_ratio", 0),
-                            now,
-                        ),
-                    )
-                    saved += 1
+            params = [
+                (
+                    ticker,
+                    r.get("date", ""),
+                    r.get("foreign_net", 0),
+                    r.get("institution_net", 0),
+                    r.get("retail_net", 0),
+                    r.get("program_net", 0),
+                    r.get("short_balance", 0),
+                    r.get("short_ratio", 0),
+                    now,
+                )
+                for r in rows
+            ]
+            self._defer_write(self._SUPPLY_DEMAND_UPSERT, params)
         except Exception:
             logger.warning("bulk_save_supply_demand failed: %s", ticker, exc_info=True)
-        return saved
+            return 0
+        return len(params)
 
     def get_supply_demand(self, ticker: str, days: int = 20) -> list[dict]:
+        """최근 ``days`` 일 수급 (최신 날짜 먼저).
+
+        write-behind 버퍼에 남은 이 종목 행은 flush 하지 않고 DB 결과 위에
+        upsert 규칙대로 겹친다 (스캔 중 저장 직후 조회가 커밋을 강제하지 않게).
+        """
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        pending = self._writes.pending_rows(
+            self._SUPPLY_DEMAND_UPSERT, lambda r: r[0] == ticker and r[1] >= cutoff,
+        )
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM supply_demand WHERE ticker=? AND date >= ? ORDER BY date DESC",
                 (ticker, cutoff),
             ).fetchall()
-        return [dict(r) for r in rows]
+        if not pending:
+            return [dict(r) for r in rows]
+
+        by_date = {r["date"]: dict(r) for r in rows}
+        for _, date, f_net, i_net, r_net, p_net, s_bal, s_ratio, created in pending:
+            row = by_date.get(date)
+            if row is None:
+                by_date[date] = {
+                    "id": None, "ticker": ticker, "date": date,
+                    "foreign_net": f_net, "institution_net": i_net, "retail_net": r_net,
+                    "program_net": p_net, "short_balance": s_bal, "short_ratio": s_ratio,
+                    "created_at": created,
+                }
+            else:
+                # ON CONFLICT 에서 갱신되는 컬럼만 덮어쓴다
+                row.update(
+                    foreign_net=f_net, institution_net=i_net,
+                    retail_net=r_net, created_at=created,
+                )
+        return sorted(by_date.values(), key=lambda r: r["date"], reverse=True)
+
+    # -- daily_bars (v14) ------------------------------------------------------
+
+    _DAILY_BAR_UPSERT = """
+        INSERT INTO daily_bars (ticker, date, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(ticker, date) DO UPDATE SET
+            open = excluded.open,
+            high = excluded.high,
+            low = excluded.low,
+            close = excluded.close,
+            volume = excluded.volume
+    """
+
+    def save_daily_bars(self, ticker: str, bars) -> int:
+        """일봉 upsert (write-behind 버퍼 경유).
+
+        수집기가 받은 봉을 그대로 넘기면 된다: ``date`` 컬럼 또는
+        DatetimeIndex를 가진 DataFrame (컬럼 대소문자 무관, yfinance
+        ``Open/High/...`` 도 가능) 또는 ``[{date, open, ..., close}, ...]``.
+        종가가 없거나 0 이하인 행은 건너뛴다.
+
+        Returns:
+            저장(대기열 등록)된 행 수
+        """
+        if bars is None:
+            return 0
+        try:
+            if hasattr(bars, "to_dict"):
+                if getattr(bars, "empty", False):
+                    return 0
+                df = bars.rename(columns=lambda c: str(c).lower())
+                if "date" not in df.columns:
+                    df = df.reset_index()
+                    df = df.rename(columns={df.columns[0]: "date"})
+                records = df.to_dict("records")
+            else:
+                records = list(bars)
+            params = []
+            for r in records:
+                close = r.get("close")
+                if close is None or close != close or close <= 0:
+                    continue
+                date = str(r.get("date", ""))[:10]
+                if not date:
+                    continue
+                row = [ticker, date]
+                for col in ("open", "high", "low"):
+                    v = r.get(col)
+                    row.append(float(v) if v is not None and v == v else float(close))
+                v = r.get("volume")
+                row.extend([float(close), float(v) if v is not None and v == v else 0.0])
+                params.append(tuple(row))
+            if params:
+                self._defer_write(self._DAILY_BAR_UPSERT, params)
+        except Exception:
+            logger.warning("save_daily_bars failed: %s", ticker, exc_info=True)
+            return 0
+        return len(params)
+
+    def get_ohlcv(self, ticker: str, days: int = 120) -> list[dict]:
+        """최근 ``days`` 개 일봉 (오래된 날짜 → 최신 순).
+
+        Returns:
+            [{date, open, high, low, close, volume}, ...] — 없으면 빈 리스트
+        """
+        self.flush_writes()
+        with self._read() as conn:
+            rows = conn.execute(
+                "SELECT date, open, high, low, close, volume FROM daily_bars "
+                "WHERE ticker=? ORDER BY date DESC LIMIT ?",
+                (ticker, int(days)),
+            ).fetchall()
+        return [dict(r) for r in reversed(rows)]
+
+    def get_ohlcv_df(self, ticker: str, days: int = 120):
+        """get_ohlcv()의 DataFrame 버전 (``date`` 컬럼 + OHLCV, 날짜 오름차순)."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.get_ohlcv(ticker, days),
+            columns=["date", "open", "high", "low", "close", "volume"],
+        )
+
+    def get_close_panel(self, tickers: list[str], days: int = 120):
+        """여러 종목 종가 패널 (index=날짜 DatetimeIndex, columns=종목).
+
+        대상 종목들에 걸친 최근 ``days`` 거래일만 읽는다.  봉이 없는 날은
+        NaN, 로컬 봉이 하나도 없는 종목은 컬럼에서 빠진다.
+        """
+        import pandas as pd
+
+        tickers = list(dict.fromkeys(t for t in tickers if t))
+        if not tickers:
+            return pd.DataFrame()
+        self.flush_writes()
+        marks = ",".join("?" * len(tickers))
+        with self._read() as conn:
+            cutoff = conn.execute(
+                f"SELECT MIN(date) FROM (SELECT DISTINCT date FROM daily_bars "
+                f"WHERE ticker IN ({marks}) ORDER BY date DESC LIMIT ?)",
+                (*tickers, int(days)),
+            ).fetchone()[0]
+            if cutoff is None:
+                return pd.DataFrame()
+            rows = conn.execute(
+                f"SELECT ticker, date, close FROM daily_bars "
+                f"WHERE ticker IN ({marks}) AND date >= ?",
+                (*tickers, cutoff),
+            ).fetchall()
+        long = pd.DataFrame([tuple(r) for r in rows], columns=["ticker", "date", "close"])
+        panel = long.pivot(index="date", columns="ticker", values="close").sort_index()
+        panel.index = pd.to_datetime(panel.index)
+        panel.columns.name = None
+        return panel[[t for t in tickers if t in panel.columns]]
+
+    def get_daily_bar_range(self, ticker: str) -> tuple[str, str, int] | None:
+        """로컬 일봉의 (첫 날짜, 마지막 날짜, 봉 수). 없으면 None."""
+        self.flush_writes()
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT MIN(date), MAX(date), COUNT(*) FROM daily_bars WHERE ticker=?",
+                (ticker,),
+            ).fetchone()
+        if not row or not row[2]:
+            return None
+        return row[0], row[1], int(row[2])
 
     # -- dart_events (v3.10) ---------------------------------------------------
 
@@ -406,7 +563,7 @@ class MarketMixin:
             return None
 
     def get_dart_events(self, ticker: str, date: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM dart_events WHERE ticker=? AND date=? ORDER BY created_at DESC",
                 (ticker, date),
@@ -432,7 +589,7 @@ class MarketMixin:
             return cursor.lastrowid
 
     def get_macro_events(self, start_date: str, end_date: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM macro_events WHERE date >= ? AND date <= ? ORDER BY date",
                 (start_date, end_date),
@@ -466,7 +623,7 @@ class MarketMixin:
 
     def get_short_selling(self, ticker: str, days: int = 60) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM short_selling WHERE ticker=? AND date >= ? ORDER BY date",
                 (ticker, cutoff),
@@ -474,7 +631,7 @@ class MarketMixin:
         return [dict(r) for r in rows]
 
     def get_short_selling_latest(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM short_selling WHERE ticker=? ORDER BY date DESC LIMIT 1",
                 (ticker,),
@@ -483,7 +640,7 @@ class MarketMixin:
 
     def get_overheated_shorts(self, min_ratio: float = 20.0, days: int = 7) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM short_selling
@@ -520,7 +677,7 @@ class MarketMixin:
 
     def get_inverse_etf(self, ticker: str, days: int = 20) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM inverse_etf WHERE ticker=? AND date >= ? ORDER BY date",
                 (ticker, cutoff),
@@ -529,7 +686,7 @@ class MarketMixin:
 
     def get_inverse_etf_by_sector(self, sector: str, days: int = 20) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM inverse_etf WHERE sector=? AND date >= ? ORDER BY date",
                 (sector, cutoff),
@@ -564,7 +721,7 @@ class MarketMixin:
 
     def get_margin_balance(self, ticker: str, days: int = 60) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM margin_balance WHERE ticker=? AND date >= ? ORDER BY date",
                 (ticker, cutoff),
@@ -572,7 +729,7 @@ class MarketMixin:
         return [dict(r) for r in rows]
 
     def get_margin_balance_latest(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM margin_balance WHERE ticker=? ORDER BY date DESC LIMIT 1",
                 (ticker,),
@@ -610,7 +767,7 @@ class MarketMixin:
             )
 
     def get_margin_thresholds(self, ticker: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM margin_thresholds WHERE ticker=?", (ticker,),
             ).fetchall()
@@ -641,7 +798,7 @@ class MarketMixin:
 
     def get_sector_snapshots(self, limit: int = 10) -> list[dict]:
         """최근 섹터 스냅샷 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM sector_snapshots ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -676,7 +833,7 @@ class MarketMixin:
 
     def get_contrarian_signals(self, limit: int = 20) -> list[dict]:
         """최근 역발상 시그널 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM contrarian_signals ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -685,7 +842,7 @@ class MarketMixin:
 
     def get_contrarian_signals_by_ticker(self, ticker: str, limit: int = 10) -> list[dict]:
         """종목별 역발상 시그널 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM contrarian_signals WHERE ticker=? "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -765,7 +922,7 @@ class MarketMixin:
         cutoff = (
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
-        with self._connect() as conn:
+        with self._read() as conn:
             if urgent_only:
                 rows = conn.execute(
                     "SELECT * FROM global_news "
@@ -828,7 +985,7 @@ class MarketMixin:
         cutoff = (
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT id FROM sent_urgent_alerts "
                 "WHERE alert_hash=? AND created_at>=?",
@@ -855,7 +1012,7 @@ class MarketMixin:
         cutoff = (
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT title_summary FROM sent_urgent_alerts WHERE created_at>=?",
                 (cutoff,),
@@ -924,7 +1081,7 @@ class MarketMixin:
         if not video_id:
             return False
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 row = conn.execute(
                     "SELECT 1 FROM youtube_intelligence WHERE video_id = ? LIMIT 1",
                     (video_id,),
@@ -941,7 +1098,7 @@ class MarketMixin:
         if not video_id:
             return None
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 row = conn.execute(
                     "SELECT * FROM youtube_intelligence WHERE video_id = ? LIMIT 1",
@@ -1002,7 +1159,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute(
                     """SELECT * FROM youtube_intelligence
@@ -1031,7 +1188,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute(
                     """SELECT mentioned_tickers, source FROM youtube_intelligence
@@ -1098,7 +1255,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute(
                     """SELECT manager_key, stance FROM manager_stances
@@ -1150,7 +1307,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute(
                     """SELECT briefing_type, content, created_at
@@ -1193,7 +1350,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 row = conn.execute(
                     """SELECT report_json, data_sources, created_at
@@ -1218,7 +1375,7 @@ class MarketMixin:
             datetime.now() - timedelta(hours=hours)
         ).strftime("%Y-%m-%d %H:%M:%S")
         try:
-            with self._connect() as conn:
+            with self._read() as conn:
                 conn.row_factory = sqlite3.Row
                 rows = conn.execute(
                     """SELECT sector_key, report_json, created_at
@@ -1269,7 +1426,7 @@ class MarketMixin:
 
     def get_surge_stocks(self, days: int = 1, limit: int = 20) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM surge_stocks WHERE created_at>=? "
                 "ORDER BY change_pct DESC LIMIT ?",
@@ -1297,7 +1454,7 @@ class MarketMixin:
 
     def get_stealth_accumulations(self, days: int = 1, limit: int = 20) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM stealth_accumulations WHERE created_at>=? "
                 "ORDER BY total_score DESC LIMIT ?",
@@ -1324,7 +1481,7 @@ class MarketMixin:
 
     def get_macro_cache(self) -> dict | None:
         """캐시된 매크로 스냅샷 반환. 없으면 None."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT snapshot_json, ai_summary, ai_summary_at, fetched_at "
                 "FROM macro_cache WHERE id=1"
@@ -1347,7 +1504,7 @@ class MarketMixin:
 
     def get_ai_summary_cache(self, max_age_seconds: int = 300) -> str | None:
         """캐시된 AI 요약 반환. max_age_seconds 이내만 유효."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT ai_summary, ai_summary_at FROM macro_cache WHERE id=1"
             ).fetchone()
@@ -1396,7 +1553,7 @@ class MarketMixin:
 
     def get_program_trading(self, days: int = 5, market: str = "KOSPI") -> list[dict]:
         """최근 N일 프로그램 매매 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, market, arb_buy, arb_sell, arb_net,
@@ -1437,7 +1594,7 @@ class MarketMixin:
 
     def get_credit_balance(self, days: int = 5) -> list[dict]:
         """최근 N일 신용잔고/예탁금 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, deposit, deposit_change, credit, credit_change
@@ -1474,7 +1631,7 @@ class MarketMixin:
 
     def get_etf_flow(self, days: int = 5) -> list[dict]:
         """최근 N일 ETF 흐름 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, code, name, etf_type, price, change_pct,
@@ -1489,7 +1646,7 @@ class MarketMixin:
 
     def get_etf_flow_by_date(self, date: str) -> list[dict]:
         """특정 날짜의 ETF 흐름 데이터."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, code, name, etf_type, price, change_pct,
@@ -1503,7 +1660,7 @@ class MarketMixin:
 
     def get_etf_flow_previous(self) -> list[dict]:
         """전일 ETF 흐름 데이터 (변화율 계산용)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             # 가장 최근 날짜 찾기
             row = conn.execute(
                 "SELECT DISTINCT date FROM etf_flow ORDER BY date DESC LIMIT 1 OFFSET 1"
@@ -1574,7 +1731,7 @@ class MarketMixin:
 
     def get_oil_analysis(self, days: int = 30) -> list[dict]:
         """최근 N일 유가 분석 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, wti_price, wti_change_pct, brent_price, brent_change_pct,
@@ -1590,7 +1747,7 @@ class MarketMixin:
 
     def get_oil_prev_regime(self) -> str:
         """직전 유가 레짐 조회 (레짐 변화 감지용)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT regime FROM oil_analysis ORDER BY date DESC LIMIT 1",
             ).fetchone()
@@ -1652,7 +1809,7 @@ class MarketMixin:
 
     def get_cross_market_impact(self, days: int = 30) -> list[dict]:
         """최근 N일 크로스마켓 영향도 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, sp500_change_pct, nasdaq_change_pct, vix, vix_change_pct,
@@ -1668,7 +1825,7 @@ class MarketMixin:
 
     def get_latest_cross_market(self) -> dict | None:
         """최근 크로스마켓 영향도 1건."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM cross_market_impact ORDER BY date DESC LIMIT 1",
             ).fetchone()
@@ -1736,7 +1893,7 @@ class MarketMixin:
         """최근 증권사 리포트 조회."""
         from datetime import datetime, timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             if ticker:
                 rows = conn.execute(
                     "SELECT * FROM broker_reports WHERE date >= ? AND ticker = ? ORDER BY date DESC",
@@ -1771,7 +1928,7 @@ class MarketMixin:
         """학습 이력 조회."""
         from datetime import datetime, timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             if event_type:
                 rows = conn.execute(
                     "SELECT * FROM learning_history WHERE date >= ? AND event_type = ? ORDER BY date DESC",
@@ -1829,7 +1986,7 @@ class MarketMixin:
 
     def get_latest_options_flow(self, days: int = 5) -> list[dict]:
         """최근 옵션 PCR 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM options_flow ORDER BY date DESC LIMIT ?",
                 (days,),
@@ -1879,7 +2036,7 @@ class MarketMixin:
 
     def get_latest_eia_inventory(self, days: int = 10) -> list[dict]:
         """최근 EIA 원유재고 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM eia_inventory ORDER BY date DESC LIMIT ?",
                 (days,),
@@ -1927,7 +2084,7 @@ class MarketMixin:
 
     def get_recent_columns(self, limit: int = 30, days: int = 7) -> list[dict]:
         """최근 칼럼 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM financial_columns "
                 "WHERE date >= date('now', ? || ' days') "
@@ -1963,7 +2120,7 @@ class MarketMixin:
 
     def get_latest_synthesis(self, days: int = 3) -> list[dict]:
         """최근 일일 합성 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM daily_synthesis ORDER BY date DESC LIMIT ?",
                 (days,),
@@ -2014,7 +2171,7 @@ class MarketMixin:
 
     def get_market_regime(self, days: int = 30) -> list[dict]:
         """최근 N일 시장 레짐 데이터 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT date, regime, confidence, duration_days, transition_prob,
@@ -2028,7 +2185,7 @@ class MarketMixin:
 
     def get_prev_market_regime(self) -> tuple:
         """직전 시장 레짐 + 지속일수 조회. Returns (regime, duration_days)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT regime, duration_days FROM market_regime ORDER BY date DESC LIMIT 1",
             ).fetchone()
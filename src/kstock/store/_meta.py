@@ -50,7 +50,7 @@ class MetaMixin:
             )
 
     def get_recent_alerts(self, limit: int = 20) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM alerts ORDER BY created_at DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -59,7 +59,7 @@ class MetaMixin:
     def has_recent_alert(self, ticker: str, alert_type: str, hours: int = 4) -> bool:
         """Check if a similar alert was sent recently (spam prevention)."""
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT COUNT(*) as cnt FROM alerts WHERE ticker=? AND alert_type=? AND created_at>?",
                 (ticker, alert_type, cutoff),
@@ -78,7 +78,7 @@ class MetaMixin:
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
         placeholders = ",".join("?" for _ in alert_types)
         params = [ticker, *alert_types, cutoff]
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 f"SELECT COUNT(*) as cnt FROM alerts "
                 f"WHERE ticker=? AND alert_type IN ({placeholders}) AND created_at>?",
@@ -98,7 +98,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_recent_chat_messages(self, limit: int = 10) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM chat_history ORDER BY id DESC LIMIT ?", (limit,)
             ).fetchall()
@@ -139,7 +139,7 @@ class MetaMixin:
 
     def search_chat_by_topic(self, topic: str, limit: int = 10) -> list[dict]:
         """토픽으로 과거 대화 검색."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM chat_memory_enhanced "
                 "WHERE topic LIKE ? ORDER BY created_at DESC LIMIT ?",
@@ -149,7 +149,7 @@ class MetaMixin:
 
     def search_chat_by_ticker(self, ticker: str, limit: int = 10) -> list[dict]:
         """티커로 과거 대화 검색."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM chat_memory_enhanced "
                 "WHERE tickers LIKE ? ORDER BY created_at DESC LIMIT ?",
@@ -159,7 +159,7 @@ class MetaMixin:
 
     def search_chat_by_keywords(self, keywords: str, limit: int = 10) -> list[dict]:
         """키워드로 과거 대화 검색 (content에서 LIKE 검색)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM chat_memory_enhanced "
                 "WHERE content LIKE ? OR keywords LIKE ? "
@@ -170,7 +170,7 @@ class MetaMixin:
 
     def get_recent_enhanced_messages(self, limit: int = 20) -> list[dict]:
         """최근 강화 대화 메시지 (최신 순)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM chat_memory_enhanced "
                 "ORDER BY id DESC LIMIT ?",
@@ -213,7 +213,7 @@ class MetaMixin:
 
     def get_user_preferences(self) -> dict[str, dict]:
         """모든 사용자 선호도 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM user_preferences ORDER BY confidence DESC"
             ).fetchall()
@@ -228,7 +228,7 @@ class MetaMixin:
 
     def get_user_preference(self, key: str) -> str | None:
         """특정 선호도 값 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT preference_value FROM user_preferences "
                 "WHERE preference_key=?",
@@ -270,7 +270,7 @@ class MetaMixin:
         """월간 API 사용량 집계. year_month: 'YYYY-MM' (빈 문자열이면 이번 달)."""
         if not year_month:
             year_month = datetime.utcnow().strftime("%Y-%m")
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT "
                 "  COUNT(*) as total_calls, "
@@ -290,7 +290,7 @@ class MetaMixin:
         """일간 API 사용량 집계."""
         if not date:
             date = datetime.utcnow().strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT "
                 "  COUNT(*) as total_calls, "
@@ -309,7 +309,7 @@ class MetaMixin:
         """모델별 API 사용량 집계."""
         if not year_month:
             year_month = datetime.utcnow().strftime("%Y-%m")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT model, "
                 "  COUNT(*) as calls, "
@@ -327,7 +327,7 @@ class MetaMixin:
         """기능별 API 사용량 집계."""
         if not year_month:
             year_month = datetime.utcnow().strftime("%Y-%m")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT function_name, "
                 "  COUNT(*) as calls, "
@@ -381,7 +381,7 @@ class MetaMixin:
 
     def get_system_scores(self, limit: int = 30) -> list[dict]:
         """최근 시스템 점수 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM system_scores ORDER BY score_date DESC LIMIT ?",
                 (limit,),
@@ -390,7 +390,7 @@ class MetaMixin:
 
     def get_latest_system_score(self) -> dict | None:
         """최신 시스템 점수."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM system_scores ORDER BY score_date DESC LIMIT 1"
             ).fetchone()
@@ -399,7 +399,7 @@ class MetaMixin:
     # -- chat_usage (v3.5) -----------------------------------------------------
 
     def get_chat_usage_count(self, date: str) -> int:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT count FROM chat_usage WHERE date=?", (date,)
             ).fetchone()
@@ -430,7 +430,7 @@ class MetaMixin:
         return cur.lastrowid or 0
 
     def get_user(self, telegram_id: int) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM users WHERE telegram_id=?",
                 (telegram_id,),
@@ -460,7 +460,7 @@ class MetaMixin:
     def get_today_feedback(self) -> list[dict]:
         """오늘 피드백 조회."""
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM user_feedback WHERE created_at LIKE ?",
                 (f"{today}%",),
@@ -471,7 +471,7 @@ class MetaMixin:
         """최근 N일 피드백 통계."""
         from datetime import timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT menu_name, feedback, COUNT(*) as cnt "
                 "FROM user_feedback WHERE created_at > ? "
@@ -510,7 +510,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_latest_feedback_report(self) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM feedback_reports ORDER BY created_at DESC LIMIT 1"
             ).fetchone()
@@ -543,7 +543,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_last_screenshot(self) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM screenshots ORDER BY created_at DESC LIMIT 1"
             ).fetchone()
@@ -553,7 +553,7 @@ class MetaMixin:
     get_latest_screenshot = get_last_screenshot
 
     def get_screenshot_history(self, limit: int = 10) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM screenshots ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -595,7 +595,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_screenshot_holdings(self, screenshot_id: int) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM screenshot_holdings WHERE screenshot_id=?",
                 (screenshot_id,),
@@ -640,7 +640,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_investment_horizon(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM investment_horizons WHERE ticker=? ORDER BY updated_at DESC LIMIT 1",
                 (ticker,),
@@ -648,7 +648,7 @@ class MetaMixin:
         return dict(row) if row else None
 
     def get_horizons_for_screenshot(self, screenshot_id: int) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM investment_horizons WHERE screenshot_id=?",
                 (screenshot_id,),
@@ -695,7 +695,7 @@ class MetaMixin:
             )
 
     def get_future_watchlist(self, sector: str | None = None) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             if sector:
                 rows = conn.execute(
                     "SELECT * FROM future_watchlist WHERE sector=? ORDER BY future_score DESC",
@@ -708,7 +708,7 @@ class MetaMixin:
         return [dict(r) for r in rows]
 
     def get_future_watchlist_entry(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM future_watchlist WHERE ticker=?", (ticker,),
             ).fetchone()
@@ -744,7 +744,7 @@ class MetaMixin:
         self, sector: str | None = None, days: int = 7, limit: int = 20,
     ) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             if sector:
                 rows = conn.execute(
                     "SELECT * FROM future_triggers WHERE sector=? AND created_at>=? "
@@ -782,7 +782,7 @@ class MetaMixin:
         return cur.lastrowid or 0
 
     def get_multi_agent_results(self, ticker: str | None = None, limit: int = 20) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             if ticker:
                 rows = conn.execute(
                     "SELECT * FROM multi_agent_results WHERE ticker=? "
@@ -800,7 +800,7 @@ class MetaMixin:
 
     def get_investor_profile(self) -> dict | None:
         """투자자 프로필 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM investor_profile WHERE id=1"
             ).fetchone()
@@ -840,7 +840,7 @@ class MetaMixin:
 
     def get_holding_analysis(self, holding_id: int) -> dict | None:
         """보유종목 분석 데이터 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM holding_analysis WHERE holding_id=?",
                 (holding_id,),
@@ -849,7 +849,7 @@ class MetaMixin:
 
     def get_all_holding_analyses(self) -> list[dict]:
         """모든 활성 보유종목 분석 데이터."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT ha.* FROM holding_analysis ha "
                 "JOIN holdings h ON ha.holding_id = h.id "
@@ -895,7 +895,7 @@ class MetaMixin:
 
     def compute_investor_stats(self) -> dict:
         """매매 이력으로 투자 성향 통계 계산."""
-        with self._connect() as conn:
+        with self._read() as conn:
             # 완료된 거래 통계
             trades = conn.execute(
                 "SELECT * FROM holdings WHERE status != 'active'"
@@ -997,7 +997,7 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_sentiment(self, ticker: str, analysis_date: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM sentiment WHERE ticker=? AND analysis_date=? "
                 "ORDER BY created_at DESC LIMIT 1",
@@ -1006,7 +1006,7 @@ class MetaMixin:
         return dict(row) if row else None
 
     def get_all_sentiments(self, analysis_date: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM sentiment WHERE analysis_date=?",
                 (analysis_date,),
@@ -1034,14 +1034,14 @@ class MetaMixin:
             return cursor.lastrowid
 
     def get_latest_weekly_report(self) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM weekly_reports ORDER BY created_at DESC LIMIT 1",
             ).fetchone()
         return dict(row) if row else None
 
     def get_weekly_reports(self, limit: int = 4) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM weekly_reports ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -1068,7 +1068,8 @@ class MetaMixin:
 
     def get_events(self, event_type: str = "", limit: int = 50) -> list[dict]:
         """이벤트 로그 조회."""
-        with self._connect() as conn:
+        self.flush_writes()
+        with self._read() as conn:
             if event_type:
                 rows = conn.execute(
                     "SELECT * FROM event_log WHERE event_type=? "
@@ -1103,7 +1104,7 @@ class MetaMixin:
 
     def get_reconciliations(self, limit: int = 10) -> list[dict]:
         """리컨실레이션 이력 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM reconciliation_log ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -1135,7 +1136,7 @@ class MetaMixin:
 
     def get_execution_replays(self, limit: int = 50) -> list[dict]:
         """Execution Replay 이력 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM execution_replay ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -1144,7 +1145,7 @@ class MetaMixin:
 
     def get_execution_replays_by_strategy(self, strategy: str, limit: int = 50) -> list[dict]:
         """전략별 Execution Replay 이력 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM execution_replay WHERE strategy=? "
                 "ORDER BY created_at DESC LIMIT ?",
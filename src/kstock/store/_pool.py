@@ -0,0 +1,253 @@
+"""SQLitePool: WAL 모드 SQLite 연결 풀 (읽기 풀 + 단일 직렬 writer).
+
+매 호출마다 ``sqlite3.connect``를 새로 여는 대신 연결을 재사용한다.
+
+- writer: 연결 1개 + RLock. 모든 쓰기는 이 연결로 직렬화된다.
+- reader: 최대 ``max_readers``개 연결을 지연 생성해 큐로 돌려쓴다.
+  ``query_only``로 열려 있어 실수로 쓰기를 해도 에러가 난다.
+- 같은 스레드에서 중첩 호출하면 이미 잡고 있는 연결을 그대로 쓰고,
+  가장 바깥 블록이 끝날 때만 commit/rollback 한다.
+
+WAL 덕분에 reader는 writer를 막지 않고, 대기/점유 시간은
+``stats()``로 헬스체크에 노출된다.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Generator
+
+logger = logging.getLogger(__name__)
+
+BUSY_TIMEOUT_S = 30.0
+MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_MAX_READERS = 4
+
+
+@dataclass
+class PoolStats:
+    """풀 역할(reader/writer)별 누적 지표."""
+
+    opened: int = 0
+    checkouts: int = 0
+    waits: int = 0            # 즉시 못 받고 대기한 횟수
+    wait_total_s: float = 0.0
+    wait_max_s: float = 0.0
+    hold_total_s: float = 0.0
+    hold_max_s: float = 0.0
+    errors: int = 0
+
+    def record(self, waited: float, held: float, blocked: bool) -> None:
+        self.checkouts += 1
+        if blocked:
+            self.waits += 1
+        self.wait_total_s += waited
+        self.wait_max_s = max(self.wait_max_s, waited)
+        self.hold_total_s += held
+        self.hold_max_s = max(self.hold_max_s, held)
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        n = max(self.checkouts, 1)
+        d["wait_avg_ms"] = round(self.wait_total_s / n * 1000, 3)
+        d["hold_avg_ms"] = round(self.hold_total_s / n * 1000, 3)
+        return d
+
+
+class SQLitePool:
+    """db_path 하나에 대한 연결 풀."""
+
+    def __init__(self, db_path: Path | str, max_readers: int = DEFAULT_MAX_READERS) -> None:
+        self.db_path = str(db_path)
+        self.max_readers = max(1, max_readers)
+        self._memory = self.db_path == ":memory:"
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._all_readers: list[sqlite3.Connection] = []
+        self._reader_lock = threading.Lock()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {"reader": PoolStats(), "writer": PoolStats()}
+        self._closed = False
+
+    # ── 연결 생성 ──────────────────────────────────────────────
+    def _open(self, readonly: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, timeout=BUSY_TIMEOUT_S, check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT_S * 1000)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        if not self._memory and not readonly:
+            try:
+                conn.execute("PRAGMA journal_mode = WAL")
+            except sqlite3.OperationalError as e:
+                logger.warning("WAL 전환 실패 (%s): %s", self.db_path, e)
+        if readonly:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            self._writer = self._open(readonly=False)
+            with self._stats_lock:
+                self._stats["writer"].opened += 1
+        return self._writer
+
+    def _acquire_reader(self) -> tuple[sqlite3.Connection, bool]:
+        """reader 연결 획득. (conn, 대기 여부)."""
+        try:
+            return self._readers.get_nowait(), False
+        except queue.Empty:
+            pass
+        with self._reader_lock:
+            if len(self._all_readers) < self.max_readers:
+                conn = self._open(readonly=True)
+                self._all_readers.append(conn)
+                with self._stats_lock:
+                    self._stats["reader"].opened += 1
+                return conn, False
+        return self._readers.get(timeout=BUSY_TIMEOUT_S), True
+
+    # ── 체크아웃 ───────────────────────────────────────────────
+    def _held(self) -> list:
+        held = getattr(self._local, "held", None)
+        if held is None:
+            held = self._local.held = []
+        return held
+
+    def holding(self) -> bool:
+        """현재 스레드가 이 풀의 연결을 잡고 있는지."""
+        return bool(self._held())
+
+    @contextmanager
+    def _reuse(self, conn: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
+        held = self._held()
+        held.append(conn)
+        try:
+            yield conn
+        finally:
+            held.pop()
+
+    def _finish(self, conn: sqlite3.Connection, ok: bool, role: str) -> None:
+        try:
+            if ok:
+                conn.commit()
+            else:
+                conn.rollback()
+        except sqlite3.Error:
+            with self._stats_lock:
+                self._stats[role].errors += 1
+            if ok:
+                raise
+            logger.debug("SQLitePool rollback failed", exc_info=True)
+
+    @contextmanager
+    def write(self) -> Generator[sqlite3.Connection, None, None]:
+        """단일 writer 연결. 블록 종료 시 commit, 예외 시 rollback."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("SQLitePool is closed")
+        held = self._held()
+        if held and held[-1] is self._writer:
+            with self._reuse(held[-1]) as conn:
+                yield conn
+            return
+
+        t0 = time.perf_counter()
+        blocked = not self._writer_lock.acquire(blocking=False)
+        if blocked:
+            self._writer_lock.acquire()
+        t1 = time.perf_counter()
+        conn: sqlite3.Connection | None = None
+        ok = False
+        try:
+            conn = self._get_writer()
+            with self._reuse(conn):
+                yield conn
+            ok = True
+        finally:
+            try:
+                if conn is not None:
+                    self._finish(conn, ok, "writer")
+            finally:
+                held_s = time.perf_counter() - t1
+                self._writer_lock.release()
+                with self._stats_lock:
+                    self._stats["writer"].record(t1 - t0, held_s, blocked)
+
+    @contextmanager
+    def read(self) -> Generator[sqlite3.Connection, None, None]:
+        """읽기 전용 연결. 이미 연결을 잡고 있는 스레드는 그 연결을 재사용."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("SQLitePool is closed")
+        held = self._held()
+        if held:
+            with self._reuse(held[-1]) as conn:
+                yield conn
+            return
+        if self._memory:
+            # :memory: DB는 연결마다 별개라 writer를 공유한다
+            with self.write() as conn:
+                yield conn
+            return
+
+        t0 = time.perf_counter()
+        conn, blocked = self._acquire_reader()
+        t1 = time.perf_counter()
+        ok = False
+        try:
+            with self._reuse(conn):
+                yield conn
+            ok = True
+        finally:
+            try:
+                self._finish(conn, ok, "reader")
+            finally:
+                self._readers.put(conn)
+                with self._stats_lock:
+                    self._stats["reader"].record(
+                        t1 - t0, time.perf_counter() - t1, blocked,
+                    )
+
+    # ── 관리 ──────────────────────────────────────────────────
+    def stats(self) -> dict:
+        """{'reader': {...}, 'writer': {...}, 'max_readers': n} 지표 스냅샷."""
+        with self._stats_lock:
+            out = {role: s.to_dict() for role, s in self._stats.items()}
+        out["max_readers"] = self.max_readers
+        out["idle_readers"] = self._readers.qsize()
+        return out
+
+    def close(self) -> None:
+        """모든 연결 닫기. 이후 체크아웃은 ProgrammingError."""
+        self._closed = True
+        with self._writer_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.close()
+                except sqlite3.Error:
+                    pass
+                self._writer = None
+        with self._reader_lock:
+            for conn in self._all_readers:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._all_readers.clear()
+        while not self._readers.empty():
+            try:
+                self._readers.get_nowait()
+            except queue.Empty:
+                break
@@ -81,12 +81,12 @@ class PortfolioMixin:
             )
 
     def get_portfolio(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute("SELECT * FROM portfolio ORDER BY score DESC").fetchall()
         return [dict(r) for r in rows]
 
     def get_portfolio_entry(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM portfolio WHERE ticker=?", (ticker,)
             ).fetchone()
@@ -124,7 +124,7 @@ class PortfolioMixin:
             return cursor.lastrowid
 
     def get_active_holdings(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """SELECT h.*, ph.horizon
                    FROM holdings h
@@ -135,7 +135,7 @@ class PortfolioMixin:
         return [dict(r) for r in rows]
 
     def get_holding(self, holding_id: int) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM holdings WHERE id=?", (holding_id,)
             ).fetchone()
@@ -144,7 +144,7 @@ class PortfolioMixin:
     def get_holding_by_ticker(
         self, ticker: str, purchase_type: str | None = None,
     ) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             if purchase_type is None:
                 row = conn.execute(
                     "SELECT * FROM holdings WHERE ticker=? AND status='active' "
@@ -166,7 +166,7 @@ class PortfolioMixin:
         """종목명으로 active 보유종목 조회 (ticker 없을 때 fallback)."""
         if not name:
             return None
-        with self._connect() as conn:
+        with self._read() as conn:
             if purchase_type is None:
                 row = conn.execute(
                     "SELECT * FROM holdings WHERE name=? AND status='active' "
@@ -193,7 +193,7 @@ class PortfolioMixin:
             params.append(name)
         if not clauses:
             return []
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 f"SELECT * FROM holdings WHERE status=? AND ({' OR '.join(clauses)}) "
                 "ORDER BY updated_at DESC, created_at DESC",
@@ -406,7 +406,7 @@ class PortfolioMixin:
             )
 
     def get_watchlist(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute("SELECT * FROM watchlist WHERE active=1").fetchall()
         return [dict(r) for r in rows]
 
@@ -448,7 +448,7 @@ class PortfolioMixin:
         self, category: str, limit: int = 8, offset: int = 0,
     ) -> tuple[list[dict], int]:
         """카테고리별 워치리스트 조회 (페이지네이션). Returns (items, total_count)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             if category == "holding":
                 rows = conn.execute(
                     """SELECT w.ticker, w.name, w.horizon, w.manager, w.sector,
@@ -511,7 +511,7 @@ class PortfolioMixin:
 
     def get_watchlist_category_counts(self) -> dict:
         """카테고리별 종목 수 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             total = conn.execute(
                 "SELECT COUNT(*) FROM watchlist WHERE active=1",
             ).fetchone()[0]
@@ -550,14 +550,14 @@ class PortfolioMixin:
             )
 
     def get_portfolio_horizon(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM portfolio_horizon WHERE ticker=?", (ticker,),
             ).fetchone()
         return dict(row) if row else None
 
     def get_all_portfolio_horizons(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM portfolio_horizon ORDER BY updated_at DESC",
             ).fetchall()
@@ -587,7 +587,7 @@ class PortfolioMixin:
         return cur.lastrowid or 0
 
     def get_portfolio_snapshots(self, limit: int = 30) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM portfolio_snapshots "
                 "ORDER BY date DESC, created_at DESC LIMIT ?",
@@ -596,7 +596,7 @@ class PortfolioMixin:
         return [dict(r) for r in rows]
 
     def get_portfolio_peak(self) -> float:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT MAX(total_value) as peak FROM portfolio_snapshots",
             ).fetchone()
@@ -622,7 +622,7 @@ class PortfolioMixin:
 
     def get_risk_violations(self, days: int = 7, limit: int = 50) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM risk_violations WHERE date >= ? "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -650,7 +650,7 @@ class PortfolioMixin:
             return cursor.lastrowid
 
     def get_rebalance_history(self, limit: int = 20) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM rebalance_history ORDER BY id DESC LIMIT ?",
                 (limit,),
@@ -687,7 +687,7 @@ class PortfolioMixin:
         return cur.lastrowid or 0
 
     def get_pending_solutions(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM solution_tracking WHERE executed=0 "
                 "ORDER BY created_at DESC",
@@ -712,7 +712,7 @@ class PortfolioMixin:
             )
 
     def get_solution_history(self, limit: int = 20) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM solution_tracking ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -721,7 +721,7 @@ class PortfolioMixin:
 
     def get_solution_stats(self) -> dict:
         """Return solution execution and effectiveness stats."""
-        with self._connect() as conn:
+        with self._read() as conn:
             total = conn.execute(
                 "SELECT COUNT(*) FROM solution_tracking",
             ).fetchone()[0]
@@ -761,7 +761,7 @@ class PortfolioMixin:
 
     def get_notification_settings(self) -> dict[str, bool]:
         self._ensure_default_notification_settings()
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute("SELECT * FROM notification_settings").fetchall()
         return {r["setting_name"]: bool(r["enabled"]) for r in rows}
 
@@ -805,7 +805,7 @@ class PortfolioMixin:
             return cursor.lastrowid
 
     def get_goal_snapshots(self, limit: int = 30) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM goal_snapshots ORDER BY snapshot_date DESC LIMIT ?",
                 (limit,),
@@ -838,7 +838,7 @@ class PortfolioMixin:
             return cursor.lastrowid
 
     def get_active_tenbagger_candidates(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM tenbagger_candidates WHERE status='monitoring' "
                 "ORDER BY conditions_met DESC"
@@ -919,7 +919,7 @@ class PortfolioMixin:
         self, sector: str = "", status: str = "active",
     ) -> list[dict]:
         """텐배거 유니버스 조회 (섹터 필터 옵션)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             if sector:
                 rows = conn.execute(
                     "SELECT * FROM tenbagger_universe "
@@ -936,7 +936,7 @@ class PortfolioMixin:
 
     def get_tenbagger_by_ticker(self, ticker: str) -> dict | None:
         """텐배거 유니버스에서 티커로 단건 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM tenbagger_universe WHERE ticker=? AND status='active'",
                 (ticker,),
@@ -994,7 +994,7 @@ class PortfolioMixin:
         self, ticker: str = "", status: str = "",
     ) -> list[dict]:
         """텐배거 카탈리스트 조회 (티커/상태 필터)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             query = "SELECT * FROM tenbagger_catalyst WHERE 1=1"
             params: list = []
             if ticker:
@@ -1051,7 +1051,7 @@ class PortfolioMixin:
         self, ticker: str, weeks: int = 12,
     ) -> list[dict]:
         """텐배거 점수 추이 조회 (최근 N주)."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM tenbagger_score_history WHERE ticker=? "
                 "ORDER BY score_date DESC LIMIT ?",
@@ -37,7 +37,7 @@ class TradingMixin:
             return cursor.lastrowid
 
     def get_trades(self, limit: int = 50) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trades ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -45,7 +45,7 @@ class TradingMixin:
         return [dict(r) for r in rows]
 
     def get_trades_by_strategy(self, strategy_type: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trades WHERE strategy_type=? ORDER BY created_at DESC",
                 (strategy_type,),
@@ -56,7 +56,7 @@ class TradingMixin:
         """Compute per-strategy performance stats from trades + recommendations."""
         result = {}
         for strat in ["A", "B", "C", "D", "E", "F", "G"]:
-            with self._connect() as conn:
+            with self._read() as conn:
                 recs = conn.execute(
                     "SELECT * FROM recommendations WHERE strategy_type=? "
                     "AND status IN ('profit', 'stop')",
@@ -77,7 +77,7 @@ class TradingMixin:
                 }
 
         # Summary from trades
-        with self._connect() as conn:
+        with self._read() as conn:
             total_trades = conn.execute(
                 "SELECT COUNT(*) as cnt FROM trades"
             ).fetchone()
@@ -147,7 +147,7 @@ class TradingMixin:
             )
 
     def get_pending_orders(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM orders WHERE status='pending' ORDER BY created_at DESC"
             ).fetchall()
@@ -155,7 +155,7 @@ class TradingMixin:
 
     def get_daily_order_count(self) -> int:
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT COUNT(*) as cnt FROM orders WHERE created_at LIKE ?",
                 (f"{today}%",),
@@ -188,7 +188,7 @@ class TradingMixin:
             return cursor.lastrowid
 
     def get_active_swing_trades(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM swing_trades WHERE status='active' "
                 "ORDER BY entry_date DESC"
@@ -243,14 +243,14 @@ class TradingMixin:
             return cursor.lastrowid
 
     def get_active_recommendations(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendations WHERE status='active' ORDER BY rec_date DESC"
             ).fetchall()
         return [dict(r) for r in rows]
 
     def get_completed_recommendations(self, limit: int = 20) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendations WHERE status IN ('profit', 'stop') "
                 "ORDER BY closed_at DESC LIMIT ?",
@@ -259,14 +259,14 @@ class TradingMixin:
         return [dict(r) for r in rows]
 
     def get_watch_recommendations(self) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendations WHERE status='watch' ORDER BY rec_date DESC"
             ).fetchall()
         return [dict(r) for r in rows]
 
     def get_all_recommendations_stats(self) -> dict:
-        with self._connect() as conn:
+        with self._read() as conn:
             total = conn.execute(
                 "SELECT COUNT(*) as cnt FROM recommendations"
             ).fetchone()
@@ -314,7 +314,7 @@ class TradingMixin:
             )
 
     def get_recommendations_by_strategy(self, strategy_type: str) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendations WHERE strategy_type=? "
                 "AND status IN ('active', 'watch') ORDER BY rec_score DESC",
@@ -323,7 +323,7 @@ class TradingMixin:
         return [dict(r) for r in rows]
 
     def has_active_recommendation(self, ticker: str) -> bool:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT COUNT(*) as cnt FROM recommendations "
                 "WHERE ticker=? AND status IN ('active', 'watch')",
@@ -369,7 +369,7 @@ class TradingMixin:
 
     def get_recommendation_results(self, days: int = 7) -> list[dict]:
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendation_results WHERE created_at > ? "
                 "ORDER BY created_at DESC",
@@ -416,7 +416,7 @@ class TradingMixin:
             )
 
     def get_recommendation_tracks(self, limit: int = 50) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM recommendation_tracking "
                 "ORDER BY recommended_date DESC LIMIT ?",
@@ -428,7 +428,7 @@ class TradingMixin:
 
     def get_unevaluated_recommendations(self, min_days: int = 1) -> list[dict]:
         """D+N 결과가 없거나 불완전한 추천 목록 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT r.id, r.ticker, r.name, r.rec_price, r.rec_date,
@@ -477,7 +477,7 @@ class TradingMixin:
 
     def get_pending_entries(self, status: str = "pending") -> list[dict]:
         """활성 대기 주문 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """SELECT * FROM pending_entries
                    WHERE status=? AND (expires_at IS NULL OR expires_at > ?)
@@ -533,7 +533,7 @@ class TradingMixin:
         return cur.lastrowid or 0
 
     def get_trade_executions(self, limit: int = 50) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trade_executions ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -556,7 +556,7 @@ class TradingMixin:
         return cur.lastrowid or 0
 
     def get_strategy_stats(self, strategy: str | None = None, limit: int = 50) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             if strategy:
                 rows = conn.execute(
                     "SELECT * FROM strategy_stats WHERE strategy=? "
@@ -578,21 +578,26 @@ class TradingMixin:
         pred_date: str,
         probability: float,
         shap_top3: str = "",
+        defer: bool = False,
     ) -> int:
+        """ML 예측 기록. defer=True면 write-behind 버퍼에 넣고 0을 반환 (스캔용)."""
         now = datetime.utcnow().isoformat()
-        with self._connect() as conn:
-            cursor = conn.execute(
-                """
+        sql = """
                 INSERT INTO ml_predictions
                     (ticker, pred_date, probability, shap_top3, created_at)
                 VALUES (?, ?, ?, ?, ?)
-                """,
-                (ticker, pred_date, probability, shap_top3, now),
-            )
+                """
+        params = (ticker, pred_date, probability, shap_top3, now)
+        if defer:
+            self._defer_write(sql, [params])
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute(sql, params)
             return cursor.lastrowid
 
     def get_predictions(self, pred_date: str) -> list[dict]:
-        with self._connect() as conn:
+        self.flush_writes()
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM ml_predictions WHERE pred_date=?",
                 (pred_date,),
@@ -606,7 +611,7 @@ class TradingMixin:
     ) -> list[dict]:
         """actual_return이 비어 있는 오래된 ML 예측 조회."""
         cutoff = (datetime.utcnow() - timedelta(days=min_age_days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 """
                 SELECT * FROM ml_predictions
@@ -657,7 +662,7 @@ class TradingMixin:
         return cur.lastrowid or 0
 
     def get_ml_performance(self, limit: int = 10) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM ml_performance ORDER BY date DESC LIMIT ?",
                 (limit,),
@@ -685,7 +690,7 @@ class TradingMixin:
 
     def get_hallucination_stats(self, days: int = 7) -> dict:
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             total = conn.execute(
                 "SELECT COUNT(*) FROM hallucination_log WHERE date >= ?",
                 (cutoff,),
@@ -725,7 +730,7 @@ class TradingMixin:
             )
 
     def get_seed_positions(self, status: str = "active") -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM seed_positions WHERE status=? ORDER BY sector, name",
                 (status,),
@@ -733,7 +738,7 @@ class TradingMixin:
         return [dict(r) for r in rows]
 
     def get_seed_position(self, ticker: str) -> dict | None:
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT * FROM seed_positions WHERE ticker=?", (ticker,),
             ).fetchone()
@@ -768,7 +773,7 @@ class TradingMixin:
         return cur.lastrowid or 0
 
     def get_trade_registers(self, status: str = "active", limit: int = 50) -> list[dict]:
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trade_registers WHERE status=? "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -804,7 +809,7 @@ class TradingMixin:
 
     def get_trade_lessons(self, limit: int = 20) -> list[dict]:
         """최근 매매 교훈 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trade_lessons ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -813,7 +818,7 @@ class TradingMixin:
 
     def get_trade_lessons_by_manager(self, manager: str, limit: int = 10) -> list[dict]:
         """특정 매니저의 매매 교훈 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trade_lessons WHERE manager=? "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -840,7 +845,7 @@ class TradingMixin:
             "worst_trade": None,
             "recent_trades": [],
         }
-        with self._connect() as conn:
+        with self._read() as conn:
             # trade_debrief (주요 소스)
             rows = conn.execute(
                 "SELECT ticker, name, action, pnl_pct, hold_days "
@@ -922,7 +927,7 @@ class TradingMixin:
 
     def get_journal_reports(self, period: str = "weekly", limit: int = 10) -> list[dict]:
         """최근 매매일지 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM trade_journal WHERE period=? "
                 "ORDER BY created_at DESC LIMIT ?",
@@ -960,7 +965,7 @@ class TradingMixin:
     def get_pending_signal_evaluations(self, days_ago: int = 1) -> list[dict]:
         """평가 대기 중인 신호 목록 (signal_date 기준 N일 이상 경과, 미평가)."""
         cutoff = (datetime.utcnow() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT * FROM signal_performance "
                 "WHERE signal_date <= ? AND evaluated_at IS NULL "
@@ -1005,7 +1010,7 @@ class TradingMixin:
     ) -> list[dict]:
         """신호 소스별 적중률 통계."""
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             if signal_source:
                 rows = conn.execute(
                     "SELECT signal_source, "
@@ -1087,7 +1092,7 @@ class TradingMixin:
         self, ticker: str | None = None, limit: int = 20,
     ) -> list[dict]:
         """매매 복기 이력 조회."""
-        with self._connect() as conn:
+        with self._read() as conn:
             if ticker:
                 rows = conn.execute(
                     "SELECT * FROM trade_debrief WHERE ticker=? "
@@ -1105,7 +1110,7 @@ class TradingMixin:
     def get_debrief_stats(self, days: int = 30) -> dict:
         """복기 통계 요약 (최근 N일)."""
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
-        with self._connect() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT "
                 "  COUNT(*) as total, "
@@ -1159,7 +1164,7 @@ class TradingMixin:
 
     def get_signal_weight_adjustments(self) -> dict[str, float]:
         """각 신호 소스의 최신 가중치 조정값 반환."""
-        with self._connect() as conn:
+        with self._read() as conn:
             rows = conn.execute(
                 "SELECT signal_source, weight_adj FROM signal_source_stats "
                 "WHERE id IN (SELECT MAX(id) FROM signal_source_stats GROUP BY signal_source)"
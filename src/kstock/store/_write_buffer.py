@@ -0,0 +1,195 @@
+"""WriteBuffer: 고빈도 INSERT를 모아 executemany 트랜잭션으로 flush.
+
+스캔 중 종목마다 수급/이벤트/예측을 한 줄씩 commit하던 것을
+SQL 문장별로 묶어 한 트랜잭션에서 ``executemany``로 기록한다.
+
+- flush 조건: 대기 행 ``max_rows`` 이상 또는 첫 행 이후 ``max_delay_s`` 경과.
+  백그라운드 스레드가 처리하며, 대기 행이 없으면 스레드는 종료된다.
+- back-pressure: 대기 행이 ``max_pending``에 도달하면 호출 스레드가
+  직접 flush 한다 (메모리 무한 증가 방지).
+- ``close()`` / atexit에서 남은 행을 반드시 flush 한다.
+- 같은 SQL 안에서는 enqueue 순서가 유지된다 (upsert 덮어쓰기 순서 보존).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from typing import Callable, Sequence
+
+from kstock.store._pool import SQLitePool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ROWS = 500
+DEFAULT_MAX_DELAY_S = 2.0
+DEFAULT_MAX_PENDING = 5000
+
+_live_buffers: "weakref.WeakSet[WriteBuffer]" = weakref.WeakSet()
+
+
+def _flush_all_at_exit() -> None:
+    for buf in list(_live_buffers):
+        try:
+            buf.close()
+        except Exception:
+            logger.debug("WriteBuffer atexit flush failed", exc_info=True)
+
+
+atexit.register(_flush_all_at_exit)
+
+
+class WriteBuffer:
+    """SQLitePool writer 앞단의 write-behind 버퍼."""
+
+    def __init__(
+        self,
+        pool: SQLitePool,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_delay_s: float = DEFAULT_MAX_DELAY_S,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._pool = pool
+        self.max_rows = max_rows
+        self.max_delay_s = max_delay_s
+        self.max_pending = max(max_pending, max_rows)
+        self._pending: dict[str, list[Sequence]] = {}
+        self._flushing: dict[str, list[Sequence]] = {}  # 기록 중인 배치
+        self._count = 0
+        self._lock = threading.Lock()        # _pending 보호
+        self._flush_lock = threading.Lock()  # flush는 한 번에 하나 (순서 보장)
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.flushes = 0
+        self.rows_written = 0
+        self.rows_dropped = 0
+        _live_buffers.add(self)
+
+    @property
+    def pending(self) -> int:
+        return self._count
+
+    def pending_rows(
+        self, sql: str, match: Callable[[Sequence], bool] | None = None,
+    ) -> list[Sequence]:
+        """아직 커밋되지 않은 ``sql`` 행 (기록 중 배치 포함, enqueue 순서).
+
+        조회 메서드가 flush 없이 버퍼 내용을 DB 결과에 겹쳐 볼 때 쓴다.
+        """
+        with self._lock:
+            rows = [*self._flushing.get(sql, ()), *self._pending.get(sql, ())]
+        return [r for r in rows if match is None or match(r)]
+
+    def add(self, sql: str, params: Sequence) -> None:
+        """한 행 enqueue."""
+        self.add_many(sql, [params])
+
+    def add_many(self, sql: str, rows: list[Sequence]) -> None:
+        """여러 행 enqueue. 임계치를 넘으면 flush를 깨우거나 직접 수행."""
+        if not rows:
+            return
+        if self._closed:
+            # 종료 후 들어온 쓰기는 즉시 기록
+            self._write({sql: list(rows)})
+            return
+        with self._lock:
+            self._pending.setdefault(sql, []).extend(rows)
+            self._count += len(rows)
+            n = self._count
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="db-write-buffer", daemon=True,
+                )
+                self._thread.start()
+        if n >= self.max_pending:
+            self.flush()
+        elif n >= self.max_rows:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """대기 중인 행을 한 트랜잭션으로 기록. 기록한 행 수 반환."""
+        # writer를 잡은 스레드가 flush 락을 기다리면 flusher와 교착되므로
+        # 그 경우엔 락을 못 잡으면 백그라운드에 맡긴다
+        if self._pool.holding():
+            if not self._flush_lock.acquire(blocking=False):
+                self._wake.set()
+                return 0
+        else:
+            self._flush_lock.acquire()
+        try:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+                self._count = 0
+            if not batch:
+                return 0
+            try:
+                return self._write(batch)
+            finally:
+                with self._lock:
+                    self._flushing = {}
+        finally:
+            self._flush_lock.release()
+
+    def _write(self, batch: dict[str, list[Sequence]]) -> int:
+        total = sum(len(rows) for rows in batch.values())
+        try:
+            with self._pool.write() as conn:
+                for sql, rows in batch.items():
+                    conn.executemany(sql, rows)
+            written = total
+        except Exception:
+            logger.warning(
+                "WriteBuffer batch flush failed (%d rows); retrying per statement",
+                total, exc_info=True,
+            )
+            written = 0
+            for sql, rows in batch.items():
+                try:
+                    with self._pool.write() as conn:
+                        conn.executemany(sql, rows)
+                    written += len(rows)
+                except Exception:
+                    self.rows_dropped += len(rows)
+                    logger.error(
+                        "WriteBuffer dropped %d rows: %s", len(rows), sql.split("(")[0].strip(),
+                        exc_info=True,
+                    )
+        self.flushes += 1
+        self.rows_written += written
+        return written
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.max_delay_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.debug("WriteBuffer background flush failed", exc_info=True)
+                time.sleep(self.max_delay_s)
+            with self._lock:
+                if not self._pending or self._closed:
+                    self._thread = None
+                    return
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._count,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "rows_dropped": self.rows_dropped,
+        }
+
+    def close(self) -> None:
+        """남은 행을 flush 하고 백그라운드 스레드를 멈춘다."""
+        self._closed = True
+        self._wake.set()
+        self.flush()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.max_delay_s + 1)
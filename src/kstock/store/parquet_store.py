@@ -1,78 +1,410 @@
-"""Parquet-based storage for OHLCV data in data/lake/."""
+"""Parquet-based storage for OHLCV data in data/lake/.
+
+Lake layout::
+
+    data/lake/
+        parts/ticker=005930/part-00000012.parquet   # append-only chunks
+        _manifest.json                              # per-ticker date ranges
+        005930.parquet                              # legacy flat file (read-only)
+
+``append`` writes only the new rows as a new part file instead of reading
+and rewriting the whole ticker.  Parts carry a ``_seq`` column so reads can
+keep the latest row per date; ``compact`` merges a ticker's parts back into
+one file once they pile up.  The manifest records each ticker's first/last
+date so "what's missing" checks never open a Parquet file.
+
+Dates are stored as ``YYYY-MM-DD`` strings and numeric columns as float64
+so every part shares one schema and ``load_panel`` can push ticker/date
+filters down to the pyarrow dataset scan.
+"""
 
 from __future__ import annotations
 
+import json
+import logging
+import os
+import threading
 from pathlib import Path
+from typing import Iterable, Optional
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
 
 DEFAULT_LAKE_DIR = Path("data/lake")
+MANIFEST_FILE = "_manifest.json"
+PARTS_DIR = "parts"
+# 종목별 part 파일이 이 개수를 넘으면 append 시 자동 compaction
+AUTO_COMPACT_PARTS = 32
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """date → 'YYYY-MM-DD' string, numeric columns → float64."""
+    out = df.copy()
+    if "ticker" in out.columns:
+        out = out.drop(columns=["ticker"])
+    if "date" in out.columns:
+        out["date"] = pd.to_datetime(out["date"]).dt.strftime("%Y-%m-%d")
+    for col in out.columns:
+        if col != "date" and pd.api.types.is_numeric_dtype(out[col]):
+            out[col] = out[col].astype("float64")
+    return out
 
 
 class ParquetStore:
-    """Read/write OHLCV DataFrames as Parquet files."""
+    """Read/write OHLCV DataFrames as a partitioned Parquet lake."""
 
     def __init__(self, lake_dir: Path = DEFAULT_LAKE_DIR) -> None:
         self.lake_dir = lake_dir
         self.lake_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()              # manifest 보호
+        self._ticker_locks: dict[str, threading.RLock] = {}
+        self._manifest: dict[str, dict] = self._read_manifest()
+
+    # -- paths & manifest ------------------------------------------------------
 
     def _ticker_path(self, ticker: str) -> Path:
-        """Return the Parquet file path for a given ticker."""
+        """Return the legacy flat Parquet file path for a given ticker."""
         return self.lake_dir / f"{ticker}.parquet"
 
+    def _parts_dir(self, ticker: str) -> Path:
+        return self.lake_dir / PARTS_DIR / f"ticker={ticker}"
+
+    def _ticker_lock(self, ticker: str) -> threading.RLock:
+        """Per-ticker write lock serializing append / save / compact."""
+        with self._lock:
+            lock = self._ticker_locks.get(ticker)
+            if lock is None:
+                lock = self._ticker_locks[ticker] = threading.RLock()
+            return lock
+
+    def _part_files(self, ticker: str) -> list[Path]:
+        d = self._parts_dir(ticker)
+        return sorted(d.glob("part-*.parquet")) if d.exists() else []
+
+    def _read_manifest(self) -> dict[str, dict]:
+        path = self.lake_dir / MANIFEST_FILE
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            logger.warning("lake manifest unreadable, rebuilding: %s", path, exc_info=True)
+            return {}
+
+    def _write_manifest(self) -> None:
+        path = self.lake_dir / MANIFEST_FILE
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self._manifest, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _next_seq(self, ticker: str) -> int:
+        return int(self._manifest.get(ticker, {}).get("seq", -1)) + 1
+
+    def _update_manifest(self, ticker: str, seq: int) -> None:
+        """Recompute a ticker's entry from the part files on disk.
+
+        ``rows`` counts distinct dates, since an append that overwrites a
+        date still reads back as one row.  Caller holds the ticker lock.
+        """
+        parts = self._part_files(ticker)
+        dates = pd.concat(
+            [pd.read_parquet(p, columns=["date"], engine="pyarrow")["date"] for p in parts],
+            ignore_index=True,
+        ) if parts else pd.Series(dtype=object)
+        entry: dict = {"rows": int(dates.nunique()), "parts": len(parts), "seq": seq}
+        if len(dates):
+            entry["start"], entry["end"] = str(dates.min()), str(dates.max())
+        with self._lock:
+            self._manifest[ticker] = entry
+            self._write_manifest()
+
+    # -- write -------------------------------------------------------------------
+
+    def _write_part(self, ticker: str, df: pd.DataFrame, seq: int) -> Path:
+        d = self._parts_dir(ticker)
+        d.mkdir(parents=True, exist_ok=True)
+        path = d / f"part-{seq:08d}.parquet"
+        out = df.copy()
+        out["_seq"] = seq
+        tmp = path.with_suffix(".parquet.tmp")
+        out.to_parquet(tmp, index=False, engine="pyarrow")
+        os.replace(tmp, path)
+        return path
+
     def save(self, ticker: str, df: pd.DataFrame) -> Path:
-        """Save a DataFrame as a Parquet file.
+        """Replace a ticker's data with *df* (one compacted part).
 
         Args:
             ticker: Stock ticker code.
             df: DataFrame with OHLCV columns (date, open, high, low, close, volume).
 
         Returns:
-            Path to the saved Parquet file.
+            Path to the saved Parquet part.
         """
-        path = self._ticker_path(ticker)
-        df.to_parquet(path, index=False, engine="pyarrow")
+        df = _normalize(df)
+        with self._ticker_lock(ticker):
+            old = self._part_files(ticker)
+            seq = self._next_seq(ticker)
+            path = self._write_part(ticker, df, seq)
+            for p in old:
+                p.unlink(missing_ok=True)
+            self._update_manifest(ticker, seq)
         return path
 
+    def append(self, ticker: str, new_df: pd.DataFrame) -> Path:
+        """Append new rows as a new part; rows for existing dates win on read.
+
+        Args:
+            ticker: Stock ticker code.
+            new_df: New OHLCV data to append.
+
+        Returns:
+            Path to the written Parquet part.
+        """
+        df = _normalize(new_df)
+        with self._ticker_lock(ticker):
+            if not self._part_files(ticker) and self._ticker_path(ticker).exists():
+                self._migrate_legacy(ticker)
+            seq = self._next_seq(ticker)
+            path = self._write_part(ticker, df, seq)
+            self._update_manifest(ticker, seq)
+            if self._manifest[ticker]["parts"] > AUTO_COMPACT_PARTS:
+                path = self.compact(ticker) or path
+        return path
+
+    def _migrate_legacy(self, ticker: str) -> None:
+        legacy = pd.read_parquet(self._ticker_path(ticker), engine="pyarrow")
+        self.save(ticker, legacy)
+        self._ticker_path(ticker).unlink(missing_ok=True)
+
+    def compact(self, ticker: str | None = None) -> Optional[Path]:
+        """Merge a ticker's parts into one deduplicated file.
+
+        With ``ticker=None`` every ticker with more than one part (or a
+        legacy flat file) is compacted.  Returns the new part path for a
+        single ticker, else None.
+        """
+        if ticker is None:
+            for t in self.list_tickers():
+                if len(self._part_files(t)) > 1 or self._ticker_path(t).exists():
+                    self.compact(t)
+            return None
+        # 읽기 → 쓰기 → 기존 part 삭제를 종목 락 하나로 묶는다 (사이에 append 된
+        # part 가 읽히지 않은 채 지워지지 않게)
+        with self._ticker_lock(ticker):
+            if not self._part_files(ticker):
+                if self._ticker_path(ticker).exists():
+                    self._migrate_legacy(ticker)
+                    return self._part_files(ticker)[-1]
+                return None
+            df = self.load(ticker)
+            if df is None:
+                return None
+            path = self.save(ticker, df)
+        logger.debug("lake compacted %s (%d rows)", ticker, len(df))
+        return path
+
+    # -- read --------------------------------------------------------------------
+
+    @staticmethod
+    def _dedup(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+        if "_seq" in df.columns:
+            df = df.sort_values([*keys, "_seq"], kind="mergesort")
+            df = df.drop_duplicates(subset=keys, keep="last").drop(columns=["_seq"])
+        return df.sort_values(keys).reset_index(drop=True)
+
     def load(self, ticker: str) -> pd.DataFrame | None:
-        """Load a Parquet file as a DataFrame.
+        """Load all rows for a ticker as a DataFrame sorted by date.
 
         Args:
             ticker: Stock ticker code.
 
         Returns:
-            DataFrame if file exists, None otherwise.
+            DataFrame if data exists, None otherwise.
         """
-        path = self._ticker_path(ticker)
-        if not path.exists():
+        parts = self._part_files(ticker)
+        if not parts:
+            path = self._ticker_path(ticker)
+            if not path.exists():
+                return None
+            return pd.read_parquet(path, engine="pyarrow")
+        df = pd.concat(
+            [pd.read_parquet(p, engine="pyarrow") for p in parts], ignore_index=True,
+        )
+        return self._dedup(df, ["date"]) if "date" in df.columns else df
+
+    def load_panel(
+        self,
+        tickers: Iterable[str],
+        start: str | None = None,
+        end: str | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Multi-ticker read in one dataset scan.
+
+        Ticker and date filters are pushed down to the pyarrow dataset (only
+        matching partitions / row groups are read) and only ``columns`` are
+        materialized.
+
+        Returns:
+            Long DataFrame with ``ticker``, ``date`` and the requested
+            columns, sorted by (ticker, date).  Legacy flat files are
+            included for tickers that have no parts yet.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        tickers = list(dict.fromkeys(tickers))
+        frames: list[pd.DataFrame] = []
+        part_root = self.lake_dir / PARTS_DIR
+        with_parts = [t for t in tickers if self._part_files(t)]
+        if with_parts and part_root.exists():
+            dataset = ds.dataset(
+                str(part_root),
+                format="parquet",
+                partitioning=ds.partitioning(pa.schema([("ticker", pa.string())]), flavor="hive"),
+            )
+            expr = ds.field("ticker").isin(with_parts)
+            if start:
+                expr = expr & (ds.field("date") >= start)
+            if end:
+                expr = expr & (ds.field("date") <= end)
+            names = set(dataset.schema.names)
+            cols = None
+            if columns is not None:
+                cols = ["ticker", "date", *[c for c in columns if c in names and c not in ("ticker", "date")]]
+                if "_seq" in names:
+                    cols.append("_seq")
+            table = dataset.to_table(columns=cols, filter=expr)
+            frames.append(table.to_pandas())
+
+        for t in tickers:
+            if t in with_parts or not self._ticker_path(t).exists():
+                continue
+            legacy = _normalize(pd.read_parquet(self._ticker_path(t), engine="pyarrow"))
+            if start:
+                legacy = legacy[legacy["date"] >= start]
+            if end:
+                legacy = legacy[legacy["date"] <= end]
+            if columns is not None:
+                legacy = legacy[["date", *[c for c in columns if c in legacy.columns and c != "date"]]]
+            frames.append(legacy.assign(ticker=t))
+
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=["ticker", "date", *(columns or [])])
+        df = pd.concat(frames, ignore_index=True)
+        df["ticker"] = df["ticker"].astype(str)
+        df = self._dedup(df, ["ticker", "date"])
+        ordered = ["ticker", "date", *[c for c in df.columns if c not in ("ticker", "date")]]
+        return df[ordered]
+
+    # -- manifest queries ----------------------------------------------------------
+
+    def date_range(self, ticker: str) -> tuple[str, str] | None:
+        """(first_date, last_date) from the manifest, without opening files."""
+        entry = self._manifest.get(ticker)
+        if not entry or "start" not in entry:
             return None
-        return pd.read_parquet(path, engine="pyarrow")
+        return entry["start"], entry["end"]
+
+    def missing(self, tickers: Iterable[str], through: str) -> list[str]:
+        """Tickers with no data or whose last date is before *through*."""
+        out = []
+        for t in tickers:
+            rng = self.date_range(t)
+            if rng is None or rng[1] < through:
+                out.append(t)
+        return out
+
+    def rebuild_manifest(self) -> dict[str, dict]:
+        """Rescan part files (e.g. after manual edits) and rewrite the manifest."""
+        with self._lock:
+            self._manifest = {}
+        for t in self.list_tickers():
+            with self._ticker_lock(t):
+                parts = self._part_files(t)
+                if not parts:
+                    continue
+                self._update_manifest(t, int(parts[-1].stem.split("-")[1]))
+        return dict(self._manifest)
 
     def exists(self, ticker: str) -> bool:
         """Check if Parquet data exists for a ticker."""
-        return self._ticker_path(ticker).exists()
+        return bool(self._part_files(ticker)) or self._ticker_path(ticker).exists()
 
     def list_tickers(self) -> list[str]:
         """List all tickers with stored data."""
-        return [p.stem for p in self.lake_dir.glob("*.parquet")]
+        tickers = {p.stem for p in self.lake_dir.glob("*.parquet")}
+        root = self.lake_dir / PARTS_DIR
+        if root.exists():
+            tickers.update(
+                d.name.split("=", 1)[1] for d in root.iterdir()
+                if d.is_dir() and d.name.startswith("ticker=")
+            )
+        return sorted(tickers)
 
-    def append(self, ticker: str, new_df: pd.DataFrame) -> Path:
-        """Append new rows to existing data, deduplicating by date.
 
-        Args:
-            ticker: Stock ticker code.
-            new_df: New OHLCV data to append.
+INTRADAY_DIR = "intraday"
 
-        Returns:
-            Path to the saved Parquet file.
-        """
-        existing = self.load(ticker)
-        if existing is not None:
-            combined = pd.concat([existing, new_df], ignore_index=True)
-            if "date" in combined.columns:
-                combined = combined.drop_duplicates(subset=["date"], keep="last")
-                combined = combined.sort_values("date").reset_index(drop=True)
-        else:
-            combined = new_df
-        return self.save(ticker, combined)
+
+class IntradayBarStore:
+    """Intraday (1m/5m) bars in the lake, one file per ticker per session.
+
+    Layout::
+
+        data/lake/intraday/interval=1m/ticker=005930/2026-10-16.parquet
+
+    Rows are keyed by a ``datetime`` column (``ParquetStore`` dedups on
+    ``date`` and would collapse a session into one row).  Writing the same
+    session twice replaces that day's file.
+    """
+
+    def __init__(self, lake_dir: Path = DEFAULT_LAKE_DIR) -> None:
+        self.root = lake_dir / INTRADAY_DIR
+
+    def _dir(self, interval: str, ticker: str) -> Path:
+        return self.root / f"interval={interval}" / f"ticker={ticker}"
+
+    def save_session(self, ticker: str, interval: str, day: str, df: pd.DataFrame) -> Path:
+        """Write one session's bars (``datetime`` + OHLCV columns)."""
+        d = self._dir(interval, ticker)
+        d.mkdir(parents=True, exist_ok=True)
+        path = d / f"{day}.parquet"
+        out = df.copy()
+        out["datetime"] = pd.to_datetime(out["datetime"])
+        out = out.sort_values("datetime").drop_duplicates("datetime", keep="last")
+        tmp = path.with_suffix(".parquet.tmp")
+        out.to_parquet(tmp, index=False, engine="pyarrow")
+        os.replace(tmp, path)
+        return path
+
+    def sessions(self, ticker: str, interval: str = "1m") -> list[str]:
+        """Stored session dates (``YYYY-MM-DD``), oldest first."""
+        d = self._dir(interval, ticker)
+        return sorted(p.stem for p in d.glob("*.parquet")) if d.exists() else []
+
+    def load(
+        self,
+        ticker: str,
+        interval: str = "1m",
+        n: int | None = None,
+        day: str | None = None,
+    ) -> pd.DataFrame | None:
+        """Load one session (``day``) or the last *n* bars across sessions."""
+        days = self.sessions(ticker, interval)
+        if day is not None:
+            days = [d for d in days if d == day]
+        if not days:
+            return None
+        frames: list[pd.DataFrame] = []
+        rows = 0
+        for d in reversed(days):
+            df = pd.read_parquet(self._dir(interval, ticker) / f"{d}.parquet", engine="pyarrow")
+            frames.append(df)
+            rows += len(df)
+            if day is not None or (n is not None and rows >= n):
+                break
+        out = pd.concat(frames[::-1], ignore_index=True)
+        return out.tail(n).reset_index(drop=True) if n is not None else out
@@ -7,13 +7,17 @@ import pytest
 
 from kstock.core.advanced_risk import (
     AdvancedVaRResult,
+    CorrelationMatrices,
     DynamicCorrelation,
+    EWMACorrelationState,
     MarketImpactEstimate,
     TCAReport,
     compute_advanced_var,
     compute_copula_var,
+    compute_correlation_matrices,
     compute_dynamic_correlation,
     compute_tca,
+    correlation_matrix,
     estimate_market_impact,
     format_risk_report,
     format_tca_report,
@@ -226,6 +230,77 @@ class TestDynamicCorrelation:
         assert 0.0 <= result.tail_correlation <= 1.0
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TestCorrelationMatrices
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TestCorrelationMatrices:
+    """v14: 전체 쌍 상관 행렬 엔진 테스트."""
+
+    @staticmethod
+    def _panel(n: int = 120, seed: int = 7) -> pd.DataFrame:
+        df = _make_returns_matrix(n, ["A", "B", "C", "D"], seed=seed)
+        df["B"] = df["A"] * 0.7 + df["B"] * 0.3
+        df["D"] = -df["C"] * 0.5 + df["D"] * 0.5
+        return df
+
+    def test_matches_pairwise(self):
+        """결측 없는 패널 → 쌍별 compute_dynamic_correlation 과 동일."""
+        df = self._panel()
+        from kstock.core.advanced_risk import _ewma_correlation
+
+        mats = compute_correlation_matrices(df)
+        assert isinstance(mats, CorrelationMatrices)
+        for a in df.columns:
+            for b in df.columns:
+                if a == b:
+                    continue
+                ref = compute_dynamic_correlation(df[a], df[b], ticker_a=a, ticker_b=b)
+                got = mats.pair(a, b)
+                assert got.rolling_60d == pytest.approx(ref.rolling_60d, abs=1e-4)
+                assert got.rolling_120d == pytest.approx(ref.rolling_120d, abs=1e-4)
+                assert got.crisis_correlation == pytest.approx(ref.crisis_correlation, abs=1e-4)
+                assert got.tail_correlation == pytest.approx(ref.tail_correlation, abs=1e-3)
+                assert got.regime == ref.regime
+                i, j = mats.index(a), mats.index(b)
+                assert mats.ewma[i, j] == pytest.approx(
+                    _ewma_correlation(df[a].to_numpy(), df[b].to_numpy()), abs=1e-9,
+                )
+
+    def test_pairwise_complete_nan(self):
+        """NaN 은 쌍별로만 제외된다."""
+        df = self._panel()
+        df.loc[:29, "C"] = np.nan
+        corr = correlation_matrix(df)
+        ok = df[["A", "C"]].dropna()
+        assert corr[0, 2] == pytest.approx(np.corrcoef(ok["A"], ok["C"])[0, 1])
+        assert corr[0, 1] == pytest.approx(np.corrcoef(df["A"], df["B"])[0, 1])
+
+    def test_ewma_incremental_matches_batch(self):
+        """EWMA 증분 갱신 = 전체 재계산."""
+        df = self._panel(150)
+        head, tail = df.iloc[:100], df.iloc[100:]
+        state = EWMACorrelationState.from_returns(head)
+        # 같은 평균을 쓰도록 배치 쪽도 head 평균으로 고정
+        batch = EWMACorrelationState(list(df.columns))
+        batch.mean = state.mean.copy()
+        for _, row in df.iterrows():
+            batch.update(row)
+        for _, row in tail.iterrows():
+            state.update(row.to_dict())
+        assert np.allclose(state.corr(), batch.corr(), atol=1e-10)
+
+    def test_top_pairs_and_short_pairs(self):
+        df = self._panel()
+        df.loc[:115, "D"] = np.nan          # D 는 관측 4개뿐
+        mats = compute_correlation_matrices(df)
+        assert mats.top_pairs(1)[0][:2] == ("A", "B")
+        assert mats.pair("A", "D").rolling_60d == 0.0
+        assert mats.pair("A", "D").regime == "normal"
+        assert mats.pair("A", "ZZZ").rolling_60d == 0.0
+        assert np.allclose(np.diag(mats.tail), 1.0)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # TestAdvancedVaR
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
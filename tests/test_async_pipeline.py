@@ -0,0 +1,77 @@
+"""Tests for kstock.core.async_pipeline — bounded-queue stage pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+
+from kstock.core.async_pipeline import Stage, run_pipeline
+
+
+def test_items_flow_through_all_stages():
+    async def double(x):
+        return x * 2
+
+    async def inc(x):
+        return x + 1
+
+    out, stats = asyncio.run(run_pipeline(range(10), [
+        Stage("double", double, workers=3),
+        Stage("inc", inc, workers=2),
+    ]))
+    assert sorted(out) == [x * 2 + 1 for x in range(10)]
+    assert stats.stages["double"].items_in == 10
+    assert stats.stages["inc"].items_out == 10
+
+
+def test_none_and_errors_are_dropped():
+    async def stage(x):
+        if x == 3:
+            raise ValueError("boom")
+        return None if x % 2 else x
+
+    out, stats = asyncio.run(run_pipeline(range(6), [Stage("s", stage, workers=2)]))
+    assert sorted(out) == [0, 2, 4]
+    s = stats.stages["s"]
+    assert s.errors == 1
+    assert s.dropped == 3
+    assert "err 1" in stats.summary()
+
+
+def test_slow_item_does_not_block_fast_items():
+    finished = []
+
+    async def work(x):
+        await asyncio.sleep(0.3 if x == 0 else 0.01)
+        finished.append(x)
+        return x
+
+    out, _ = asyncio.run(run_pipeline(range(8), [Stage("w", work, workers=4)]))
+    assert sorted(out) == list(range(8))
+    # 고정 배치였다면 1~3은 0을 기다렸다가 끝났을 것
+    assert finished[-1] == 0
+
+
+def test_bounded_queue_applies_back_pressure():
+    async def fast(x):
+        return x
+
+    async def slow(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    out, stats = asyncio.run(run_pipeline(
+        range(20), [Stage("fast", fast, workers=1), Stage("slow", slow, workers=1)],
+        queue_size=2,
+    ))
+    assert len(out) == 20
+    assert stats.stages["fast"].blocked_s > 0
+    assert set(stats.to_dict()["stages"]) == {"fast", "slow"}
+
+
+def test_empty_input():
+    async def stage(x):
+        return x
+
+    out, stats = asyncio.run(run_pipeline([], [Stage("s", stage, workers=2)]))
+    assert out == []
+    assert stats.stages["s"].items_in == 0
@@ -126,3 +126,39 @@ def test_update_baseline():
     # Should not update with bad accuracy
     monitor.update_baseline(0.3)
     assert monitor._baseline_accuracy == 0.75
+
+
+def test_collect_from_feature_store_bulk_labels(monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    import kstock.ml.feature_store as fs_mod
+    import kstock.ml.labels as labels_mod
+    from kstock.ml.feature_store import FeatureRecord
+
+    store = fs_mod.ColumnarFeatureStore(db_path=":memory:")
+    base = date.today() - timedelta(days=120)
+    dates = [(base + timedelta(days=i)).isoformat() for i in range(3)]
+    store.add_features_batch([
+        FeatureRecord(t, d, f"f{k}", float(k))
+        for d in dates for t in ("A", "B") for k in range(30)
+    ])
+    monkeypatch.setattr(fs_mod, "open_columnar", lambda: store)
+
+    idx = pd.date_range(base, periods=120).strftime("%Y-%m-%d")
+    panel = pd.DataFrame(
+        {"A": np.linspace(100, 200, 120), "B": np.linspace(100, 50, 120)}, index=idx,
+    )
+    loads = []
+
+    def fake_load(tickers, start, end, **kw):
+        loads.append(list(tickers))
+        return panel
+
+    monkeypatch.setattr(labels_mod, "load_close_panel", fake_load)
+
+    data = AutoTrainer()._collect_from_feature_store()
+    assert len(loads) == 1
+    assert len(data) == 6
+    assert {d["target"] for d in data} == {0, 1}
+    assert all("target_medium" in d and "target_tenbagger" in d for d in data)
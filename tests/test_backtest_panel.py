@@ -0,0 +1,154 @@
+"""Tests for the panel (dates × tickers) backtest kernel."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kstock.backtest.panel import build_panel, download_ohlcv, simulate_exits
+
+
+def _frame(closes, start="2025-01-01", skip=()):
+    dates = pd.bdate_range(start=start, periods=len(closes)).strftime("%Y-%m-%d")
+    df = pd.DataFrame({
+        "date": dates,
+        "open": closes,
+        "high": closes,
+        "low": closes,
+        "close": np.asarray(closes, dtype=float),
+        "volume": [1000] * len(closes),
+    })
+    return df.drop(index=list(skip)).reset_index(drop=True)
+
+
+def _history(closes, start="2025-01-01"):
+    idx = pd.bdate_range(start=start, periods=len(closes))
+    c = np.asarray(closes, dtype=float)
+    return pd.DataFrame(
+        {"Open": c, "High": c, "Low": c, "Close": c, "Volume": [1000] * len(c)},
+        index=idx,
+    )
+
+
+class TestBuildPanel:
+    def test_aligns_on_union_of_dates(self):
+        panel = build_panel({
+            "A": _frame([1.0, 2.0, 3.0, 4.0]),
+            "B": _frame([10.0, 20.0, 30.0, 40.0], skip=(1,)),
+        })
+        assert panel.close.shape == (4, 2)
+        assert panel.codes == ["A", "B"]
+        assert np.isnan(panel.close[1, 1])
+        assert panel.valid[:, 0].all()
+
+    def test_frame_returns_own_bars(self):
+        panel = build_panel({"B": _frame([10.0, 20.0, 30.0], skip=(1,))})
+        df = panel.frame(0)
+        assert df["close"].tolist() == [10.0, 30.0]
+
+
+class TestSimulateExits:
+    def _run(self, closes, entry_bars, **kw):
+        panel = build_panel({"A": _frame(closes)})
+        entry = np.zeros(panel.close.shape, dtype=bool)
+        entry[list(entry_bars), 0] = True
+        kw.setdefault("lookback", 0)
+        return simulate_exits(panel, entry, **kw).trades[0]
+
+    def test_target_exit(self):
+        trades = self._run([100, 100, 100, 104, 104, 104], [1])
+        assert len(trades) == 1
+        t = trades[0]
+        assert t.entry_row == 2 and t.exit_row == 3
+        assert t.pnl_pct == pytest.approx(4.0)
+        assert t.holding_days == 1
+
+    def test_stop_exit(self):
+        trades = self._run([100, 100, 100, 94, 94, 94], [1])
+        assert trades[0].exit_row == 3
+        assert trades[0].pnl_pct == pytest.approx(-6.0)
+
+    def test_max_hold_exit(self):
+        trades = self._run([100.0] * 10, [0], max_hold=3)
+        assert trades[0].exit_row == 4
+        assert trades[0].holding_days == 3
+
+    def test_open_trade_closed_on_last_bar(self):
+        trades = self._run([100.0] * 6, [2])
+        assert trades[0].exit_row == 5
+        assert trades[0].holding_days == 2
+
+    def test_cost_pct_is_subtracted(self):
+        trades = self._run([100, 100, 100, 104, 104, 104], [1], cost_pct=0.5)
+        assert trades[0].pnl_pct == pytest.approx(3.5)
+
+    def test_no_reentry_on_exit_bar(self):
+        trades = self._run([100, 100, 100, 104, 104, 104, 104], [1, 3])
+        assert len(trades) == 1
+
+    def test_tickers_are_independent(self):
+        panel = build_panel({
+            "A": _frame([100, 100, 100, 104, 104]),
+            "B": _frame([100, 100, 100, 94, 94]),
+        })
+        entry = np.zeros(panel.close.shape, dtype=bool)
+        entry[1, :] = True
+        sim = simulate_exits(panel, entry, lookback=0)
+        assert sim.trades[0][0].pnl_pct > 0
+        assert sim.trades[1][0].pnl_pct < 0
+
+    def test_missing_rows_do_not_count_as_bars(self):
+        panel = build_panel({
+            "A": _frame([100.0] * 8),
+            "B": _frame([100.0] * 8, skip=(3, 4)),
+        })
+        entry = np.zeros(panel.close.shape, dtype=bool)
+        entry[0, :] = True
+        sim = simulate_exits(panel, entry, lookback=0, max_hold=3)
+        assert sim.trades[0][0].exit_row == 4
+        # B has no bars on rows 3-4, so its 3rd held bar is row 6
+        assert sim.trades[1][0].exit_row == 6
+        assert sim.trades[1][0].holding_days == 3
+
+
+class TestDownloadOhlcv:
+    def test_splits_multi_ticker_batch(self):
+        data = pd.concat(
+            {"A.KS": _history([1.0, 2.0]), "B.KS": _history([3.0, 4.0])}, axis=1,
+        )
+        with patch("yfinance.download", return_value=data) as mock_dl:
+            frames = download_ohlcv(["A.KS", "B.KS"], period="1mo")
+        assert mock_dl.call_count == 1
+        assert frames["B.KS"]["close"].tolist() == [3.0, 4.0]
+
+    def test_download_failure_returns_empty(self):
+        with patch("yfinance.download", side_effect=Exception("timeout")):
+            assert download_ohlcv(["A.KS"]) == {}
+
+
+class TestRunBacktestPanel:
+    def test_matches_single_ticker_runs(self):
+        from kstock.backtest import engine
+
+        rng = np.random.default_rng(7)
+        h1 = _history(50000 * np.cumprod(1 + rng.normal(0, 0.03, 200)))
+        h2 = _history(30000 * np.cumprod(1 + rng.normal(0, 0.03, 200)))
+        data = pd.concat({"005930.KS": h1, "000660.KS": h2}, axis=1)
+
+        class _Buy:
+            signal = "BUY"
+
+        with patch.object(engine, "compute_composite_score", return_value=_Buy()):
+            with patch("yfinance.download", return_value=data):
+                panel = engine.run_backtest_panel(
+                    [{"code": "005930"}, {"code": "000660"}], costs=engine.TradeCosts(),
+                )
+            with patch("yfinance.download", return_value=h2):
+                single = engine.run_backtest("000660", costs=engine.TradeCosts())
+
+        assert set(panel) == {"005930", "000660"}
+        assert panel["000660"].trades == single.trades
+        assert panel["000660"].total_trades > 0
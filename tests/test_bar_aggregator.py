@@ -0,0 +1,116 @@
+"""Tests for kstock.ingest.bar_aggregator — live 1m/5m bars from WS ticks."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from kstock.core.tz import KST
+from kstock.ingest.bar_aggregator import BarAggregator
+from kstock.ingest.kis_websocket import KISWebSocket
+
+
+def _ts(day: str = "2026-10-16", hh: int = 9, mm: int = 0, ss: int = 0) -> float:
+    return datetime.fromisoformat(f"{day}T{hh:02d}:{mm:02d}:{ss:02d}").replace(tzinfo=KST).timestamp()
+
+
+def test_one_minute_and_five_minute_bars():
+    agg = BarAggregator()
+    ticks = [  # (hhmmss, price, vol)
+        (90001, 100, 10), (90030, 105, 5), (90059, 98, 5),
+        (90100, 101, 20), (90455, 103, 10), (90500, 110, 1),
+    ]
+    for hhmmss, price, vol in ticks:
+        agg.on_tick("005930", price, vol, ts=_ts(), hhmmss=hhmmss)
+
+    m1 = agg.get_bars("005930", "1m")
+    assert list(m1["datetime"].dt.strftime("%H:%M")) == ["09:00", "09:01", "09:04", "09:05"]
+    first = m1.iloc[0]
+    assert (first.open, first.high, first.low, first.close, first.volume, first.trades) == (
+        100, 105, 98, 98, 20, 3,
+    )
+    assert first.vwap == pytest.approx((100 * 10 + 105 * 5 + 98 * 5) / 20)
+    assert len(agg.get_bars("005930", "1m", include_partial=False)) == 3
+    assert len(agg.get_bars("005930", "1m", n=2)) == 2
+
+    m5 = agg.get_bars("005930", "5m")
+    assert list(m5["volume"]) == [50, 1]
+    assert m5.iloc[0].high == 105 and m5.iloc[0].close == 103
+    assert agg.last_bar("005930", "5m")["close"] == 110
+    assert agg.session_vwap("005930") == pytest.approx(
+        sum(p * v for _, p, v in ticks) / sum(v for *_, v in ticks),
+    )
+    assert agg.get_bars("000660").empty
+
+
+def test_consumes_ws_tick_ring_without_losing_coalesced_ticks():
+    ws = KISWebSocket()
+    agg = BarAggregator(intervals=("1m",))
+    agg.attach(ws)
+    agg.attach(ws)
+    assert len(ws._callbacks) == 1
+
+    ring = ws.tick_store
+    for i, price in enumerate([100, 101, 102]):
+        ring.append("005930", _ts(ss=i), price, 10, 10 * (i + 1), 0, 0, 90000 + i)
+    agg._on_ws_update("price", "005930", None)          # 병합된 콜백 한 번
+    bar = agg.last_bar("005930")
+    assert (bar["open"], bar["close"], bar["volume"], bar["trades"]) == (100, 102, 30, 3)
+
+    ring.append("005930", _ts(ss=5), 99, 1, 31, 0, 0, 90005)
+    agg._on_ws_update("price", "005930", None)
+    assert agg.last_bar("005930")["trades"] == 4
+
+
+def test_persist_and_day_rollover(tmp_path):
+    pytest.importorskip("pyarrow")
+    from kstock.store.parquet_store import IntradayBarStore
+
+    store = IntradayBarStore(tmp_path)
+    agg = BarAggregator(store=store)
+    agg.on_tick("005930", 100, 1, ts=_ts(), hhmmss=90000)
+    agg.on_tick("005930", 101, 1, ts=_ts(), hhmmss=90130)
+    agg.on_tick("005930", 200, 1, ts=_ts("2026-10-19"), hhmmss=90000)  # 다음 거래일
+
+    prev = store.load("005930", "1m", day="2026-10-16")
+    assert list(prev["close"]) == [100, 101]
+    assert len(agg.get_bars("005930")) == 1
+
+    assert agg.persist() == 2
+    assert store.sessions("005930", "5m") == ["2026-10-16", "2026-10-19"]
+    last = store.load("005930", "1m", n=2)
+    assert list(last["close"]) == [101, 200]
+    assert pd.api.types.is_datetime64_any_dtype(last["datetime"])
+
+
+class _CountingStore:
+    def __init__(self):
+        self.calls: list[tuple[str, str, str, str]] = []
+
+    def save_session(self, ticker, interval, day, df):
+        self.calls.append((ticker, interval, day, threading.current_thread().name))
+
+
+def test_persisted_session_not_rewritten_on_rollover():
+    store = _CountingStore()
+    agg = BarAggregator(intervals=("1m",), store=store)
+    agg.on_tick("005930", 100, 1, ts=_ts(), hhmmss=90000)
+    assert agg.persist() == 1
+    assert agg.persist() == 0                      # 새 틱이 없으면 다시 쓰지 않음
+    agg.on_tick("005930", 200, 1, ts=_ts("2026-10-19"), hhmmss=90000)
+    assert len(store.calls) == 1                   # 다음 날 첫 틱이 전날 파일을 다시 쓰지 않음
+
+
+@pytest.mark.asyncio
+async def test_rollover_write_runs_off_event_loop():
+    store = _CountingStore()
+    agg = BarAggregator(intervals=("1m",), store=store)
+    agg.on_tick("005930", 100, 1, ts=_ts(), hhmmss=90000)
+    agg.on_tick("005930", 200, 1, ts=_ts("2026-10-19"), hhmmss=90000)
+    await asyncio.gather(*agg._roll_writes)
+    assert [c[2] for c in store.calls] == ["2026-10-16"]
+    assert store.calls[0][3] != threading.current_thread().name
@@ -18,7 +18,10 @@ from kstock.bot.chat_handler import (
     should_use_lightweight_chat,
 )
 from kstock.bot.context_builder import (
+    ContextSectionCache,
+    build_full_context_with_macro,
     build_system_prompt,
+    get_context_cache,
     get_market_context,
     get_portfolio_context,
     get_recommendation_context,
@@ -293,6 +296,58 @@ class TestGetRecommendationContext:
         assert len(lines) == 3
 
 
+class TestContextSectionCache:
+    def test_hit_within_ttl_and_same_key(self) -> None:
+        cache = ContextSectionCache(ttls={"portfolio": 60})
+        db = _MockDB()
+        calls: list[int] = []
+
+        def _build() -> str:
+            calls.append(1)
+            return f"v{len(calls)}"
+
+        assert cache.get("portfolio", db, ("a",), _build) == "v1"
+        assert cache.get("portfolio", db, ("a",), _build) == "v1"
+        assert cache.get("portfolio", db, ("b",), _build) == "v2"   # 키 변경 → 재빌드
+        cache.invalidate("portfolio")
+        assert cache.get("portfolio", db, ("b",), _build) == "v3"
+        row = cache.report()[0]
+        assert row["section"] == "portfolio"
+        assert (row["builds"], row["hits"]) == (3, 1)
+        assert row["tokens"] > 0
+
+    def test_expired_ttl_rebuilds_and_failures_not_cached(self) -> None:
+        cache = ContextSectionCache(ttls={"news": 0})
+        db = _MockDB()
+        assert cache.get("news", db, None, lambda: "a") == "a"
+        assert cache.get("news", db, None, lambda: "b") == "b"
+
+        def _boom() -> str:
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            cache.get("other", db, None, _boom)
+        assert cache.lookup("other", db) is None
+        assert {r["section"]: r["failures"] for r in cache.report()}["other"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_context_reuses_sections_until_invalidated(self) -> None:
+        get_context_cache().reset()
+        db = _MockDB(recs=[
+            {"name": "에코프로", "rec_price": 90000, "rec_date": "2026-02-20"},
+        ])
+        first = await build_full_context_with_macro(db)
+        db._recs = []
+        second = await build_full_context_with_macro(db)
+        assert second == first   # recommendations TTL 안 → 캐시 그대로
+        get_context_cache().invalidate("recommendations")
+        third = await build_full_context_with_macro(db)
+        assert third["recommendations"] == "최근 추천 없음"
+        hits = {r["section"]: r["hits"] for r in get_context_cache().report()}
+        assert hits["portfolio"] == 2
+        get_context_cache().reset()
+
+
 # ===========================================================================
 # chat_memory tests
 # ===========================================================================
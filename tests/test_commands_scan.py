@@ -93,3 +93,75 @@ def test_swing_signal_from_scan_result_skips_weak_setup():
     )
     swing = mixin._swing_signal_from_scan_result(result)
     assert swing is None
+
+
+def test_scan_all_stocks_pipeline_runs_each_stage_once_per_ticker():
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    import numpy as np
+    import pandas as pd
+
+    from kstock.bot.mixins import commands as cmd_mod
+    from kstock.ingest.ohlcv_cache import OHLCVCache
+
+    def _frame(seed):
+        close = 10000 * np.cumprod(1 + np.random.default_rng(seed).normal(0, 0.01, 130))
+        return pd.DataFrame({
+            "date": pd.bdate_range("2025-01-01", periods=130).strftime("%Y-%m-%d"),
+            "open": close, "high": close * 1.01, "low": close * 0.99,
+            "close": close, "volume": np.full(130, 1e5),
+        })
+
+    universe = [{"code": f"00000{i}", "name": f"S{i}", "market": "KOSPI"} for i in range(6)]
+    fetched_singles = []
+
+    class _YF:
+        async def batch_download(self, codes, period="6mo"):
+            return {c["code"]: _frame(i) for i, c in enumerate(codes) if c["code"] != "000005"}
+
+        async def get_ohlcv(self, code, market="KOSPI", period="6mo"):
+            fetched_singles.append(code)
+            return _frame(99)
+
+        async def get_stock_info(self, code, name, market):
+            return {"current_price": 10000}
+
+    async def _macro():
+        return SimpleNamespace(vix=15.0, usdkrw=1300.0)
+
+    mixin = CommandsMixin.__new__(CommandsMixin)
+    mixin.macro_client = SimpleNamespace(get_snapshot=_macro)
+    mixin._sector_strengths = [object()]
+    mixin._sector_strengths_time = float("inf")
+    mixin._build_scan_universe = lambda max_tickers=None: universe
+    mixin.yf_client = _YF()
+    mixin._ohlcv_cache = OHLCVCache()
+    mixin.db = MagicMock()
+
+    async def _price(ticker, base_price=0):
+        return base_price
+
+    mixin._get_price = _price
+    analyzed = []
+
+    async def _fake_analyze(ticker, name, macro, **kw):
+        inputs = kw["inputs"]
+        assert inputs.tech is not None and inputs.info.current_price == 10000
+        analyzed.append((ticker, kw["rs_total"]))
+        return _make_scan_result(
+            ticker, name, price=10000, rsi=50.0, bb_pctb=0.5, macd_signal_cross=0,
+            volume_ratio=1.0, ma20=10000, return_3m_pct=0.0,
+        )
+
+    mixin._analyze_stock = _fake_analyze
+    results = asyncio.run(mixin._scan_all_stocks())
+
+    assert sorted(r.ticker for r in results) == sorted(s["code"] for s in universe)
+    assert fetched_singles == ["000005"]          # 배치에서 빠진 종목만 개별 fetch
+    assert {n for _, n in analyzed} == {6}
+    stages = mixin._last_scan_stage_stats["stages"]
+    assert list(stages) == ["prefetch", "fetch", "indicators", "enrich"]
+    assert stages["enrich"]["items_out"] == 6
+    assert cmd_mod._return_3m(None) is None
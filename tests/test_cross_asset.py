@@ -90,6 +90,20 @@ class TestCorrelations:
         # Not enough data for 30-day window -> 0.0 fallback
         assert result[0].correlation_30d == 0.0
 
+    def test_matrix_path_matches_rolling(self) -> None:
+        """Gap-free panel (matrix path) matches pandas rolling correlation."""
+        rm = _make_returns_map(300, seed=5)
+        rm["B"] = rm["A"] * 0.6 + rm["B"] * 0.4
+        fast = compute_asset_correlations(rm, windows=[30, 90, 252])
+        for res in fast:
+            a, b = rm[res.asset_a], rm[res.asset_b]
+            assert res.correlation_30d == pytest.approx(
+                a.rolling(30).corr(b).iloc[-1], abs=1e-9,
+            )
+            assert res.correlation_252d == pytest.approx(
+                a.rolling(252).corr(b).iloc[-1], abs=1e-9,
+            )
+
 
 # ---------------------------------------------------------------------------
 # TestTailDependency
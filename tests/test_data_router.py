@@ -258,3 +258,191 @@ async def test_get_price_prefers_naver_during_live_session():
 
     assert price == 1100.0
     assert router.last_source_used == "naver"
+
+
+# ---------------------------------------------------------------------------
+# v14: batch APIs / single-flight / shared quote cache
+# ---------------------------------------------------------------------------
+
+
+class BatchYF:
+    def __init__(self, prices=None, frames=None):
+        self.prices = prices or {}
+        self.frames = frames or {}
+        self.price_calls: list[list[str]] = []
+        self.ohlcv_calls: list[list[str]] = []
+
+    async def get_current_prices(self, codes, markets=None):
+        self.price_calls.append(list(codes))
+        return {c: self.prices[c] for c in codes if c in self.prices}
+
+    async def get_ohlcv_many(self, codes, markets=None, period="6mo"):
+        self.ohlcv_calls.append(list(codes))
+        return {c: self.frames[c] for c in codes if c in self.frames}
+
+
+class BatchNaver:
+    def __init__(self, prices=None, frames=None):
+        self.prices = prices or {}
+        self.frames = frames or {}
+        self.price_calls: list[list[str]] = []
+        self.ohlcv_calls: list[str] = []
+
+    async def get_current_prices(self, codes):
+        self.price_calls.append(list(codes))
+        return {c: self.prices[c] for c in codes if c in self.prices}
+
+    async def get_current_price(self, code):
+        return self.prices.get(code, 0.0)
+
+    async def get_ohlcv(self, code, period_days=120):
+        import pandas as pd
+        self.ohlcv_calls.append(code)
+        return self.frames.get(code, pd.DataFrame())
+
+
+def _router(yf=None, naver=None, live=False, ws=None):
+    router = DataRouter(kis_broker=None, yf_client=yf, db=None, ws=ws)
+    router._get_naver_client = lambda: naver
+    router._is_kr_live_session = lambda: live
+    router._record_fetch = lambda *a, **k: None
+    return router
+
+
+@pytest.mark.asyncio
+async def test_get_prices_batches_by_source_and_caches():
+    yf = BatchYF({"A": 100.0, "B": 200.0})
+    naver = BatchNaver({"C": 300.0})
+    router = _router(yf, naver)
+
+    prices = await router.get_prices(["A", "B", "C", "A"])
+    assert prices == {"A": 100.0, "B": 200.0, "C": 300.0}
+    assert yf.price_calls == [["A", "B", "C"]]          # 다종목 1회
+    assert naver.price_calls == [["C"]]                  # 남은 종목만 폴백
+    assert router.last_source_used == "naver"            # 가장 지연 큰 소스
+
+    # 공유 캐시: 재요청 없음 (단건 get_price 포함)
+    assert await router.get_price("B") == 200.0
+    assert await router.get_prices(["A", "C"]) == {"A": 100.0, "C": 300.0}
+    assert len(yf.price_calls) == 1
+    assert router.batch_stats()["quote_hits"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_prices_prefers_naver_polling_during_live_session():
+    yf = BatchYF({"A": 100.0, "B": 200.0})
+    naver = BatchNaver({"A": 110.0})
+    router = _router(yf, naver, live=True)
+
+    assert await router.get_prices(["A", "B"]) == {"A": 110.0, "B": 200.0}
+    assert naver.price_calls == [["A", "B"]]
+    assert yf.price_calls == [["B"]]
+
+
+@pytest.mark.asyncio
+async def test_ws_snapshot_used_first():
+    import time as _time
+    from types import SimpleNamespace
+
+    class WS:
+        def get_price(self, ticker):
+            if ticker == "A":
+                return SimpleNamespace(price=123.0, updated_at=_time.time())
+            if ticker == "B":
+                return SimpleNamespace(price=456.0, updated_at=_time.time() - 3600)
+            return None
+
+    yf = BatchYF({"B": 200.0})
+    router = _router(yf, None, ws=WS())
+    assert await router.get_prices(["A", "B"]) == {"A": 123.0, "B": 200.0}
+    assert yf.price_calls == [["B"]]                     # 오래된 스냅샷은 무시
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced():
+    import asyncio
+
+    calls = []
+
+    class SlowYF:
+        async def get_current_price(self, ticker, market="KOSPI"):
+            calls.append(ticker)
+            await asyncio.sleep(0.02)
+            return 500.0
+
+    router = _router(SlowYF(), None)
+    results = await asyncio.gather(
+        router.get_price("A"), router.get_price("A"), router.get_prices(["A", "B"]),
+    )
+    assert results[0] == results[1] == 500.0
+    assert results[2] == {"A": 500.0, "B": 500.0}
+    assert sorted(calls) == ["A", "B"]
+    assert router.batch_stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiters_survive_leader_cancel():
+    import asyncio
+
+    calls = []
+
+    class SlowYF:
+        async def get_current_price(self, ticker, market="KOSPI"):
+            calls.append(ticker)
+            await asyncio.sleep(0.1)
+            return 500.0
+
+    router = _router(SlowYF(), None)
+
+    # 첫 요청자만 타임아웃으로 취소돼도 합류자는 기본값(0.0)이 아닌 실제 시세를 받는다
+    async def follower(get):
+        await asyncio.sleep(0.01)
+        return await get()
+
+    leader = asyncio.wait_for(router.get_price("A"), 0.03)
+    results = await asyncio.gather(
+        leader,
+        follower(lambda: router.get_price("A")),
+        follower(lambda: router.get_prices(["A"])),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == 500.0
+    assert results[2] == {"A": 500.0}
+    assert calls == ["A"]
+    assert router._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiters_get_leader_exception():
+    import asyncio
+
+    router = _router(None, None)
+
+    async def boom():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("down")
+
+    async def follower():
+        await asyncio.sleep(0.005)
+        return await router._single_flight("k", boom, 0.0)
+
+    results = await asyncio.gather(
+        router._single_flight("k", boom, 0.0), follower(), return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_get_ohlcv_many_batch_then_naver_fallback():
+    import pandas as pd
+
+    frame = pd.DataFrame({"date": ["2025-01-02"], "close": [1.0]})
+    yf = BatchYF(frames={"A": frame})
+    naver = BatchNaver(frames={"B": frame})
+    router = _router(yf, naver)
+
+    out = await router.get_ohlcv_many(["A", "B", "C"], period="3mo")
+    assert sorted(out) == ["A", "B"]
+    assert yf.ohlcv_calls == [["A", "B", "C"]]
+    assert sorted(naver.ohlcv_calls) == ["B", "C"]
@@ -6,11 +6,16 @@ from datetime import datetime, timedelta
 
 import pytest
 
+import numpy as np
+
 from kstock.ml.feature_store import (
+    ColumnarFeatureStore,
     FeatureRecord,
     FeatureSet,
     FeatureStats,
     FeatureStore,
+    migrate_to_columnar,
+    open_columnar,
 )
 
 # ---------------------------------------------------------------------------
@@ -18,10 +23,10 @@ from kstock.ml.feature_store import (
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
-def store():
-    """In-memory feature store for isolated tests."""
-    s = FeatureStore(db_path=":memory:", ttl_days=30)
+@pytest.fixture(params=[FeatureStore, ColumnarFeatureStore], ids=["eav", "columnar"])
+def store(request):
+    """In-memory feature store for isolated tests (both layouts)."""
+    s = request.param(db_path=":memory:", ttl_days=30)
     yield s
     s.close()
 
@@ -186,3 +191,97 @@ class TestBackwardCompatible:
         finally:
             fs_mod._default_store.close()
             fs_mod._default_store = None
+
+
+# ---------------------------------------------------------------------------
+# Bulk panel reads & columnar layout
+# ---------------------------------------------------------------------------
+
+
+def _fill(store, dates, tickers, names):
+    records = [
+        FeatureRecord(t, d, n, float(di * 100 + ti * 10 + k), "technical")
+        for di, d in enumerate(dates)
+        for ti, t in enumerate(tickers)
+        for k, n in enumerate(names)
+    ]
+    store.add_features_batch(records)
+
+
+class TestPanel:
+    def test_panel_shape_and_values(self, store):
+        dates = ["2025-03-01", "2025-03-02"]
+        tickers = ["005930", "000660", "035420"]
+        names = ["rsi_14", "macd"]
+        _fill(store, dates, tickers, names)
+
+        panel = store.get_panel(dates)
+        assert panel.shape == (6, 2)
+        assert panel.loc[("2025-03-02", "000660"), "macd"] == pytest.approx(111.0)
+
+    def test_panel_filters_and_missing(self, store):
+        _fill(store, ["2025-03-01"], ["005930", "000660"], ["rsi_14"])
+        panel = store.get_panel(
+            ["2025-03-01"], tickers=["000660"], features=["rsi_14", "unknown"],
+        )
+        assert list(panel.columns) == ["rsi_14", "unknown"]
+        assert len(panel) == 1
+        assert np.isnan(panel["unknown"].iloc[0])
+
+
+class TestColumnar:
+    def test_new_feature_on_existing_row(self):
+        s = ColumnarFeatureStore(db_path=":memory:")
+        s.add_feature("005930", "2025-03-01", "rsi_14", 60.0)
+        s.add_feature("000660", "2025-03-01", "rsi_14", 40.0)
+        s.add_feature("005930", "2025-03-01", "macd", 1.5)
+        assert s.get_features_dict("005930", "2025-03-01") == {"rsi_14": 60.0, "macd": 1.5}
+        # older, shorter vector reads back NaN-padded
+        assert s.get_features_dict("000660", "2025-03-01") == {"rsi_14": 40.0}
+        assert s.get_cross_section("2025-03-01", "macd") == {"005930": 1.5}
+        s.close()
+
+    def test_columns_persist_across_reopen(self, tmp_path):
+        path = tmp_path / "wide.db"
+        s = ColumnarFeatureStore(db_path=path)
+        s.add_feature_row("005930", "2025-03-01", {"a": 1.0, "b": 2.0}, category="technical")
+        s.close()
+        s = ColumnarFeatureStore(db_path=path)
+        assert s.feature_names == ["a", "b"]
+        fs = s.get_features("005930", "2025-03-01")
+        assert fs.features == {"a": 1.0, "b": 2.0}
+        assert fs.categories["a"] == "technical"
+        s.close()
+
+    def test_migrate_from_eav(self):
+        eav = FeatureStore(db_path=":memory:")
+        dates = ["2025-03-01", "2025-03-02", "2025-03-03"]
+        tickers = ["005930", "000660"]
+        names = ["rsi_14", "macd", "bb_pctb"]
+        _fill(eav, dates, tickers, names)
+        wide = ColumnarFeatureStore(db_path=":memory:")
+
+        assert migrate_to_columnar(eav, wide) == 18
+        for d in dates:
+            for t in tickers:
+                assert wide.get_features_dict(t, d) == eav.get_features_dict(t, d)
+        assert wide.get_stats().total_records == eav.get_stats().total_records
+        eav.close()
+        wide.close()
+
+    def test_open_columnar_seeds_from_legacy_once(self, tmp_path):
+        legacy = tmp_path / "features.db"
+        eav = FeatureStore(db_path=legacy)
+        _fill(eav, ["2025-03-01"], ["005930"], ["rsi_14", "macd"])
+        eav.close()
+
+        wide = open_columnar(tmp_path / "wide.db", legacy_path=legacy)
+        assert wide.get_features_dict("005930", "2025-03-01") == {"rsi_14": 0.0, "macd": 1.0}
+        wide.add_feature("005930", "2025-03-01", "rsi_14", 55.0)
+        wide.close()
+
+        # already seeded: the legacy copy must not overwrite newer values
+        wide = open_columnar(tmp_path / "wide.db", legacy_path=legacy)
+        assert wide.get_features_dict("005930", "2025-03-01")["rsi_14"] == 55.0
+        wide.close()
+        assert open_columnar(":memory:", legacy_path=tmp_path / "none.db").feature_names == []
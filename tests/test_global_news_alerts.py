@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
+from kstock.ingest import global_news as gn
 from kstock.ingest.global_news import (
     NewsItem,
     _DEAD_FEED_BACKOFF,
@@ -15,16 +16,33 @@ from kstock.ingest.global_news import (
     _is_actionable_market_news,
     analyze_urgent_news,
     fetch_global_news,
+    get_feed_fetch_stats,
+    reset_feed_cache,
     translate_titles_to_korean,
 )
 from kstock.core.tz import KST
 
 
+@pytest.fixture(autouse=True)
+def _isolated_feed_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(gn, "FEED_STATE_PATH", tmp_path / "rss_feed_state.json")
+    reset_feed_cache(clear_state=True)
+    yield
+    reset_feed_cache(clear_state=True)
+
+
 class _FakeResponse:
-    def __init__(self, status_code: int, text: str = "", json_data: dict | None = None):
+    def __init__(
+        self,
+        status_code: int,
+        text: str = "",
+        json_data: dict | None = None,
+        headers: dict | None = None,
+    ):
         self.status_code = status_code
         self.text = text
         self._json_data = json_data or {}
+        self.headers = headers or {}
 
     def json(self):
         return self._json_data
@@ -57,6 +75,7 @@ class _FakeFeedClient:
 
     async def get(self, url, *args, **kwargs):
         self.calls[url] = self.calls.get(url, 0) + 1
+        self.last_headers = kwargs.get("headers") or {}
         queue = self.responses.get(url, [])
         if queue:
             return queue.pop(0)
@@ -219,3 +238,93 @@ async def test_fetch_global_news_clears_backoff_on_success(monkeypatch):
     assert len(items) == 1
     assert items[0].title == "유가 하락에 코스피 반등"
     assert url not in _DEAD_FEED_BACKOFF
+
+
+def _rss(*titles: str) -> str:
+    items = "".join(
+        f"<item><title>{t}</title><link>https://example.com/{i}</link>"
+        f"<guid>g-{t}</guid><pubDate>Mon, 12 Oct 2026 0{i}:00:00 +0900</pubDate></item>"
+        for i, t in sorted(enumerate(titles), reverse=True)
+    )
+    return f"<rss><channel>{items}</channel></rss>"
+
+
+@pytest.mark.asyncio
+async def test_fetch_global_news_conditional_get_reuses_items():
+    url = "https://example.com/cond.xml"
+    feed = {"name": "Cond feed", "url": url, "lang": "ko", "category": "market"}
+    body = _rss("코스피 반등 환율 하락", "유가 급등에 증시 하락")
+    client = _FakeFeedClient({url: [
+        _FakeResponse(200, body, headers={"etag": '"v1"', "last-modified": "Mon, 12 Oct 2026"}),
+        _FakeResponse(304, ""),
+    ]})
+    _DEAD_FEED_BACKOFF.clear()
+
+    with patch("httpx.AsyncClient", return_value=client):
+        first = await fetch_global_news(feeds=[feed], include_youtube=False)
+        second = await fetch_global_news(feeds=[feed], include_youtube=False)
+
+    assert client.last_headers["If-None-Match"] == '"v1"'
+    assert client.last_headers["If-Modified-Since"] == "Mon, 12 Oct 2026"
+    assert [i.title for i in second] == [i.title for i in first]
+    assert len(first) == 2 and first[0] is not second[0]
+    stats = get_feed_fetch_stats()
+    assert stats["requests"] == 2
+    assert stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(body.encode("utf-8"))
+    assert gn.FEED_STATE_PATH.exists()
+
+
+def test_watermark_stops_parsing_at_known_items(monkeypatch):
+    feed = {
+        "name": "WM feed", "url": "https://example.com/wm.xml", "lang": "ko",
+        "category": "market", "sorted": True,
+    }
+    gn._update_feed_state(feed, _FakeResponse(200, _rss("a 코스피", "b 코스피")))
+
+    parsed: list[str] = []
+    real = gn._entry_to_item
+
+    def _spy(entry, f):
+        item = real(entry, f)
+        parsed.append(item.title)
+        return item
+
+    monkeypatch.setattr(gn, "_entry_to_item", _spy)
+    items = gn._update_feed_state(feed, _FakeResponse(200, _rss("a 코스피", "b 코스피", "c 코스피")))
+
+    assert parsed == ["c 코스피", "b 코스피"]   # 이미 본 b에서 멈춤
+    assert [i.title for i in items] == ["c 코스피", "b 코스피", "a 코스피"]
+    assert items == gn._parse_rss(_rss("a 코스피", "b 코스피", "c 코스피"), feed)
+
+
+def test_unsorted_feed_keeps_new_items_below_old_pinned_item():
+    feed = {"name": "Search feed", "url": "https://example.com/search.xml", "lang": "en", "category": "market"}
+    gn._update_feed_state(feed, _FakeResponse(200, _rss("a 코스피", "b 코스피")))
+
+    # 관련도 정렬: 이미 본 오래된 a 가 맨 위에 고정되고 새 c, d 는 그 아래
+    body = _rss("a 코스피").replace("</channel></rss>", "") + "".join(
+        f"<item><title>{t}</title><link>https://example.com/{t}</link>"
+        f"<guid>g-{t}</guid><pubDate>Mon, 12 Oct 2026 0{h}:00:00 +0900</pubDate></item>"
+        for t, h in (("d 코스피", 5), ("c 코스피", 4))
+    ) + "</channel></rss>"
+    items = gn._update_feed_state(feed, _FakeResponse(200, body))
+
+    titles = [i.title for i in items]
+    assert titles[:2] == ["d 코스피", "c 코스피"]
+    assert set(titles) == {"a 코스피", "b 코스피", "c 코스피", "d 코스피"}
+
+
+def test_feed_state_persists_across_restart():
+    feed = {"name": "P feed", "url": "https://example.com/p.xml", "lang": "ko", "category": "market"}
+    gn._update_feed_state(feed, _FakeResponse(200, _rss("증시 급락"), headers={"etag": "x"}))
+    gn._save_feed_state()
+
+    reset_feed_cache(clear_state=True)
+    gn._FEED_STATE_META["loaded"] = False
+    gn._load_feed_state()
+
+    state = gn._FEED_STATE[feed["url"]]
+    assert state["etag"] == "x"
+    assert state["watermark"]["id"] == "g-증시 급락"
+    assert gn._conditional_headers(state)["If-None-Match"] == "x"
@@ -14,6 +14,7 @@ from kstock.core.health_monitor import (
     check_disk_usage,
     check_memory_usage,
     check_db_accessible,
+    check_db_pool,
     check_db_size,
     check_manager_pipeline,
     backup_database,
@@ -525,3 +526,32 @@ class TestFormatHealthAlert:
         text = format_health_alert(failed)
         assert "[오류]" in text
         assert "[주의]" in text
+
+
+# =========================================================================
+# TestCheckDbPool
+# =========================================================================
+
+
+class TestCheckDbPool:
+    """check_db_pool 함수 테스트."""
+
+    def _stats(self, wait_ms):
+        role = {"checkouts": 10, "wait_avg_ms": wait_ms, "hold_avg_ms": 1.0}
+        return {"reader": role, "writer": dict(role, wait_avg_ms=0.0)}
+
+    def test_ok(self):
+        assert check_db_pool(self._stats(1.0)).status == "ok"
+
+    def test_warning_and_error(self):
+        assert check_db_pool(self._stats(500.0)).status == "warning"
+        assert check_db_pool(self._stats(5000.0)).status == "error"
+
+    def test_from_store(self, tmp_path):
+        from kstock.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(db_path=tmp_path / "pool.db")
+        store.get_portfolio()
+        checks = run_health_checks(pool_stats=store.pool_stats())
+        pool = [c for c in checks if c.name == "db_pool"]
+        assert pool and pool[0].status == "ok"
@@ -0,0 +1,128 @@
+"""Tests for kstock.ingest.http_pool — pooled async HTTP client layer."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from kstock.ingest import http_pool as hp
+from kstock.ingest.http_pool import HostPolicy, HttpPool, LatencyHistogram
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """httpx.AsyncClient를 MockTransport 기반으로 바꾸고 생성 횟수를 센다."""
+    created: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("down", request=request)
+        status = 500 if request.url.path == "/err" else 200
+        return httpx.Response(status, json={"path": request.url.path})
+
+    real = httpx.AsyncClient
+
+    class _Client(real):
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            kwargs.pop("http2", None)
+            super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(hp.httpx, "AsyncClient", _Client)
+    return created
+
+
+def test_client_reused_per_host(transport):
+    pool = HttpPool()
+
+    async def run():
+        a = await pool.get("https://a.example.com/x")
+        await pool.get("https://a.example.com/y", endpoint="a.y")
+        async with pool.session(timeout=5) as client:
+            await client.get("https://b.example.com/z")
+        await pool.aclose()
+        return a
+
+    resp = asyncio.run(run())
+    assert resp.json() == {"path": "/x"}
+    assert len(transport) == 2                      # 호스트당 클라이언트 하나
+    stats = pool.stats()
+    assert stats["a.example.com/x"]["count"] == 1
+    assert stats["a.y"]["count"] == 1
+    assert stats["b.example.com/z"]["count"] == 1
+
+
+def test_client_kept_when_factory_swapped(transport, monkeypatch):
+    pool = HttpPool()
+
+    async def run():
+        first = pool.client("a.example.com")
+        # 같은 루프에서 클래스를 바꿔도 기존 클라이언트를 버리지(누수) 않는다
+        monkeypatch.setattr(hp.httpx, "AsyncClient", lambda **kw: pytest.fail("rebuilt"))
+        assert pool.client("a.example.com") is first
+        await pool.aclose()
+        return first
+
+    assert asyncio.run(run()).is_closed
+    assert len(transport) == 1
+
+
+def test_new_loop_gets_new_client(transport):
+    pool = HttpPool()
+    asyncio.run(pool.get("https://a.example.com/x"))
+    asyncio.run(pool.get("https://a.example.com/x"))
+    assert len(transport) == 2
+
+
+def test_per_host_rate_limit(transport):
+    pool = HttpPool({"slow.example.com": HostPolicy(rate=2, period_s=0.2)})
+
+    async def run():
+        t0 = time.perf_counter()
+        await asyncio.gather(*[pool.get("https://slow.example.com/q") for _ in range(6)])
+        slow = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        await asyncio.gather(*[pool.get("https://fast.example.com/q") for _ in range(6)])
+        return slow, time.perf_counter() - t0
+
+    slow, fast = asyncio.run(run())
+    assert slow >= 0.35                             # 2건/0.2s → 6건은 두 번 대기
+    assert fast < slow
+    assert "slow.example.com" in pool.stats()["_throttled_s"]
+
+
+def test_errors_are_recorded(transport):
+    pool = HttpPool()
+
+    async def run():
+        resp = await pool.get("https://a.example.com/err")
+        with pytest.raises(httpx.ConnectError):
+            await pool.get("https://a.example.com/boom")
+        return resp
+
+    assert asyncio.run(run()).status_code == 500
+    stats = pool.stats()
+    assert stats["a.example.com/err"]["errors"] == 1
+    assert stats["a.example.com/boom"]["errors"] == 1
+
+
+def test_policy_suffix_match():
+    pool = HttpPool()
+    assert pool.policy_for("api.finance.naver.com").rate == 10
+    assert pool.policy_for("openapivts.koreainvestment.com").rate == 2
+    assert pool.policy_for("unknown.example.com") == hp._DEFAULT_POLICY
+
+
+def test_latency_histogram_percentiles():
+    h = LatencyHistogram()
+    for ms in [5] * 90 + [300] * 9 + [20000]:
+        h.observe(ms)
+    d = h.to_dict()
+    assert d["count"] == 100
+    assert d["p50_ms"] == 10
+    assert d["p95_ms"] == 500
+    assert d["max_ms"] == 20000
+    assert d["buckets"]["inf"] == 1
@@ -88,3 +88,99 @@ def test_status_includes_last_disconnect_reason():
     ws._desired_subscriptions = {"005930"}
     ws._last_disconnect_reason = "ping timeout"
     assert "ping timeout" in ws.get_status()
+
+
+def _price_record(ticker="005930", hhmmss="090001", price=70000, trade_vol=10, volume=1000,
+                  sign="2", n_fields=46):
+    f = ["0"] * n_fields
+    f[0], f[1], f[2], f[3], f[4], f[5] = ticker, hhmmss, str(price), sign, "500", "0.72"
+    f[12], f[13] = str(trade_vol), str(volume)
+    f[25], f[26], f[27], f[28] = str(price + 100), str(price), "5000", "7000"
+    return "^".join(f)
+
+
+def test_parse_price_updates_in_place_and_records_ticks():
+    ws = KISWebSocket(tick_capacity=3)
+    seen = []
+    ws.on_update(lambda ev, t, d: seen.append((ev, t, d.price)))
+
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=70000))
+    first = ws.get_price("005930")
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=70100, sign="5"))
+
+    rp = ws.get_price("005930")
+    assert rp is first                              # 틱마다 새 객체를 만들지 않음
+    assert rp.price == 70100 and rp.change == -500 and rp.change_pct == -0.72
+    assert rp.trade_time == "09:00:01" and rp.ask_price == 70200
+    assert seen == [("price", "005930", 70000), ("price", "005930", 70100)]  # 루프 없음 → 즉시
+
+    for p in (70200, 70300):
+        ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=p))
+    ticks = ws.get_ticks("005930")
+    assert list(ticks["price"]) == [70100, 70200, 70300]   # 용량 3 링
+    assert ticks["hhmmss"][-1] == 90001
+    assert list(ws.get_ticks("005930", 1)["price"]) == [70300]
+    assert len(ws.get_ticks("000660")) == 0
+
+
+def test_parse_price_multi_record_and_short_frame():
+    ws = KISWebSocket()
+    frame = "^".join([_price_record(price=100), _price_record("000660", price=200),
+                      _price_record(price=101)])
+    ws._parse_realtime_data("0|H0STCNT0|003|" + frame)
+    assert ws.get_price("005930").price == 101
+    assert ws.get_price("000660").price == 200
+    assert list(ws.get_ticks("005930")["price"]) == [100, 101]
+
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record("035720", n_fields=30))
+    assert ws.get_price("035720") is None
+
+
+def test_tick_store_since_skips_overwritten():
+    from kstock.ingest.tick_store import TickRing
+
+    ring = TickRing(4)
+    for i in range(6):
+        ring.append(i, 100 + i, 1, i, 0, 0, 90000 + i)
+    ticks, seq = ring.since(3)
+    assert list(ticks["price"]) == [103, 104, 105] and seq == 6
+    ticks, _ = ring.since(0)                        # 덮어쓴 0,1은 잃고 남은 4개
+    assert list(ticks["price"]) == [102, 103, 104, 105]
+    assert ring.since(6)[0].size == 0
+
+
+@pytest.mark.asyncio
+async def test_callbacks_dispatched_off_receive_loop_and_coalesced():
+    ws = KISWebSocket()
+    seen = []
+    ws.on_update(lambda ev, t, d: seen.append((t, d.price)))
+
+    for p in (100, 101, 102):
+        ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=p))
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record("000660", price=5))
+    assert seen == []                               # 파싱 중에는 콜백 미실행
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert seen == [("005930", 102), ("000660", 5)]
+    stats = ws.get_dispatch_stats()
+    assert stats["coalesced"] == 2 and stats["dispatched"] == 2 and stats["pending"] == 0
+    assert len(ws.get_ticks("005930")) == 3         # 틱 이력은 전부 남음
+
+    await ws.disconnect()
+    assert ws._dispatch_task is None
+
+
+@pytest.mark.asyncio
+async def test_callback_data_is_snapshot_not_live_object():
+    ws = KISWebSocket()
+    seen = []
+    ws.on_update(lambda ev, t, d: seen.append(d))
+
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=100))
+    await asyncio.sleep(0)
+    ws._parse_realtime_data("0|H0STCNT0|001|" + _price_record(price=130))
+    # 콜백이 await 뒤에 읽어도 자신을 트리거한 틱 값을 본다
+    assert seen[0].price == 100
+    assert ws.get_price("005930").price == 130
+    await ws.disconnect()
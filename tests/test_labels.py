@@ -0,0 +1,106 @@
+"""Tests for kstock.ml.labels — vectorized training labels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kstock.ml.labels import (
+    LabelBuilder,
+    build_label_builder,
+    forward_return_pct,
+    load_close_panel,
+    triple_barrier_labels,
+)
+from kstock.ml.predictor import triple_barrier_label
+
+
+def _walk(n, seed=0, vol=0.03):
+    rng = np.random.default_rng(seed)
+    return 10000 * np.cumprod(1 + rng.normal(0, vol, n))
+
+
+def test_forward_return_pct():
+    close = np.array([100.0, 101.0, 102.0, 110.0, 90.0])
+    out = forward_return_pct(close, 3)
+    assert out[0] == pytest.approx(10.0)
+    assert out[1] == pytest.approx(-10.891089, rel=1e-5)
+    assert np.isnan(out[2:]).all()
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_triple_barrier_matches_scalar(seed):
+    close = _walk(120, seed)
+    labels = triple_barrier_labels(close)
+    for i in range(len(close)):
+        if i + 29 < len(close):
+            assert labels[i] == triple_barrier_label(close[i:], 0, window=29)
+        else:
+            assert np.isnan(labels[i])
+
+
+def test_label_builder_uses_own_bars():
+    dates = pd.bdate_range("2025-01-01", periods=80).strftime("%Y-%m-%d")
+    a = np.full(80, 100.0)
+    a[5] = 104.0                    # +4% only on row 5
+    b = a.copy()
+    b[2] = np.nan                   # B has no bar on row 2 → its D+5 is row 6
+    panel = pd.DataFrame({"A": a, "B": b}, index=dates)
+    lb = LabelBuilder(close=panel)
+
+    assert lb.labels("A", dates[0])["target"] == 1
+    assert lb.labels("B", dates[0])["target"] == 0
+    # base date on a missing bar starts from the next own bar
+    assert lb.labels("B", dates[2]) == lb.labels("B", dates[3])
+    assert lb.labels("A", dates[0])["target_medium"] in (0, 1)
+    assert "target_tenbagger" in lb.labels("A", dates[0])
+    assert lb.labels("A", dates[77]) == {}            # not enough forward bars
+
+
+def test_known_returns_take_priority():
+    dates = pd.bdate_range("2025-01-01", periods=40).strftime("%Y-%m-%d")
+    panel = pd.DataFrame({"A": np.full(40, 100.0)}, index=dates)
+    lb = LabelBuilder(close=panel, known_returns={("A", dates[0]): 5.0})
+    assert lb.labels("A", dates[0])["target"] == 1
+    assert lb.labels("A", dates[1])["target"] == 0
+
+
+def test_load_close_panel_fetches_once_per_ticker(tmp_path):
+    calls = []
+
+    def fetch(ticker, start, end):
+        calls.append(ticker)
+        idx = pd.bdate_range(start, periods=10).strftime("%Y-%m-%d")
+        return pd.Series(np.arange(10, dtype=float), index=idx)
+
+    panel = load_close_panel(
+        ["A", "B", "A"], "2025-01-01", "2025-03-01", lake_dir=tmp_path, fetch=fetch,
+    )
+    assert calls == ["A", "B"]
+    assert panel.shape == (10, 2)
+
+
+def test_load_close_panel_reads_lake_before_fetch(tmp_path):
+    pytest.importorskip("pyarrow")
+    from kstock.store.parquet_store import ParquetStore
+
+    dates = pd.bdate_range("2025-01-02", periods=5)
+    ParquetStore(tmp_path).save("A", pd.DataFrame({"date": dates, "close": np.arange(5.0)}))
+    calls = []
+
+    def fetch(ticker, start, end):
+        calls.append(ticker)
+        return pd.Series([1.0], index=["2025-01-02"])
+
+    panel = load_close_panel(["A", "B"], "2025-01-03", "2025-03-01", lake_dir=tmp_path, fetch=fetch)
+    assert calls == ["B"]
+    assert panel["A"].dropna().tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_load_close_panel_offline_without_data(tmp_path):
+    assert load_close_panel(["A"], "2025-01-01", "2025-03-01", lake_dir=tmp_path, fetch=None).empty
+
+
+def test_build_label_builder_empty():
+    assert build_label_builder([]).labels("A", "2025-01-01") == {}
@@ -2,7 +2,10 @@
 
 from kstock.ingest.global_news import (
     NewsItem,
+    NewsLSHIndex,
+    _lsh_rows,
     _youtube_priority_score,
+    group_similar_news,
     merge_related_topic_groups,
 )
 from kstock.store.sqlite import SQLiteStore
@@ -85,3 +88,42 @@ def test_merge_related_topic_groups_collapses_same_war_cluster():
 
     assert len(merged) == 1
     assert len(merged[0]) == 2
+
+
+def test_group_similar_news_lsh_groups_near_duplicates():
+    items = [
+        NewsItem(title="삼성전자 3분기 영업이익 10조 돌파 시장 예상 상회", source="a"),
+        NewsItem(title="코스피 외국인 순매수 전환 2600선 회복", source="b"),
+        NewsItem(title="삼성전자 3분기 영업이익 10조 돌파 예상 상회", source="c"),
+        NewsItem(title="미국 연준 FOMC 기준금리 동결", source="d"),
+        NewsItem(title="Fed 금리 인하 기대 후퇴", source="e"),
+    ]
+    groups = group_similar_news(items, threshold=0.4)
+    assert [[i.source for i in g] for g in groups] == [["a", "c"], ["b"], ["d", "e"]]
+    assert group_similar_news([]) == []
+
+
+def test_lsh_rows_keep_high_recall():
+    assert _lsh_rows(0.8) >= 4
+    assert _lsh_rows(0.22) == 1
+    assert 1 - (1 - 0.35 ** _lsh_rows(0.35)) ** (128 // _lsh_rows(0.35)) >= 0.99
+
+
+def test_news_index_window_and_alerted_dedup():
+    idx = NewsLSHIndex(window_hours=48)
+    t0 = 1_000_000.0
+    idx.add("삼성전자 3분기 영업이익 10조 돌파 시장 예상 상회", now=t0)
+    idx.mark_alerted([NewsItem(title="미국 이란 핵시설 공습 검토 중동 전쟁 우려", source="a")], now=t0)
+
+    hits = idx.query("삼성전자 3분기 영업이익 10조 돌파 예상 상회", now=t0 + 60)
+    assert [h.title for h in hits] == ["삼성전자 3분기 영업이익 10조 돌파 시장 예상 상회"]
+    assert idx.query("코스피 2600선 회복", now=t0 + 60) == []
+
+    assert idx.is_alerted("미국 이란 핵시설 공습 검토…중동 전쟁 우려", now=t0 + 3600)
+    assert not idx.is_alerted("미국 이란 핵시설 공습 검토 중동 전쟁 우려", hours=24, now=t0 + 25 * 3600)
+    assert not idx.is_alerted("삼성전자 3분기 영업이익 10조 돌파 예상 상회", now=t0 + 60)
+
+    idx.add("코스피 2600선 회복", now=t0 + 47 * 3600)
+    assert len(idx) == 3
+    idx.query("아무 제목", now=t0 + 49 * 3600)          # 48h 지난 항목 제거
+    assert len(idx) == 1
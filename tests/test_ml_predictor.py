@@ -8,14 +8,17 @@ from datetime import date, timedelta
 import numpy as np
 import pytest
 
+from kstock.ml import predictor as predictor_mod
 from kstock.ml.predictor import (
     FEATURE_NAMES,
     PredictionResult,
     _probability_to_label,
     build_features,
     build_training_data,
+    explain_results,
     format_ml_prediction,
     get_score_bonus,
+    invalidate_explainers,
     predict,
     predict_batch,
     retrain_if_needed,
@@ -288,6 +291,94 @@ class TestPredictBatch:
         assert results[0].label == "NEUTRAL"
 
 
+class _FakeModel:
+    """sklearn 스타일 모델: 확률 = rsi / 100."""
+
+    n_features_in_ = len(FEATURE_NAMES)
+    feature_importances_ = np.arange(len(FEATURE_NAMES), dtype=float)
+
+    def predict_proba(self, X):
+        p = np.clip(X[:, 0] / 100.0, 0, 1)
+        return np.column_stack([1 - p, p])
+
+
+class _FakeShap:
+    """TreeExplainer 생성/호출 횟수를 세는 shap 대역."""
+
+    def __init__(self):
+        self.built = 0
+        self.calls: list[int] = []
+        outer = self
+
+        class TreeExplainer:
+            def __init__(self, model):
+                outer.built += 1
+
+            def shap_values(self, X):
+                outer.calls.append(len(X))
+                vals = np.zeros_like(X, dtype=float)
+                vals[:, 1] = X[:, 0]          # 행마다 다른 top feature
+                vals[:, 2] = 50.0
+                return vals
+
+        self.TreeExplainer = TreeExplainer
+
+
+class TestShapCache:
+    @pytest.fixture
+    def fake_shap(self, monkeypatch):
+        fake = _FakeShap()
+        monkeypatch.setattr(predictor_mod, "shap", fake)
+        monkeypatch.setattr(predictor_mod, "_HAS_SHAP", True)
+        invalidate_explainers()
+        yield fake
+        invalidate_explainers()
+
+    @staticmethod
+    def _rows(n):
+        return [{"rsi": 10.0 + 20 * i} for i in range(n)]
+
+    def test_batch_uses_one_explainer_and_one_call(self, fake_shap):
+        model = {"lgb": None, "xgb": _FakeModel()}
+        results = predict_batch(self._rows(4), model=model)
+        assert fake_shap.built == 1
+        assert fake_shap.calls == [4]
+        assert results[0].shap_top3[0] == (FEATURE_NAMES[2], 50.0)
+        assert results[3].shap_top3[0] == (FEATURE_NAMES[1], 70.0)
+
+        predict(self._rows(1)[0], model)
+        assert fake_shap.built == 1          # 같은 모델 → explainer 재사용
+
+    def test_invalidate_rebuilds(self, fake_shap):
+        sub = _FakeModel()
+        predict_batch(self._rows(2), model={"lgb": None, "xgb": sub})
+        invalidate_explainers({"lgb": None, "xgb": sub})
+        predict_batch(self._rows(2), model={"lgb": None, "xgb": sub})
+        assert fake_shap.built == 2
+
+    def test_lazy_explain_only_selected_rows(self, fake_shap):
+        model = {"lgb": None, "xgb": _FakeModel()}
+        rows = self._rows(5)
+        results = predict_batch(rows, model=model, explain=False)
+        assert fake_shap.calls == []
+        assert all(r.shap_top3 == [] for r in results)
+
+        top = sorted(range(5), key=lambda i: -results[i].probability)[:2]
+        explain_results(results, rows, model, top)
+        assert fake_shap.calls == [2]
+        assert [bool(r.shap_top3) for r in results] == [False, False, False, True, True]
+
+        subset = predict_batch(rows, model=model, explain=[0])
+        assert subset[0].shap_top3 and not subset[1].shap_top3
+
+    def test_importance_fallback_without_shap(self, monkeypatch):
+        monkeypatch.setattr(predictor_mod, "_HAS_SHAP", False)
+        results = predict_batch(self._rows(2), model={"lgb": None, "xgb": _FakeModel()})
+        last = FEATURE_NAMES[len(FEATURE_NAMES) - 1]
+        assert results[0].shap_top3[0][0] == last
+        assert results[0].shap_top3 == results[1].shap_top3
+
+
 # ===========================================================================
 # 10-14. get_score_bonus
 # ===========================================================================
@@ -5,8 +5,8 @@ import pandas as pd
 import pytest
 
 from kstock.ingest.naver_finance import (
-    NaverFinanceClient, _naver_info_cache, _parse_current_price, _parse_sise_json,
-    _parse_main_page, _to_float,
+    NaverFinanceClient, _naver_info_cache, _parse_current_price, _parse_polling_json,
+    _parse_sise_json, _parse_main_page, _to_float,
 )
 
 
@@ -55,6 +55,15 @@ def test_parse_sise_json_header_only():
     assert df.empty
 
 
+def test_parse_polling_json():
+    text = (
+        '{"resultCode":"success","result":{"areas":[{"name":"SERVICE_ITEM","datas":['
+        '{"cd":"005930","nv":71000},{"cd":"000660","nv":"185500"},{"cd":"999999","nv":0}]}]}}'
+    )
+    assert _parse_polling_json(text) == {"005930": 71000.0, "000660": 185500.0}
+    assert _parse_polling_json("not json") == {}
+
+
 def test_parse_main_page_empty():
     result = _parse_main_page("")
     assert isinstance(result, dict)
@@ -0,0 +1,261 @@
+"""Tests for kstock.ingest.ohlcv_cache — shared OHLCV cache."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from kstock.core.tz import KST
+from kstock.ingest import ohlcv_cache as oc
+from kstock.ingest.ohlcv_cache import OHLCVCache, merge_bars, tail_period
+
+
+def _bars(dates, close0=100.0):
+    dates = [pd.Timestamp(d).strftime("%Y-%m-%d") for d in dates]
+    return pd.DataFrame({
+        "date": dates,
+        "open": [close0 + i for i in range(len(dates))],
+        "high": [close0 + i + 1 for i in range(len(dates))],
+        "low": [close0 + i - 1 for i in range(len(dates))],
+        "close": [close0 + i for i in range(len(dates))],
+        "volume": [1000.0] * len(dates),
+    })
+
+
+def _recent_days(n, end_offset=1):
+    end = datetime.now(KST).date() - timedelta(days=end_offset)
+    return list(pd.bdate_range(end=end, periods=n))
+
+
+class TestHelpers:
+    def test_tail_period(self):
+        today = datetime(2025, 3, 10, tzinfo=KST)
+        assert tail_period(None) == "6mo"
+        assert tail_period("2025-03-07", today) == "5d"
+        assert tail_period("2025-02-20", today) == "1mo"
+        assert tail_period("2025-01-10", today) == "3mo"
+        assert tail_period("2024-10-01", today) == "6mo"
+
+    def test_merge_bars_tail_wins(self):
+        base = _bars(["2025-01-02", "2025-01-03"])
+        tail = _bars(["2025-01-03", "2025-01-06"], close0=500.0)
+        df = merge_bars(base, tail)
+        assert list(df["date"]) == ["2025-01-02", "2025-01-03", "2025-01-06"]
+        assert df["close"].tolist() == [100.0, 500.0, 501.0]
+
+
+class TestDictCompat:
+    def test_get_put_contains_items(self):
+        cache = OHLCVCache()
+        df = _bars(["2025-01-02"])
+        cache["005930"] = df
+        assert "005930" in cache
+        assert cache.get("005930") is df
+        assert cache.get("000660") is None
+        assert [t for t, _ in cache.items()] == ["005930"]
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_per_ticker_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(oc.time, "monotonic", lambda: now[0])
+        cache = OHLCVCache(ttl_s=60)
+        cache.put("A", _bars(["2025-01-02"]))
+        cache.put("B", _bars(["2025-01-02"]), ttl_s=600)
+        now[0] += 120
+        assert cache.get("A") is None
+        assert cache.get("B") is not None
+
+    def test_lru_eviction_by_bytes(self):
+        one = _bars(pd.bdate_range("2025-01-01", periods=50))
+        size = oc._frame_bytes(one)
+        cache = OHLCVCache(max_bytes=int(size * 2.5))
+        cache.put("A", one)
+        cache.put("B", one.copy())
+        cache.get("A")                 # A가 최근 사용
+        cache.put("C", one.copy())
+        assert "B" not in cache
+        assert "A" in cache and "C" in cache
+        assert cache.stats()["evictions"] == 1
+
+
+class TestFetch:
+    def test_single_flight(self):
+        cache = OHLCVCache()
+        calls = []
+
+        async def fetch(ticker, since):
+            calls.append((ticker, since))
+            await asyncio.sleep(0.01)
+            return _bars(["2025-01-02"])
+
+        async def run():
+            return await asyncio.gather(*[cache.get_or_fetch("A", fetch) for _ in range(5)])
+
+        results = asyncio.run(run())
+        assert calls == [("A", None)]
+        assert all(r is not None and len(r) == 1 for r in results)
+        assert cache.stats()["coalesced"] == 4
+        # 이후 조회는 캐시 hit
+        assert asyncio.run(cache.get_or_fetch("A", fetch)) is not None
+        assert len(calls) == 1
+
+    def test_fetch_failure_returns_none(self):
+        cache = OHLCVCache()
+
+        async def fetch(ticker, since):
+            raise RuntimeError("down")
+
+        assert asyncio.run(cache.get_or_fetch("A", fetch)) is None
+        assert cache.stats()["fetch_errors"] == 1
+        assert cache._inflight == {}
+
+
+class TestLakeBackfill:
+    @pytest.fixture
+    def lake(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from kstock.store.parquet_store import ParquetStore
+
+        return ParquetStore(tmp_path / "lake")
+
+    def test_get_or_fetch_downloads_only_tail(self, lake):
+        days = _recent_days(80, end_offset=3)
+        lake.save("A", _bars(days))
+        cache = OHLCVCache(lake=lake)
+        seen = []
+        tail_day = datetime.now(KST).date() - timedelta(days=1)
+
+        async def fetch(ticker, since):
+            seen.append(since)
+            return _bars([days[-1], tail_day], close0=900.0)
+
+        df = asyncio.run(cache.get_or_fetch("A", fetch, max_bars=50))
+        assert seen == [days[-1].strftime("%Y-%m-%d")]
+        assert len(df) == 50
+        assert df["date"].iloc[-1] == tail_day.strftime("%Y-%m-%d")
+        assert df["close"].iloc[-2] == 900.0          # 겹친 날짜는 새 봉 우선
+        assert cache.stats()["lake_backfills"] == 1
+        assert lake.date_range("A")[1] == tail_day.strftime("%Y-%m-%d")
+
+    def test_short_lake_history_fetches_full(self, lake):
+        lake.save("A", _bars(_recent_days(5)))
+        cache = OHLCVCache(lake=lake)
+        seen = []
+
+        async def fetch(ticker, since):
+            seen.append(since)
+            return _bars(_recent_days(120))
+
+        assert len(asyncio.run(cache.get_or_fetch("A", fetch))) == 120
+        assert seen == [None]
+
+    def test_get_many_groups_tail_and_full(self, lake):
+        days = _recent_days(70, end_offset=2)
+        lake.save("A", _bars(days))
+        cache = OHLCVCache(lake=lake, lake_writeback=False)
+        cache.put("C", _bars(days[-3:]))
+        calls = []
+
+        async def fetch_batch(codes, since):
+            calls.append((sorted(codes), since))
+            return {c: _bars(_recent_days(3, end_offset=0)) for c in codes}
+
+        out = asyncio.run(cache.get_many(["A", "B", "C"], fetch_batch))
+        assert sorted(out) == ["A", "B", "C"]
+        assert sorted(calls, key=lambda c: c[1] or "") == [
+            (["B"], None),
+            (["A"], days[-1].strftime("%Y-%m-%d")),
+        ]
+        assert len(out["A"]) > 70 and len(out["B"]) == 3
+        assert lake.date_range("A")[1] == days[-1].strftime("%Y-%m-%d")
+
+
+class TestLocalBars:
+    def test_last_completed_session(self):
+        from datetime import date
+
+        def at(day, hh):
+            return datetime.fromisoformat(f"{day}T{hh:02d}:00:00").replace(tzinfo=KST)
+
+        assert oc.last_completed_session(at("2026-10-16", 10)) == date(2026, 10, 15)  # 장중
+        assert oc.last_completed_session(at("2026-10-16", 16)) == date(2026, 10, 16)  # 마감 후
+        assert oc.last_completed_session(at("2026-10-18", 12)) == date(2026, 10, 16)  # 일요일
+        assert oc.last_completed_session(at("2026-10-10", 12)) == date(2026, 10, 8)   # 한글날 연휴
+
+    def test_fetched_bars_saved_and_read_back(self, tmp_path, monkeypatch):
+        from kstock.store.sqlite import SQLiteStore
+
+        days = _recent_days(30)
+        monkeypatch.setattr(oc, "last_completed_session", lambda: days[-1].date())
+        store = SQLiteStore(db_path=tmp_path / "bars.db")
+        cache = OHLCVCache(bar_store=store)
+
+        async def fetch(ticker, since):
+            return _bars(days)
+
+        asyncio.run(cache.get_or_fetch("A", fetch))
+        assert len(store.get_ohlcv("A", days=100)) == 30
+        local = cache.local_bars("A", 20)
+        assert local is not None and len(local) == 20
+        assert cache.local_bars("A", 40) is None            # 봉 부족
+        assert cache.local_bars("A", 40, min_bars=25) is not None
+
+    def test_stale_local_bars_ignored(self, tmp_path):
+        from kstock.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(db_path=tmp_path / "bars.db")
+        store.save_daily_bars("A", _bars(_recent_days(10, end_offset=30)))
+        cache = OHLCVCache(bar_store=store)
+        assert cache.local_bars("A", 5) is None
+        assert OHLCVCache().local_bars("A", 5) is None     # bar_store 없음
+
+    def test_missing_sessions_tail_fetched_and_merged(self, tmp_path, monkeypatch):
+        from kstock.store.sqlite import SQLiteStore
+
+        days = list(pd.bdate_range("2026-09-01", "2026-10-16"))
+        monkeypatch.setattr(oc, "last_completed_session", lambda: days[-1].date())
+        store = SQLiteStore(db_path=tmp_path / "bars.db")
+        store.save_daily_bars("A", _bars(days[:-3]))        # 최근 3거래일 없음
+        cache = OHLCVCache(bar_store=store)
+        assert cache.local_bars("A", 20) is None            # 며칠 지난 봉은 최신 아님
+
+        periods = []
+
+        def fetch_tail(period):
+            periods.append(period)
+            hist = _bars(days[-5:], close0=500.0).set_index("date")
+            hist.index = pd.to_datetime(hist.index).tz_localize("Asia/Seoul")
+            hist.columns = [c.capitalize() for c in hist.columns]
+            return hist
+
+        local = cache.local_bars("A", 20, fetch_tail=fetch_tail)
+        assert len(periods) == 1
+        assert list(local["date"].iloc[-3:]) == [d.strftime("%Y-%m-%d") for d in days[-3:]]
+        assert len(local) == 20 and local["close"].iloc[-1] == 504.0
+        # 받은 꼬리는 저장돼 다음 조회는 원격 없이 최신
+        assert cache.local_bars("A", 20) is not None
+
+
+class TestIndicatorStates:
+    def test_indicators_reuse_state_per_frame(self):
+        from kstock.features.technical import compute_indicators
+
+        cache = OHLCVCache()
+        df = _bars(pd.bdate_range("2025-01-02", periods=60))
+        assert cache.indicators("005930", df) == compute_indicators(df)
+        df2 = df.copy()
+        df2.loc[df2.index[-1], "close"] = 90.0
+        assert cache.indicators("005930", df2) == compute_indicators(df2)
+        cache.indicators("005930", df2.tail(40).reset_index(drop=True))  # 다른 기간 → 별도 상태
+        stats = cache.stats()
+        assert (stats["indicator_updates"], stats["indicator_rebuilds"]) == (1, 2)
+        assert stats["indicator_states"] == 2
+
+        cache.invalidate("005930")
+        assert cache.stats()["indicator_states"] == 0
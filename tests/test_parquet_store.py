@@ -0,0 +1,157 @@
+"""Tests for kstock.store.parquet_store — partitioned Parquet lake."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from kstock.store import parquet_store as ps_mod  # noqa: E402
+from kstock.store.parquet_store import ParquetStore  # noqa: E402
+
+
+def _bars(dates, close0=100.0):
+    n = len(dates)
+    return pd.DataFrame({
+        "date": pd.to_datetime(dates),
+        "open": [close0 + i for i in range(n)],
+        "high": [close0 + i + 1 for i in range(n)],
+        "low": [close0 + i - 1 for i in range(n)],
+        "close": [close0 + i for i in range(n)],
+        "volume": [1000 + i for i in range(n)],
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ParquetStore(tmp_path / "lake")
+
+
+def test_save_load_roundtrip(store):
+    store.save("005930", _bars(["2025-01-02", "2025-01-03"]))
+    df = store.load("005930")
+    assert list(df["date"]) == ["2025-01-02", "2025-01-03"]
+    assert df["volume"].dtype == "float64"
+    assert "_seq" not in df.columns
+    assert store.exists("005930")
+    assert store.load("000660") is None
+
+
+def test_append_writes_parts_and_later_rows_win(store):
+    store.save("005930", _bars(["2025-01-02", "2025-01-03"]))
+    store.append("005930", _bars(["2025-01-03", "2025-01-06"], close0=200.0))
+    assert len(store._part_files("005930")) == 2
+    df = store.load("005930")
+    assert list(df["date"]) == ["2025-01-02", "2025-01-03", "2025-01-06"]
+    assert df.loc[df["date"] == "2025-01-03", "close"].item() == 200.0
+
+
+def test_manifest_range_and_missing(store, tmp_path):
+    store.append("005930", _bars(["2025-01-02", "2025-01-03"]))
+    store.append("005930", _bars(["2025-01-06"]))
+    store.append("000660", _bars(["2025-01-02"]))
+    assert store.date_range("005930") == ("2025-01-02", "2025-01-06")
+    assert store.missing(["005930", "000660", "035420"], "2025-01-06") == ["000660", "035420"]
+
+    reopened = ParquetStore(tmp_path / "lake")
+    assert reopened.date_range("000660") == ("2025-01-02", "2025-01-02")
+
+
+def test_compact_merges_parts(store):
+    for d in ["2025-01-02", "2025-01-03", "2025-01-03", "2025-01-06"]:
+        store.append("005930", _bars([d], close0=float(len(store._part_files("005930")))))
+    before = store.load("005930")
+    store.compact()
+    assert len(store._part_files("005930")) == 1
+    pd.testing.assert_frame_equal(store.load("005930"), before)
+    assert store._manifest["005930"]["rows"] == 3
+    # 이후 append도 기존 part를 지우지 않아야 함
+    store.append("005930", _bars(["2025-01-07"]))
+    assert len(store.load("005930")) == 4
+
+
+def test_auto_compaction(store, monkeypatch):
+    monkeypatch.setattr(ps_mod, "AUTO_COMPACT_PARTS", 3)
+    days = pd.bdate_range("2025-01-01", periods=5)
+    for d in days:
+        store.append("005930", _bars([d]))
+    assert len(store._part_files("005930")) <= 3
+    assert len(store.load("005930")) == 5
+
+
+def test_load_panel_filters_and_projects(store):
+    store.save("005930", _bars(["2025-01-02", "2025-01-03", "2025-01-06"]))
+    store.append("005930", _bars(["2025-01-06"], close0=500.0))
+    store.save("000660", _bars(["2025-01-02", "2025-01-03"], close0=50.0))
+    store.save("035420", _bars(["2025-01-02"]))
+
+    df = store.load_panel(["005930", "000660"], start="2025-01-03", columns=["close"])
+    assert list(df.columns) == ["ticker", "date", "close"]
+    assert list(zip(df["ticker"], df["date"])) == [
+        ("000660", "2025-01-03"),
+        ("005930", "2025-01-03"),
+        ("005930", "2025-01-06"),
+    ]
+    assert df["close"].tolist() == [51.0, 101.0, 500.0]
+
+    assert store.load_panel(["999999"]).empty
+
+
+def test_legacy_flat_file_read_and_migrated(store):
+    legacy = _bars(["2025-01-02", "2025-01-03"])
+    legacy.to_parquet(store._ticker_path("005930"), index=False)
+    assert store.list_tickers() == ["005930"]
+    panel = store.load_panel(["005930"], end="2025-01-02", columns=["close"])
+    assert panel["close"].tolist() == [100.0]
+
+    store.append("005930", _bars(["2025-01-06"]))
+    assert not store._ticker_path("005930").exists()
+    assert list(store.load("005930")["date"]) == ["2025-01-02", "2025-01-03", "2025-01-06"]
+
+
+def test_rebuild_manifest(store, tmp_path):
+    store.append("005930", _bars(["2025-01-02"]))
+    store.append("005930", _bars(["2025-01-03"]))
+    (tmp_path / "lake" / ps_mod.MANIFEST_FILE).unlink()
+
+    reopened = ParquetStore(tmp_path / "lake")
+    assert reopened.date_range("005930") is None
+    reopened.rebuild_manifest()
+    assert reopened.date_range("005930") == ("2025-01-02", "2025-01-03")
+    reopened.append("005930", _bars(["2025-01-06"]))
+    assert len(reopened.load("005930")) == 3
+
+
+def test_overwrite_append_does_not_inflate_rows(store):
+    store.append("005930", _bars(["2025-01-02", "2025-01-03"]))
+    store.append("005930", _bars(["2025-01-03", "2025-01-06"], close0=200.0))
+    store.append("005930", _bars(["2025-01-06"], close0=300.0))
+    assert store._manifest["005930"]["rows"] == len(store.load("005930")) == 3
+    store.compact("005930")
+    assert store._manifest["005930"]["rows"] == 3
+
+
+def test_append_during_compact_not_lost(store, monkeypatch):
+    import threading
+
+    store.append("005930", _bars(["2025-01-02"]))
+    store.append("005930", _bars(["2025-01-03"]))
+    real_load = store.load
+    writer = []
+
+    def slow_load(ticker):
+        df = real_load(ticker)
+        # compact 가 읽은 직후 다른 스레드가 append
+        t = threading.Thread(target=store.append, args=("005930", _bars(["2025-01-06"])))
+        t.start()
+        writer.append(t)
+        t.join(0.2)  # 락이 없으면 이 사이에 part 가 써진다
+        return df
+
+    monkeypatch.setattr(store, "load", slow_load)
+    store.compact("005930")
+    writer[0].join()
+    monkeypatch.setattr(store, "load", real_load)
+    assert list(store.load("005930")["date"]) == ["2025-01-02", "2025-01-03", "2025-01-06"]
+    assert store.date_range("005930") == ("2025-01-02", "2025-01-06")
@@ -0,0 +1,209 @@
+"""Tests for kstock.signal.pattern_matcher — DTW kernels and pattern index."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kstock.signal import pattern_matcher as pm_mod
+from kstock.signal.pattern_matcher import (
+    PatternIndex,
+    PatternMatcher,
+    _dtw_distance,
+    _normalize_series,
+    dtw_distances,
+    format_pattern_report,
+    lb_keogh,
+)
+
+
+def _naive_dtw(a, b, band=None):
+    n, m = len(a), len(b)
+    r = max(band, abs(n - m)) if band is not None else max(n, m)
+    d = np.full((n + 1, m + 1), np.inf)
+    d[0, 0] = 0.0
+    for i in range(1, n + 1):
+        for j in range(max(1, i - r), min(m, i + r) + 1):
+            d[i, j] = abs(a[i - 1] - b[j - 1]) + min(d[i - 1, j], d[i, j - 1], d[i - 1, j - 1])
+    return d[n, m]
+
+
+def _walk(n, seed=0, vol=0.02):
+    return 10000 * np.cumprod(1 + np.random.default_rng(seed).normal(0, vol, n))
+
+
+def _ohlcv(closes, start="2020-01-01"):
+    return pd.DataFrame({
+        "date": pd.bdate_range(start, periods=len(closes)).strftime("%Y-%m-%d"),
+        "close": closes,
+    })
+
+
+class TestKernels:
+    @pytest.mark.parametrize("band", [None, 1, 3])
+    def test_dtw_distances_matches_naive(self, band):
+        rng = np.random.default_rng(0)
+        q = rng.random(20)
+        windows = rng.random((30, 20))
+        expected = [_naive_dtw(q, w, band) for w in windows]
+        assert np.allclose(dtw_distances(q, windows, band=band), expected)
+
+    def test_unequal_lengths_and_scalar_wrapper(self):
+        rng = np.random.default_rng(1)
+        a, b = rng.random(12), rng.random(9)
+        assert _dtw_distance(a, b) == pytest.approx(_naive_dtw(a, b))
+        assert _dtw_distance(a, a) == 0.0
+
+    def test_float32_windows(self):
+        rng = np.random.default_rng(2)
+        q = rng.random(20)
+        w = rng.random((10, 20))
+        assert np.allclose(
+            dtw_distances(q, w.astype(np.float32), band=2),
+            dtw_distances(q, w, band=2), atol=1e-5,
+        )
+
+    @pytest.mark.parametrize("band", [1, 2, 4])
+    def test_lb_keogh_is_lower_bound(self, band):
+        rng = np.random.default_rng(3)
+        q = _normalize_series(rng.random(20))
+        w = rng.random((200, 20))
+        assert (lb_keogh(q, w, band) <= dtw_distances(q, w, band=band) + 1e-9).all()
+
+
+class TestFindSimilarPatterns:
+    def test_matches_scalar_reference(self):
+        closes = _walk(200, seed=4)
+        report = PatternMatcher().find_similar_patterns(_ohlcv(closes))
+        lb = 20
+        current = _normalize_series(closes[-lb:])
+        total = len(closes) - lb - 20
+        dists = np.array([
+            _naive_dtw(current, _normalize_series(closes[i:i + lb])) for i in range(total)
+        ])
+        sims = 1.0 - dists / dists.max()
+        expected = np.argsort(-sims, kind="stable")[:10]
+        assert report.total_windows == total
+        assert [m.similarity for m in report.matches] == [round(sims[i], 3) for i in expected]
+        first = report.matches[0]
+        end = expected[0] + lb - 1
+        assert first.forward_5d_return == pytest.approx(
+            (closes[end + 5] - closes[end]) / closes[end], abs=1e-4,
+        )
+
+    def test_short_history_returns_empty(self):
+        assert PatternMatcher().find_similar_patterns(_ohlcv(_walk(30))).matches == []
+
+
+class TestPatternIndex:
+    @pytest.fixture
+    def closes(self):
+        dates = pd.bdate_range("2015-01-01", periods=300).strftime("%Y-%m-%d")
+        return {f"{i:06d}": pd.Series(_walk(300, seed=i), index=dates) for i in range(8)}
+
+    def test_search_equals_brute_force(self, closes):
+        index = PatternIndex.from_closes(closes, step=3, band=2)
+        assert index.windows.dtype == np.float32
+        query = _walk(20, seed=99)
+        q = _normalize_series(query)
+        brute = dtw_distances(q, index.windows, band=2)
+        matches = index.search(query, k=5)
+        assert len(matches) == 5
+        assert matches[0].similarity == round(max(0.0, 1 - brute.min() / 20), 3)
+        assert matches[0].ticker in closes
+        sims = [m.similarity for m in matches]
+        assert sims == sorted(sims, reverse=True)
+
+    def test_exact_window_is_found_and_self_excluded(self, closes):
+        index = PatternIndex.from_closes(closes, step=1, band=2)
+        src = closes["000003"]
+        query = src.iloc[100:120].to_numpy()
+        top = index.search(query, k=3)[0]
+        assert (top.ticker, top.match_date, top.similarity) == ("000003", src.index[100], 1.0)
+        end = 119
+        assert top.forward_20d_return == pytest.approx(
+            (src.iloc[end + 20] - src.iloc[end]) / src.iloc[end], abs=1e-4,
+        )
+
+        excluded = index.search(query, k=3, exclude_ticker="000003", exclude_from=src.index[90])
+        assert all(
+            not (m.ticker == "000003" and m.match_end_date >= src.index[90]) for m in excluded
+        )
+
+    def test_overlapping_windows_deduplicated(self, closes):
+        index = PatternIndex.from_closes(closes, step=1, band=2)
+        matches = index.search(closes["000001"].iloc[50:70].to_numpy(), k=10)
+        by_ticker: dict[str, list[int]] = {}
+        pos = {d: i for i, d in enumerate(closes["000001"].index)}
+        for m in matches:
+            by_ticker.setdefault(m.ticker, []).append(pos[m.match_date])
+        for starts in by_ticker.values():
+            starts.sort()
+            assert all(b - a >= 20 for a, b in zip(starts, starts[1:]))
+
+    def test_clustered_duplicates_still_fill_k(self):
+        # 두 종목에 거의 같은 윈도우가 39개씩 몰려 있어 첫 후보 풀(k × overlap)이
+        # 종목당 1개로 줄어든다 → 후보 풀을 넓혀 세 번째 종목까지 찾아야 한다
+        query = _walk(20, seed=7)
+        q = _normalize_series(query).astype(np.float32)
+        shifts = [0.001 * (1 + abs(i - 19)) for i in range(39)]
+        shifts += [s + 0.0005 for s in shifts] + [0.3, 0.4, 0.5]
+        ticker_idx = np.array([0] * 39 + [1] * 39 + [2, 3, 4], dtype=np.int32)
+        dates = pd.bdate_range("2020-01-01", periods=len(shifts)).strftime("%Y-%m-%d")
+        index = PatternIndex(
+            windows=np.stack([q + np.float32(s) for s in shifts]),
+            tickers=np.array(["A", "B", "C", "D", "E"]),
+            ticker_idx=ticker_idx,
+            start_dates=np.array(dates), end_dates=np.array(dates),
+            forward=np.zeros((len(shifts), 3), dtype=np.float32),
+            lookback=20, step=1, band=2,
+        )
+        matches = index.search(query, k=3)
+        assert [m.ticker for m in matches] == ["A", "B", "C"]
+
+    def test_save_load_roundtrip(self, closes, tmp_path):
+        index = PatternIndex.from_closes(closes, step=5)
+        path = index.save(tmp_path / "idx.npz")
+        loaded = PatternIndex.load(path)
+        assert len(loaded) == len(index)
+        assert (loaded.step, loaded.lookback, loaded.band) == (5, 20, 2)
+        q = _walk(20, seed=5)
+        assert [m.similarity for m in loaded.search(q)] == [m.similarity for m in index.search(q)]
+        assert PatternIndex.load(tmp_path / "missing.npz") is None
+
+    def test_build_from_lake(self, closes, tmp_path):
+        pytest.importorskip("pyarrow")
+        from kstock.store.parquet_store import ParquetStore
+
+        lake = ParquetStore(tmp_path / "lake")
+        for t, s in list(closes.items())[:3]:
+            lake.save(t, pd.DataFrame({"date": s.index, "close": s.to_numpy()}))
+        index = PatternIndex.build(lake, years=30)
+        assert sorted(index.tickers) == sorted(closes)[:3]
+        assert len(index) > 0
+
+    def test_find_best_uses_universe_index(self, closes, monkeypatch):
+        index = PatternIndex.from_closes(closes, step=1)
+        monkeypatch.setattr(pm_mod, "get_pattern_index", lambda: index)
+        src = closes["000002"]
+        ohlcv = pd.DataFrame({"date": src.index[:140], "close": src.to_numpy()[:140]})
+        report = PatternMatcher().find_best(ohlcv, ticker="000002")
+        assert report.total_windows == len(index)
+        assert report.matches and all(m.ticker for m in report.matches)
+        assert "000" in format_pattern_report(report)
+
+    def test_find_best_falls_back_without_index(self, closes, monkeypatch):
+        monkeypatch.setattr(pm_mod, "get_pattern_index", lambda: None)
+        src = closes["000002"]
+        report = PatternMatcher().find_best(_ohlcv(src.to_numpy()), ticker="000002")
+        assert report.ticker == "000002"
+        assert report.matches and not any(m.ticker for m in report.matches)
+
+    def test_get_pattern_index_reloads_on_change(self, closes, tmp_path, monkeypatch):
+        monkeypatch.setattr(pm_mod, "_index_cache", {})
+        path = tmp_path / "idx.npz"
+        assert pm_mod.get_pattern_index(path) is None
+        PatternIndex.from_closes(closes, step=10).save(path)
+        first = pm_mod.get_pattern_index(path)
+        assert pm_mod.get_pattern_index(path) is first
@@ -8,6 +8,7 @@ from kstock.core.risk_engine import (
     calculate_historical_var,
     calculate_parametric_var,
     run_monte_carlo,
+    run_monte_carlo_sweep,
     run_stress_test,
     calculate_real_correlation,
     _calculate_risk_grade,
@@ -15,6 +16,13 @@ from kstock.core.risk_engine import (
     HISTORICAL_STRESS_SCENARIOS,
 )
 import pandas as pd
+from kstock.core.monte_carlo import (
+    cholesky_cache_info,
+    cholesky_factor,
+    clear_cholesky_cache,
+    simulate_streaming,
+    standard_normals,
+)
 
 
 def test_historical_var_basic():
@@ -59,6 +67,78 @@ def test_monte_carlo_distribution():
     assert result.best_case_pct > result.worst_case_pct
 
 
+def test_monte_carlo_sweep_matches_analytic():
+    """100종목 북 1/5/20일 스윕 — 1일 VaR 가 정규 근사와 일치."""
+    rng = np.random.RandomState(0)
+    n = 100
+    a = rng.normal(0, 0.01, (n, n))
+    cov = a @ a.T / n + np.eye(n) * 1e-4
+    weights = np.full(n, 1 / n)
+    mean_returns = np.zeros(n)
+    results = run_monte_carlo_sweep(
+        10_000_000, weights, mean_returns, cov,
+        horizons=(1, 5, 20), simulations=20000, seed=1,
+    )
+    assert sorted(results) == [1, 5, 20]
+    sigma = np.sqrt(weights @ cov @ weights) * 100
+    assert results[1].var_95_pct == pytest.approx(-1.6449 * sigma, rel=0.05)
+    assert results[1].var_95_pct > results[5].var_95_pct > results[20].var_95_pct
+    assert all(r.simulations == 20000 for r in results.values())
+
+
+def test_monte_carlo_early_stop_and_seed():
+    weights = np.array([0.6, 0.4])
+    mean_returns = np.array([0.0005, 0.0003])
+    cov_matrix = np.array([[0.0004, 0.00005], [0.00005, 0.0002]])
+    full = run_monte_carlo(10_000_000, weights, mean_returns, cov_matrix,
+                           simulations=50000, seed=7)
+    again = run_monte_carlo(10_000_000, weights, mean_returns, cov_matrix,
+                            simulations=50000, seed=7)
+    assert full.var_95_pct == again.var_95_pct
+    early = run_monte_carlo(10_000_000, weights, mean_returns, cov_matrix,
+                            simulations=50000, seed=7, tol=0.05)
+    assert early.simulations < 50000
+    assert early.var_95_pct == pytest.approx(full.var_95_pct, rel=0.1)
+
+
+def test_monte_carlo_rejects_unknown_method():
+    weights = np.array([0.6, 0.4])
+    mean_returns = np.array([0.0005, 0.0003])
+    cov_matrix = np.array([[0.0004, 0.00005], [0.00005, 0.0002]])
+    # 단순 정규 fallback 으로 조용히 바뀌지 않고 바로 실패
+    with pytest.raises(ValueError):
+        run_monte_carlo(10_000_000, weights, mean_returns, cov_matrix,
+                        simulations=1000, method="halton")
+
+
+def test_cholesky_factor_cached():
+    clear_cholesky_cache()
+    cov = np.array([[0.0004, 0.0001], [0.0001, 0.0003]])
+    f1 = cholesky_factor(cov)
+    f2 = cholesky_factor(cov.copy())
+    assert f1 is f2
+    assert np.allclose(f1 @ f1.T, cov)
+    assert cholesky_cache_info()["hits"] == 1
+    # 양의 정치가 아니어도 보정 후 분해
+    bad = np.array([[1.0, 2.0], [2.0, 1.0]])
+    assert np.all(np.isfinite(cholesky_factor(bad)))
+
+
+def test_antithetic_and_streaming_chunks():
+    z = standard_normals(np.random.RandomState(0), 10, 3)
+    assert z.dtype == np.float32
+    assert np.allclose(z[:5], -z[5:])
+    calls = []
+
+    def _chunk(k):
+        calls.append(k)
+        return np.ones(k)
+
+    out = simulate_streaming(_chunk, 2500, 1000)
+    assert calls == [1000, 1000, 500]
+    assert out.shape == (2500, 1)
+
+
 def test_stress_test_all_scenarios():
     holdings = [
         {"ticker": "005930", "name": "삼성전자", "weight": 0.5, "sector": "반도체"},
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from kstock.core.performance_tracker import (
@@ -11,6 +12,10 @@ from kstock.core.performance_tracker import (
     compute_information_ratio,
     compute_rolling_beta,
     compute_rolling_metrics,
+    compute_rolling_metrics_batch,
+    rolling_max_drawdown_array,
+    rolling_sharpe_array,
+    simulate_shadow_portfolio,
 )
 
 
@@ -124,3 +129,130 @@ def test_rolling_metrics_integration():
     assert m.rolling_sharpe != 0.0
     assert m.rolling_sortino != 0.0
     assert m.date != ""
+
+
+# --- test_sharpe_matches_naive_window ---
+
+def test_sharpe_matches_naive_window():
+    rng = np.random.RandomState(3)
+    rets = rng.normal(0.0005, 0.01, 300)
+    sharpe = compute_rolling_sharpe(list(rets), window=WINDOW)
+    i = 200
+    w = rets[i - WINDOW + 1 : i + 1]
+    expected = (w.mean() - 0.035 / 252) / w.std() * np.sqrt(252)
+    assert sharpe[i] == pytest.approx(expected, abs=1e-6)
+
+
+# --- test_flat_window_is_zero ---
+
+def test_flat_window_is_zero():
+    """전액 현금 구간 (수익률 0 이 window 일 이상) 은 누적합 잔차로 폭주하지 않는다."""
+    rng = np.random.RandomState(198)
+    nav = list(100 * np.cumprod(1 + rng.normal(0.0004, 0.01, 200)))
+    nav += [nav[-1]] * WINDOW
+    last = compute_rolling_metrics(nav, [""] * len(nav))[-1]
+    assert last.rolling_sharpe == 0.0
+    assert last.rolling_volatility_pct == 0.0
+
+    active = list(rng.normal(0.0, 0.01, 100)) + [0.0] * WINDOW
+    zeros = [0.0] * len(active)
+    assert compute_information_ratio(active, zeros, window=WINDOW)[-1] == 0.0
+    # 벤치마크가 평평하면 분산 0 → 기존 규칙대로 beta 1.0
+    port = list(rng.normal(0.0, 0.01, len(active)))
+    assert compute_rolling_beta(port, active, window=WINDOW)[-1] == 1.0
+
+
+# --- test_array_panel_matches_columns ---
+
+def test_array_panel_matches_columns():
+    rng = np.random.RandomState(4)
+    panel = rng.normal(0.0003, 0.01, (250, 5))
+    batch = rolling_sharpe_array(panel, window=WINDOW)
+    assert batch.shape == panel.shape
+    for j in range(panel.shape[1]):
+        assert np.allclose(batch[:, j], compute_rolling_sharpe(list(panel[:, j]), window=WINDOW))
+
+
+# --- test_rolling_max_drawdown_window ---
+
+def test_rolling_max_drawdown_window():
+    values = [100, 110, 99, 105, 120, 90]
+    mdd = rolling_max_drawdown_array(values, window=3)
+    assert list(mdd[:2]) == [0.0, 0.0]
+    assert mdd[2] == pytest.approx(-10.0)   # 110 -> 99
+    assert mdd[5] == pytest.approx(-25.0)   # 120 -> 90
+
+
+# --- test_batch_matches_single ---
+
+def test_batch_matches_single():
+    rng = np.random.RandomState(5)
+    navs = {
+        f"mgr{i}": list(100 * np.cumprod(1 + rng.normal(0.0004, 0.01, n)))
+        for i, n in enumerate([400, 250, 130])
+    }
+    bench = list(100 * np.cumprod(1 + rng.normal(0.0002, 0.008, 400)))
+    batch = compute_rolling_metrics_batch(navs, benchmark_values=bench, window=WINDOW)
+    assert batch.sharpe.shape == (399, 3)
+    for name, values in navs.items():
+        single = compute_rolling_metrics(
+            values, [""] * len(values), bench[-len(values):], window=WINDOW,
+        )[-1]
+        last = batch.latest()[name]
+        assert last.rolling_sharpe == pytest.approx(single.rolling_sharpe, abs=1e-5)
+        assert last.rolling_beta == pytest.approx(single.rolling_beta, abs=1e-5)
+        assert last.rolling_alpha == pytest.approx(single.rolling_alpha, abs=1e-5)
+        assert last.rolling_max_drawdown_pct == pytest.approx(
+            single.rolling_max_drawdown_pct, abs=1e-4,
+        )
+    # 짧은 시계열의 앞쪽 패딩 구간은 워밍업처럼 0.0
+    assert np.all(batch.sharpe[:300, 2] == 0.0)
+
+
+# --- test_batch_matches_single_every_row ---
+
+def test_batch_matches_single_every_row():
+    """길이가 다른 우측 정렬 시계열: 모든 행/지표가 단일 계산과 같다."""
+    rng = np.random.RandomState(6)
+    lengths = [300, 180, WINDOW + 5, WINDOW]
+    navs = {
+        f"s{n}": list(100 * np.cumprod(1 + rng.normal(0.0003, 0.012, n)))
+        for n in lengths
+    }
+    bench = list(100 * np.cumprod(1 + rng.normal(0.0002, 0.008, lengths[0])))
+    batch = compute_rolling_metrics_batch(navs, benchmark_values=bench, window=WINDOW)
+    fields = {
+        "sharpe": "rolling_sharpe",
+        "sortino": "rolling_sortino",
+        "information_ratio": "rolling_information_ratio",
+        "beta": "rolling_beta",
+        "alpha": "rolling_alpha",
+        "volatility_pct": "rolling_volatility_pct",
+        "max_drawdown_pct": "rolling_max_drawdown_pct",
+    }
+    for j, (name, values) in enumerate(navs.items()):
+        single = compute_rolling_metrics(
+            values, [""] * len(values), bench[-len(values):], window=WINDOW,
+        )
+        offset = batch.sharpe.shape[0] - len(single)
+        for attr, field in fields.items():
+            column = getattr(batch, attr)[:, j]
+            assert np.all(column[:offset] == 0.0), (name, attr)
+            expected = [getattr(m, field) for m in single]
+            assert np.allclose(column[offset:], expected, atol=1e-4), (name, attr)
+
+
+# --- test_shadow_portfolio_nav_curve_feeds_batch ---
+
+def test_shadow_portfolio_nav_curve_feeds_batch():
+    recs = [
+        {"ticker": f"{i:06d}", "name": f"S{i}", "rec_date": f"2025-01-{1 + i:02d}",
+         "manager_key": "scalp", "rec_score": 70, "day5_return": (-1) ** i * 2.0}
+        for i in range(20)
+    ]
+    summary = simulate_shadow_portfolio(recs)
+    assert summary.nav_curve[0] == 100.0
+    assert len(summary.nav_curve) == summary.trades_taken + 1
+    batch = compute_rolling_metrics_batch({"scalp": summary.nav_curve}, window=5)
+    assert batch.names == ["scalp"]
+    assert batch.max_drawdown_pct.min() <= 0.0
@@ -125,3 +125,141 @@ def test_track_usage_skips_zero_token_success_logs():
     )
 
     db.log_api_usage.assert_not_called()
+
+
+def _router_with_cache(tmp_path):
+    from kstock.bot.ai_router import AIRouter
+    from kstock.bot.response_cache import AIResponseCache
+
+    with patch("kstock.bot.ai_router.get_db", return_value=None):
+        router = AIRouter()
+    router._response_cache = AIResponseCache(db_path=tmp_path / "ai_cache.db")
+    router.providers["gemini"].available = True
+    return router
+
+
+@pytest.mark.asyncio
+async def test_ai_router_response_cache_skips_repeat_calls(tmp_path):
+    router = _router_with_cache(tmp_path)
+    router._call_provider = AsyncMock(return_value="요약 결과")
+
+    with patch("kstock.bot.ai_router.get_db", return_value=None):
+        first = await router.analyze("news_summary", "뉴스 10:15 기준\n삼성전자 +3%")
+        # 시각/공백만 다른 같은 요청 → 캐시 적중
+        second = await router.analyze("news_summary", "뉴스 10:20 기준  \n삼성전자 +3%")
+        third = await router.analyze("news_summary", "뉴스\n삼성전자 +3%", data_version="v2")
+
+    assert first == second == third == "요약 결과"
+    assert router._call_provider.await_count == 2
+    stats = router.response_cache.stats()
+    assert stats.memory_hits == 1 and stats.misses == 2
+    assert "응답 캐시" in router.get_status()
+
+
+@pytest.mark.asyncio
+async def test_ai_router_coalesces_concurrent_identical_calls(tmp_path):
+    import asyncio
+
+    router = _router_with_cache(tmp_path)
+    calls = 0
+
+    async def slow_provider(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "답변"
+
+    router._call_provider = slow_provider
+    with patch("kstock.bot.ai_router.get_db", return_value=None):
+        # chat 은 저장하지 않지만 동시 중복 호출은 합친다
+        results = await asyncio.gather(*[
+            router.analyze("chat", "같은 질문") for _ in range(3)
+        ])
+        await router.analyze("chat", "같은 질문")
+
+    assert results == ["답변"] * 3
+    assert calls == 2
+    assert router.response_cache.stats().coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_leader_cancel_keeps_followers(tmp_path):
+    import asyncio
+
+    from kstock.bot.response_cache import AIResponseCache
+
+    cache = AIResponseCache(db_path=None)
+    calls = 0
+
+    async def slow():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.15)
+        return "결과", 0.001
+
+    # 첫 호출자만 타임아웃으로 취소돼도 공유 호출은 계속되고 합류자는 결과를 받는다
+    async def follower():
+        await asyncio.sleep(0.01)
+        return await cache.get_or_call("k", "debate", slow)
+
+    leader = asyncio.wait_for(cache.get_or_call("k", "debate", slow), 0.05)
+    results = await asyncio.gather(leader, follower(), return_exceptions=True)
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert results[1] == "결과"
+    assert calls == 1
+    assert await cache.get_or_call("k", "debate", slow) == "결과"
+    assert calls == 1
+
+
+def test_response_cache_inflight_per_event_loop(tmp_path):
+    import asyncio
+    import threading
+
+    from kstock.bot.response_cache import AIResponseCache
+
+    cache = AIResponseCache(db_path=None)
+    started = threading.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.1)
+        return "결과", 0.0
+
+    results: list = []
+
+    def other_loop():
+        started.wait(1)
+        try:
+            results.append(asyncio.run(cache.get_or_call("k", "chat", slow)))
+        except Exception as exc:
+            results.append(exc)
+
+    worker = threading.Thread(target=other_loop)
+    worker.start()
+    assert asyncio.run(cache.get_or_call("k", "chat", slow)) == "결과"
+    worker.join()
+    assert results == ["결과"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_disk_tier_and_error_responses(tmp_path):
+    from kstock.bot.response_cache import AIResponseCache
+
+    path = tmp_path / "ai_cache.db"
+    cache = AIResponseCache(db_path=path)
+    fetch = AsyncMock(return_value=("브리핑", 0.002))
+    await cache.get_or_call("k1", "morning_briefing", fetch)
+    cache.close()
+
+    reopened = AIResponseCache(db_path=path)
+    assert await reopened.get_or_call("k1", "morning_briefing", fetch) == "브리핑"
+    assert fetch.await_count == 1
+    stats = reopened.stats()
+    assert stats.disk_hits == 1
+    assert stats.saved_cost_usd == pytest.approx(0.002)
+
+    failing = AsyncMock(return_value=('{"error": "API 호출 실패"}', 0.0))
+    await reopened.get_or_call("k2", "morning_briefing", failing)
+    await reopened.get_or_call("k2", "morning_briefing", failing)
+    assert failing.await_count == 2
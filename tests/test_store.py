@@ -293,3 +293,203 @@ class TestTrades:
         assert perf["A"]["win_rate"] == 50.0
         assert "summary" in perf
         assert perf["summary"]["execution_rate"] == 50.0
+
+
+class TestConnectionPool:
+    def test_wal_mode_enabled(self, store):
+        with store._connect() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_connections_are_reused(self, store):
+        with store._connect() as c1:
+            pass
+        with store._connect() as c2:
+            pass
+        assert c1 is c2
+        with store._read() as r1:
+            pass
+        with store._read() as r2:
+            pass
+        assert r1 is r2
+        assert r1 is not c1
+
+    def test_reader_is_query_only(self, store):
+        import sqlite3
+
+        with pytest.raises(sqlite3.OperationalError):
+            with store._read() as conn:
+                conn.execute("DELETE FROM portfolio")
+
+    def test_nested_read_sees_uncommitted_write(self, store):
+        with store._connect():
+            store.upsert_portfolio("005930", name="삼성전자", score=85.0, signal="BUY")
+            assert store.get_portfolio_entry("005930") is not None
+
+    def test_exception_rolls_back(self, store):
+        with pytest.raises(RuntimeError):
+            with store._connect() as conn:
+                conn.execute(
+                    "INSERT INTO portfolio (ticker, updated_at) VALUES ('000660', 'x')"
+                )
+                raise RuntimeError("boom")
+        assert store.get_portfolio_entry("000660") is None
+
+    def test_concurrent_reads_and_writes(self, store):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def work(i):
+            store.upsert_job_run(f"job{i}", "2024-01-01")
+            return store.get_last_job_run(f"job{i}")
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(ex.map(work, range(40)))
+        assert all(r is not None for r in results)
+        stats = store.pool_stats()
+        assert stats["writer"]["checkouts"] >= 40
+        assert stats["writer"]["opened"] == 1
+        assert stats["reader"]["opened"] <= stats["max_readers"]
+
+    def test_close(self, store):
+        import sqlite3
+
+        store.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.get_portfolio()
+
+
+class TestWriteBuffer:
+    def _rows(self, n=20):
+        return [
+            {"date": f"2026-01-{d + 1:02d}", "foreign_net": d, "institution_net": -d}
+            for d in range(n)
+        ]
+
+    def test_supply_demand_batched_into_few_commits(self, store):
+        before = store.pool_stats()["writer"]["checkouts"]
+        for i in range(300):
+            store.bulk_save_supply_demand(f"{i:06d}", self._rows(5))
+        store.flush_writes()
+        assert store.pool_stats()["write_buffer"]["rows_written"] == 1500
+        commits = store.pool_stats()["writer"]["checkouts"] - before
+        assert commits <= 10
+
+    def test_read_sees_buffered_rows(self, store):
+        from datetime import datetime
+
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        assert store.bulk_save_supply_demand("005930", [{"date": today, "foreign_net": 7}]) == 1
+        rows = store.get_supply_demand("005930")
+        assert rows and rows[0]["foreign_net"] == 7
+
+    def test_read_after_save_does_not_force_commit(self, store):
+        from datetime import datetime, timedelta
+
+        today = datetime.utcnow()
+        days = [(today - timedelta(days=d)).strftime("%Y-%m-%d") for d in range(3)]
+        store.bulk_save_supply_demand("000001", [{"date": days[2], "foreign_net": 1, "program_net": 9}])
+        store.flush_writes()
+        before = store.pool_stats()["writer"]["checkouts"]
+        # 스캔 경로: 종목마다 저장 직후 조회
+        for i in range(50):
+            store.bulk_save_supply_demand(f"{i:06d}", [{"date": d, "foreign_net": i} for d in days[:2]])
+            rows = store.get_supply_demand(f"{i:06d}")
+            assert [r["date"] for r in rows][:2] == days[:2]
+            assert rows[0]["foreign_net"] == i
+        assert store.pool_stats()["writer"]["checkouts"] == before
+        # 기존 행 위 upsert 는 ON CONFLICT 컬럼만 덮어쓴다
+        store.bulk_save_supply_demand("000001", [{"date": days[2], "foreign_net": 5}])
+        row = [r for r in store.get_supply_demand("000001") if r["date"] == days[2]][0]
+        assert (row["foreign_net"], row["program_net"]) == (5, 9)
+        overlaid = store.get_supply_demand("000001")
+        store.flush_writes()
+        committed = store.get_supply_demand("000001")
+        strip = lambda rows: [{k: v for k, v in r.items() if k != "id"} for r in rows]
+        assert strip(overlaid) == strip(committed)
+
+    def test_upsert_order_preserved(self, store):
+        store.bulk_save_supply_demand("005930", [{"date": "2026-01-02", "foreign_net": 1}])
+        store.bulk_save_supply_demand("005930", [{"date": "2026-01-02", "foreign_net": 2}])
+        store.flush_writes()
+        with store._read() as conn:
+            row = conn.execute("SELECT foreign_net FROM supply_demand").fetchone()
+        assert row[0] == 2
+
+    def test_background_flush_by_time(self, store):
+        import time
+
+        store._writes.max_delay_s = 0.05
+        store.add_prediction("005930", "2026-03-01", 0.7, "[]", defer=True)
+        deadline = time.time() + 2
+        while store._writes.pending and time.time() < deadline:
+            time.sleep(0.02)
+        assert store._writes.pending == 0
+        with store._read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM ml_predictions").fetchone()[0] == 1
+
+    def test_back_pressure_flushes_inline(self, store):
+        store._writes.max_pending = 50
+        store.bulk_save_supply_demand("005930", self._rows(60))
+        assert store._writes.pending == 0
+
+    def test_close_flushes(self, tmp_path):
+        import sqlite3
+
+        s = SQLiteStore(db_path=tmp_path / "close.db")
+        s.bulk_save_supply_demand("005930", self._rows(3))
+        s.close()
+        conn = sqlite3.connect(tmp_path / "close.db")
+        assert conn.execute("SELECT COUNT(*) FROM supply_demand").fetchone()[0] == 3
+        conn.close()
+
+    def test_bad_statement_does_not_drop_others(self, store):
+        store._defer_write("INSERT INTO no_such_table VALUES (?)", [(1,)])
+        store.bulk_save_supply_demand("005930", self._rows(2))
+        store.flush_writes()
+        stats = store.pool_stats()["write_buffer"]
+        assert stats["rows_dropped"] == 1
+        with store._read() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM supply_demand").fetchone()[0] == 2
+
+
+class TestDailyBars:
+    def test_get_ohlcv_oldest_first_and_upsert(self, store):
+        rows = [
+            {"date": f"2026-01-{d:02d}", "open": 100 + d, "high": 101 + d,
+             "low": 99 + d, "close": 100 + d, "volume": 1000}
+            for d in range(2, 9)
+        ]
+        assert store.save_daily_bars("005930", rows) == 7
+        store.save_daily_bars("005930", [{"date": "2026-01-08", "close": 500}])
+        bars = store.get_ohlcv("005930", days=3)
+        assert [b["date"] for b in bars] == ["2026-01-06", "2026-01-07", "2026-01-08"]
+        assert bars[-1]["close"] == 500 and bars[-1]["open"] == 500
+        assert store.get_daily_bar_range("005930") == ("2026-01-02", "2026-01-08", 7)
+        assert store.get_ohlcv("000660") == []
+
+    def test_skips_rows_without_close(self, store):
+        n = store.save_daily_bars("005930", [
+            {"date": "2026-01-02", "close": 0},
+            {"date": "2026-01-03", "close": float("nan")},
+            {"date": "2026-01-05", "close": 10},
+        ])
+        assert n == 1
+
+    def test_yfinance_frame_and_close_panel(self, store):
+        import pandas as pd
+
+        idx = pd.date_range("2026-01-05", periods=5, freq="B", tz="Asia/Seoul", name="Date")
+        hist = pd.DataFrame({
+            "Open": range(5), "High": range(5), "Low": range(5),
+            "Close": [10.0, 11, 12, 13, 14], "Volume": [1] * 5, "Dividends": [0] * 5,
+        }, index=idx)
+        assert store.save_daily_bars("005930", hist) == 5
+        store.save_daily_bars("000660", [{"date": "2026-01-08", "close": 7},
+                                         {"date": "2026-01-09", "close": 8}])
+        panel = store.get_close_panel(["000660", "005930", "035420"], days=3)
+        assert list(panel.columns) == ["000660", "005930"]
+        assert [d.strftime("%Y-%m-%d") for d in panel.index] == [
+            "2026-01-07", "2026-01-08", "2026-01-09",
+        ]
+        assert panel["005930"].tolist() == [12.0, 13.0, 14.0]
+        assert pd.isna(panel["000660"].iloc[0])
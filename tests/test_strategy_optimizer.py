@@ -11,10 +11,12 @@ import pytest
 
 from kstock.backtest.strategy_optimizer import (
     BayesianConfig,
+    FitnessEvaluator,
     GAConfig,
     Individual,
     MultiObjectiveResult,
     OptimizationResult,
+    ProcessPoolEvaluator,
     RobustnessResult,
     _dominates,
     _evaluate_strategy,
@@ -428,3 +430,73 @@ class TestLatinHypercube:
             for i, name in enumerate(names):
                 lo, hi = param_ranges[name]
                 assert lo <= genes[i] <= hi, f"{name}={genes[i]} outside [{lo}, {hi}]"
+
+
+# ---------------------------------------------------------------------------
+# TestFitnessEvaluator
+# ---------------------------------------------------------------------------
+
+
+class TestFitnessEvaluator:
+    def test_duplicate_genes_evaluated_once(self, ohlcv_data):
+        calls = []
+
+        def counting_strategy(ohlcv, **params):
+            calls.append(params)
+            return dummy_strategy(ohlcv, **params)
+
+        ev = FitnessEvaluator(ohlcv_data, counting_strategy)
+        p = {"rsi_period": 14.0, "rsi_buy": 30.0, "rsi_sell": 70.0}
+        near = {"rsi_period": 14.0 + 1e-9, "rsi_buy": 30.0, "rsi_sell": 70.0}
+        results = ev.evaluate([p, dict(p), near])
+        assert len(calls) == 1
+        assert ev.evaluations == 1
+        assert ev.cache_hits == 2
+        assert results[0].fitness == results[2].fitness
+        assert results[0] is not results[1]
+
+    def test_matches_direct_evaluation(self, ohlcv_data):
+        p = {"rsi_period": 10.0, "rsi_buy": 25.0, "rsi_sell": 75.0}
+        ind = FitnessEvaluator(ohlcv_data, dummy_strategy).evaluate([p])[0]
+        assert ind == _evaluate_strategy(p, ohlcv_data, dummy_strategy)
+
+    def test_generation_stats_recorded(self, ohlcv_data, param_ranges):
+        config = GAConfig(population_size=10, n_generations=3)
+        result = optimize_genetic(
+            param_ranges, ohlcv_data, dummy_strategy, config=config,
+        )
+        stats = result.generation_stats
+        assert [s["generation"] for s in stats] == list(range(len(stats)))
+        assert stats[0]["size"] == 10
+        for s in stats:
+            assert s["evaluated"] + s["cache_hits"] == s["size"]
+            assert s["seconds"] >= 0
+
+    def test_multi_objective_generation_stats(self, ohlcv_data, param_ranges):
+        result = optimize_multi_objective(
+            param_ranges, ohlcv_data, dummy_strategy,
+            population_size=8, n_generations=2,
+        )
+        assert len(result.generation_stats) == 3
+
+    def test_process_pool_matches_sequential(self, ohlcv_data, param_ranges):
+        config = GAConfig(population_size=10, n_generations=3)
+        expected = optimize_genetic(
+            param_ranges, ohlcv_data, dummy_strategy, config=config,
+        )
+        with ProcessPoolEvaluator(ohlcv_data, dummy_strategy, max_workers=2) as ev:
+            result = optimize_genetic(
+                param_ranges, ohlcv_data, dummy_strategy, config=config, evaluator=ev,
+            )
+        assert result.best_params == expected.best_params
+        assert result.convergence_history == expected.convergence_history
+
+    def test_process_pool_falls_back_for_unpicklable_strategy(self, ohlcv_data):
+        p = {"rsi_period": 14.0, "rsi_buy": 30.0, "rsi_sell": 70.0}
+        q = {"rsi_period": 20.0, "rsi_buy": 25.0, "rsi_sell": 75.0}
+        with ProcessPoolEvaluator(
+            ohlcv_data, lambda o, **kw: dummy_strategy(o, **kw),
+            max_workers=2, start_method="spawn",
+        ) as ev:
+            results = ev.evaluate([p, q])
+        assert results[0].fitness == _evaluate_strategy(p, ohlcv_data, dummy_strategy).fitness
@@ -7,8 +7,10 @@ import pandas as pd
 import pytest
 
 from kstock.features.technical import (
+    IndicatorState,
     TechnicalIndicators,
     compute_disparity,
+    compute_indicator_series,
     compute_indicators,
     compute_near_high_pct,
     compute_weekly_trend,
@@ -60,6 +62,61 @@ class TestComputeIndicators:
         assert isinstance(result, TechnicalIndicators)
 
 
+class TestIndicatorSeries:
+    def test_last_bar_matches_compute_indicators(self):
+        df = _make_ohlcv(days=260)
+        assert compute_indicator_series(df).at(-1) == compute_indicators(df)
+
+    def test_every_bar_matches_prefix(self):
+        df = _make_ohlcv(days=130)
+        series = compute_indicator_series(df)
+        assert len(series) == 130
+        for i in (1, 10, 30, 59, 99, 100, 129):
+            assert series.at(i) == compute_indicators(df.iloc[:i + 1]), i
+
+    def test_span_switch_at_200_bars(self):
+        df = _make_ohlcv(days=220)
+        series = compute_indicator_series(df)
+        for i in (198, 199, 200):
+            assert series.at(i) == compute_indicators(df.iloc[:i + 1]), i
+
+    def test_out_of_range_raises(self):
+        series = compute_indicator_series(_make_ohlcv(days=40))
+        with pytest.raises(IndexError):
+            series.at(40)
+
+
+class TestIndicatorState:
+    def test_push_matches_every_prefix(self):
+        df = _make_ohlcv(days=230)
+        state = IndicatorState()
+        for i, row in enumerate(df.itertuples()):
+            state.push(row.close, row.high, row.low, row.volume, key=row.date)
+            if i in (0, 1, 13, 19, 24, 59, 98, 99, 100, 120, 199, 200, 229):
+                assert state.indicators() == compute_indicators(df.iloc[:i + 1]), i
+
+    def test_revised_last_bar_is_incremental(self):
+        df = _make_ohlcv(days=130)
+        state = IndicatorState.from_frame(df)
+        revised = df.copy()
+        revised.loc[revised.index[-1], ["close", "high"]] = [df["close"].iloc[-1] * 1.05,
+                                                             df["high"].iloc[-1] * 1.06]
+        revised.loc[revised.index[-1], "volume"] = 9_000_000
+        assert state.sync(revised) is True
+        assert state.indicators() == compute_indicators(revised)
+        assert len(state) == 130
+
+    def test_sync_appends_one_bar_and_rebuilds_on_shift(self):
+        full = _make_ohlcv(days=132)
+        state = IndicatorState.from_frame(full.iloc[:130])
+        assert state.sync(full.iloc[:131]) is True
+        assert state.indicators() == compute_indicators(full.iloc[:131])
+
+        shifted = full.iloc[2:132].reset_index(drop=True)   # 창 앞이 밀림 → EWM 시작점 변경
+        assert state.sync(shifted) is False
+        assert state.indicators() == compute_indicators(shifted)
+
+
 class TestV25Fields:
     def test_ema_fields(self):
         result = compute_indicators(_make_ohlcv())